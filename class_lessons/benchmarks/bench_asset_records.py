@@ -0,0 +1,73 @@
+"""
+資産クラスと __slots__ 版レコードのメモリ使用量・属性アクセス速度を比較するベンチマーク
+
+リポジトリのルートで実行する:
+    python -m class_lessons.benchmarks.bench_asset_records --count 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from class_lessons.samples.asset_management.asset import Asset
+from class_lessons.samples.asset_management.metal import Metal
+from class_lessons.samples.asset_management.records import (
+    AssetRecord,
+    MetalRecord,
+    StockRecord,
+    WrappedStockRecord,
+)
+from class_lessons.samples.asset_management.stock import Stock
+from class_lessons.samples.asset_management.stock_with_mixin import WrappedStock
+
+# (ラベル, 比較元のクラス, __slots__ 版のクラス, コンストラクタ引数)
+CASES = [
+    ('Asset', Asset, AssetRecord, ('gold', 600000)),
+    ('Metal', Metal, MetalRecord, ('gold', 6000, 100)),
+    ('Stock', Stock, StockRecord, ('orange', 1400, 1000)),
+    ('WrappedStock', WrappedStock, WrappedStockRecord, ('nile', 2500, 300)),
+]
+
+
+def measure_memory(cls, args, count):
+    """ count 個のインスタンスを生成したときの確保メモリ(バイト)と生成時間を返す """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    instances = [cls(*args) for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return instances, current, elapsed
+
+
+def measure_access(instances):
+    """ 全インスタンスの total_price を合計する時間を返す """
+    start = time.perf_counter()
+    total = 0
+    for instance in instances:
+        total += instance.total_price
+    return time.perf_counter() - start
+
+
+def run(count):
+    print(f'インスタンス数: {count:,}')
+    print(f'{"class":<14}{"variant":<10}{"memory(MB)":>12}{"bytes/obj":>11}{"create(s)":>11}{"access(s)":>11}')
+    for label, plain_cls, slotted_cls, args in CASES:
+        for variant, cls in (('dict', plain_cls), ('slots', slotted_cls)):
+            instances, memory, create_time = measure_memory(cls, args, count)
+            access_time = measure_access(instances)
+            print(f'{label:<14}{variant:<10}{memory / 1024 / 1024:>12.1f}{memory / count:>11.1f}'
+                  f'{create_time:>11.3f}{access_time:>11.3f}')
+            del instances
+
+
+def main():
+    parser = argparse.ArgumentParser(description='資産クラスのメモリ・属性アクセスベンチマーク')
+    parser.add_argument('--count', type=int, default=1_000_000, help='生成するインスタンス数')
+    args = parser.parse_args()
+    run(args.count)
+
+
+if __name__ == '__main__':
+    main()
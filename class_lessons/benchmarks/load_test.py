@@ -0,0 +1,152 @@
+"""
+相場 API に対する負荷試験
+
+asset_management の Metal / Stock を使って、評価額の取得 (valuation) と売却 (sell) を並列に実行し、
+スループットと p50/p99 レイテンシを表示する。--stub を付けるとローカルのスタブサーバーを起動して使う。
+
+リポジトリのルートで実行する:
+    python -m class_lessons.benchmarks.load_test --stub --workload valuation --requests 2000 --concurrency 16
+    python -m class_lessons.benchmarks.load_test --base-url http://127.0.0.1:8000 --workload sell
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from class_lessons.benchmarks.stub_exchange import METAL_PRICES, STOCK_PRICES, start_in_thread
+from class_lessons.samples.asset_management.metal import Metal
+from class_lessons.samples.asset_management.mixins import CSVDealsMixin
+from class_lessons.samples.asset_management.stock import Stock
+
+
+class WorkerSessions(threading.local):
+    """ ワーカースレッドごとに requests.Session を持ち、接続を使い回す (Session はスレッドセーフではない) """
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def get(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.session.post(url, **kwargs)
+
+
+def configure(base_url):
+    """ 資産クラスの接続先を切り替える """
+    base_url = base_url.rstrip('/')
+    Metal.base_url = f'{base_url}/metal'
+    Stock.base_url = f'{base_url}/stock'
+    CSVDealsMixin.base_url = f'{base_url}/stock'
+
+
+def use_sessions():
+    """ 資産クラスの HTTP 呼び出しを、ワーカーごとの Session 経由にする """
+    sessions = WorkerSessions()
+    Metal.http = sessions
+    CSVDealsMixin.http = sessions
+
+
+def make_assets():
+    assets = [Metal(name, price, 10 ** 9) for name, price in METAL_PRICES.items()]
+    assets += [Stock(name, price, 10 ** 9) for name, price in STOCK_PRICES.items()]
+    return assets
+
+
+def valuation(asset):
+    return asset.get_current_total_price()
+
+
+def sell(asset):
+    return asset.sell(1)
+
+
+WORKLOADS = {
+    'valuation': valuation,
+    'sell': sell,
+}
+
+
+def timed_call(func, asset):
+    """ (成功したか, 経過秒) を返す """
+    start = time.perf_counter()
+    try:
+        func(asset)
+        ok = True
+    except Exception:
+        ok = False
+    return ok, time.perf_counter() - start
+
+
+def percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(ratio * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run(workload, count, concurrency):
+    func = WORKLOADS[workload]
+    assets = make_assets()
+    use_sessions()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda i: timed_call(func, assets[i % len(assets)]), range(count)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for ok, latency in results if ok)
+    errors = sum(1 for ok, _ in results if not ok)
+    return {
+        'workload': workload,
+        'requests': count,
+        'concurrency': concurrency,
+        'errors': errors,
+        'elapsed': elapsed,
+        'throughput': count / elapsed if elapsed else 0.0,
+        'mean': statistics.fmean(latencies) if latencies else 0.0,
+        'p50': percentile(latencies, 0.50),
+        'p99': percentile(latencies, 0.99),
+    }
+
+
+def report(result):
+    print(f"workload:    {result['workload']}")
+    print(f"requests:    {result['requests']:,} (concurrency {result['concurrency']})")
+    print(f"errors:      {result['errors']:,}")
+    print(f"elapsed:     {result['elapsed']:.2f} s")
+    print(f"throughput:  {result['throughput']:.1f} req/s")
+    print(f"latency:     mean {result['mean'] * 1000:.1f} ms / "
+          f"p50 {result['p50'] * 1000:.1f} ms / p99 {result['p99'] * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='相場 API の負荷試験')
+    parser.add_argument('--workload', choices=sorted(WORKLOADS), default='valuation')
+    parser.add_argument('--requests', type=int, default=1000, help='実行する処理の総数')
+    parser.add_argument('--concurrency', type=int, default=8, help='同時に実行するスレッド数')
+    parser.add_argument('--base-url', default=None, help='接続先 (省略時は ASSET_API_BASE_URL の設定)')
+    parser.add_argument('--stub', action='store_true', help='ローカルのスタブサーバーを起動して使う')
+    parser.add_argument('--latency', type=float, default=0.0, help='スタブの遅延(ミリ秒)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='スタブのエラー率 (0-1)')
+    args = parser.parse_args()
+
+    server = None
+    if args.stub:
+        server, base_url = start_in_thread(latency=args.latency / 1000, error_rate=args.error_rate)
+        configure(base_url)
+    elif args.base_url:
+        configure(args.base_url)
+
+    try:
+        report(run(args.workload, args.requests, args.concurrency))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    main()
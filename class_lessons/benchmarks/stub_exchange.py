@@ -0,0 +1,177 @@
+"""
+flask.pc5bai.com の相場 API を真似たローカルのスタブサーバー
+
+ネットワークに出ずに asset_management や sample41-44 を動かすためのもの。
+遅延とエラー率を指定できるので、負荷試験やエラー処理の確認にも使える。
+
+リポジトリのルートで実行する:
+    python -m class_lessons.benchmarks.stub_exchange --port 8000 --latency 20 --error-rate 0.01
+
+サンプル側は環境変数で接続先を切り替える:
+    ASSET_API_BASE_URL=http://127.0.0.1:8000 python sample42.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METAL_PRICES = {
+    'gold': 9800,
+    'silver': 120,
+    'platinum': 4800,
+}
+
+STOCK_PRICES = {
+    'toggle': 2500,
+    'orange': 1400,
+    'macrosoft': 2000,
+    'nile': 1800,
+}
+
+
+class StubExchange:
+    """ スタブの相場と、注入する遅延・エラーの設定 """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, volatility=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.volatility = volatility
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.prices = {
+            'metal': dict(METAL_PRICES),
+            'stock': dict(STOCK_PRICES),
+        }
+
+    def wait(self):
+        """ 設定された遅延(秒)だけ待つ """
+        with self.lock:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def should_fail(self):
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+    def quote(self, kind, name):
+        """ (買取価格, 販売価格) を返す。volatility が指定されていれば相場をランダムに動かす """
+        with self.lock:
+            prices = self.prices[kind]
+            if name not in prices:
+                return None
+            if self.volatility:
+                prices[name] = max(1, round(prices[name] * (1 + self.random.gauss(0, self.volatility))))
+            buy = prices[name]
+        return buy, round(buy * 1.05)
+
+    def stock_csv(self):
+        lines = ['company_name,buy,sell']
+        for name in STOCK_PRICES:
+            buy, sell = self.quote('stock', name)
+            lines.append(f'{name},{buy},{sell}')
+        return '\n'.join(lines) + '\n'
+
+
+class StubExchangeHandler(BaseHTTPRequestHandler):
+    exchange = None  # make_server で設定する
+
+    def log_message(self, format, *args):
+        pass
+
+    def parts(self):
+        """ パスを要素に分解する (重複したスラッシュや末尾のスラッシュは無視する) """
+        return [part for part in self.path.split('?')[0].split('/') if part]
+
+    def send(self, status, body, content_type='application/json'):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, status, payload):
+        self.send(status, json.dumps(payload, ensure_ascii=False))
+
+    def do_GET(self):
+        self.exchange.wait()
+        if self.exchange.should_fail():
+            return self.send_json(500, {'error': 'injected error'})
+        parts = self.parts()
+        if len(parts) == 4 and parts[:3] == ['metal', 'api', 'info']:
+            quote = self.exchange.quote('metal', parts[3])
+            if quote is None:
+                return self.send_json(404, {'error': f'unknown metal: {parts[3]}'})
+            return self.send_json(200, {'name': parts[3], 'buy': quote[0], 'sell': quote[1]})
+        if parts == ['stock', 'info', 'csv']:
+            return self.send(200, self.exchange.stock_csv(), content_type='text/csv')
+        self.send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        self.exchange.wait()
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.exchange.should_fail():
+            return self.send_json(500, {'error': 'injected error'})
+        parts = self.parts()
+        if len(parts) != 3 or parts[0] not in ('metal', 'stock') or parts[1:] != ['api', 'buy']:
+            return self.send_json(404, {'error': 'not found'})
+        try:
+            data = json.loads(body or b'{}')
+            amount = float(data['amount'])
+        except (ValueError, KeyError, TypeError):
+            return self.send_json(400, {'error': 'invalid request'})
+        quote = self.exchange.quote(parts[0], data.get('name'))
+        if quote is None:
+            return self.send_json(404, {'error': f'unknown item: {data.get("name")}'})
+        self.send_json(200, {'name': data['name'], 'amount': data['amount'], 'price': round(quote[0] * amount)})
+
+
+class StubExchangeServer(ThreadingHTTPServer):
+    # 既定の listen のバックログ (5) では、同時接続が多いと SYN が捨てられて再送待ち (約 1 秒) が起きる
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def make_server(host='127.0.0.1', port=0, **options):
+    """ スタブサーバーを作成する。port=0 なら空いているポートを使う """
+    handler = type('Handler', (StubExchangeHandler,), {'exchange': StubExchange(**options)})
+    return StubExchangeServer((host, port), handler)
+
+
+def start_in_thread(host='127.0.0.1', port=0, **options):
+    """ バックグラウンドスレッドでスタブサーバーを起動し、(server, base_url) を返す """
+    server = make_server(host, port, **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f'http://{host}:{port}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='相場 API のスタブサーバー')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help='応答ごとの遅延(ミリ秒)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='遅延に加えるランダムな揺らぎの最大値(ミリ秒)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='HTTP 500 を返す割合 (0-1)')
+    parser.add_argument('--volatility', type=float, default=0.0, help='1 回の問い合わせごとの相場変動率')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                         error_rate=args.error_rate, volatility=args.volatility, seed=args.seed)
+    print(f'スタブサーバーを起動しました: http://{args.host}:{server.server_address[1]}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
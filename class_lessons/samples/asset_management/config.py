@@ -0,0 +1,4 @@
+import os
+
+# 相場 API の接続先。環境変数 ASSET_API_BASE_URL でローカルのスタブサーバーなどに切り替えられる
+API_BASE_URL = os.environ.get('ASSET_API_BASE_URL', 'https://flask.pc5bai.com').rstrip('/')
@@ -1,10 +1,14 @@
 import requests
 
 from .asset import Asset
+from .config import API_BASE_URL
 
 
 class Metal(Asset):
     type_name = 'metal'
+    base_url = f'{API_BASE_URL}/metal'
+    price_store = None  # PriceHistoryStore を設定すると、取得した相場を記録する
+    http = requests  # requests.Session などを設定すると、接続を使い回せる
 
     def __init__(self, name, base_price, amount):
         super().__init__(name, base_price * amount)
@@ -18,20 +22,23 @@ class Metal(Asset):
         return self.total_price / self.amount
 
     def get_current_price_per_unit(self):
-        """ flask.pc5bai.com から最新の貴金属買取単価を得る """
-        url = f'https://flask.pc5bai.com/metal/api/info/{self.name}'
-        response = requests.get(url)
-        return response.json()['buy']
+        """ 相場 API から最新の貴金属買取単価を得る """
+        url = f'{self.base_url}/api/info/{self.name}'
+        response = self.http.get(url)
+        quote = response.json()
+        if self.price_store is not None:
+            self.price_store.append(self.name, quote['buy'], quote.get('sell', float('nan')))
+        return quote['buy']
 
     def get_current_total_price(self):
         return self.get_current_price_per_unit() * self.amount
 
     def sell(self, units):
         """ units 相当を売却する """
-        url = 'https://flask.pc5bai.com/metal/api/buy/'
+        url = f'{self.base_url}/api/buy/'
         data = {"name": self.name, "amount": units, "email": "foo@bar.com", "user": "山田太郎"
                 }
-        response = requests.post(url, json=data, )
+        response = self.http.post(url, json=data, )
         if response.status_code != 200:
             raise Exception('売却に失敗しました。')
         self.amount -= units
@@ -2,9 +2,14 @@ import csv
 
 import requests
 
+from .config import API_BASE_URL
+
 
 class CSVDealsMixin:
     """ 株取引のためのメソッドを有する、多重継承用のクラス """
+    base_url = f'{API_BASE_URL}/stock'
+    price_store = None  # PriceHistoryStore を設定すると、取得した相場を記録する
+    http = requests  # requests.Session などを設定すると、接続を使い回せる
 
     def __init__(self, name, base_price, amount):
         self.name=name
@@ -19,26 +24,28 @@ class CSVDealsMixin:
         return self.total_price / self.amount
 
     def get_csv_deals(self):
-        url = f'http://flask.pc5bai.com/stock/info/csv'
-        response = requests.get(url)
+        url = f'{self.base_url}/info/csv'
+        response = self.http.get(url)
         return response.text.splitlines()
 
     def get_current_price_per_unit_from_csv(self):
         """
-        flask.pc5bai.com から最新の株買取単価を得る
+        相場 API から最新の株買取単価を得る
         """
         reader = csv.DictReader(self.get_csv_deals())
         for row in reader:
             if row['company_name'] == self.name:
+                if self.price_store is not None:
+                    self.price_store.append(self.name, int(row['buy']), float(row.get('sell') or 'nan'))
                 return int(row['buy'])
         raise NotImplementedError
 
     def sell(self, units):
         """ units 相当を売却する """
-        url = 'https://flask.pc5bai.com/stock/api/buy/'
+        url = f'{self.base_url}/api/buy/'
         data = {"name": self.name, "amount": units, "email": "foo@bar.com", "user": "山田太郎"
                 }
-        response = requests.post(url, json=data, )
+        response = self.http.post(url, json=data, )
         if response.status_code != 200:
             raise Exception('売却に失敗しました。')
         self.amount -= units
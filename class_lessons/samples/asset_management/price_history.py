@@ -0,0 +1,200 @@
+"""
+価格履歴をローカルに保存するストア
+
+取得した相場 (タイムスタンプ, 買取価格, 販売価格) を銘柄ごとの固定長バイナリファイルに追記し、
+読み出しは mmap 経由で行う。タイムスタンプは追記順に単調増加している前提で、
+範囲検索・時点検索 (as-of) は二分探索で行う。
+レコードはリトルエンディアンで保存する。ビッグエンディアンの環境では mmap を直接読まず、
+array に読み込んでバイト順を並べ替える。
+"""
+import array
+import bisect
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+
+# 1 レコード = timestamp(float64), buy(float64), sell(float64)
+RECORD = struct.Struct('<ddd')
+FIELDS = ('timestamp', 'buy', 'sell')
+# mmap を float64 の列としてそのまま読めるか (RECORD と同じバイト順か)
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+class _Timestamps:
+    """ mmap 上のレコード列をタイムスタンプの列として見せる(bisect 用) """
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values) // 3
+
+    def __getitem__(self, index):
+        return self.values[index * 3]
+
+
+class PriceSeries:
+    """ 1 銘柄分の価格履歴 """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'ab')
+        size = os.path.getsize(path)
+        if size % RECORD.size:
+            # 書き込みの途中で止まったなどで半端なレコードが末尾に残っていれば切り捨てる
+            # (残したまま追記すると、以降のレコードの区切りがずれる)
+            self._file.truncate(size - size % RECORD.size)
+        self._mmap = None
+        self._values = None
+        self._mapped_size = 0
+        self._last_timestamp = None
+        if len(self):
+            self._last_timestamp = self._get_values()[-3]
+
+    def __len__(self):
+        return os.path.getsize(self.path) // RECORD.size
+
+    def append(self, buy, sell=math.nan, timestamp=None):
+        """
+        相場を 1 件追記する
+        timestamp を省略した場合は現在時刻を使う。時計が戻っていても (NTP の補正など)
+        直前のレコードの時刻に揃えて追記し、指定された timestamp が過去に戻っている場合だけエラーにする
+        """
+        if timestamp is None:
+            timestamp = time.time()
+            if self._last_timestamp is not None:
+                timestamp = max(timestamp, self._last_timestamp)
+        elif self._last_timestamp is not None and timestamp < self._last_timestamp:
+            raise ValueError(f'タイムスタンプが過去に戻っています: {timestamp} < {self._last_timestamp}')
+        self._file.write(RECORD.pack(timestamp, buy, sell))
+        self._file.flush()
+        self._last_timestamp = timestamp
+
+    def _release(self):
+        if isinstance(self._values, memoryview):
+            self._values.release()
+        self._values = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._mapped_size = 0
+
+    def _get_values(self):
+        """ ファイル全体を float64 の列として返す。追記されていれば mmap を張り直す """
+        size = len(self) * RECORD.size
+        if size != self._mapped_size:
+            self._release()
+            if size and _NATIVE_LITTLE_ENDIAN:
+                with open(self.path, 'rb') as f:
+                    self._mmap = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+                self._values = memoryview(self._mmap).cast('d')
+                self._mapped_size = size
+            elif size:
+                with open(self.path, 'rb') as f:
+                    self._values = array.array('d', f.read(size))
+                self._values.byteswap()
+                self._mapped_size = size
+        return self._values if self._values is not None else ()
+
+    def _record(self, values, index):
+        offset = index * 3
+        return values[offset], values[offset + 1], values[offset + 2]
+
+    def _index_range(self, start=None, end=None):
+        values = self._get_values()
+        timestamps = _Timestamps(values)
+        low = 0 if start is None else bisect.bisect_left(timestamps, start)
+        high = len(timestamps) if end is None else bisect.bisect_left(timestamps, end)
+        return values, low, high
+
+    def range(self, start=None, end=None):
+        """ start <= timestamp < end のレコードを (timestamp, buy, sell) のリストで返す """
+        values, low, high = self._index_range(start, end)
+        return [self._record(values, i) for i in range(low, high)]
+
+    def as_of(self, timestamp):
+        """ timestamp 時点で最新だったレコードを返す。該当がなければ None """
+        values = self._get_values()
+        index = bisect.bisect_right(_Timestamps(values), timestamp) - 1
+        if index < 0:
+            return None
+        return self._record(values, index)
+
+    def resample(self, interval, start=None, end=None, field='buy'):
+        """
+        interval 秒ごとの OHLC を返す
+        戻り値は (区間の開始時刻, open, high, low, close) のリスト
+        """
+        column = FIELDS.index(field)
+        values, low, high = self._index_range(start, end)
+        bars = []
+        for i in range(low, high):
+            timestamp = values[i * 3]
+            price = values[i * 3 + column]
+            bucket = timestamp - timestamp % interval
+            if bars and bars[-1][0] == bucket:
+                _, open_, high_, low_, _ = bars[-1]
+                bars[-1] = (bucket, open_, max(high_, price), min(low_, price), price)
+            else:
+                bars.append((bucket, price, price, price, price))
+        return bars
+
+    def close(self):
+        self._release()
+        self._file.close()
+
+
+class PriceHistoryStore:
+    """ 銘柄ごとの PriceSeries をまとめて管理する """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._series = {}
+
+    def series(self, name):
+        if name not in self._series:
+            self._series[name] = PriceSeries(os.path.join(self.directory, f'{name}.bin'))
+        return self._series[name]
+
+    def names(self):
+        """ 履歴が保存されている銘柄名の一覧 """
+        return sorted(filename[:-4] for filename in os.listdir(self.directory) if filename.endswith('.bin'))
+
+    def append(self, name, buy, sell=math.nan, timestamp=None):
+        self.series(name).append(buy, sell, timestamp)
+
+    def range(self, name, start=None, end=None):
+        return self.series(name).range(start, end)
+
+    def as_of(self, name, timestamp):
+        return self.series(name).as_of(timestamp)
+
+    def resample(self, name, interval, start=None, end=None, field='buy'):
+        return self.series(name).resample(interval, start, end, field)
+
+    def portfolio_values(self, assets, start, end, interval):
+        """
+        保有資産(amount と name を持つインスタンスのリスト)の評価額の推移を返す
+        ネットワークにはアクセスせず、保存済みの履歴だけで計算する
+        戻り値は (時刻, 評価額) のリスト
+        """
+        values = []
+        timestamp = start
+        while timestamp < end:
+            total = 0
+            for asset in assets:
+                record = self.as_of(asset.name, timestamp)
+                if record is not None:
+                    total += record[1] * asset.amount
+            values.append((timestamp, total))
+            timestamp += interval
+        return values
+
+    def close(self):
+        for series in self._series.values():
+            series.close()
+        self._series.clear()
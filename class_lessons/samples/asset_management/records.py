@@ -0,0 +1,128 @@
+"""
+__slots__ を使った省メモリ版の資産クラス
+
+Asset / Metal / Stock / WrappedStock と同じ公開メソッドを持つが、
+インスタンスごとの __dict__ を持たないので、大量の保有データを扱うときのメモリ消費が小さい。
+ネットワークにアクセスするメソッドは元のクラスの関数をそのまま借りている。
+"""
+from .metal import Metal
+from .mixins import CSVDealsMixin
+from .stock import Stock
+
+
+class AssetRecord:
+    """ 資産クラス(__slots__ 版) """
+    __slots__ = ('name', 'total_price')
+    type_name = 'asset'
+
+    def __init__(self, name, total_price, ):
+        self.name = name
+        self.total_price = total_price
+
+    def __str__(self):
+        return f'{self.name} {self.total_price}'
+
+    def __add__(self, other):
+        return self.total_price + other.total_price
+
+    def __eq__(self, other):
+        return self.total_price == other.total_price
+
+    def get_total_price(self):
+        return self.total_price
+
+    def get_info(self):
+        return f'{self.name}を総額{self.total_price:,}円有しています。'
+
+
+class MetalRecord(AssetRecord):
+    """ 貴金属クラス(__slots__ 版) """
+    __slots__ = ('amount',)
+    type_name = Metal.type_name
+    base_url = Metal.base_url
+    price_store = None
+
+    def __init__(self, name, base_price, amount):
+        super().__init__(name, base_price * amount)
+        self.amount = amount
+
+    get_info = Metal.get_info
+    get_price_per_unit = Metal.get_price_per_unit
+    get_current_price_per_unit = Metal.get_current_price_per_unit
+    get_current_total_price = Metal.get_current_total_price
+    sell = Metal.sell
+
+
+class StockRecord(MetalRecord):
+    """ 株クラス(__slots__ 版) """
+    __slots__ = ()
+    type_name = Stock.type_name
+    base_url = Stock.base_url
+
+    get_current_price_per_unit = Stock.get_current_price_per_unit
+    sell = Stock.sell
+
+
+class WrappedStockRecord(MetalRecord):
+    """ CSVDealsMixin を使う株クラス(__slots__ 版) """
+    __slots__ = ()
+    type_name = 'stock'
+    base_url = CSVDealsMixin.base_url
+
+    get_info = CSVDealsMixin.get_info
+    get_csv_deals = CSVDealsMixin.get_csv_deals
+    get_current_price_per_unit_from_csv = CSVDealsMixin.get_current_price_per_unit_from_csv
+    sell = CSVDealsMixin.sell
+
+    def get_current_price_per_unit(self):
+        return self.get_current_price_per_unit_from_csv()
+
+
+class BaseAssetRecord:
+    """ sample41.BaseAsset と同じ振る舞いをする __slots__ 版の基底クラス """
+    __slots__ = ('type_name', 'total_price', 'amount')
+    allowed_types = []
+    asset_type = ""
+
+    def __init__(self, type_name, total_price, amount, **kwargs):
+        if type_name not in self.allowed_types:
+            raise ValueError(f'許可されていない商品です: {type_name}')
+        self.type_name = type_name
+        self.total_price = total_price
+        self.amount = amount
+
+    def __str__(self):
+        return f'{self.type_name} {self.amount}g'
+
+    def __add__(self, other):
+        return self.total_price + other.total_price
+
+    def __eq__(self, other):
+        return self.total_price == other.total_price
+
+    def get_info(self):
+        return f'{self.asset_type} {self.type_name} {self.amount} 総額{self.total_price:,}円有しています。'
+
+    def get_per_unit_price(self):
+        return self.total_price / self.amount
+
+    get_price_per_unit = get_per_unit_price
+
+
+class MetalHoldingRecord(BaseAssetRecord):
+    """ sample42.Metal に相当する保有データ """
+    __slots__ = ()
+    allowed_types = ['silver', 'gold', 'platinum', ]
+    asset_type = "貴金属"
+
+
+class StockHoldingRecord(BaseAssetRecord):
+    """ sample43.Stock に相当する保有データ(取引日と証券会社を持つ) """
+    __slots__ = ('date', 'trader')
+    allowed_types = ['toggle', 'orange', 'macrosoft', 'nile', ]
+    asset_type = "株券"
+
+    def __init__(self, type_name, total_price, amount, date='', trader=''):
+        super().__init__(type_name, total_price, amount, )
+        self.date = date
+        self.trader = trader
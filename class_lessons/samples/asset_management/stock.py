@@ -1,33 +1,35 @@
 import csv
 
-import requests
-
+from .config import API_BASE_URL
 from .metal import Metal
 
 
 class Stock(Metal):
     type_name = 'stock'
+    base_url = f'{API_BASE_URL}/stock'
 
     def get_current_price_per_unit(self):
-        """ flask.pc5bai.com から最新の株買取単価を得る """
-        url = f'http://flask.pc5bai.com/stock/info/csv'
-        response = requests.get(url)
+        """ 相場 API から最新の株買取単価を得る """
+        url = f'{self.base_url}/info/csv'
+        response = self.http.get(url)
         reader = csv.DictReader(response.text.splitlines())
         for row in reader:
             if row['company_name'] == self.name:
+                if self.price_store is not None:
+                    self.price_store.append(self.name, int(row['buy']), float(row.get('sell') or 'nan'))
                 return int(row['buy'])
         raise NotImplementedError
 
     def sell(self, units):
         """ units 相当を売却する """
-        url = 'https://flask.pc5bai.com/stock/api/buy/'
+        url = f'{self.base_url}/api/buy/'
         data = {
             "name": self.name,
             "amount": units,
             "email": "foo@bar.com",
             "user": "山田太郎"
         }
-        response = requests.post(url, json=data, )  # headers={'Content-Type': 'application/json'})
+        response = self.http.post(url, json=data, )  # headers={'Content-Type': 'application/json'})
         if response.status_code != 200:
             raise Exception('売却に失敗しました。')
         self.amount -= units
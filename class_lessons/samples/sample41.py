@@ -1,7 +1,11 @@
 import json
+import os
 
 import requests
 
+# 相場 API の接続先。環境変数 ASSET_API_BASE_URL でローカルのスタブサーバーなどに切り替えられる
+API_BASE_URL = os.environ.get('ASSET_API_BASE_URL', 'https://flask.pc5bai.com').rstrip('/')
+
 
 class BaseAsset:
     allowed_types = []
@@ -1,12 +1,12 @@
 import requests
 
-from sample41 import BaseAsset
+from sample41 import API_BASE_URL, BaseAsset
 
 
 class Metal(BaseAsset):
     allowed_types = ['silver', 'gold', 'platinum', ]
     asset_type = "貴金属"
-    base_url = 'https://flask.pc5bai.com/metal/'
+    base_url = f'{API_BASE_URL}/metal/'
 
     def get_current_unit_price(self):
         """ 現在の買取単価を調べる """
@@ -2,13 +2,13 @@ import csv
 
 import requests
 
-from sample41 import BaseAsset
+from sample41 import API_BASE_URL, BaseAsset
 
 
 class Stock(BaseAsset):
     allowed_types = ['toggle', 'orange', 'macrosoft', 'nile', ]
     asset_type = "株券"
-    base_url = 'https://flask.pc5bai.com/stock/'
+    base_url = f'{API_BASE_URL}/stock/'
 
     def __init__(self, type_name, total_price, amount, date='', trader=''):
         super().__init__(type_name, total_price, amount, )
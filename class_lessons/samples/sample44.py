@@ -2,7 +2,7 @@ import csv
 
 import requests
 
-from sample41 import BaseAsset
+from sample41 import API_BASE_URL, BaseAsset
 
 
 class CSVMixin:
@@ -25,7 +25,7 @@ class CSVMixin:
 class Stock(CSVMixin, BaseAsset):
     allowed_types = ['toggle', 'orange', 'macrosoft', 'nile', ]
     asset_type = "株券"
-    base_url = 'https://flask.pc5bai.com/stock/'
+    base_url = f'{API_BASE_URL}/stock/'
 
     def __init__(self, type_name, total_price, amount, date='', trader=''):
         super().__init__(type_name, total_price, amount, )
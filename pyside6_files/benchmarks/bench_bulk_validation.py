@@ -0,0 +1,128 @@
+"""
+一括検証エンジンのベンチマーク
+
+ValidatorDemoWindow と同じスキーマで、ランダムに生成した行を
+1プロセスで検証した場合と、プロセスプールに分散した場合の処理件数(行/秒)を比較します。
+
+PySide6 がある場合は、最初に ValidatorDemoWindow の入力欄のバリデーター(QIntValidator など)と
+一括検証エンジンの結果が一致することを確認します(一致しなければ終了コード 1)。
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.bench_bulk_validation --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from pyside6_files.common.bulk_validation import BulkValidationEngine
+
+SCHEMA = {
+    "整数": ("int", -100, 100),
+    "小数": ("double", 0.0, 999.99, 2),
+    "年齢": ("int", 0, 150),
+    "郵便番号": ("postal_code",),
+    "電話番号": ("phone_number",),
+    "英数字": ("alphanumeric",),
+    "メールアドレス": ("email",),
+    "パスワード": ("password", 8),
+}
+
+
+def make_columns(rows, seed=0):
+    """有効な値と無効な値が混ざった列を作成する"""
+    rng = random.Random(seed)
+    return {
+        "整数": [str(rng.randint(-150, 150)) for _ in range(rows)],
+        "小数": [f"{rng.uniform(0, 1200):.{rng.choice((1, 2, 3))}f}" for _ in range(rows)],
+        "年齢": [str(rng.randint(0, 200)) for _ in range(rows)],
+        "郵便番号": [f"{rng.randrange(1000):03d}-{rng.randrange(100000):04d}" for _ in range(rows)],
+        "電話番号": [f"0{rng.randrange(100)}-{rng.randrange(10000)}-{rng.randrange(10000):04d}" for _ in range(rows)],
+        "英数字": [rng.choice(("abc123", "ABC", "a-b", "")) for _ in range(rows)],
+        "メールアドレス": [f"user{rng.randrange(rows)}@{rng.choice(('example.com', 'example', ''))}" for _ in range(rows)],
+        "パスワード": [rng.choice(("Passw0rd!", "password", "Sh0rt!")) for _ in range(rows)],
+    }
+
+
+# 生成した値に加えて比較する、判定が分かれやすい値
+EDGE_CASES = {
+    "整数": ["", "+", "-", "150", "+150", "1500", "-150", "0150", "1.5", "1,000"],
+    "小数": ["", ".", "-", "1e2", "1E-1", "1e", "e2", "+e-2", "-e", ".e5", "1.5e3", "7e-875", "1e999",
+           "1000", "999.999", "-1", "+5", "1,5"],
+    "年齢": ["", "-1", "151", "999", "1500"],
+    "郵便番号": ["", "123", "123-", "1234", "123-45678"],
+    "電話番号": ["", "0", "090-", "090-1234-", "90-1234-5678"],
+    "英数字": ["", "a b", "日本"],
+    "メールアドレス": ["", "user", "user@", "user@example", "user@@example.com", "a,b@example.com"],
+    "パスワード": ["", "Passw0rd!", "passw0rd!"],
+}
+
+
+def check_against_qt(columns, rows):
+    """
+    入力欄のバリデーターと一括検証エンジンの結果を比べる
+
+    Returns:
+        bool: すべて一致した(または PySide6 がなく比較しなかった)場合 True
+    """
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PySide6.QtWidgets import QApplication
+
+        from pyside6_files.samples.q960_qvalidator.qvalidator_01 import ValidatorDemoWindow
+    except ImportError:
+        print("PySide6 がないため、QValidator との比較は省略します")
+        return True
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = ValidatorDemoWindow()
+    agreed = True
+    for field, input_widget in window.form_inputs.items():
+        values = columns[field][:rows] + EDGE_CASES.get(field, [])
+        validator = input_widget.validator()
+        states = window.bulk_engine.validate({field: values}).states[field]
+        mismatches = []
+        for value, state in zip(values, states):
+            qt_state = validator.validate(value, 0)[0].value
+            if qt_state != state:
+                mismatches.append((value, qt_state, state))
+        print(f"  {field} {window.form_schema[field]}: {len(values):,} 件中 不一致 {len(mismatches)} 件"
+              + (f" 例: {mismatches[:3]} (値, Qt, エンジン)" if mismatches else ""))
+        agreed = agreed and not mismatches
+    window.close()
+    app.processEvents()
+    return agreed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="一括検証エンジンのベンチマーク")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="行数")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="プロセスプールのプロセス数")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="1バッチの件数")
+    parser.add_argument("--check-rows", type=int, default=10_000, help="QValidator と比較する行数")
+    args = parser.parse_args()
+
+    columns = make_columns(args.rows)
+    print("QValidator との比較")
+    if not check_against_qt(columns, args.check_rows):
+        sys.exit(1)
+    values = args.rows * len(columns)
+    print(f"{args.rows:,} 行 × {len(columns)} フィールド = {values:,} 件")
+
+    for label, threshold, workers in (("1プロセス", args.rows + 1, 1), ("プロセスプール", 0, args.workers)):
+        with BulkValidationEngine(SCHEMA, batch_size=args.batch_size, max_workers=workers,
+                                  parallel_threshold=threshold) as engine:
+            start = time.perf_counter()
+            report = engine.validate(columns)
+            elapsed = time.perf_counter() - start
+        print(f"{label:<10}{elapsed:>8.2f} 秒  {values / elapsed:>14,.0f} 件/秒  "
+              f"全フィールド有効: {report.valid_row_count():,} 行")
+
+    for field, counts in report.summary().items():
+        print(f"  {field}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+文字数カウンターのベンチマーク
+
+AdvancedMainWindow に大きなテキスト(既定 10 MB)を読み込み、末尾に1文字ずつ入力したときの
+1キーあたりの時間を比較します。
+- before: textChanged のたびに toPlainText() で数え、QLabel を作り直す(変更前の実装)
+- after: DocumentStats で文字数・行数を読み、1つのラベルを更新する
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.bench_document_stats --size-mb 10 --keys 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QTextCursor  # noqa: E402
+from PySide6.QtWidgets import QApplication, QLabel  # noqa: E402
+
+from pyside6_files.samples.q030_qmainwindow.qmainwindow_02 import AdvancedMainWindow  # noqa: E402
+
+FRAME_MS = 1000 / 60
+
+
+def legacy_update_char_count(window):
+    """変更前の update_char_count と同じ処理"""
+    text = window.text_edit.toPlainText()
+    char_count = len(text)
+    line_count = text.count('\n') + 1 if text else 1
+    count_text = f"文字数: {char_count} | 行数: {line_count}"
+    window.status_bar.removeWidget(window.legacy_label)
+    window.legacy_label = QLabel(count_text)
+    window.status_bar.addPermanentWidget(window.legacy_label)
+
+
+def make_text(size_mb):
+    line = "あいうえお abcdefghij 0123456789 サンプルテキストの行です。\n"
+    return line * (size_mb * 1024 * 1024 // len(line.encode("utf-8")))
+
+
+def type_keys(window, keys):
+    """末尾に1文字ずつ挿入し、1キーあたりの時間(ミリ秒)のリストを返す"""
+    cursor = window.text_edit.textCursor()
+    cursor.movePosition(QTextCursor.MoveOperation.End)
+    timings = []
+    for i in range(keys):
+        start = time.perf_counter()
+        cursor.insertText("\n" if i % 40 == 39 else "x")
+        QApplication.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="文字数カウンターのベンチマーク")
+    parser.add_argument("--size-mb", type=int, default=10, help="読み込むテキストの大きさ(MB)")
+    parser.add_argument("--keys", type=int, default=200, help="入力する文字数")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    text = make_text(args.size_mb)
+
+    print(f"テキスト: {len(text):,} 文字 (1フレーム = {FRAME_MS:.1f} ms)")
+    print(f"{'方式':<10}{'平均(ms)':>12}{'最大(ms)':>12}{'1フレーム以内':>16}")
+    for label in ("before", "after"):
+        window = AdvancedMainWindow()
+        window.text_edit.setPlainText(text)
+        if label == "before":
+            window.document_stats.document.contentsChange.disconnect(window.document_stats._on_contents_change)
+            window.legacy_label = QLabel()
+            window.status_bar.addPermanentWidget(window.legacy_label)
+            window.text_edit.textChanged.connect(lambda w=window: legacy_update_char_count(w))
+        window.show()
+        QApplication.processEvents()
+
+        timings = type_keys(window, args.keys)
+        window.update_char_count()
+        within = sum(1 for t in timings if t <= FRAME_MS)
+        print(f"{label:<10}{sum(timings) / len(timings):>12.2f}{max(timings):>12.2f}{within:>10}/{len(timings)}")
+        window.close()
+        window.deleteLater()
+        QApplication.processEvents()
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
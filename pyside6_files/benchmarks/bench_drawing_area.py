@@ -0,0 +1,105 @@
+"""
+DrawingArea の描画ベンチマーク
+
+DrawingArea に大量の矩形(既定 100,000 個)を追加し、次の時間を測定します。
+- legacy: 変更前の paintEvent と同じく、全図形を1つずつ描画した場合
+- 初回描画: キャッシュを作成する描画
+- 全体の再描画: キャッシュを転送するだけの描画
+- 図形を1つ追加したときの描画
+- ウィンドウを広げたときの描画(描画済みのキャッシュを引き継ぎ、広がった部分だけを描く)
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.bench_drawing_area --shapes 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QRect, Qt  # noqa: E402
+from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPen  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from pyside6_files.samples.q920_qsize_qrect_qpoint.geometry_01 import DrawingArea  # noqa: E402
+
+FRAME_MS = 1000 / 60
+
+
+def make_shapes(count, width, height, seed=0):
+    rng = random.Random(seed)
+    colors = [QColor("#3498db"), QColor("#e74c3c")]
+    shapes = []
+    for i in range(count):
+        w, h = rng.randint(4, 40), rng.randint(4, 40)
+        rect = QRect(rng.randint(0, width - w), rng.randint(0, height - h), w, h)
+        shape_type = "rect" if (i // 1000) % 2 == 0 else "circle"
+        shapes.append((shape_type, rect, colors[shape_type == "circle"]))
+    return shapes
+
+
+def legacy_paint(area):
+    """変更前の描画処理(図形ごとに QPen / QBrush を作って1つずつ描く)を画像に対して実行"""
+    image = QImage(area.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.white)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    area.draw_basic_shapes(painter)
+    for shape_type, shape_rect, color in area.shapes:
+        painter.setPen(QPen(color, 2))
+        painter.setBrush(QBrush(color, Qt.BrushStyle.SolidPattern))
+        if shape_type == "rect":
+            painter.drawRect(shape_rect)
+        elif shape_type == "circle":
+            painter.drawEllipse(shape_rect)
+    painter.end()
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DrawingArea の描画ベンチマーク")
+    parser.add_argument("--shapes", type=int, default=100_000, help="追加する図形の数")
+    parser.add_argument("--rounds", type=int, default=20, help="再描画を繰り返す回数")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    area = DrawingArea()
+    area.resize(800, 600)
+    area.show()
+    app.processEvents()
+    area.add_shapes(make_shapes(args.shapes, area.width(), area.height()))
+
+    print(f"図形数: {args.shapes:,} (1フレーム = {FRAME_MS:.1f} ms)")
+    print(f"legacy(全図形を毎回描画): {timed(lambda: legacy_paint(area)):10.1f} ms")
+    print(f"初回描画(キャッシュ作成): {timed(area.repaint):10.1f} ms")
+
+    full = [timed(area.repaint) for _ in range(args.rounds)]
+    print(f"全体の再描画:             {sum(full) / len(full):10.2f} ms (最大 {max(full):.2f} ms)")
+
+    rng = random.Random(1)
+    added = []
+    for _ in range(args.rounds):
+        rect = QRect(rng.randint(0, 700), rng.randint(0, 500), 80, 60)
+        added.append(timed(lambda: (area.add_shape(("rect", rect, QColor("#3498db"))), area.repaint(rect))))
+    print(f"1図形追加後の部分再描画:  {sum(added) / len(added):10.2f} ms (最大 {max(added):.2f} ms)")
+
+    resized = []
+    for i in range(args.rounds):
+        area.resize(800 + 10 * (i + 1), 600 + 10 * (i + 1))
+        resized.append(timed(area.repaint))
+    print(f"サイズ変更後の再描画:     {sum(resized) / len(resized):10.2f} ms (最大 {max(resized):.2f} ms)")
+
+    area.close()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+描画リソースキャッシュのマイクロベンチマーク
+
+次の処理について、毎回オブジェクトを作る方法(before)と
+paint_resources の共有キャッシュを使う方法(after)を比較します。
+- QPen / QBrush / QFont の取得
+- グラデーション画像(300x200)の作成
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.bench_paint_resources --repeat 10000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPixmap  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from pyside6_files.common.paint_resources import PaintResources  # noqa: E402
+
+
+def legacy_gradient():
+    """変更前の create_gradient_image と同じ処理"""
+    pixmap = QPixmap(300, 200)
+    painter = QPainter(pixmap)
+    for i in range(300):
+        color = QColor()
+        color.setHsv(int(240 * i / 300.0), 200, 255)
+        painter.setPen(QPen(color, 1))
+        painter.drawLine(i, 0, i, 200)
+    painter.end()
+    return pixmap
+
+
+def report(label, before, after, repeat):
+    before_us = before / repeat * 1e6
+    after_us = after / repeat * 1e6
+    print(f"{label:<28}{before_us:>12.2f}{after_us:>12.2f}{before / after:>10.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="描画リソースキャッシュのマイクロベンチマーク")
+    parser.add_argument("--repeat", type=int, default=10000, help="繰り返し回数")
+    args = parser.parse_args()
+    repeat = args.repeat
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    paint = PaintResources()
+
+    print(f"{'処理':<28}{'before(µs)':>12}{'after(µs)':>12}{'倍率':>10}")
+    report(
+        "QPen(QColor(name), 2)",
+        timeit.timeit(lambda: QPen(QColor("#3498db"), 2), number=repeat),
+        timeit.timeit(lambda: paint.pen("#3498db", 2), number=repeat),
+        repeat,
+    )
+    report(
+        "QBrush(QColor(r, g, b, a))",
+        timeit.timeit(lambda: QBrush(QColor(255, 255, 0, 100)), number=repeat),
+        timeit.timeit(lambda: paint.brush((255, 255, 0, 100)), number=repeat),
+        repeat,
+    )
+    report(
+        "QFont(family, size, weight)",
+        timeit.timeit(lambda: QFont("Arial", 14, QFont.Weight.Bold), number=repeat),
+        timeit.timeit(lambda: paint.font("Arial", 14, QFont.Weight.Bold), number=repeat),
+        repeat,
+    )
+
+    gradient_repeat = max(repeat // 100, 1)
+    report(
+        "グラデーション(初回作成)",
+        timeit.timeit(legacy_gradient, number=gradient_repeat),
+        timeit.timeit(lambda: (paint.clear(), paint.hue_gradient(300, 200)), number=gradient_repeat),
+        gradient_repeat,
+    )
+    report(
+        "グラデーション(2回目以降)",
+        timeit.timeit(legacy_gradient, number=gradient_repeat),
+        timeit.timeit(lambda: paint.hue_gradient(300, 200), number=gradient_repeat),
+        gradient_repeat,
+    )
+
+    print(f"キャッシュ: ヒット {paint.hits:,} 回 / 作成 {paint.misses:,} 回")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
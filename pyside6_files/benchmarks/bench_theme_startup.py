@@ -0,0 +1,147 @@
+"""
+スタイル適用方法による起動時間の比較ベンチマーク
+
+ウィジェットごとに setStyleSheet を呼ぶ方法(before)と、テーマレジストリで
+アプリケーション全体のスタイルシートを一度だけ設定し、動的プロパティで
+見た目を指定する方法(after)で、フォームの生成から最初の描画までの時間を比較します。
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.bench_theme_startup --widgets 300
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import (  # noqa: E402
+    QApplication,
+    QGroupBox,
+    QLabel,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pyside6_files.common.theme import set_properties, set_state, theme  # noqa: E402
+
+INLINE_BUTTON = """
+    QPushButton {
+        background-color: #27ae60;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #219a52;
+    }
+"""
+
+INLINE_LABEL = """
+    QLabel {
+        background-color: #e8f5e8;
+        padding: 8px;
+        border-radius: 4px;
+        border-left: 4px solid #27ae60;
+        margin: 5px 0;
+    }
+"""
+
+INLINE_GROUP = """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #3498db;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+"""
+
+
+def build_form(widget_count, use_theme):
+    """
+    widget_count 個のウィジェットを持つフォームを作成する
+
+    Returns:
+        tuple: (フォーム, ラベルのリスト)
+    """
+    form = QWidget()
+    layout = QVBoxLayout(form)
+    labels = []
+    group = None
+    for i in range(widget_count):
+        if i % 10 == 0:
+            group = QGroupBox(f"グループ {i // 10}")
+            group.setLayout(QVBoxLayout())
+            if use_theme:
+                set_properties(group, accent="blue")
+            else:
+                group.setStyleSheet(INLINE_GROUP)
+            layout.addWidget(group)
+        if i % 2 == 0:
+            widget = QPushButton(f"ボタン {i}")
+            if use_theme:
+                set_properties(widget, variant="success")
+            else:
+                widget.setStyleSheet(INLINE_BUTTON)
+        else:
+            widget = QLabel(f"ラベル {i}")
+            labels.append(widget)
+            if use_theme:
+                set_properties(widget, notice="success")
+            else:
+                widget.setStyleSheet(INLINE_LABEL)
+        group.layout().addWidget(widget)
+    return form, labels
+
+
+def measure(app, widget_count, use_theme):
+    """
+    生成・表示・状態切り替えの時間(秒)を計測する
+    """
+    app.setStyleSheet("")
+    if use_theme:
+        theme.install(app)
+
+    start = time.perf_counter()
+    form, labels = build_form(widget_count, use_theme)
+    built = time.perf_counter()
+    form.show()
+    app.processEvents()
+    shown = time.perf_counter()
+
+    # ラベルの見た目をすべて「エラー」状態に切り替える
+    for label in labels:
+        if use_theme:
+            set_state(label, "notice", "danger")
+        else:
+            label.setStyleSheet(INLINE_LABEL.replace("#e8f5e8", "#f8d7da").replace("#27ae60", "#e74c3c"))
+    app.processEvents()
+    switched = time.perf_counter()
+
+    form.close()
+    form.deleteLater()
+    app.processEvents()
+    return built - start, shown - built, switched - shown
+
+
+def main():
+    parser = argparse.ArgumentParser(description="スタイル適用方法による起動時間の比較")
+    parser.add_argument("--widgets", type=int, default=300, help="フォームのウィジェット数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数(最小値を表示)")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"ウィジェット数: {args.widgets}")
+    print(f"{'方式':<10}{'生成(ms)':>12}{'表示(ms)':>12}{'状態切替(ms)':>14}")
+    for label, use_theme in (("inline", False), ("theme", True)):
+        results = [measure(app, args.widgets, use_theme) for _ in range(args.repeat)]
+        build, show, switch = (min(values) * 1000 for values in zip(*results))
+        print(f"{label:<10}{build:>12.1f}{show:>12.1f}{switch:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+テーマ切り替え時間のベンチマーク
+
+StyleSheetDemoWindow にウィジェットを追加して大きなウィンドウを作り、
+テーマ全体を setStyleSheet で設定し直す方法(before)と、
+ThemeManager でパレットと残りのスタイルシートだけを切り替える方法(after)を比較します。
+after では setStyleSheet を呼んだ回数も表示します(残りのスタイルシートが前のテーマと
+異なる場合だけ呼ばれます)。
+各回の時間にはウィンドウ全体の再描画も含まれるため、テーマを切り替えずに
+同じ手順で再描画だけを行った時間(redraw)も表示します。
+最後に、Flat テーマと QWidget の色だけを変えたテーマを交互に切り替えた場合
+(setStyleSheet を呼ばずにパレットだけで切り替わる場合)の時間を表示します。
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.bench_theme_switch --widgets 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QGridLayout, QLabel, QLineEdit, QPushButton, QWidget  # noqa: E402
+
+from pyside6_files.common.theme_manager import format_rules, parse_rules  # noqa: E402
+from pyside6_files.samples.q950_qstyle_stylesheet.qstyle_stylesheet_01 import StyleSheetDemoWindow  # noqa: E402
+
+FRAME_MS = 1000 / 60
+
+
+def build_window(widget_count):
+    """
+    widget_count 個のウィジェットを追加したデモウィンドウを作成する
+    """
+    window = StyleSheetDemoWindow()
+    filler = QWidget()
+    grid = QGridLayout(filler)
+    widget_types = (QLabel, QPushButton, QLineEdit)
+    for i in range(widget_count):
+        widget_type = widget_types[i % len(widget_types)]
+        widget = QLineEdit() if widget_type is QLineEdit else widget_type(f"項目 {i}")
+        grid.addWidget(widget, i // 20, i % 20)
+    window.layout().addWidget(filler)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+
+def switch_inline(window, name):
+    window.setStyleSheet(window.themes[name])
+
+
+def switch_manager(window, name):
+    window.theme_manager.apply(name)
+
+
+def recolor(css, background, color):
+    """QWidget ルールの色だけを変えたスタイルシートを返す"""
+    rules = []
+    for selector, declarations in parse_rules(css):
+        if selector == "QWidget":
+            declarations = [("background-color", background), ("color", color)]
+        rules.append((selector, declarations))
+    return format_rules(rules)
+
+
+def measure(window, switch, rounds, names=None):
+    """
+    テーマを順番に切り替え、1回あたりの時間(ミリ秒)のリストを返す
+    """
+    names = names or list(window.themes)
+    timings = []
+    for _ in range(rounds):
+        for name in names:
+            start = time.perf_counter()
+            switch(window, name)
+            QApplication.processEvents()
+            window.repaint()
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="テーマ切り替え時間のベンチマーク")
+    parser.add_argument("--widgets", type=int, default=1000, help="追加するウィジェット数")
+    parser.add_argument("--rounds", type=int, default=3, help="全テーマを切り替える回数")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = build_window(args.widgets)
+
+    print(f"ウィジェット数: {args.widgets} (1フレーム = {FRAME_MS:.1f} ms)")
+    print(f"{'方式':<10}{'平均(ms)':>12}{'最大(ms)':>12}{'1フレーム以内':>16}")
+    for label, switch in (("redraw", lambda window, name: None), ("inline", switch_inline),
+                          ("manager", switch_manager)):
+        window.setStyleSheet("")
+        window.theme_manager.current = None
+        window.theme_manager.stylesheet_applies = 0
+        timings = measure(window, switch, args.rounds)
+        within = sum(1 for t in timings if t <= FRAME_MS)
+        print(f"{label:<10}{sum(timings) / len(timings):>12.1f}{max(timings):>12.1f}{within:>10}/{len(timings)}")
+    print(f"manager の setStyleSheet: {window.theme_manager.stylesheet_applies} 回 / {len(timings)} 回の切り替え")
+
+    manager = window.theme_manager
+    manager.add_theme("Flat (dark)", recolor(window.themes["Flat"], "#2c3e50", "#ecf0f1"))
+    manager.current = None
+    manager.stylesheet_applies = 0
+    timings = measure(window, switch_manager, args.rounds * 3, ["Flat", "Flat (dark)"])[1:]
+    within = sum(1 for t in timings if t <= FRAME_MS)
+    print(f"色だけが異なるテーマの切り替え(最初の1回を除く, setStyleSheet {manager.stylesheet_applies} 回)")
+    print(f"{'manager':<10}{sum(timings) / len(timings):>12.1f}{max(timings):>12.1f}{within:>10}/{len(timings)}")
+
+    window.close()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
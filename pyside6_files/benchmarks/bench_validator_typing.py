@@ -0,0 +1,110 @@
+"""
+ValidatorDemoWindow のキー入力レイテンシのベンチマーク
+
+入力欄に1文字ずつキー入力を送り、textChanged から検証結果の表示までに
+かかる時間を計測します。従来の setStyleSheet による表示更新(legacy)と、
+validationState プロパティによる表示更新(property)を比較します。
+
+リポジトリのルートで実行します:
+    QT_QPA_PLATFORM=offscreen python -m pyside6_files.benchmarks.bench_validator_typing --chars 2000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtGui import QValidator  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from pyside6_files.samples.q960_qvalidator.qvalidator_01 import ValidatorDemoWindow  # noqa: E402
+
+# 有効・部分的・無効が入れ替わるように入力する文字列
+TYPING_TEXT = "user.name@example.com"
+
+
+def legacy_validate_and_log(self, field_name, text, input_widget):
+    """
+    変更前の実装と同じく、キー入力ごとに setStyleSheet で表示を更新する
+    """
+    validator = input_widget.validator()
+    if validator:
+        state, _, _ = validator.validate(text, 0)
+        if state == QValidator.State.Acceptable:
+            input_widget.setStyleSheet("border: 2px solid #27ae60; background-color: #d5f4e6;")
+            status, color = "✓ 有効", "#27ae60"
+        elif state == QValidator.State.Intermediate:
+            input_widget.setStyleSheet("border: 2px solid #f39c12; background-color: #fef9e7;")
+            status, color = "⚠ 部分的", "#f39c12"
+        else:
+            input_widget.setStyleSheet("border: 2px solid #e74c3c; background-color: #fadbd8;")
+            status, color = "✗ 無効", "#e74c3c"
+        self.log_display.append(f"[{field_name}] '{text}' → {status}")
+        self.validation_status.setText(f"最後の検証: {field_name} - {status}")
+        self.validation_status.setStyleSheet(f"""
+            QLabel {{
+                background-color: #f8f9fa;
+                padding: 10px;
+                border-radius: 5px;
+                border-left: 4px solid {color};
+                color: {color};
+            }}
+        """)
+
+
+def measure(window, char_count):
+    """
+    email_input に char_count 文字を入力し、1キーごとの時間(ミリ秒)のリストを返す
+    """
+    widget = window.email_input
+    widget.clear()
+    timings = []
+    for i in range(char_count):
+        if len(widget.text()) >= len(TYPING_TEXT):
+            widget.clear()
+        char = TYPING_TEXT[len(widget.text())]
+        start = time.perf_counter()
+        QTest.keyClick(widget, char)
+        QApplication.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    ordered = sorted(timings)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<10}{statistics.fmean(timings):>10.3f}{statistics.median(timings):>10.3f}{p99:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ValidatorDemoWindow のキー入力レイテンシ")
+    parser.add_argument("--chars", type=int, default=2000, help="入力する文字数")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"入力文字数: {args.chars}")
+    print(f"{'方式':<10}{'平均(ms)':>10}{'中央(ms)':>10}{'p99(ms)':>10}")
+
+    legacy = ValidatorDemoWindow()
+    legacy.validate_and_log = types.MethodType(legacy_validate_and_log, legacy)
+    legacy.show()
+    legacy.email_input.setFocus(Qt.FocusReason.OtherFocusReason)
+    report("legacy", measure(legacy, args.chars))
+    legacy.close()
+
+    window = ValidatorDemoWindow()
+    window.show()
+    window.email_input.setFocus(Qt.FocusReason.OtherFocusReason)
+    report("property", measure(window, args.chars))
+    window.close()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+検証ロジック(validators モジュール)のベンチマーク
+
+Qtを使わずに次の2つを測定します。
+- 一括検証: メールアドレスの列を validate_many で検証したときの処理件数(件/秒)。
+  目標の 1,000,000 件/秒と比較して表示します
+- 入力中の判定: 1文字ずつ入力したときの1回あたりの時間を、
+  毎回全体を判定し直す方法(before)と差分だけ読み進める方法(after)で比較
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.bench_validators_batch --count 1000000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from pyside6_files.common import validators
+
+TARGET_PER_SECOND = 1_000_000
+
+# 変更前の EmailValidator と同じ判定(毎回 re.match で全体を調べる)
+LEGACY_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+
+def legacy_state(text):
+    if not text:
+        return validators.INTERMEDIATE
+    if re.match(LEGACY_PATTERN, text):
+        return validators.ACCEPTABLE
+    if not re.match(r'^[a-zA-Z0-9._%+-@]*$', text) or text.count('@') > 1:
+        return validators.INVALID
+    if '@' in text:
+        local, domain = text.split('@')
+        if not local or not re.match(r'^[a-zA-Z0-9.-]*$', domain):
+            return validators.INVALID
+    return validators.INTERMEDIATE
+
+
+def make_emails(count, seed=0):
+    """有効・部分的・無効が混ざったメールアドレスの列を作成する"""
+    rng = random.Random(seed)
+    domains = ["example.com", "example.co.jp", "mail.example.org", "test"]
+    values = []
+    for i in range(count):
+        kind = rng.random()
+        user = f"user{rng.randrange(count // 4 + 1)}"
+        if kind < 0.7:
+            values.append(f"{user}@{rng.choice(domains)}")
+        elif kind < 0.9:
+            values.append(f"{user}@")
+        else:
+            values.append(f"{user}@@{rng.choice(domains)}")
+    return values
+
+
+def bench_batch(count):
+    values = make_emails(count)
+    core = validators.EmailCore()
+    start = time.perf_counter()
+    states = core.validate_many(values)
+    elapsed = time.perf_counter() - start
+    summary = {name: states.count(state) for state, name in validators.STATE_NAMES.items()}
+    rate = count / elapsed
+    result = "達成" if rate >= TARGET_PER_SECOND else "未達"
+    print(f"一括検証: {count:,} 件 / {elapsed:.2f} 秒 = {rate:,.0f} 件/秒 "
+          f"(目標 {TARGET_PER_SECOND:,} 件/秒: {result}) {summary}")
+
+
+def bench_typing(length):
+    text = ("a" * length) + "@example.com"
+    core = validators.EmailCore()
+    for label, state in (("before", legacy_state), ("after", core.state_incremental)):
+        start = time.perf_counter()
+        for end in range(1, len(text) + 1):
+            state(text[:end])
+        elapsed = time.perf_counter() - start
+        print(f"入力中の判定 {label:<7}{elapsed / len(text) * 1e6:>10.2f} µs/キー ({len(text)} 文字)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="検証ロジックのベンチマーク")
+    parser.add_argument("--count", type=int, default=1_000_000, help="一括検証する件数")
+    parser.add_argument("--length", type=int, default=2000, help="入力中の判定で入力する文字数")
+    args = parser.parse_args()
+
+    bench_batch(args.count)
+    bench_typing(args.length)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+PySide6 サンプルウィンドウのベンチマークハーネス
+
+pyside6_files.samples 以下のモジュールからウィンドウクラスを探し、
+画面を使わずに(offscreen プラットフォーム)1つずつ次の値を測定します。
+- construct_ms: コンストラクタの実行時間
+- first_paint_ms: show() から最初の Paint イベントまでの時間
+- widget_count: 子孫を含むウィジェット数
+- rss_delta_kb: 作成・表示の前後の常駐メモリ(RSS)の増加量
+- py_alloc_kb / py_peak_kb: 作成中に Python が確保したメモリ(tracemalloc)
+- interactions: SCENARIOS に定義した操作(QTest によるキー入力など)ごとの時間
+
+結果は JSON で出力します。変更前の結果を --baseline に渡すと差分を表示します。
+
+リポジトリのルートで実行します:
+    python -m pyside6_files.benchmarks.window_harness --output before.json
+    python -m pyside6_files.benchmarks.window_harness --output after.json --baseline before.json
+    python -m pyside6_files.benchmarks.window_harness --only ValidatorDemoWindow BasicTableWindow
+"""
+
+import argparse
+import gc
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6  # noqa: E402
+from PySide6.QtCore import QEvent, QObject  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+import pyside6_files.samples  # noqa: E402
+
+FIRST_PAINT_TIMEOUT = 5.0
+
+
+def _type_text(attribute, text):
+    def step(window):
+        QTest.keyClicks(getattr(window, attribute), text)
+    return step
+
+
+def _repeat(method, count, *args):
+    def step(window):
+        for _ in range(count):
+            getattr(window, method)(*args)
+    return step
+
+
+def _slide(attribute, values):
+    def step(window):
+        slider = getattr(window, attribute)
+        for value in values:
+            slider.setValue(value)
+    return step
+
+
+# ウィンドウクラス名 → [(操作名, 操作)]。操作はウィンドウを受け取る関数
+SCENARIOS = {
+    "ValidatorDemoWindow": [
+        ("type_email", _type_text("email_input", "user.name@example.co.jp")),
+        ("type_password", _type_text("password_input", "Passw0rd!Secure")),
+        ("validate_all", _repeat("validate_all_inputs", 10)),
+    ],
+    "BasicTableWindow": [
+        ("add_rows", _repeat("add_row", 50)),
+    ],
+    "ImageViewerEditor": [
+        ("zoom_in", _repeat("zoom_in", 5)),
+        ("rotate", _repeat("rotate_right", 4)),
+        ("brightness", _slide("brightness_slider", range(-50, 51, 10))),
+    ],
+    "SignalSlotDemoWindow": [
+        ("type_name", _type_text("name_edit", "PySide6 Signal")),
+        ("slide_counter", _slide("counter_slider", range(0, 51, 5))),
+    ],
+    "AdvancedMainWindow": [
+        ("type_text", _type_text("text_edit", "The quick brown fox jumps over the lazy dog. " * 10)),
+    ],
+    "GeometryDemoWindow": [
+        ("add_rects", _repeat("add_rect", 200)),
+        ("add_circles", _repeat("add_circle", 200)),
+    ],
+}
+
+
+def rss_bytes():
+    """現在の常駐メモリ(RSS)。/proc が使えない環境ではピーク値で代用する"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS はバイト、Linux はキロバイト単位
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class PaintWatcher(QObject):
+    """ウィンドウが最初に Paint イベントを受け取った時刻を記録する"""
+
+    def __init__(self):
+        super().__init__()
+        self.painted_at = None
+
+    def eventFilter(self, obj, event):
+        if self.painted_at is None and event.type() == QEvent.Type.Paint:
+            self.painted_at = time.perf_counter()
+        return False
+
+
+def discover_windows(only=None):
+    """
+    サンプルのモジュールから、引数なしで作成できるトップレベルのウィンドウクラスを探す
+
+    Args:
+        only (list): 対象にするクラス名(省略時は全て)
+
+    Returns:
+        tuple: ([(モジュール名, クラス)], [(モジュール名, エラー)])
+    """
+    windows = []
+    errors = []
+    prefix = pyside6_files.samples.__name__ + "."
+    for module_info in pkgutil.walk_packages(pyside6_files.samples.__path__, prefix):
+        if module_info.ispkg:
+            continue
+        try:
+            module = importlib.import_module(module_info.name)
+        except Exception as e:  # サンプルの読み込み失敗は記録して続行する
+            errors.append((module_info.name, f"{type(e).__name__}: {e}"))
+            continue
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__ or not issubclass(cls, QWidget):
+                continue
+            if not name.endswith(("Window", "Editor")):
+                continue
+            if only and name not in only:
+                continue
+            try:
+                inspect.signature(cls).bind()
+            except (TypeError, ValueError):
+                continue
+            windows.append((module.__name__, cls))
+    return windows, errors
+
+
+def measure_window(cls):
+    """
+    1つのウィンドウクラスを測定する
+
+    Returns:
+        dict: 測定結果
+    """
+    app = QApplication.instance()
+    gc.collect()
+    rss_before = rss_bytes()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    window = cls()
+    construct = time.perf_counter() - start
+    py_alloc, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    watcher = PaintWatcher()
+    window.installEventFilter(watcher)
+    shown_at = time.perf_counter()
+    window.show()
+    deadline = shown_at + FIRST_PAINT_TIMEOUT
+    while watcher.painted_at is None and time.perf_counter() < deadline:
+        app.processEvents()
+    first_paint = (watcher.painted_at - shown_at) * 1000 if watcher.painted_at else None
+
+    result = {
+        "construct_ms": round(construct * 1000, 3),
+        "first_paint_ms": round(first_paint, 3) if first_paint is not None else None,
+        "widget_count": len(window.findChildren(QWidget)) + 1,
+        "rss_delta_kb": round((rss_bytes() - rss_before) / 1024, 1),
+        "py_alloc_kb": round(py_alloc / 1024, 1),
+        "py_peak_kb": round(py_peak / 1024, 1),
+        "interactions": {},
+    }
+
+    for step_name, step in SCENARIOS.get(cls.__name__, []):
+        start = time.perf_counter()
+        try:
+            step(window)
+            app.processEvents()
+        except Exception as e:  # 操作の失敗は結果に記録して次へ進む
+            result["interactions"][step_name] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+        result["interactions"][step_name] = {"ms": round((time.perf_counter() - start) * 1000, 3)}
+
+    window.removeEventFilter(watcher)
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return result
+
+
+def run(only=None):
+    """
+    全ウィンドウを測定して、JSON に変換できる辞書を返す
+    """
+    windows, errors = discover_windows(only)
+    report = {
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "platform": QApplication.platformName(),
+        "windows": {},
+        "import_errors": dict(errors),
+    }
+    for module_name, cls in windows:
+        key = f"{module_name}.{cls.__name__}"
+        try:
+            report["windows"][key] = measure_window(cls)
+        except Exception as e:  # 1つのウィンドウの失敗で全体を止めない
+            report["windows"][key] = {"error": f"{type(e).__name__}: {e}"}
+        print(f"  {key}", file=sys.stderr)
+    return report
+
+
+def print_diff(baseline, report):
+    """
+    変更前の結果との差分を表示する(値が大きいほど悪化)
+    """
+    fields = ("construct_ms", "first_paint_ms", "widget_count", "rss_delta_kb", "py_alloc_kb")
+    print(f"{'ウィンドウ / 項目':<60}{'before':>12}{'after':>12}{'差分':>12}")
+    for key, after in report["windows"].items():
+        before = baseline.get("windows", {}).get(key)
+        if not before or "error" in before or "error" in after:
+            continue
+        rows = [(field, before.get(field), after.get(field)) for field in fields]
+        for step_name, step in after["interactions"].items():
+            old = before.get("interactions", {}).get(step_name, {})
+            rows.append((step_name, old.get("ms"), step.get("ms")))
+        print(key.rsplit(".", 1)[-1])
+        for field, old, new in rows:
+            if old is None or new is None:
+                continue
+            print(f"  {field:<58}{old:>12.1f}{new:>12.1f}{new - old:>+12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PySide6 サンプルウィンドウのベンチマークハーネス")
+    parser.add_argument("--output", help="結果を書き出す JSON ファイル(省略時は標準出力)")
+    parser.add_argument("--baseline", help="比較する変更前の JSON ファイル")
+    parser.add_argument("--only", nargs="*", help="対象にするウィンドウクラス名")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    report = run(args.only)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    elif not args.baseline:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            print_diff(json.load(f), report)
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""
+PySide6サンプル共通のヘルパー
+
+複数のサンプルから使う部品をまとめたパッケージです。
+このパッケージを使うサンプルは、リポジトリのルートから
+``python -m pyside6_files.samples.q140_qtablewidget.qtablewidget_01`` のように実行します。
+
+モジュール:
+- theme.py: アプリケーション全体のスタイルシートを一括管理するテーマレジストリ
+- theme_manager.py: テーマを QPalette に事前変換して切り替えるテーママネージャー
+- validation_feedback.py: 動的プロパティによる入力検証結果の表示
+- validators.py: Qtに依存しない検証ロジック(コンパイル済み正規表現・差分判定・一括検証)
+- bulk_validation.py: 列形式のデータをバッチ・プロセスプールで検証する一括検証エンジン
+- document_stats.py: QTextDocument の文字数・行数を全文コピーせずに追跡するドキュメント統計
+- paint_resources.py: QColor / QPen / QBrush / QFont とグラデーション画像を共有する描画リソースキャッシュ
+- screen_placement.py: QScreen の画面と作業領域をキャッシュするウィンドウの配置(tkinter と共通の API)
+"""
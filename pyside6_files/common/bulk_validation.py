@@ -0,0 +1,205 @@
+"""
+一括検証エンジン - 列形式のデータをまとめて検証する
+
+CSVの取り込みなどで大量の行を検証するためのエンジンです。
+フィールドごとに検証の種類(メールアドレス・整数・郵便番号など)を定義したスキーマを渡し、
+列(フィールド名 → 値のリスト)単位で検証します。
+
+- 値は batch_size 件ずつのバッチに分けて検証します
+- max_workers に 2 以上を指定し、行数が parallel_threshold 以上の場合は、
+  バッチをプロセスプールに分散します
+- 結果は行ごとの状態の配列(array('b'))と、状態ごとの件数の集計で返します
+
+既定では1プロセスで検証します。検証は1件あたり 0.1〜1.5 µs と軽く、ワーカーに値を
+渡すための pickle(1件あたり 0.05〜0.4 µs)とプロセスの起動の方が高くつくためです
+(300,000 行 × 8 フィールドで、プロセスプールの 1.97 秒に対して1プロセスは 1.36 秒)。
+プロセスプールは、Python で判定する重いフィールドが多い場合などに、
+bench_bulk_validation で効果を確かめてから指定してください。
+
+フォームの「全て検証」も、1行だけのデータとしてこのエンジンを使います。
+スキーマは入力欄に設定したバリデーターから作ります(qvalidator_01.field_spec)。
+
+使い方:
+    from pyside6_files.common.bulk_validation import BulkValidationEngine
+
+    schema = {"email": ("email",), "age": ("int", 0, 150)}
+    with BulkValidationEngine(schema) as engine:
+        report = engine.validate({"email": emails, "age": ages})
+    print(report.summary(), report.valid_row_count())
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from pyside6_files.common import validators
+
+# スキーマで指定できる検証の種類 → 検証ロジックを作る関数
+FIELD_TYPES = {
+    "email": validators.EmailCore,
+    "password": validators.PasswordCore,
+    "int": validators.IntRangeCore,
+    "double": validators.DoubleRangeCore,
+    "postal_code": validators.postal_code_core,
+    "phone_number": validators.phone_number_core,
+    "alphanumeric": validators.alphanumeric_core,
+    "regex": validators.regex_core,
+}
+
+# ワーカープロセスごとに作成済みの検証ロジック
+_worker_cores = {}
+
+
+def _get_core(spec):
+    core = _worker_cores.get(spec)
+    if core is None:
+        kind, *args = spec
+        core = _worker_cores[spec] = FIELD_TYPES[kind](*args)
+    return core
+
+
+def _validate_batch(spec, values):
+    """
+    1つのバッチを検証する(ワーカープロセスで実行される)
+
+    検証ロジックのインスタンスはプロセス間で受け渡さず、
+    スキーマの指定(タプル)から各プロセスで作成します。
+
+    Returns:
+        bytes: 各値の検証状態
+    """
+    return bytes(_get_core(spec).validate_many(values))
+
+
+class ValidationReport:
+    """
+    一括検証の結果
+
+    Attributes:
+        row_count (int): 行数
+        states (dict): フィールド名 → 各行の検証状態(array('b'))
+    """
+
+    def __init__(self, row_count, states):
+        self.row_count = row_count
+        self.states = states
+
+    def summary(self):
+        """
+        フィールドごとの状態別件数
+
+        Returns:
+            dict: {フィールド名: {"acceptable": 件数, "intermediate": 件数, "invalid": 件数}}
+        """
+        result = {}
+        for field, states in self.states.items():
+            counts = bytes(states)
+            result[field] = {
+                name: counts.count(state) for state, name in validators.STATE_NAMES.items()
+            }
+        return result
+
+    def row_valid(self, row):
+        """その行の全フィールドが Acceptable かどうか"""
+        return all(states[row] == validators.ACCEPTABLE for states in self.states.values())
+
+    def valid_row_count(self):
+        """全フィールドが Acceptable の行数"""
+        if not self.states:
+            return self.row_count
+        acceptable = validators.ACCEPTABLE
+        columns = list(self.states.values())
+        return sum(1 for row in zip(*columns) if min(row) == acceptable)
+
+    def invalid_rows(self, field):
+        """指定したフィールドが Acceptable でない行番号のリスト"""
+        acceptable = validators.ACCEPTABLE
+        return [row for row, state in enumerate(self.states[field]) if state != acceptable]
+
+
+class BulkValidationEngine:
+    """
+    スキーマに従って列形式のデータを検証するエンジン
+
+    Args:
+        schema (dict): フィールド名 → (種類, 引数...) のタプル。種類は FIELD_TYPES のキー
+        batch_size (int): 1つのバッチの件数
+        max_workers (int): プロセス数(1 はプロセスプールを使わない。None は CPU 数)
+        parallel_threshold (int): この行数以上のときにプロセスプールを使う
+    """
+
+    def __init__(self, schema, batch_size=50_000, max_workers=1, parallel_threshold=200_000):
+        for field, spec in schema.items():
+            if spec[0] not in FIELD_TYPES:
+                raise ValueError(f"未対応の検証の種類です: {field}={spec[0]}")
+        self.schema = {field: tuple(spec) for field, spec in schema.items()}
+        self.batch_size = batch_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self._executor = None
+
+    def validate(self, columns):
+        """
+        列形式のデータを検証する
+
+        Args:
+            columns (dict): フィールド名 → 値(文字列)のリスト。スキーマにないフィールドは無視する
+
+        Returns:
+            ValidationReport: 検証結果
+        """
+        fields = [field for field in self.schema if field in columns]
+        lengths = {len(columns[field]) for field in fields}
+        if len(lengths) > 1:
+            raise ValueError("列ごとに行数が異なります")
+        row_count = lengths.pop() if lengths else 0
+
+        if row_count >= self.parallel_threshold and self.max_workers > 1:
+            states = self._validate_parallel(fields, columns)
+        else:
+            states = {
+                field: array("b", _validate_batch(self.schema[field], columns[field]))
+                for field in fields
+            }
+        return ValidationReport(row_count, states)
+
+    def validate_row(self, row):
+        """
+        1行だけを検証する(フォームの入力値など)
+
+        Args:
+            row (dict): フィールド名 → 値
+
+        Returns:
+            ValidationReport: 検証結果
+        """
+        return self.validate({field: [value] for field, value in row.items()})
+
+    def _validate_parallel(self, fields, columns):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        size = self.batch_size
+        futures = []
+        for field in fields:
+            values = columns[field]
+            spec = self.schema[field]
+            for start in range(0, len(values), size):
+                futures.append((field, self._executor.submit(_validate_batch, spec, values[start:start + size])))
+
+        states = {field: array("b") for field in fields}
+        for field, future in futures:
+            states[field].frombytes(future.result())
+        return states
+
+    def close(self):
+        """プロセスプールを終了する"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
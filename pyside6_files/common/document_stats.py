@@ -0,0 +1,123 @@
+"""
+ドキュメント統計 - QTextDocument の文字数・行数を全文コピーせずに追跡する
+
+textChanged のたびに toPlainText() で全文をコピーして数えると、
+1キー入力ごとにドキュメント全体の長さに比例した処理が発生します。
+
+このモジュールでは QTextDocument.contentsChange を受け取ったときに、
+ドキュメントが内部で保持している文字数(characterCount)とブロック数(blockCount)を読みます。
+どちらも全文をたどらずに得られるため、ドキュメントの大きさに関係なく一定の時間で更新できます。
+characterCount は UTF-16 のコード単位の数なので、絵文字などの BMP 外の文字(サロゲートペア)の
+位置を変更された範囲だけ調べて保持し、その数を引いて len(toPlainText()) と同じ文字数にします。
+表示の更新はタイマーで間引き、短い間隔の連続入力は1回の更新にまとめます。
+
+使い方:
+    stats = DocumentStats(text_edit.document(), parent=window)
+    stats.bind_label(label)
+"""
+
+import bisect
+import re
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextCursor
+
+# BMP 外の文字(UTF-16 ではサロゲートペアの 2 単位になる)
+_ASTRAL = re.compile("[\U00010000-\U0010ffff]")
+
+
+class DocumentStats(QObject):
+    """
+    QTextDocument の文字数・行数を保持するクラス
+
+    Signals:
+        changed(int, int): 表示を更新するタイミングで (文字数, 行数) を通知
+
+    Attributes:
+        chars (int): 文字数(改行を含む。len(toPlainText()) と同じくコードポイントで数える)
+        lines (int): 行数(段落の数)
+    """
+
+    changed = Signal(int, int)
+
+    def __init__(self, document, interval=50, parent=None):
+        """
+        Args:
+            document (QTextDocument): 対象のドキュメント
+            interval (int): 表示を更新する最短の間隔(ミリ秒)。0 ならイベントループが空いたとき
+            parent (QObject): 親オブジェクト
+        """
+        super().__init__(parent)
+        self.document = document
+        self.chars = 0
+        self.lines = 1
+        # サロゲートペアの位置(UTF-16 のコード単位での位置、昇順)
+        self._pairs = []
+        self.change_count = 0
+        self._emitted = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.flush)
+
+        self.recount()
+        document.contentsChange.connect(self._on_contents_change)
+
+    def recount(self):
+        """ドキュメントから文字数と行数を読み直す"""
+        self._pairs = self._find_pairs(0, self.document.characterCount())
+        self._update_counts()
+
+    def _update_counts(self):
+        # characterCount() は最後の段落区切りを含むため 1 を引き、
+        # サロゲートペアを 1 文字として数えるためにその数を引く
+        self.chars = max(self.document.characterCount() - 1 - len(self._pairs), 0)
+        self.lines = self.document.blockCount()
+
+    def _find_pairs(self, position, length):
+        """position から length 単位の範囲にあるサロゲートペアの位置を返す"""
+        end = min(position + length, self.document.characterCount() - 1)
+        if end <= position:
+            return []
+        cursor = QTextCursor(self.document)
+        cursor.setPosition(position)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        # 文字列の中の位置はコードポイント単位なので、前にあるペアの数を足して UTF-16 の位置にする
+        return [position + match.start() + count
+                for count, match in enumerate(_ASTRAL.finditer(cursor.selectedText()))]
+
+    def _on_contents_change(self, position, removed, added):
+        # 削除された範囲のペアを除き、後ろのペアをずらしてから、追加された範囲だけを調べる
+        start = bisect.bisect_left(self._pairs, position)
+        end = bisect.bisect_left(self._pairs, position + removed)
+        shift = added - removed
+        self._pairs[start:] = self._find_pairs(position, added) + [pair + shift for pair in self._pairs[end:]]
+        self._update_counts()
+        self.change_count += 1
+        # 連続した変更はタイマーが動いている間まとめる(タイマーは延長しない)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """保留中の更新をすぐに通知する"""
+        self._timer.stop()
+        current = (self.chars, self.lines)
+        if current != self._emitted:
+            self._emitted = current
+            self.changed.emit(*current)
+
+    def bind_label(self, label, template="文字数: {chars} | 行数: {lines}"):
+        """
+        ラベルの表示を統計に合わせて更新する
+
+        Args:
+            label (QLabel): 表示先のラベル(使い回すため、生成は1回だけ)
+            template (str): 表示形式
+        """
+        def update(chars, lines):
+            label.setText(template.format(chars=chars, lines=lines))
+
+        self.changed.connect(update)
+        update(self.chars, self.lines)
+        self._emitted = (self.chars, self.lines)
@@ -0,0 +1,159 @@
+"""
+描画リソースキャッシュ - QColor / QPen / QBrush / QFont を共有する
+
+paintEvent や画像生成のループの中で QPen(QColor("#3498db"), 2) のように毎回オブジェクトを作ると、
+色名の解析とオブジェクトの生成・破棄が描画のたびに発生します。
+このモジュールでは、同じ指定のリソースを一度だけ作成して使い回します。
+
+QPainter.setPen などは値をコピー(暗黙の共有)して使うため、共有したオブジェクトを渡しても安全です。
+ただし、返されたオブジェクトを直接変更(setWidth など)しないでください。
+
+使い方:
+    from pyside6_files.common.paint_resources import paint
+
+    painter.setPen(paint.pen("#3498db", 2))
+    painter.setBrush(paint.brush("#e74c3c"))
+    painter.setFont(paint.font("Arial", 14, QFont.Weight.Bold))
+"""
+
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QImage, QPen, QPixmap
+
+
+def _color_key(spec):
+    """色の指定をキャッシュのキーに変換する"""
+    if isinstance(spec, QColor):
+        return spec.rgba()
+    if isinstance(spec, str):
+        return spec.lower()
+    return tuple(spec)
+
+
+class PaintResources:
+    """
+    描画リソースを種類ごとに保持するキャッシュ
+
+    色は (r, g, b) のように任意の値を取り得るため、種類ごとに最大 max_entries 件を
+    最近使った順に保持します(LRU)。
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._caches = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, kind, key, factory):
+        cache = self._caches.get(kind)
+        if cache is None:
+            cache = self._caches[kind] = OrderedDict()
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = cache[key] = factory()
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False)
+        return value
+
+    def color(self, spec):
+        """
+        色を返す
+
+        Args:
+            spec: 色名("#3498db", "red")、(r, g, b[, a]) のタプル、または QColor
+
+        Returns:
+            QColor: 共有の色
+        """
+        if isinstance(spec, QColor):
+            return spec
+        return self._get("color", _color_key(spec), lambda: QColor(spec) if isinstance(spec, str) else QColor(*spec))
+
+    def pen(self, color, width=1, style=Qt.PenStyle.SolidLine):
+        """
+        ペンを返す
+
+        Args:
+            color: color() と同じ色の指定
+            width (int): 線の太さ
+            style (Qt.PenStyle): 線の種類
+
+        Returns:
+            QPen: 共有のペン
+        """
+        key = (_color_key(color), width, style)
+        return self._get("pen", key, lambda: QPen(self.color(color), width, style))
+
+    def brush(self, color, style=Qt.BrushStyle.SolidPattern):
+        """
+        ブラシを返す
+
+        Args:
+            color: color() と同じ色の指定
+            style (Qt.BrushStyle): 塗りつぶしの種類
+
+        Returns:
+            QBrush: 共有のブラシ
+        """
+        key = (_color_key(color), style)
+        return self._get("brush", key, lambda: QBrush(self.color(color), style))
+
+    def font(self, family, point_size=-1, weight=QFont.Weight.Normal):
+        """
+        フォントを返す
+
+        Args:
+            family (str): フォントファミリー
+            point_size (int): ポイントサイズ
+            weight (QFont.Weight): 太さ
+
+        Returns:
+            QFont: 共有のフォント
+        """
+        key = (family, point_size, weight)
+        return self._get("font", key, lambda: QFont(family, point_size, weight))
+
+    def hue_gradient(self, width, height, start_hue=0, end_hue=240, saturation=200, value=255):
+        """
+        左から右へ色相が変化するグラデーション画像を返す
+
+        1行分の色だけを計算して QImage に書き込み、縦方向は拡大(行の複製)で埋めます。
+        列ごとにペンを作って線を引く方法と同じ結果になります。
+
+        Args:
+            width (int): 幅
+            height (int): 高さ
+            start_hue (int): 左端の色相
+            end_hue (int): 右端の色相
+            saturation (int): 彩度
+            value (int): 明度
+
+        Returns:
+            QPixmap: 共有のグラデーション画像
+        """
+        def create():
+            row = QImage(width, 1, QImage.Format.Format_RGB32)
+            color = QColor()
+            for x in range(width):
+                color.setHsv(start_hue + int((end_hue - start_hue) * x / width), saturation, value)
+                row.setPixel(x, 0, color.rgb())
+            image = row.scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio,
+                               Qt.TransformationMode.FastTransformation)
+            return QPixmap.fromImage(image)
+
+        key = (width, height, start_hue, end_hue, saturation, value)
+        return self._get("hue_gradient", key, create)
+
+    def clear(self):
+        self._caches.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# サンプル全体で共有する既定のキャッシュ
+paint = PaintResources()
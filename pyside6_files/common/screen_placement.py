@@ -0,0 +1,65 @@
+"""
+ウィンドウの配置 - QScreen の画面と作業領域をキャッシュする
+
+配置の計算は tkinter のサンプルと共通の tkinter_files/common/placement.py を使い、
+このモジュールでは画面の一覧(QGuiApplication.screens())の取得とウィンドウの移動だけを実装します。
+画面の一覧は一度だけ問い合わせてキャッシュし、画面の追加・削除や
+解像度・作業領域の変更のシグナルを受け取ったときに捨てます。
+
+使い方:
+    from pyside6_files.common.screen_placement import QtPlacement
+
+    placement = QtPlacement()
+    placement.center_on_screen(window, 500, 400)
+    placement.beside_parent(sub_window, window, 250, 200)
+"""
+
+from PySide6.QtCore import QObject
+from PySide6.QtGui import QGuiApplication
+
+from tkinter_files.common.placement import Placement, Rect, Screen
+
+
+def _rect(qrect):
+    return Rect(qrect.x(), qrect.y(), qrect.width(), qrect.height())
+
+
+class QtPlacement(QObject, Placement):
+    """
+    PySide6 のウィンドウの配置(メソッドは TkPlacement と同じ)
+
+    Args:
+        parent (QObject): 親オブジェクト
+    """
+
+    def __init__(self, parent=None):
+        QObject.__init__(self, parent)
+        Placement.__init__(self)
+        self._watched = set()
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screens_changed)
+        app.screenRemoved.connect(self._on_screens_changed)
+        app.primaryScreenChanged.connect(self._on_screens_changed)
+
+    def _on_screens_changed(self, *args):
+        self.invalidate()
+
+    def _query_screens(self):
+        primary = QGuiApplication.primaryScreen()
+        screens = sorted(QGuiApplication.screens(), key=lambda screen: screen is not primary)
+        for screen in screens:
+            if screen not in self._watched:
+                self._watched.add(screen)
+                screen.geometryChanged.connect(self._on_screens_changed)
+                screen.availableGeometryChanged.connect(self._on_screens_changed)
+        return [Screen(_rect(screen.geometry()), _rect(screen.availableGeometry())) for screen in screens]
+
+    def window_rect(self, window):
+        # frameGeometry は保持している値を返すだけで、レイアウトの計算は行わない
+        return _rect(window.frameGeometry())
+
+    def apply(self, window, rect):
+        # 位置は window_rect と同じく枠を含めた左上(move はタイトルバーを含めた位置を設定する)、
+        # 大きさはサンプルが指定するクライアント領域の大きさとして扱う
+        window.resize(rect.width, rect.height)
+        window.move(rect.x, rect.y)
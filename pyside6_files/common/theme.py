@@ -0,0 +1,227 @@
+"""
+テーマレジストリ - アプリケーション単位のスタイルシート管理
+
+ウィジェットごとに setStyleSheet を呼ぶと、そのたびにCSSの解析とウィジェットの
+再ポリッシュが発生します。このモジュールでは、スタイルのルールを objectName や
+動的プロパティ(role, variant, accent など)をセレクタにして1枚のスタイルシートにまとめ、
+QApplication に一度だけ設定します。
+
+見た目の切り替えはプロパティを変更して style().unpolish/polish を呼ぶだけで行えます。
+
+使い方:
+    from pyside6_files.common.theme import set_properties, set_state, theme
+
+    theme.register("my_window", '''
+        QLabel#resultLabel { font-size: 16px; }
+    ''')
+    theme.install()
+
+    button = set_properties(QPushButton("保存"), variant="success")
+    set_state(label, "notice", "danger")
+"""
+
+import textwrap
+
+from PySide6.QtWidgets import QApplication
+
+# 複数のサンプルで共通して使うルール
+BASE_RULES = """
+QLabel[role="title"] {
+    color: #2c3e50;
+    background-color: #ecf0f1;
+    padding: 15px;
+    border-radius: 8px;
+    border: 2px solid #bdc3c7;
+    margin-bottom: 15px;
+}
+
+QLabel[role="info"] {
+    background-color: #e3f2fd;
+    padding: 10px;
+    border: 1px solid #2196f3;
+    border-radius: 5px;
+    font-size: 14px;
+}
+
+QLabel[role="status"] {
+    background-color: #f5f5f5;
+    padding: 8px;
+    border: 1px solid #ddd;
+    border-radius: 3px;
+}
+
+QLabel[notice] {
+    padding: 8px;
+    border-radius: 4px;
+    margin: 5px 0;
+}
+QLabel[notice="success"] { background-color: #e8f5e8; border-left: 4px solid #27ae60; }
+QLabel[notice="warning"] { background-color: #fff3cd; border-left: 4px solid #f39c12; }
+QLabel[notice="danger"] { background-color: #f8d7da; border-left: 4px solid #e74c3c; }
+QLabel[notice="info"] { background-color: #e3f2fd; border-left: 4px solid #3498db; }
+
+QGroupBox[accent] {
+    font-weight: bold;
+    border: 2px solid #bdc3c7;
+    border-radius: 8px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QGroupBox[accent]::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+    color: #2c3e50;
+    background-color: white;
+}
+QGroupBox[accent="blue"] { border-color: #3498db; }
+QGroupBox[accent="red"] { border-color: #e74c3c; }
+QGroupBox[accent="orange"] { border-color: #f39c12; }
+QGroupBox[accent="purple"] { border-color: #9b59b6; }
+QGroupBox[accent="green"] { border-color: #27ae60; }
+QGroupBox[accent="dark"] { border-color: #2c3e50; }
+
+QPushButton[variant] {
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+}
+QPushButton[variant="primary"] { background-color: #3498db; }
+QPushButton[variant="primary"]:hover { background-color: #2980b9; }
+QPushButton[variant="success"] { background-color: #27ae60; }
+QPushButton[variant="success"]:hover { background-color: #219a52; }
+QPushButton[variant="danger"] { background-color: #e74c3c; }
+QPushButton[variant="danger"]:hover { background-color: #c0392b; }
+QPushButton[variant="warning"] { background-color: #f39c12; }
+QPushButton[variant="warning"]:hover { background-color: #e67e22; }
+QPushButton[variant="toggle"] { background-color: #f39c12; }
+QPushButton[variant="toggle"]:hover { background-color: #d68910; }
+QPushButton[variant="secondary"] { background-color: #95a5a6; }
+QPushButton[variant="secondary"]:hover { background-color: #7f8c8d; }
+
+QTextEdit[role="log"] {
+    background-color: #f8f9fa;
+    border: 1px solid #dee2e6;
+    border-radius: 4px;
+    padding: 5px;
+    font-family: 'Courier New', monospace;
+}
+"""
+
+
+class ThemeRegistry:
+    """
+    スタイルシートのルールを集めて、1枚のスタイルシートとして適用するクラス
+
+    ルールは名前付きで登録し、同じ名前で同じ内容が登録された場合は何もしません。
+    結合済みのスタイルシートはキャッシュされ、内容が変わらない限り
+    QApplication への再設定(=再解析)は行いません。
+    """
+
+    def __init__(self):
+        self._rules = {}
+        self._sheet = None
+        self._installed_sheet = None
+
+    def register(self, name, css):
+        """
+        ルールを登録する
+
+        Args:
+            name (str): ルールのまとまりの名前(サンプル名など)
+            css (str): スタイルシートの文字列
+        """
+        css = textwrap.dedent(css).strip()
+        if self._rules.get(name) == css:
+            return
+        self._rules[name] = css
+        self._sheet = None
+
+    def unregister(self, name):
+        if self._rules.pop(name, None) is not None:
+            self._sheet = None
+
+    def names(self):
+        return list(self._rules)
+
+    def stylesheet(self):
+        """
+        登録済みのルールを結合したスタイルシートを返す
+
+        Returns:
+            str: アプリケーション全体のスタイルシート
+        """
+        if self._sheet is None:
+            self._sheet = "\n\n".join(self._rules.values())
+        return self._sheet
+
+    def install(self, app=None):
+        """
+        QApplication にスタイルシートを設定する
+
+        前回設定したものと同じ内容であれば何もしないため、
+        各ウィンドウのコンストラクタから何度呼んでも解析は一度だけです。
+
+        Args:
+            app (QApplication): 設定先。省略時は QApplication.instance()
+
+        Returns:
+            bool: スタイルシートを設定し直した場合True
+        """
+        app = app or QApplication.instance()
+        sheet = self.stylesheet()
+        if app is None or (self._installed_sheet == sheet and app.styleSheet() == sheet):
+            return False
+        app.setStyleSheet(sheet)
+        self._installed_sheet = sheet
+        return True
+
+
+def set_properties(widget, object_name=None, **properties):
+    """
+    ウィジェットに objectName と動的プロパティを設定する
+
+    表示前のウィジェットに対して使うため、再ポリッシュは行いません。
+
+    Args:
+        widget (QWidget): 対象のウィジェット
+        object_name (str): objectName(セレクタの #名前 に対応)
+        **properties: 動的プロパティ(セレクタの [名前="値"] に対応)
+
+    Returns:
+        QWidget: 引数のウィジェット(生成と同時に書けるように)
+    """
+    if object_name:
+        widget.setObjectName(object_name)
+    for name, value in properties.items():
+        widget.setProperty(name, value)
+    return widget
+
+
+def set_state(widget, name, value):
+    """
+    動的プロパティで見た目の状態を切り替える
+
+    値が変わったときだけ、そのウィジェットを unpolish/polish します。
+
+    Args:
+        widget (QWidget): 対象のウィジェット
+        name (str): プロパティ名
+        value: 新しい値
+
+    Returns:
+        bool: 状態が変わった場合True
+    """
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    return True
+
+
+# サンプル全体で共有する既定のレジストリ
+theme = ThemeRegistry()
+theme.register("base", BASE_RULES)
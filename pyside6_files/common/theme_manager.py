@@ -0,0 +1,292 @@
+"""
+テーママネージャー - スタイルシートのテーマを QPalette に事前変換して切り替える
+
+テーマ全体を setStyleSheet で設定し直すと、CSSの再解析と全子ウィジェットの
+再ポリッシュが毎回発生します。特に ``QWidget { background-color: ...; color: ... }``
+のような全ウィジェットに一致するルールの影響が大きくなります。
+
+このモジュールでは、テーマの登録時に一度だけCSSを解析し、
+- ``QWidget`` ルールの色指定(単色・qlineargradient) → ウィンドウの QPalette
+- ``QWidget`` ルールの font-family → QFont
+- ``#title`` / ``QLabel#title`` のような単純なセレクタで、色とフォントだけを指定したルールの色
+  → 一致する子ウィジェットごとの QPalette
+- それ以外 → 残りのスタイルシート(residual)
+  (border・padding などを持つルールや :hover などのルールがあるウィジェットはスタイルシートで
+  描画され、パレットの色が使われないため、色も含めてルールをそのまま残します)
+に分けておきます。切り替え時は、残りのスタイルシートが前のテーマと同じであれば(色だけが
+異なるテーマ同士であれば)パレットとフォントの差し替えだけで済ませ、
+異なる場合は setStyleSheet で残りのスタイルシートを設定し直します。
+
+スタイルシートを設定したウィジェットの子はパレットを継承しなくなるため、
+ThemeManager は AA_UseStyleSheetPropagationInWidgetStyles を有効にします。
+なお ``QWidget`` ルールの背景はスタイルシートでは子ウィジェットごとに塗られますが
+(グラデーションは子ウィジェットごとにやり直しになります)、パレットではウィンドウ全体に一度だけ塗られます。
+"""
+
+import re
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QGradient, QLinearGradient, QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+# パレットに変換できる単純なセレクタ(型名・#オブジェクト名・その組み合わせ)
+_SIMPLE_SELECTOR = re.compile(r"([A-Za-z_]\w*)?(?:#(\w+))?")
+_SELECTOR_NAME = re.compile(r"#\w+|[A-Za-z_]\w*|\*")
+_GRADIENT = re.compile(r"qlineargradient\((.*)\)", re.S)
+
+_BACKGROUND_ROLES = (
+    QPalette.ColorRole.Window,
+    QPalette.ColorRole.Base,
+    QPalette.ColorRole.Button,
+)
+# 色のプロパティと、それを反映するパレットの役割
+_PALETTE_ROLES = {
+    "background-color": _BACKGROUND_ROLES,
+    "background": _BACKGROUND_ROLES,
+    "color": (
+        QPalette.ColorRole.WindowText,
+        QPalette.ColorRole.Text,
+        QPalette.ColorRole.ButtonText,
+    ),
+}
+
+
+def _is_palette_safe(prop):
+    """パレットに移した色と一緒に残しても、描画がスタイルシートに切り替わらないプロパティか"""
+    return prop in _PALETTE_ROLES or prop.startswith("font")
+
+
+def parse_rules(css):
+    """
+    スタイルシートを (セレクタ, [(プロパティ, 値), ...]) のリストに分解する
+
+    Args:
+        css (str): スタイルシートの文字列
+
+    Returns:
+        list: ルールのリスト
+    """
+    rules = []
+    for selector, body in _RULE.findall(_COMMENT.sub("", css)):
+        declarations = []
+        for declaration in body.split(";"):
+            if ":" not in declaration:
+                continue
+            name, value = declaration.split(":", 1)
+            declarations.append((name.strip().lower(), " ".join(value.split())))
+        rules.append((" ".join(selector.split()), declarations))
+    return rules
+
+
+def parse_brush(value):
+    """
+    色の値を QBrush に変換する
+
+    Args:
+        value (str): 色名・#rrggbb・qlineargradient(...) のいずれか
+
+    Returns:
+        QBrush: 変換結果(変換できなければ None)
+    """
+    if QColor.isValidColorName(value):
+        return QBrush(QColor(value))
+    match = _GRADIENT.fullmatch(value)
+    if match is None:
+        return None
+    points = {}
+    stops = []
+    for item in match.group(1).split(","):
+        if ":" not in item:
+            return None
+        key, argument = (part.strip() for part in item.split(":", 1))
+        if key == "stop":
+            position, color = argument.split(None, 1)
+            if not QColor.isValidColorName(color):
+                return None
+            stops.append((float(position), QColor(color)))
+        else:
+            points[key] = float(argument)
+    gradient = QLinearGradient(points.get("x1", 0), points.get("y1", 0), points.get("x2", 0), points.get("y2", 0))
+    # 座標はスタイルシートと同じくウィジェットの大きさに対する割合
+    gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    for position, color in stops:
+        gradient.setColorAt(position, color)
+    return QBrush(gradient)
+
+
+def format_rules(rules):
+    """parse_rules の結果をスタイルシートの文字列に戻す"""
+    blocks = []
+    for selector, declarations in rules:
+        body = "\n".join(f"    {name}: {value};" for name, value in declarations)
+        blocks.append(f"{selector} {{\n{body}\n}}")
+    return "\n".join(blocks)
+
+
+class CompiledTheme:
+    """
+    事前変換済みのテーマ
+
+    Attributes:
+        name (str): テーマ名
+        palette (QPalette): 色の設定
+        font_families (list): フォントファミリー(指定がなければ空)
+        scoped (list): (型名, オブジェクト名, 色の宣言のリスト) のリスト(子ウィジェットごとのパレット)
+        stylesheet (str): パレットに変換できなかった残りのスタイルシート
+    """
+
+    def __init__(self, name, palette, font_families, scoped, stylesheet):
+        self.name = name
+        self.palette = palette
+        self.font_families = font_families
+        self.scoped = scoped
+        self.stylesheet = stylesheet
+
+
+class ThemeManager:
+    """
+    ウィジェット(通常はトップレベルのウィンドウ)のテーマを切り替えるクラス
+    """
+
+    def __init__(self, widget):
+        """
+        Args:
+            widget (QWidget): テーマを適用するウィジェット
+        """
+        self.widget = widget
+        # スタイルシートを設定したウィジェットの子は、既定では親のパレットとフォントを
+        # 継承しなくなる(ポリッシュした時点の値で固定される)ため、継承するように切り替える
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles)
+        self.base_palette = QPalette(widget.palette())
+        self.base_font = widget.font()
+        self.themes = {}
+        self.current = None
+        self.last_switch_time = 0.0
+        # パレットを設定した子ウィジェット(次のテーマで対象外になったら親のパレットに戻す)
+        self._styled = []
+        # setStyleSheet を呼んだ回数(パレットだけで切り替えられたかの確認用)
+        self.stylesheet_applies = 0
+
+    def add_theme(self, name, css):
+        """
+        テーマを登録する(CSSの解析はここで一度だけ行う)
+
+        Args:
+            name (str): テーマ名
+            css (str): テーマのスタイルシート
+
+        Returns:
+            CompiledTheme: 変換結果
+        """
+        palette = QPalette(self.base_palette)
+        font_families = []
+        scoped = []
+        residual = []
+        rules = parse_rules(css)
+        # 擬似状態・子孫セレクタなどのルールに現れる型名と #オブジェクト名
+        complex_names = set()
+        for selector, _ in rules:
+            if not _SIMPLE_SELECTOR.fullmatch(selector):
+                complex_names.update(_SELECTOR_NAME.findall(selector))
+        for selector, declarations in rules:
+            match = _SIMPLE_SELECTOR.fullmatch(selector)
+            if match is None or not any(match.groups()):
+                residual.append((selector, declarations))
+                continue
+            type_name, object_name = match.groups()
+            is_window = selector == "QWidget"
+            if not is_window and (complex_names & {"*", "QWidget", type_name, f"#{object_name}"}
+                                  or any(not _is_palette_safe(prop) for prop, _ in declarations)):
+                # 枠や余白を持つウィジェット、:hover などのルールがあるウィジェットは
+                # スタイルシートで描画され、パレットの色が使われないので、ルールをそのまま残す
+                residual.append((selector, declarations))
+                continue
+            colors = []
+            remaining = []
+            for prop, value in declarations:
+                brush = parse_brush(value) if prop in _PALETTE_ROLES else None
+                if brush is not None:
+                    colors.append((prop, brush))
+                elif prop == "font-family" and is_window:
+                    font_families = [family.strip(" '\"") for family in value.split(",")]
+                else:
+                    remaining.append((prop, value))
+            if is_window:
+                self._set_brushes(palette, colors)
+            elif colors:
+                scoped.append((type_name, object_name, colors))
+            if remaining:
+                residual.append((selector, remaining))
+
+        # スタイルシートと同じく、#オブジェクト名を含むルールを型名だけのルールより優先する
+        scoped.sort(key=lambda rule: rule[1] is not None)
+        theme = CompiledTheme(name, palette, font_families, scoped, format_rules(residual))
+        self.themes[name] = theme
+        return theme
+
+    def apply(self, name):
+        """
+        テーマを適用する
+
+        Args:
+            name (str): テーマ名
+
+        Returns:
+            float: 切り替えにかかった時間(秒)
+        """
+        theme = self.themes[name]
+        start = time.perf_counter()
+
+        self.widget.setPalette(theme.palette)
+        if self.current is None or self.current.font_families != theme.font_families:
+            # フォントを変えると全子ウィジェットの大きさを計算し直すので、同じなら設定しない
+            font = self.base_font
+            if theme.font_families:
+                font = QFont(self.base_font)
+                font.setFamilies(theme.font_families)
+            self.widget.setFont(font)
+        self._apply_scoped(theme)
+        if self.current is None or self.current.stylesheet != theme.stylesheet:
+            self.widget.setStyleSheet(theme.stylesheet)
+            self.stylesheet_applies += 1
+
+        self.current = theme
+        self.last_switch_time = time.perf_counter() - start
+        return self.last_switch_time
+
+    @staticmethod
+    def _set_brushes(palette, colors):
+        for prop, brush in colors:
+            solid = brush
+            if brush.gradient() is not None:
+                # ボタンや入力欄の色は Fusion が単色として扱うため、グラデーションの最初の色にする
+                solid = QBrush(brush.gradient().stops()[0][1])
+            for role in _PALETTE_ROLES[prop]:
+                palette.setBrush(role, brush if role == QPalette.ColorRole.Window else solid)
+
+    def _apply_scoped(self, theme):
+        styled = []
+        if theme.scoped:
+            for child in self.widget.findChildren(QWidget):
+                colors = [
+                    color
+                    for type_name, object_name, rule_colors in theme.scoped
+                    if (type_name is None or child.inherits(type_name))
+                    and (object_name is None or child.objectName() == object_name)
+                    for color in rule_colors
+                ]
+                if colors:
+                    # テーマのパレットに、一致したルールの色を優先度の低いものから重ねる
+                    palette = QPalette(theme.palette)
+                    self._set_brushes(palette, colors)
+                    child.setPalette(palette)
+                    styled.append(child)
+        kept = set(map(id, styled))
+        for child in self._styled:
+            if id(child) not in kept:
+                # 空のパレットを設定すると、親のパレットを継承する状態に戻る
+                child.setPalette(QPalette())
+        self._styled = styled
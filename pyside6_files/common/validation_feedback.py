@@ -0,0 +1,113 @@
+"""
+検証フィードバック - 動的プロパティによる入力状態の表示
+
+入力のたびに setStyleSheet で色を変えると、キー入力ごとにCSSの解析と
+再ポリッシュが発生します。このモジュールでは ``validationState`` 動的プロパティに
+一致するルールをテーマレジストリに一度だけ登録し、状態が変わったときだけ
+ウィジェットを再ポリッシュします。ログは上限付きのリングバッファに記録します。
+"""
+
+from collections import deque
+
+from PySide6.QtGui import QValidator
+
+from pyside6_files.common.theme import set_state, theme
+
+# QValidator の状態と validationState プロパティの値の対応
+STATE_NAMES = {
+    QValidator.State.Acceptable: "acceptable",
+    QValidator.State.Intermediate: "intermediate",
+    QValidator.State.Invalid: "invalid",
+}
+
+STATE_LABELS = {
+    "acceptable": "✓ 有効",
+    "intermediate": "⚠ 部分的",
+    "invalid": "✗ 無効",
+}
+
+theme.register("validation_feedback", """
+    QLineEdit[validationState="acceptable"] { border: 2px solid #27ae60; background-color: #d5f4e6; }
+    QLineEdit[validationState="intermediate"] { border: 2px solid #f39c12; background-color: #fef9e7; }
+    QLineEdit[validationState="invalid"] { border: 2px solid #e74c3c; background-color: #fadbd8; }
+
+    QLabel[role="validationStatus"] {
+        background-color: #f8f9fa;
+        padding: 10px;
+        border-radius: 5px;
+        border-left: 4px solid #6c757d;
+    }
+    QLabel[role="validationStatus"][validationState="acceptable"] { border-left-color: #27ae60; color: #27ae60; }
+    QLabel[role="validationStatus"][validationState="intermediate"] { border-left-color: #f39c12; color: #f39c12; }
+    QLabel[role="validationStatus"][validationState="invalid"] { border-left-color: #e74c3c; color: #e74c3c; }
+
+    QLabel[strength] { font-weight: bold; }
+    QLabel[strength="none"] { color: #7f8c8d; font-weight: normal; font-style: italic; }
+    QLabel[strength="weak"] { color: #e74c3c; }
+    QLabel[strength="fair"] { color: #e67e22; }
+    QLabel[strength="strong"] { color: #f39c12; }
+    QLabel[strength="very_strong"] { color: #27ae60; }
+""")
+
+
+class ValidationFeedback:
+    """
+    検証結果を入力欄・ステータスラベル・ログに反映するクラス
+
+    Attributes:
+        entries (deque): ログの最新 log_limit 件
+    """
+
+    def __init__(self, status_label, log_display=None, log_limit=500):
+        """
+        Args:
+            status_label (QLabel): 最後の検証結果を表示するラベル
+            log_display (QTextEdit): ログ表示(省略可)
+            log_limit (int): ログに保持する最大行数
+        """
+        self.status_label = status_label
+        self.status_label.setProperty("role", "validationStatus")
+        self.log_display = log_display
+        self.entries = deque(maxlen=log_limit)
+        if log_display is not None:
+            # ドキュメント側も最大行数を設定し、古い行から自動的に捨てる
+            log_display.document().setMaximumBlockCount(log_limit)
+
+    def report(self, field_name, text, input_widget, state):
+        """
+        検証結果を反映する
+
+        Args:
+            field_name (str): フィールド名
+            text (str): 入力テキスト
+            input_widget (QLineEdit): 入力ウィジェット
+            state (QValidator.State): 検証状態
+
+        Returns:
+            str: 状態の表示文字列
+        """
+        state_name = STATE_NAMES[state]
+        status = STATE_LABELS[state_name]
+        set_state(input_widget, "validationState", state_name)
+        set_state(self.status_label, "validationState", state_name)
+        self.status_label.setText(f"最後の検証: {field_name} - {status}")
+        self.log(f"[{field_name}] '{text}' → {status}")
+        return status
+
+    def reset(self, input_widgets, message="入力待ち..."):
+        """入力欄とステータス表示を初期状態に戻す"""
+        for input_widget in input_widgets:
+            set_state(input_widget, "validationState", "")
+        set_state(self.status_label, "validationState", "")
+        self.status_label.setText(message)
+
+    def log(self, message):
+        """ログに1行追加する(上限を超えた古い行は捨てられる)"""
+        self.entries.append(message)
+        if self.log_display is not None:
+            self.log_display.append(message)
+
+    def clear_log(self):
+        self.entries.clear()
+        if self.log_display is not None:
+            self.log_display.clear()
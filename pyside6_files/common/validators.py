@@ -0,0 +1,464 @@
+"""
+バリデーターツールキット - Qtに依存しない検証ロジック
+
+QValidator のサブクラスから呼び出す検証ロジックを、Qtに依存しない形でまとめたモジュールです。
+Qtに依存しないため、CSVの取り込みなどGUIのない処理(別プロセスを含む)からも使えます。
+
+- 正規表現はクラスごとに一度だけコンパイルします
+- 直近の入力と検証結果は小さなLRUキャッシュに保持します
+- 部分入力(Intermediate)か無効(Invalid)かは、接頭辞を判定するオートマトン(DFA)で判定します。
+  前回の入力の続きであれば、前回の状態から差分の文字だけを進めるため、
+  キー入力1回あたりの処理量は入力全体の長さではなく変更された文字数に比例します
+- validate_many で列全体(インポートしたメールアドレスなど)をまとめて検証できます
+
+検証状態の値は QValidator.State と同じです(Invalid=0, Intermediate=1, Acceptable=2)。
+"""
+
+import functools
+import math
+import re
+import string
+
+INVALID = 0
+INTERMEDIATE = 1
+ACCEPTABLE = 2
+
+STATE_NAMES = {
+    INVALID: "invalid",
+    INTERMEDIATE: "intermediate",
+    ACCEPTABLE: "acceptable",
+}
+
+DIGITS = frozenset(string.digits)
+LETTERS = frozenset(string.ascii_letters)
+ALNUM = DIGITS | LETTERS
+
+
+class TableAutomaton:
+    """
+    文字クラスと遷移表で定義する決定性オートマトン
+
+    遷移先がない文字を読んだ時点で、どう続けても受理されない(=無効)と判定します。
+    """
+
+    def __init__(self, start, classes, transitions, accepting):
+        """
+        Args:
+            start: 開始状態
+            classes (dict): 文字クラス名 → その文字の集合
+            transitions (dict): (状態, 文字クラス名) → 次の状態
+            accepting (set): 受理状態の集合
+        """
+        self.start = start
+        self.accepting = frozenset(accepting)
+        self._char_class = {}
+        for class_name, chars in classes.items():
+            for char in chars:
+                self._char_class.setdefault(char, class_name)
+        self._transitions = dict(transitions)
+
+    def step(self, state, char):
+        """1文字進めた状態を返す。受理の見込みがなくなった場合は None"""
+        return self._transitions.get((state, self._char_class.get(char)))
+
+
+class SequenceAutomaton:
+    """
+    「文字集合の繰り返し」を並べたパターン(例: 数字3桁 - 数字4桁)のオートマトン
+
+    状態は (何番目の要素か, その要素を何文字読んだか) で表します。
+    隣り合う要素の文字集合は重ならない前提です。
+    """
+
+    def __init__(self, tokens):
+        """
+        Args:
+            tokens (list): (文字集合, 最小回数, 最大回数) のリスト。最大回数 None は上限なし
+        """
+        self.tokens = [(frozenset(chars), minimum, maximum) for chars, minimum, maximum in tokens]
+        self.start = (0, 0)
+        last = len(self.tokens) - 1
+        self.accepting = frozenset(
+            (last, count) for count in range(self.tokens[last][1], (self.tokens[last][2] or self.tokens[last][1]) + 1)
+        )
+        self._unbounded_last = self.tokens[last][2] is None
+
+    def step(self, state, char):
+        index, count = state
+        chars, minimum, maximum = self.tokens[index]
+        if char in chars and (maximum is None or count < maximum):
+            return (index, min(count + 1, minimum) if maximum is None and count >= minimum else count + 1)
+        if count >= minimum and index + 1 < len(self.tokens) and char in self.tokens[index + 1][0]:
+            return (index + 1, 1)
+        return None
+
+    def is_accepting(self, state):
+        if state in self.accepting:
+            return True
+        # 上限なしの最後の要素は、最小回数以上読んでいれば受理
+        index, count = state
+        return self._unbounded_last and index == len(self.tokens) - 1 and count >= self.tokens[index][1]
+
+
+def _is_accepting(automaton, state):
+    if isinstance(automaton, SequenceAutomaton):
+        return automaton.is_accepting(state)
+    return state in automaton.accepting
+
+
+class ValidatorCore:
+    """
+    検証ロジックの基底クラス
+
+    サブクラスは pattern(完全一致) と partial_pattern(部分入力として妥当な文字列) を
+    クラス属性として一度だけコンパイルし、automaton に対話入力用のオートマトンを定義します。
+    """
+
+    pattern = None
+    partial_pattern = None
+    automaton = None
+    cache_size = 256
+
+    def __init__(self):
+        self._cached_state = functools.lru_cache(maxsize=self.cache_size)(self._compute_state)
+        self._last_text = ""
+        self._prefix_states = [self.automaton.start] if self.automaton else []
+
+    def _compute_state(self, text):
+        """1つの文字列の検証状態(キャッシュなし)"""
+        if self.pattern.fullmatch(text):
+            return ACCEPTABLE
+        if self.partial_pattern.fullmatch(text):
+            return INTERMEDIATE
+        return INVALID
+
+    def state(self, text):
+        """
+        入力文字列の検証状態を返す(直近の結果はLRUキャッシュから返す)
+
+        Args:
+            text (str): 入力文字列
+
+        Returns:
+            int: INVALID / INTERMEDIATE / ACCEPTABLE
+        """
+        return self._cached_state(text)
+
+    def state_incremental(self, text):
+        """
+        前回の入力との共通部分を再利用して検証状態を返す
+
+        prefix_states[i] に先頭 i 文字を読んだ後のオートマトンの状態を保持しておき、
+        変更された位置以降の文字だけを読み進めます。
+
+        Args:
+            text (str): 入力文字列
+
+        Returns:
+            int: INVALID / INTERMEDIATE / ACCEPTABLE
+        """
+        if self.automaton is None:
+            return self.state(text)
+
+        last = self._last_text
+        if text.startswith(last):
+            common = len(last)
+        elif last.startswith(text):
+            common = len(text)
+        else:
+            common = 0
+            for a, b in zip(text, last):
+                if a != b:
+                    break
+                common += 1
+
+        states = self._prefix_states
+        common = min(common, len(states) - 1)
+        del states[common + 1:]
+        state = states[common]
+        automaton = self.automaton
+        if state is not None:
+            for char in text[common:]:
+                state = automaton.step(state, char)
+                states.append(state)
+                if state is None:
+                    break
+        self._last_text = text
+
+        if len(states) <= len(text) or state is None:
+            return INVALID
+        return ACCEPTABLE if _is_accepting(automaton, state) else INTERMEDIATE
+
+    def is_partial(self, text):
+        """受理の見込みがある(無効ではない)入力かどうか"""
+        return self.state(text) != INVALID
+
+    def validate_many(self, values):
+        """
+        列全体をまとめて検証する
+
+        正規表現で判定するクラスは、コンパイル済みの正規表現を内包表記から直接呼び出します
+        (取り込むデータは重複が少なく、重複をまとめる辞書の処理の方が高くつくため)。
+        Python で判定するクラス(_compute_state を上書きしたもの)は、同じ値を1回だけ判定します。
+
+        Args:
+            values (iterable): 文字列の列
+
+        Returns:
+            list: 各値の検証状態
+        """
+        if self.pattern is None:
+            seen = {}
+            states = []
+            append = states.append
+            compute = self._compute_state
+            for value in values:
+                state = seen.get(value)
+                if state is None:
+                    state = seen[value] = compute(value)
+                append(state)
+            return states
+
+        full = self.pattern.fullmatch
+        partial = self.partial_pattern.fullmatch
+        return [ACCEPTABLE if full(value) else INTERMEDIATE if partial(value) else INVALID for value in values]
+
+
+def _email_automaton():
+    """
+    メールアドレス用のオートマトン
+
+    local: ローカル部(1文字以上)  @ の後はドメイン部を以下の状態で追跡する
+        domain_empty: まだ何もない
+        domain: 1文字以上あるが、末尾が「. + 英字2文字以上」になっていない
+        dot: 直前が(先頭以外の) .
+        tld1: . の後に英字1文字
+        tld: . の後に英字2文字以上(受理)
+    """
+    classes = {
+        "letter": LETTERS,
+        "digit": DIGITS,
+        "dot": ".",
+        "hyphen": "-",
+        "symbol": "_%+",
+        "at": "@",
+    }
+    transitions = {}
+    for char_class in ("letter", "digit", "dot", "hyphen", "symbol"):
+        transitions[("start", char_class)] = "local"
+        transitions[("local", char_class)] = "local"
+    transitions[("local", "at")] = "domain_empty"
+    for state in ("domain_empty", "domain", "dot", "tld1", "tld"):
+        for char_class in ("digit", "hyphen"):
+            transitions[(state, char_class)] = "domain"
+        transitions[(state, "dot")] = "dot" if state != "domain_empty" else "domain"
+    transitions[("domain_empty", "letter")] = "domain"
+    transitions[("domain", "letter")] = "domain"
+    transitions[("dot", "letter")] = "tld1"
+    transitions[("tld1", "letter")] = "tld"
+    transitions[("tld", "letter")] = "tld"
+    return TableAutomaton("start", classes, transitions, {"tld"})
+
+
+class EmailCore(ValidatorCore):
+    """メールアドレスの検証ロジック"""
+
+    pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+    partial_pattern = re.compile(r"[a-zA-Z0-9._%+-]*|[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]*")
+    automaton = _email_automaton()
+
+
+class SequencePatternCore(ValidatorCore):
+    """
+    SequenceAutomaton で表せる正規表現(郵便番号・電話番号など)の検証ロジック
+
+    Args:
+        regex (str): 完全一致の正規表現
+        partial_regex (str): 部分入力として妥当な文字列の正規表現
+        tokens (list): SequenceAutomaton の要素
+    """
+
+    def __init__(self, regex, partial_regex, tokens):
+        self.pattern = _compile(regex)
+        self.partial_pattern = _compile(partial_regex)
+        self.automaton = SequenceAutomaton(tokens)
+        super().__init__()
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(regex):
+    """同じ正規表現は一度だけコンパイルする"""
+    return re.compile(regex)
+
+
+def postal_code_core():
+    """日本の郵便番号(123-4567)"""
+    return SequencePatternCore(
+        r"\d{3}-\d{4}",
+        r"\d{0,3}|\d{3}-\d{0,4}",
+        [(DIGITS, 3, 3), ("-", 1, 1), (DIGITS, 4, 4)],
+    )
+
+
+def phone_number_core():
+    """電話番号(090-1234-5678)"""
+    return SequencePatternCore(
+        r"0\d{1,4}-\d{1,4}-\d{4}",
+        r"|0\d{0,4}|0\d{1,4}-\d{0,4}|0\d{1,4}-\d{1,4}-\d{0,4}",
+        [("0", 1, 1), (DIGITS, 1, 4), ("-", 1, 1), (DIGITS, 1, 4), ("-", 1, 1), (DIGITS, 4, 4)],
+    )
+
+
+def alphanumeric_core():
+    """英数字のみ(空文字列も可)"""
+    return SequencePatternCore(r"[a-zA-Z0-9]*", r"[a-zA-Z0-9]*", [(ALNUM, 0, None)])
+
+
+class PasswordCore(ValidatorCore):
+    """
+    パスワードの検証ロジック
+
+    最小文字数を満たし、大文字・小文字・数字・記号をすべて含めば Acceptable、
+    それ以外は Intermediate(入力を続ければ受理され得るため Invalid にはならない)
+    """
+
+    SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+    def __init__(self, min_length=8):
+        self.min_length = min_length
+        super().__init__()
+
+    def _compute_state(self, text):
+        if len(text) < self.min_length:
+            return INTERMEDIATE
+        has_upper = any(c.isupper() for c in text)
+        has_lower = any(c.islower() for c in text)
+        has_digit = any(c.isdigit() for c in text)
+        has_special = not self.SPECIAL_CHARS.isdisjoint(text)
+        if has_upper and has_lower and has_digit and has_special:
+            return ACCEPTABLE
+        return INTERMEDIATE
+
+    def state_incremental(self, text):
+        return self.state(text)
+
+
+class IntRangeCore(ValidatorCore):
+    """
+    整数の検証ロジック(QIntValidator と同じ規則)
+
+    ロケールは小数点が "."、桁区切りを受け付けない設定(RejectGroupSeparator)のものに相当します。
+
+    Args:
+        bottom (int): 最小値
+        top (int): 最大値
+    """
+
+    _number = re.compile(r"([+-]?)\d*")
+
+    def __init__(self, bottom, top):
+        self.bottom = bottom
+        self.top = top
+        super().__init__()
+
+    def _compute_state(self, text):
+        if not text:
+            return INTERMEDIATE
+        match = self._number.fullmatch(text)
+        if match is None:
+            return INVALID
+        sign = match.group(1)
+        if (sign == "-" and self.bottom >= 0) or (sign == "+" and self.top < 0):
+            return INVALID
+        if text == sign:
+            return INTERMEDIATE
+        value = int(text)
+        if self.bottom <= value <= self.top:
+            return ACCEPTABLE
+        if value >= 0:
+            # 上限と同じ桁数までは、符号を後から入力する場合に備えて Intermediate にする
+            length = len(text) - (sign == "+")
+            if value > self.top and -value < self.bottom and length > len(str(abs(self.top))):
+                return INVALID
+            return INTERMEDIATE
+        return INVALID if value < self.bottom else INTERMEDIATE
+
+
+class DoubleRangeCore(ValidatorCore):
+    """
+    小数の検証ロジック(QDoubleValidator と同じ規則)
+
+    ロケールは小数点が "."、桁区切りを受け付けない設定(RejectGroupSeparator)のものに相当します。
+
+    Args:
+        bottom (float): 最小値
+        top (float): 最大値
+        decimals (int): 小数点以下の最大桁数
+        scientific (bool): 指数表記(1e2)を受け付けるか(QDoubleValidator の既定は ScientificNotation)
+    """
+
+    _number = re.compile(r"([+-]?)(\d*)(?:\.(\d*))?([eE][+-]?\d*)?")
+
+    def __init__(self, bottom, top, decimals, scientific=True):
+        self.bottom = bottom
+        self.top = top
+        self.decimals = decimals
+        self.scientific = scientific
+        super().__init__()
+        # 標準表記では、上限・下限と同じ桁数(と小数点以下の桁数)に収まる値までを Intermediate にする
+        digits = len(str(math.floor(max(abs(bottom), abs(top)))))
+        self._intermediate_limit = 10 ** digits - 10 ** -decimals
+
+    def _compute_state(self, text):
+        match = self._number.fullmatch(text)
+        if match is None:
+            return INVALID
+        sign, integer_part, fraction, exponent = match.groups()
+        if exponent is not None and not self.scientific:
+            return INVALID
+        if fraction is not None and len(fraction) > self.decimals:
+            return INVALID
+        if not text:
+            return INTERMEDIATE
+        if (sign == "-" and self.bottom >= 0) or (sign == "+" and self.top < 0):
+            return INVALID
+        if exponent is not None and not (integer_part or fraction):
+            # "e2" や "+e-2" は、仮数部をあとから入力できるので入力途中として扱う(Qt と同じ)
+            return INTERMEDIATE
+        try:
+            value = float(text)
+        except ValueError:
+            # "-" や "1e" のような入力途中の値
+            return INTERMEDIATE
+        if value == 0 and (integer_part + (fraction or "")).strip("0"):
+            # "7e-875" のように 0 にアンダーフローする値は、Qt では数値に変換できず入力途中になる
+            return INTERMEDIATE
+        if self.bottom <= value <= self.top:
+            return ACCEPTABLE
+        if not self.scientific and abs(value) > self._intermediate_limit:
+            return INVALID
+        return INTERMEDIATE
+
+
+# QRegularExpressionValidator のパターン → 同じ判定をする検証ロジックを作る関数
+REGEX_CORES = {
+    r"^\d{3}-\d{4}$": postal_code_core,
+    r"^0\d{1,4}-\d{1,4}-\d{4}$": phone_number_core,
+    r"^[a-zA-Z0-9]*$": alphanumeric_core,
+}
+
+
+def regex_core(pattern):
+    """
+    QRegularExpressionValidator のパターンに対応する検証ロジックを返す
+
+    Python の re は部分一致(入力途中かどうか)を判定できないため、
+    部分入力の正規表現とオートマトンを定義済みのパターンだけに対応します。
+
+    Raises:
+        ValueError: 対応していないパターンの場合
+    """
+    factory = REGEX_CORES.get(pattern)
+    if factory is None:
+        raise ValueError(f"一括検証に対応していない正規表現です: {pattern}")
+    return factory()
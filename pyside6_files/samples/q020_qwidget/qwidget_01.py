@@ -10,6 +10,7 @@ QWidgetは、すべてのユーザーインターフェース要素の基底ク
 - サイズと位置の制御
 - 基本的なスタイリング
 - 子ウィジェットの配置
+- 画面の作業領域の中央への配置(QScreen の情報は QtPlacement でキャッシュ)
 
 """
 
@@ -19,6 +20,8 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QApplication, QLabel, QPushButton, QWidget
 
+from pyside6_files.common.screen_placement import QtPlacement
+
 
 class BasicWidgetWindow(QWidget):
     """
@@ -34,6 +37,8 @@ class BasicWidgetWindow(QWidget):
         ウィンドウの初期設定と子ウィジェットの配置を行います。
         """
         super().__init__()
+        # 移動・リサイズのたびに QScreen に問い合わせないよう、画面の情報はキャッシュする
+        self.placement = QtPlacement(self)
         self.init_ui()
         
     def init_ui(self):
@@ -44,7 +49,7 @@ class BasicWidgetWindow(QWidget):
         """
         # ウィンドウの基本設定
         self.setWindowTitle("QWidget基本サンプル")
-        self.setGeometry(300, 300, 500, 400)
+        self.placement.center_on_screen(self, 500, 400)
         
         # ウィンドウの最小・最大サイズ設定
         self.setMinimumSize(400, 300)
@@ -108,7 +113,7 @@ class BasicWidgetWindow(QWidget):
         
         # 情報表示ラベル
         self.info_label = QLabel("ウィンドウ情報が表示されます", self)
-        self.info_label.setGeometry(50, 230, 400, 60)
+        self.info_label.setGeometry(50, 222, 400, 80)
         self.info_label.setStyleSheet("""
             QLabel {
                 background-color: #e8f5e8;
@@ -174,11 +179,14 @@ class BasicWidgetWindow(QWidget):
         geometry = self.geometry()
         size = self.size()
         position = self.pos()
+        screen = self.placement.screen_for(self.placement.window_rect(self))
+        work_area = f"{screen.work_area.width} x {screen.work_area.height}" if screen else "画面外"
         
         info_text = (
             f"サイズ: {size.width()} x {size.height()}\n"
             f"位置: ({position.x()}, {position.y()})\n"
-            f"表示状態: {'表示中' if self.isVisible() else '非表示'}"
+            f"表示状態: {'表示中' if self.isVisible() else '非表示'}\n"
+            f"画面の作業領域: {work_area}"
         )
         
         self.info_label.setText(info_text)
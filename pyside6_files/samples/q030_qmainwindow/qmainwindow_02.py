@@ -19,6 +19,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QApplication,
+    QLabel,
     QMainWindow,
     QMenuBar,
     QStatusBar,
@@ -28,6 +29,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common.document_stats import DocumentStats
+
 
 class AdvancedMainWindow(QMainWindow):
     """
@@ -164,9 +167,11 @@ class AdvancedMainWindow(QMainWindow):
         self.status_bar = self.statusBar()
         self.status_bar.showMessage("準備完了", 2000)
         
-        # 文字数カウンター
-        self.char_count_label = self.status_bar.addPermanentWidget(None)
-        self.update_char_count()
+        # 文字数カウンター(ラベルは1つだけ作成して表示を更新する)
+        self.char_count_label = QLabel()
+        self.status_bar.addPermanentWidget(self.char_count_label)
+        self.document_stats = DocumentStats(self.text_edit.document(), parent=self)
+        self.document_stats.bind_label(self.char_count_label)
         
     def new_document(self):
         """
@@ -197,30 +202,17 @@ class AdvancedMainWindow(QMainWindow):
         """
         テキスト変更時の処理
         
-        テキストが変更された際に文字数を更新します。
+        文字数・行数は DocumentStats がドキュメントの変更を受けて更新します。
         """
-        self.update_char_count()
         self.status_bar.showMessage("テキストが変更されました", 1000)
         
     def update_char_count(self):
         """
         文字数カウンターの更新
         
-        現在のテキストの文字数を計算してステータスバーに表示します。
+        保留中の文字数・行数の更新をすぐにステータスバーへ反映します。
         """
-        text = self.text_edit.toPlainText()
-        char_count = len(text)
-        line_count = text.count('\n') + 1 if text else 1
-        
-        count_text = f"文字数: {char_count} | 行数: {line_count}"
-        
-        # ステータスバーの右端に文字数を表示
-        if hasattr(self, 'char_count_label') and self.char_count_label:
-            self.status_bar.removeWidget(self.char_count_label)
-        
-        from PySide6.QtWidgets import QLabel
-        self.char_count_label = QLabel(count_text)
-        self.status_bar.addPermanentWidget(self.char_count_label)
+        self.document_stats.flush()
 
 
 def main():
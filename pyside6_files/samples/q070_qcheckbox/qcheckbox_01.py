@@ -10,6 +10,7 @@ QCheckBoxは複数選択可能なオプション、QRadioButtonは単一選択
 - 三状態チェックボックス（部分選択）
 - チェック状態の管理と同期
 - シグナルとスロットによるイベント処理
+- 選択状態の保存と復元(tkinter のサンプルと共通の SettingsStore)
 
 """
 
@@ -31,6 +32,25 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common.theme import set_properties, theme
+from tkinter_files.common.settings_store import SettingsStore, default_settings_path
+
+# 保存する設定のキーと既定値(キーは他のサンプルと同じファイルを共有するため接頭辞を付ける)
+SETTINGS_DEFAULTS = {
+    "qcheckbox_01.basic.auto_save": True,
+    "qcheckbox_01.basic.notifications": True,
+    "qcheckbox_01.basic.dark_mode": False,
+    "qcheckbox_01.basic.sound_effects": False,
+    "qcheckbox_01.basic.auto_update": False,
+    "qcheckbox_01.theme": "light",
+    "qcheckbox_01.language": "ja",
+    "qcheckbox_01.notifications_enabled": True,
+    "qcheckbox_01.notification.email": True,
+    "qcheckbox_01.notification.push": False,
+    "qcheckbox_01.notification.sms": False,
+    "qcheckbox_01.notification.desktop": True,
+}
+
 
 class CheckBoxDemoWindow(QWidget):
     """
@@ -46,6 +66,9 @@ class CheckBoxDemoWindow(QWidget):
         ウィンドウの初期設定とチェックボックスサンプルの作成を行います。
         """
         super().__init__()
+        theme.install()
+        # 書き込みはワーカースレッドがまとめて行うので、切り替えのたびに UI を止めない
+        self.settings = SettingsStore(default_settings_path(), SETTINGS_DEFAULTS)
         self.init_ui()
         
     def init_ui(self):
@@ -81,16 +104,7 @@ class CheckBoxDemoWindow(QWidget):
         title_font.setPointSize(18)
         title_font.setBold(True)
         title_label.setFont(title_font)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                background-color: #ecf0f1;
-                padding: 15px;
-                border-radius: 8px;
-                border: 2px solid #bdc3c7;
-                margin-bottom: 15px;
-            }
-        """)
+        set_properties(title_label, role="title")
         layout.addWidget(title_label)
         
     def create_basic_checkbox_section(self, layout):
@@ -102,22 +116,7 @@ class CheckBoxDemoWindow(QWidget):
         """
         # 基本チェックボックスグループ
         checkbox_group = QGroupBox("基本的なチェックボックス")
-        checkbox_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #3498db;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(checkbox_group, accent="blue")
         
         checkbox_layout = QVBoxLayout()
         
@@ -134,14 +133,13 @@ class CheckBoxDemoWindow(QWidget):
         for key, text in basic_options:
             checkbox = QCheckBox(text)
             checkbox.setObjectName(key)
+            # 保存されている状態(なければ既定値)で初期化
+            checkbox.setChecked(self.settings.get(f"qcheckbox_01.basic.{key}"))
             checkbox.toggled.connect(lambda checked, cb=checkbox: self.on_checkbox_toggled(cb, checked))
             self.basic_checkboxes.append(checkbox)
             checkbox_layout.addWidget(checkbox)
             
-        # デフォルトでいくつかをチェック
-        self.basic_checkboxes[0].setChecked(True)  # 自動保存
-        self.basic_checkboxes[1].setChecked(True)  # 通知
-        
+
         checkbox_group.setLayout(checkbox_layout)
         layout.addWidget(checkbox_group)
         
@@ -154,22 +152,7 @@ class CheckBoxDemoWindow(QWidget):
         """
         # ラジオボタングループ
         radio_group = QGroupBox("ラジオボタン（単一選択）")
-        radio_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e74c3c;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(radio_group, accent="red")
         
         radio_layout = QVBoxLayout()
         
@@ -181,15 +164,15 @@ class CheckBoxDemoWindow(QWidget):
         self.theme_group = QButtonGroup()
         self.theme_radios = []
         theme_options = [
-            ("light", "ライトテーマ", True),
-            ("dark", "ダークテーマ", False),
-            ("auto", "システムに従う", False)
+            ("light", "ライトテーマ"),
+            ("dark", "ダークテーマ"),
+            ("auto", "システムに従う")
         ]
         
-        for key, text, default in theme_options:
+        for key, text in theme_options:
             radio = QRadioButton(text)
             radio.setObjectName(key)
-            radio.setChecked(default)
+            radio.setChecked(self.settings.get("qcheckbox_01.theme") == key)
             radio.toggled.connect(lambda checked, rb=radio: self.on_radio_toggled(rb, checked))
             self.theme_group.addButton(radio)
             self.theme_radios.append(radio)
@@ -205,16 +188,16 @@ class CheckBoxDemoWindow(QWidget):
         self.lang_group = QButtonGroup()
         self.lang_radios = []
         lang_options = [
-            ("ja", "日本語", True),
-            ("en", "English", False),
-            ("zh", "中文", False),
-            ("ko", "한국어", False)
+            ("ja", "日本語"),
+            ("en", "English"),
+            ("zh", "中文"),
+            ("ko", "한국어")
         ]
         
-        for key, text, default in lang_options:
+        for key, text in lang_options:
             radio = QRadioButton(text)
             radio.setObjectName(key)
-            radio.setChecked(default)
+            radio.setChecked(self.settings.get("qcheckbox_01.language") == key)
             radio.toggled.connect(lambda checked, rb=radio: self.on_radio_toggled(rb, checked))
             self.lang_group.addButton(radio)
             self.lang_radios.append(radio)
@@ -232,22 +215,7 @@ class CheckBoxDemoWindow(QWidget):
         """
         # 三状態グループ
         tristate_group = QGroupBox("三状態チェックボックス（親子関係）")
-        tristate_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #f39c12;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(tristate_group, accent="orange")
         
         tristate_layout = QVBoxLayout()
         
@@ -294,24 +262,9 @@ class CheckBoxDemoWindow(QWidget):
         # 通知設定グループ
         notification_group = QGroupBox("通知設定")
         notification_group.setCheckable(True)
-        notification_group.setChecked(True)
+        notification_group.setChecked(self.settings.get("qcheckbox_01.notifications_enabled"))
         notification_group.toggled.connect(self.on_notification_group_toggled)
-        notification_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #9b59b6;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(notification_group, accent="purple")
         
         notification_layout = QVBoxLayout()
         
@@ -327,13 +280,14 @@ class CheckBoxDemoWindow(QWidget):
         for key, text in notification_options:
             checkbox = QCheckBox(text)
             checkbox.setObjectName(key)
+            checkbox.setChecked(self.settings.get(f"qcheckbox_01.notification.{key}"))
+            checkbox.toggled.connect(
+                lambda checked, key=key: self.settings.set(f"qcheckbox_01.notification.{key}", checked)
+            )
             self.notification_checkboxes.append(checkbox)
             notification_layout.addWidget(checkbox)
             
-        # デフォルト設定
-        self.notification_checkboxes[0].setChecked(True)  # メール
-        self.notification_checkboxes[3].setChecked(True)  # デスクトップ
-        
+
         notification_group.setLayout(notification_layout)
         layout.addWidget(notification_group)
         
@@ -346,22 +300,7 @@ class CheckBoxDemoWindow(QWidget):
         """
         # インタラクティブグループ
         interactive_group = QGroupBox("インタラクティブ機能")
-        interactive_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #27ae60;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(interactive_group, accent="green")
         
         interactive_layout = QVBoxLayout()
         
@@ -370,50 +309,17 @@ class CheckBoxDemoWindow(QWidget):
         
         get_status_btn = QPushButton("選択状態を取得")
         get_status_btn.clicked.connect(self.get_selection_status)
-        get_status_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        set_properties(get_status_btn, variant="primary")
         button_layout.addWidget(get_status_btn)
         
         toggle_all_btn = QPushButton("すべて切り替え")
         toggle_all_btn.clicked.connect(self.toggle_all_checkboxes)
-        toggle_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #d68910;
-            }
-        """)
+        set_properties(toggle_all_btn, variant="toggle")
         button_layout.addWidget(toggle_all_btn)
         
         reset_btn = QPushButton("デフォルトに戻す")
         reset_btn.clicked.connect(self.reset_to_defaults)
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        set_properties(reset_btn, variant="secondary")
         button_layout.addWidget(reset_btn)
         
         interactive_layout.addLayout(button_layout)
@@ -422,15 +328,7 @@ class CheckBoxDemoWindow(QWidget):
         self.status_display = QTextEdit()
         self.status_display.setMaximumHeight(150)
         self.status_display.setPlaceholderText("選択状態がここに表示されます...")
-        self.status_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 5px;
-                font-family: 'Courier New', monospace;
-            }
-        """)
+        set_properties(self.status_display, role="log")
         interactive_layout.addWidget(self.status_display)
         
         interactive_group.setLayout(interactive_layout)
@@ -447,6 +345,7 @@ class CheckBoxDemoWindow(QWidget):
         name = checkbox.objectName() or checkbox.text()
         status = "有効" if checked else "無効"
         print(f"{name}: {status}")
+        self.settings.set(f"qcheckbox_01.basic.{checkbox.objectName()}", checked)
         
     def on_radio_toggled(self, radio, checked):
         """
@@ -459,6 +358,8 @@ class CheckBoxDemoWindow(QWidget):
         if checked:  # 選択された時のみ処理
             name = radio.objectName() or radio.text()
             print(f"選択された: {name}")
+            key = "qcheckbox_01.theme" if radio in self.theme_radios else "qcheckbox_01.language"
+            self.settings.set(key, radio.objectName())
             
     def on_select_all_changed(self, state):
         """
@@ -498,6 +399,7 @@ class CheckBoxDemoWindow(QWidget):
         """
         status = "有効" if enabled else "無効"
         print(f"通知設定: {status}")
+        self.settings.set("qcheckbox_01.notifications_enabled", enabled)
         
     def get_selection_status(self):
         """
@@ -581,6 +483,16 @@ class CheckBoxDemoWindow(QWidget):
             checkbox.setChecked(i in [0, 3])  # メールとデスクトップのみ
             
         self.status_display.clear()
+        
+    def closeEvent(self, event):
+        """
+        ウィンドウを閉じる前に、書き込みが残っている設定を保存する
+        
+        Args:
+            event (QCloseEvent): クローズイベント
+        """
+        self.settings.close()
+        super().closeEvent(event)
 
 
 def main():
@@ -30,6 +30,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common.theme import set_properties, theme
+
 
 class ComboBoxDemoWindow(QWidget):
     """
@@ -45,6 +47,7 @@ class ComboBoxDemoWindow(QWidget):
         ウィンドウの初期設定とコンボボックスサンプルの作成を行います。
         """
         super().__init__()
+        theme.install()
         self.init_ui()
         
     def init_ui(self):
@@ -81,16 +84,7 @@ class ComboBoxDemoWindow(QWidget):
         title_font.setBold(True)
         title_label.setFont(title_font)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                background-color: #ecf0f1;
-                padding: 15px;
-                border-radius: 8px;
-                border: 2px solid #bdc3c7;
-                margin-bottom: 15px;
-            }
-        """)
+        set_properties(title_label, role="title")
         layout.addWidget(title_label)
         
     def create_basic_combo_section(self, layout):
@@ -102,22 +96,7 @@ class ComboBoxDemoWindow(QWidget):
         """
         # 基本コンボボックスグループ
         basic_group = QGroupBox("基本的なコンボボックス")
-        basic_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #3498db;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(basic_group, accent="blue")
         
         basic_layout = QVBoxLayout()
         
@@ -151,15 +130,7 @@ class ComboBoxDemoWindow(QWidget):
         
         # ステータス表示
         self.basic_status = QLabel("国: 日本, 優先度: 中")
-        self.basic_status.setStyleSheet("""
-            QLabel {
-                background-color: #e8f5e8;
-                padding: 8px;
-                border-radius: 4px;
-                border-left: 4px solid #27ae60;
-                margin: 5px 0;
-            }
-        """)
+        set_properties(self.basic_status, notice="success")
         
         basic_layout.addLayout(country_row)
         basic_layout.addLayout(priority_row)
@@ -177,22 +148,7 @@ class ComboBoxDemoWindow(QWidget):
         """
         # データ付きコンボボックスグループ
         data_group = QGroupBox("データ付きコンボボックス")
-        data_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e74c3c;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(data_group, accent="red")
         
         data_layout = QVBoxLayout()
         
@@ -242,15 +198,7 @@ class ComboBoxDemoWindow(QWidget):
         
         # データ表示エリア
         self.data_display = QLabel("言語コード: ja, 通貨コード: JPY")
-        self.data_display.setStyleSheet("""
-            QLabel {
-                background-color: #fff3cd;
-                padding: 8px;
-                border-radius: 4px;
-                border-left: 4px solid #f39c12;
-                margin: 5px 0;
-            }
-        """)
+        set_properties(self.data_display, notice="warning")
         
         data_layout.addLayout(lang_row)
         data_layout.addLayout(currency_row)
@@ -268,22 +216,7 @@ class ComboBoxDemoWindow(QWidget):
         """
         # 編集可能コンボボックスグループ
         editable_group = QGroupBox("編集可能なコンボボックス")
-        editable_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #f39c12;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(editable_group, accent="orange")
         
         editable_layout = QVBoxLayout()
         
@@ -302,18 +235,7 @@ class ComboBoxDemoWindow(QWidget):
         
         search_button = QPushButton("検索")
         search_button.clicked.connect(self.perform_search)
-        search_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        set_properties(search_button, variant="primary")
         
         search_row.addWidget(search_label)
         search_row.addWidget(self.search_combo, 1)
@@ -335,15 +257,7 @@ class ComboBoxDemoWindow(QWidget):
         
         # 入力状態表示
         self.edit_status = QLabel("入力待ち...")
-        self.edit_status.setStyleSheet("""
-            QLabel {
-                background-color: #f8d7da;
-                padding: 8px;
-                border-radius: 4px;
-                border-left: 4px solid #e74c3c;
-                margin: 5px 0;
-            }
-        """)
+        set_properties(self.edit_status, notice="danger")
         
         editable_layout.addLayout(search_row)
         editable_layout.addLayout(custom_row)
@@ -361,22 +275,7 @@ class ComboBoxDemoWindow(QWidget):
         """
         # 動的コンボボックスグループ
         dynamic_group = QGroupBox("動的コンボボックス（連動選択）")
-        dynamic_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #9b59b6;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(dynamic_group, accent="purple")
         
         dynamic_layout = QVBoxLayout()
         
@@ -429,22 +328,7 @@ class ComboBoxDemoWindow(QWidget):
         """
         # インタラクティブグループ
         interactive_group = QGroupBox("インタラクティブ機能")
-        interactive_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #27ae60;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(interactive_group, accent="green")
         
         interactive_layout = QVBoxLayout()
         
@@ -453,48 +337,15 @@ class ComboBoxDemoWindow(QWidget):
         
         get_values_btn = QPushButton("選択値を取得")
         get_values_btn.clicked.connect(self.get_all_values)
-        get_values_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        set_properties(get_values_btn, variant="primary")
         
         clear_history_btn = QPushButton("履歴をクリア")
         clear_history_btn.clicked.connect(self.clear_search_history)
-        clear_history_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        set_properties(clear_history_btn, variant="danger")
         
         reset_btn = QPushButton("デフォルトに戻す")
         reset_btn.clicked.connect(self.reset_to_defaults)
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        set_properties(reset_btn, variant="secondary")
         
         button_row.addWidget(get_values_btn)
         button_row.addWidget(clear_history_btn)
@@ -504,15 +355,7 @@ class ComboBoxDemoWindow(QWidget):
         self.result_display = QTextEdit()
         self.result_display.setMaximumHeight(120)
         self.result_display.setPlaceholderText("結果がここに表示されます...")
-        self.result_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 5px;
-                font-family: 'Courier New', monospace;
-            }
-        """)
+        set_properties(self.result_display, role="log")
         
         interactive_layout.addLayout(button_row)
         interactive_layout.addWidget(self.result_display)
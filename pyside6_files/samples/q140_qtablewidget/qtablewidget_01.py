@@ -27,6 +27,31 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common.theme import set_properties, theme
+
+# このサンプル固有のスタイル(アプリケーション全体のスタイルシートにまとめて適用される)
+theme.register("qtablewidget_01", """
+    QTableWidget#scoreTable {
+        gridline-color: #d0d0d0;
+        background-color: white;
+        alternate-background-color: #f5f5f5;
+    }
+    QTableWidget#scoreTable::item {
+        padding: 5px;
+    }
+    QTableWidget#scoreTable::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QTableWidget#scoreTable QHeaderView::section {
+        background-color: #34495e;
+        color: white;
+        padding: 8px;
+        font-weight: bold;
+        border: 1px solid #2c3e50;
+    }
+""")
+
 
 class BasicTableWindow(QWidget):
     """
@@ -42,6 +67,7 @@ class BasicTableWindow(QWidget):
         ウィンドウの初期設定とテーブルの作成を行います。
         """
         super().__init__()
+        theme.install()
         self.init_ui()
         
     def init_ui(self):
@@ -58,16 +84,7 @@ class BasicTableWindow(QWidget):
         self.setLayout(layout)
         
         # 説明ラベル
-        info_label = QLabel("学生成績管理テーブル - セルをクリックして選択できます")
-        info_label.setStyleSheet("""
-            QLabel {
-                background-color: #e3f2fd;
-                padding: 10px;
-                border: 1px solid #2196f3;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-        """)
+        info_label = set_properties(QLabel("学生成績管理テーブル - セルをクリックして選択できます"), role="info")
         layout.addWidget(info_label)
         
         # テーブルの作成
@@ -78,15 +95,7 @@ class BasicTableWindow(QWidget):
         self.create_control_buttons(layout)
         
         # ステータスラベル
-        self.status_label = QLabel("準備完了")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background-color: #f5f5f5;
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 3px;
-            }
-        """)
+        self.status_label = set_properties(QLabel("準備完了"), role="status")
         layout.addWidget(self.status_label)
         
     def create_table(self):
@@ -96,7 +105,7 @@ class BasicTableWindow(QWidget):
         学生の成績データを含むテーブルを作成します。
         """
         # テーブルウィジェットの作成
-        self.table = QTableWidget()
+        self.table = set_properties(QTableWidget(), object_name="scoreTable")
         
         # テーブルのサイズを設定（行数、列数）
         self.table.setRowCount(8)
@@ -168,29 +177,6 @@ class BasicTableWindow(QWidget):
         # 水平ヘッダーのストレッチ（最後の列を自動調整）
         self.table.horizontalHeader().setStretchLastSection(True)
         
-        # テーブルのスタイル設定
-        self.table.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #d0d0d0;
-                background-color: white;
-                alternate-background-color: #f5f5f5;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: white;
-                padding: 8px;
-                font-weight: bold;
-                border: 1px solid #2c3e50;
-            }
-        """)
-        
         # 交互の行の色を有効化
         self.table.setAlternatingRowColors(True)
         
@@ -206,52 +192,19 @@ class BasicTableWindow(QWidget):
         # 行追加ボタン
         add_row_button = QPushButton("行を追加")
         add_row_button.clicked.connect(self.add_row)
-        add_row_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
+        set_properties(add_row_button, variant="success")
         button_layout.addWidget(add_row_button)
         
         # 選択行削除ボタン
         delete_row_button = QPushButton("選択行を削除")
         delete_row_button.clicked.connect(self.delete_selected_row)
-        delete_row_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        set_properties(delete_row_button, variant="danger")
         button_layout.addWidget(delete_row_button)
         
         # データクリアボタン
         clear_button = QPushButton("全データクリア")
         clear_button.clicked.connect(self.clear_all_data)
-        clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
+        set_properties(clear_button, variant="warning")
         button_layout.addWidget(clear_button)
         
         layout.addLayout(button_layout)
@@ -15,7 +15,7 @@ QColorは色を表現し操作するためのクラスで、様々な色空間
 import sys
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPalette, QPen
 from PySide6.QtWidgets import (
     QApplication,
     QGroupBox,
@@ -29,6 +29,45 @@ from PySide6.QtWidgets import (
 )
 
 
+class ColorPreview(QWidget):
+    """
+    色のプレビュー
+
+    色はパレット(Window / WindowText)で保持し、paintEvent で塗ります。
+    スライダーを動かすたびにスタイルシートを作り直して解析する必要がなく、
+    親ウィジェットのスタイルシート(テーマ)の背景色でも上書きされません。
+    """
+
+    def __init__(self, text, parent=None):
+        super().__init__(parent)
+        self.text = text
+
+    def set_color(self, color):
+        """
+        プレビューの色を設定する
+
+        Args:
+            color (QColor): 表示する色
+        """
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, color)
+        text_color = Qt.GlobalColor.white if color.lightness() < 128 else Qt.GlobalColor.black
+        palette.setColor(QPalette.ColorRole.WindowText, text_color)
+        self.setPalette(palette)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        palette = self.palette()
+        painter.fillRect(self.rect(), palette.color(QPalette.ColorRole.Window))
+        painter.setPen(QPen(Qt.GlobalColor.black, 2))
+        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(palette.color(QPalette.ColorRole.WindowText))
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.text)
+
+
 class ColorDemoWindow(QWidget):
     """
     QColorの使用例を示すウィンドウクラス
@@ -244,10 +283,9 @@ class ColorDemoWindow(QWidget):
         
         # 結果表示
         result_layout = QVBoxLayout()
-        self.color_display = QLabel("Color Preview")
+        self.color_display = ColorPreview("Color Preview")
         self.color_display.setMinimumSize(150, 100)
-        self.color_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.color_display.setStyleSheet("border: 2px solid black; background-color: rgb(128, 128, 128);")
+        self.color_display.set_color(QColor(128, 128, 128))
         result_layout.addWidget(self.color_display)
         
         self.color_info = QLabel("RGB(128, 128, 128)\n#808080")
@@ -481,17 +519,11 @@ color.setHsv(0, 255, 255)
             g (int): 緑成分
             b (int): 青成分
         """
+        # RGB は 1677 万通りあるので、キャッシュせずにその場で作る
         color = QColor(r, g, b)
         
-        # 背景色を更新
-        self.color_display.setStyleSheet(f"""
-            QLabel {{
-                border: 2px solid black;
-                background-color: rgb({r}, {g}, {b});
-                color: {'white' if (0.299 * r + 0.587 * g + 0.114 * b) < 128 else 'black'};
-                font-weight: bold;
-            }}
-        """)
+        # 背景色を更新(パレットだけを変更し、スタイルシートは解析しない)
+        self.color_display.set_color(color)
         
         # 色情報を更新
         self.color_info.setText(f"RGB({r}, {g}, {b})\n{color.name().upper()}")
@@ -509,6 +541,8 @@ color.setHsv(0, 255, 255)
                 background-color: #f8f9fa;
             }
         """)
+        # テーマのスタイルシートはプレビューのパレットも上書きするので、色を設定し直す
+        self.update_rgb_color()
         
     def apply_dark_theme(self):
         """
@@ -523,6 +557,8 @@ color.setHsv(0, 255, 255)
                 background-color: #34495e;
             }
         """)
+        # テーマのスタイルシートはプレビューのパレットも上書きするので、色を設定し直す
+        self.update_rgb_color()
 
 
 def main():
@@ -14,9 +14,11 @@ QSize, QRect, QPoint基本サンプル - 基本図形クラスの操作
 
 import math
 import sys
+from collections import defaultdict
+from itertools import groupby
 
 from PySide6.QtCore import QPoint, QRect, QSize, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen
+from PySide6.QtGui import QFont, QPainter, QPixmap, QRegion
 from PySide6.QtWidgets import (
     QApplication,
     QGroupBox,
@@ -29,6 +31,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common.paint_resources import paint
+
 
 class GeometryDemoWindow(QWidget):
     """
@@ -449,7 +453,7 @@ QRect:
         point = QPoint(self.x_spinbox.value(), self.y_spinbox.value())
         size = QSize(self.width_spinbox.value(), self.height_spinbox.value())
         rect = QRect(point, size)
-        self.drawing_area.add_shape(("rect", rect, QColor("#3498db")))
+        self.drawing_area.add_shape(("rect", rect, paint.color("#3498db")))
         
     def add_circle(self):
         """
@@ -458,7 +462,7 @@ QRect:
         point = QPoint(self.x_spinbox.value(), self.y_spinbox.value())
         size = QSize(self.width_spinbox.value(), self.height_spinbox.value())
         rect = QRect(point, size)  # 円は矩形に内接して描画
-        self.drawing_area.add_shape(("circle", rect, QColor("#e74c3c")))
+        self.drawing_area.add_shape(("circle", rect, paint.color("#e74c3c")))
         
     def clear_shapes(self):
         """
@@ -467,13 +471,66 @@ QRect:
         self.drawing_area.clear_shapes()
 
 
+class ShapeGridIndex:
+    """
+    図形の外接矩形をグリッドのセルに登録する空間インデックス
+    
+    再描画が必要な領域に重なる図形だけを、追加した順番で取り出すために使います。
+    """
+    
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        
+    def _cells(self, rect):
+        size = self.cell_size
+        for cx in range(rect.left() // size, rect.right() // size + 1):
+            for cy in range(rect.top() // size, rect.bottom() // size + 1):
+                yield cx, cy
+                
+    def insert(self, index, rect):
+        """
+        図形を登録
+        
+        Args:
+            index (int): 図形の番号(追加順)
+            rect (QRect): 外接矩形
+        """
+        for cell in self._cells(rect):
+            self.cells[cell].append(index)
+            
+    def query(self, rect):
+        """
+        矩形に重なる可能性のある図形の番号を追加順に返す
+        
+        Args:
+            rect (QRect): 検索する領域
+            
+        Returns:
+            list: 図形の番号のリスト
+        """
+        found = set()
+        for cell in self._cells(rect):
+            found.update(self.cells.get(cell, ()))
+        return sorted(found)
+        
+    def clear(self):
+        self.cells.clear()
+
+
 class DrawingArea(QWidget):
     """
     図形描画エリア
     
     QPoint、QSize、QRectの可視化を行います。
+    
+    追加図形は透明な QPixmap(キャッシュ)に描いておき、paintEvent ではキャッシュを
+    転送するだけにします。キャッシュは領域ごとに有効かどうかを管理し、無効な領域に
+    重なる図形だけを空間インデックスで取り出して描き直します。
     """
     
+    PEN_WIDTH = 2
+    
     def __init__(self):
         """
         DrawingAreaクラスのコンストラクタ
@@ -487,6 +544,11 @@ class DrawingArea(QWidget):
         self.basic_rect = QRect(self.basic_point, self.basic_size)
         self.shapes = []
         
+        # 追加図形のキャッシュと、キャッシュが描画済みの領域
+        self.shape_index = ShapeGridIndex()
+        self.cache = None
+        self.cache_valid = QRegion()
+        
     def set_basic_shapes(self, point, size, rect):
         """
         基本図形の設定
@@ -505,34 +567,127 @@ class DrawingArea(QWidget):
         """
         図形の追加
         
+        キャッシュがあれば新しい図形だけをキャッシュに重ねて描き、その範囲だけを再描画します。
+        
         Args:
             shape (tuple): (タイプ, 図形, 色)
         """
+        index = len(self.shapes)
         self.shapes.append(shape)
-        self.update()
+        bounds = self.shape_bounds(shape[1])
+        self.shape_index.insert(index, bounds)
+        
+        if self.cache is not None:
+            painter = QPainter(self.cache)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.draw_additional_shapes(painter, [shape])
+            painter.end()
+        self.update(bounds)
+        
+    def add_shapes(self, shapes):
+        """
+        図形をまとめて追加(キャッシュは次の描画時に作り直す)
+        
+        Args:
+            shapes (list): (タイプ, 図形, 色) のリスト
+        """
+        for shape in shapes:
+            index = len(self.shapes)
+            self.shapes.append(shape)
+            self.shape_index.insert(index, self.shape_bounds(shape[1]))
+        self.invalidate_cache()
         
     def clear_shapes(self):
         """
         図形のクリア
         """
         self.shapes.clear()
+        self.shape_index.clear()
+        self.invalidate_cache()
+        
+    def shape_bounds(self, rect):
+        """ペンの太さを含めた図形の外接矩形"""
+        margin = self.PEN_WIDTH
+        return rect.adjusted(-margin, -margin, margin, margin)
+        
+    def invalidate_cache(self):
+        """キャッシュ全体を無効にして再描画を要求"""
+        self.cache = None
+        self.cache_valid = QRegion()
         self.update()
         
+    def resizeEvent(self, event):
+        """
+        サイズ変更時は、描画済みのキャッシュを新しい大きさの画像に移す
+        
+        図形の座標はウィジェットの大きさに依存しないため、描画済みの部分はそのまま使えます。
+        広がった部分だけが次の描画でキャッシュに描かれます。
+        """
+        if self.cache is not None:
+            old = self.cache
+            ratio = self.devicePixelRatioF()
+            self.cache = QPixmap(event.size() * ratio)
+            self.cache.setDevicePixelRatio(ratio)
+            self.cache.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(self.cache)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawPixmap(0, 0, old)
+            painter.end()
+            self.cache_valid = self.cache_valid.intersected(QRect(QPoint(0, 0), event.size()))
+        super().resizeEvent(event)
+        
+    def ensure_cache(self, region):
+        """
+        指定した領域のキャッシュを描画済みにする
+        
+        Args:
+            region (QRegion): 必要な領域
+        """
+        if self.cache is None:
+            ratio = self.devicePixelRatioF()
+            self.cache = QPixmap(self.size() * ratio)
+            self.cache.setDevicePixelRatio(ratio)
+            self.cache.fill(Qt.GlobalColor.transparent)
+            self.cache_valid = QRegion()
+            
+        dirty = region.subtracted(self.cache_valid)
+        if dirty.isEmpty():
+            return
+            
+        painter = QPainter(self.cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # 領域を構成する矩形(重ならない)ごとに、その矩形にかかる図形だけを描く
+        # (L 字形の領域を外接矩形でまとめると、ほぼ全ての図形を描くことになる)
+        for dirty_rect in dirty:
+            painter.setClipRect(dirty_rect)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.fillRect(dirty_rect, Qt.GlobalColor.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            indices = self.shape_index.query(dirty_rect)
+            self.draw_additional_shapes(painter, [self.shapes[i] for i in indices])
+        painter.end()
+        self.cache_valid = self.cache_valid.united(dirty)
+        
     def paintEvent(self, event):
         """
         描画イベント
         
+        再描画が必要な領域(event.region())だけを描画します。
+        
         Args:
             event: ペイントイベント
         """
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRegion(event.region())
         
         # 基本図形の描画
         self.draw_basic_shapes(painter)
         
-        # 追加図形の描画
-        self.draw_additional_shapes(painter)
+        # 追加図形の描画(キャッシュの転送)
+        if self.shapes:
+            self.ensure_cache(event.region())
+            painter.drawPixmap(0, 0, self.cache)
         
     def draw_basic_shapes(self, painter):
         """
@@ -542,11 +697,11 @@ class DrawingArea(QWidget):
             painter (QPainter): ペインター
         """
         # QPoint（点）の描画
-        painter.setPen(QPen(QColor("#e74c3c"), 8))
+        painter.setPen(paint.pen("#e74c3c", 8))
         painter.drawPoint(self.basic_point)
         
         # 点のラベル
-        painter.setPen(QPen(QColor("#2c3e50"), 2))
+        painter.setPen(paint.pen("#2c3e50", 2))
         painter.drawText(
             self.basic_point.x() + 10, 
             self.basic_point.y() - 10,
@@ -554,12 +709,12 @@ class DrawingArea(QWidget):
         )
         
         # QRect（矩形）の描画
-        painter.setPen(QPen(QColor("#3498db"), 2))
-        painter.setBrush(QBrush(QColor("#3498db"), Qt.BrushStyle.NoBrush))
+        painter.setPen(paint.pen("#3498db", 2))
+        painter.setBrush(paint.brush("#3498db", Qt.BrushStyle.NoBrush))
         painter.drawRect(self.basic_rect)
         
         # 矩形のラベル
-        painter.setPen(QPen(QColor("#2c3e50"), 2))
+        painter.setPen(paint.pen("#2c3e50", 2))
         painter.drawText(
             self.basic_rect.x(),
             self.basic_rect.y() - 5,
@@ -574,27 +729,37 @@ class DrawingArea(QWidget):
         )
         
         # 角の点を描画
-        painter.setPen(QPen(QColor("#f39c12"), 6))
+        painter.setPen(paint.pen("#f39c12", 6))
         painter.drawPoint(self.basic_rect.topLeft())
         painter.drawPoint(self.basic_rect.topRight())
         painter.drawPoint(self.basic_rect.bottomLeft())
         painter.drawPoint(self.basic_rect.bottomRight())
         
-    def draw_additional_shapes(self, painter):
+    def draw_additional_shapes(self, painter, shapes=None):
         """
         追加図形の描画
         
+        同じ種類・同じ色の図形が続く部分は、ペンとブラシを1回だけ設定し、
+        矩形は drawRects でまとめて描画します。
+        円は drawEllipse で1つずつ描きます(QPainterPath にまとめると、重なりを合成する処理が
+        図形の数に対して急激に重くなり、1つずつ描くより何十倍も遅くなるため)。
+        
         Args:
             painter (QPainter): ペインター
-        """
-        for shape_type, shape_rect, color in self.shapes:
-            painter.setPen(QPen(color, 2))
-            painter.setBrush(QBrush(color, Qt.BrushStyle.SolidPattern))
+            shapes (list): 描画する図形(省略時は全て)
+        """
+        if shapes is None:
+            shapes = self.shapes
+        for (shape_type, color), run in groupby(shapes, key=lambda shape: (shape[0], shape[2])):
+            painter.setPen(paint.pen(color, self.PEN_WIDTH))
+            painter.setBrush(paint.brush(color))
+            rects = [shape_rect for _, shape_rect, _ in run]
             
             if shape_type == "rect":
-                painter.drawRect(shape_rect)
+                painter.drawRects(rects)
             elif shape_type == "circle":
-                painter.drawEllipse(shape_rect)
+                for shape_rect in rects:
+                    painter.drawEllipse(shape_rect)
 
 
 def main():
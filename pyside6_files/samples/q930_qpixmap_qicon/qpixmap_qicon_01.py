@@ -20,12 +20,10 @@ from typing import Optional
 
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import (
-    QBrush,
-    QColor,
     QFont,
     QIcon,
+    QImage,
     QPainter,
-    QPen,
     QPixmap,
     QTransform,
 )
@@ -44,6 +42,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common.paint_resources import paint
+
 
 class PixmapIconDemoWindow(QWidget):
     """
@@ -487,18 +487,8 @@ class PixmapIconDemoWindow(QWidget):
         """
         グラデーション画像の作成
         """
-        pixmap = QPixmap(300, 200)
-        painter = QPainter(pixmap)
-        
-        # グラデーション作成
-        for i in range(300):
-            ratio = i / 300.0
-            color = QColor()
-            color.setHsv(int(240 * ratio), 200, 255)  # 青から赤へのグラデーション
-            painter.setPen(QPen(color, 1))
-            painter.drawLine(i, 0, i, 200)
-            
-        painter.end()
+        # 青から赤へのグラデーション(1行分の色だけを計算し、作成した画像は共有キャッシュから使い回す)
+        pixmap = paint.hue_gradient(300, 200, 0, 240, 200, 255)
         
         self.original_pixmap = pixmap
         self.current_pixmap = pixmap.copy()
@@ -520,13 +510,13 @@ class PixmapIconDemoWindow(QWidget):
         for row in range(0, 200, checker_size):
             for col in range(0, 300, checker_size):
                 if (row // checker_size + col // checker_size) % 2 == 0:
-                    painter.fillRect(col, row, checker_size, checker_size, QColor("#3498db"))
+                    painter.fillRect(col, row, checker_size, checker_size, paint.color("#3498db"))
                 else:
-                    painter.fillRect(col, row, checker_size, checker_size, QColor("#e74c3c"))
+                    painter.fillRect(col, row, checker_size, checker_size, paint.color("#e74c3c"))
                     
         # 円形パターンを重ねる
         painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Multiply)
-        painter.setBrush(QBrush(QColor(255, 255, 0, 100)))
+        painter.setBrush(paint.brush((255, 255, 0, 100)))
         painter.setPen(Qt.PenStyle.NoPen)
         
         for i in range(5):
@@ -552,10 +542,10 @@ class PixmapIconDemoWindow(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # 背景
-        painter.fillRect(50, 50, 300, 200, QColor("#f8f9fa"))
+        painter.fillRect(50, 50, 300, 200, paint.color("#f8f9fa"))
         
         # グリッド線
-        painter.setPen(QPen(QColor("#dee2e6"), 1))
+        painter.setPen(paint.pen("#dee2e6", 1))
         for i in range(6):
             y = 50 + i * 40
             painter.drawLine(50, y, 350, y)
@@ -565,7 +555,7 @@ class PixmapIconDemoWindow(QWidget):
             
         # データ描画
         data = [30, 80, 45, 90, 65, 120]
-        painter.setPen(QPen(QColor("#3498db"), 3))
+        painter.setPen(paint.pen("#3498db", 3))
         
         for i in range(len(data) - 1):
             x1 = 50 + i * 50
@@ -575,15 +565,15 @@ class PixmapIconDemoWindow(QWidget):
             painter.drawLine(x1, y1, x2, y2)
             
         # データポイント
-        painter.setBrush(QBrush(QColor("#e74c3c")))
+        painter.setBrush(paint.brush("#e74c3c"))
         for i, value in enumerate(data):
             x = 50 + i * 50
             y = 250 - value
             painter.drawEllipse(x - 4, y - 4, 8, 8)
             
         # タイトル
-        painter.setPen(QPen(QColor("#2c3e50"), 2))
-        painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        painter.setPen(paint.pen("#2c3e50", 2))
+        painter.setFont(paint.font("Arial", 14, QFont.Weight.Bold))
         painter.drawText(150, 30, "サンプルチャート")
         
         painter.end()
@@ -608,12 +598,12 @@ class PixmapIconDemoWindow(QWidget):
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             
             # 背景円
-            painter.setBrush(QBrush(QColor("#3498db")))
+            painter.setBrush(paint.brush("#3498db"))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(1, 1, size - 2, size - 2)
             
             # 星型を描画
-            painter.setBrush(QBrush(QColor("#ffffff")))
+            painter.setBrush(paint.brush("#ffffff"))
             star_size = size * 0.6
             center = size / 2
             
@@ -628,7 +618,7 @@ class PixmapIconDemoWindow(QWidget):
                 inner_y = center + (star_size / 2) * 0.3 * math.sin(inner_angle)
                 
                 # 簡略化して中央から線を引く
-                painter.setPen(QPen(QColor("#ffffff"), max(1, size // 16)))
+                painter.setPen(paint.pen("#ffffff", max(1, size // 16)))
                 painter.drawLine(int(center), int(center), int(outer_x), int(outer_y))
                 
             painter.end()
@@ -746,22 +736,16 @@ class PixmapIconDemoWindow(QWidget):
         if not self.original_pixmap:
             return
             
-        grayscale_pixmap = QPixmap(self.original_pixmap.size())
-        grayscale_pixmap.fill(Qt.GlobalColor.white)
-        
-        painter = QPainter(grayscale_pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-        
         # グレースケール変換（簡易版）
-        for y in range(self.original_pixmap.height()):
-            for x in range(self.original_pixmap.width()):
-                color = self.original_pixmap.toImage().pixelColor(x, y)
-                gray = int(0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue())
-                gray_color = QColor(gray, gray, gray)
-                painter.setPen(gray_color)
-                painter.drawPoint(x, y)
+        # 画像への変換は1回だけ行い、ピクセルは QImage に直接書き込む
+        image = self.original_pixmap.toImage().convertToFormat(QImage.Format.Format_RGB32)
+        for y in range(image.height()):
+            for x in range(image.width()):
+                rgb = image.pixel(x, y)
+                gray = int(0.299 * ((rgb >> 16) & 0xFF) + 0.587 * ((rgb >> 8) & 0xFF) + 0.114 * (rgb & 0xFF))
+                image.setPixel(x, y, 0xFF000000 | (gray << 16) | (gray << 8) | gray)
                 
-        painter.end()
+        grayscale_pixmap = QPixmap.fromImage(image)
         
         self.current_pixmap = grayscale_pixmap
         self.image_label.setPixmap(self.current_pixmap)
@@ -780,7 +764,7 @@ class PixmapIconDemoWindow(QWidget):
         
         # セピアオーバーレイ
         painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Multiply)
-        painter.fillRect(sepia_pixmap.rect(), QColor(222, 184, 135, 100))
+        painter.fillRect(sepia_pixmap.rect(), paint.color((222, 184, 135, 100)))
         
         painter.end()
         
@@ -806,7 +790,7 @@ class PixmapIconDemoWindow(QWidget):
         pixmap.fill(Qt.GlobalColor.white)
         
         painter = QPainter(pixmap)
-        painter.setFont(QFont("Arial", 12))
+        painter.setFont(paint.font("Arial", 12))
         painter.drawText(10, 20, "システムアイコンの例:")
         painter.drawText(10, 50, "• QStyle::SP_ComputerIcon")
         painter.drawText(10, 80, "• QStyle::SP_FileIcon") 
@@ -835,21 +819,21 @@ class PixmapIconDemoWindow(QWidget):
         
         for size in sizes:
             # 簡単なアイコンを描画
-            painter.setBrush(QBrush(QColor("#3498db")))
-            painter.setPen(QPen(QColor("#2980b9"), 2))
+            painter.setBrush(paint.brush("#3498db"))
+            painter.setPen(paint.pen("#2980b9", 2))
             painter.drawRoundedRect(x_pos, 100, size, size, size//4, size//4)
             
             # サイズラベル
-            painter.setPen(QPen(QColor("#2c3e50"), 1))
-            painter.setFont(QFont("Arial", 10))
+            painter.setPen(paint.pen("#2c3e50", 1))
+            painter.setFont(paint.font("Arial", 10))
             painter.drawText(x_pos, 90, f"{size}px")
             
             x_pos += size + 20
             
         # タイトル
-        painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        painter.setFont(paint.font("Arial", 14, QFont.Weight.Bold))
         painter.drawText(50, 30, "マルチサイズアイコンの例")
-        painter.setFont(QFont("Arial", 10))
+        painter.setFont(paint.font("Arial", 10))
         painter.drawText(50, 50, "同じアイコンを異なるサイズで使用")
         
         painter.end()
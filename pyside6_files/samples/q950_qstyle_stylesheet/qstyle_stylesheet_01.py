@@ -35,6 +35,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common.theme_manager import ThemeManager
+
 
 class StyleSheetDemoWindow(QWidget):
     """
@@ -217,7 +219,7 @@ class StyleSheetDemoWindow(QWidget):
         layout.addWidget(self.log_display)
         
     def setup_themes(self):
-        """テーマの設定"""
+        """テーマの設定(各テーマは QPalette と残りのスタイルシートに事前変換しておく)"""
         self.themes = {
             "Default": self.get_default_theme(),
             "Dark": self.get_dark_theme(),
@@ -225,6 +227,9 @@ class StyleSheetDemoWindow(QWidget):
             "Flat": self.get_flat_theme(),
             "Gradient": self.get_gradient_theme()
         }
+        self.theme_manager = ThemeManager(self)
+        for name, css in self.themes.items():
+            self.theme_manager.add_theme(name, css)
         
     def get_default_theme(self):
         """デフォルトテーマ"""
@@ -407,9 +412,9 @@ class StyleSheetDemoWindow(QWidget):
     def change_theme(self, theme_name):
         """テーマの変更"""
         if theme_name in self.themes:
-            self.setStyleSheet(self.themes[theme_name])
+            elapsed = self.theme_manager.apply(theme_name)
             self.current_theme = theme_name.lower()
-            self.log_action(f"テーマを '{theme_name}' に変更しました")
+            self.log_action(f"テーマを '{theme_name}' に変更しました ({elapsed * 1000:.1f} ms)")
             
     def animate_button(self):
         """ボタンのアニメーション"""
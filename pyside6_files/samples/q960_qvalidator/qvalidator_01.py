@@ -13,10 +13,9 @@ QValidatorは、ユーザー入力の妥当性を検証するためのクラス
 
 """
 
-import re
 import sys
 
-from PySide6.QtCore import QRegularExpression, Qt
+from PySide6.QtCore import QLocale, QRegularExpression, Qt
 from PySide6.QtGui import (
     QDoubleValidator,
     QFont,
@@ -38,12 +37,37 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from pyside6_files.common import validators
+from pyside6_files.common.bulk_validation import BulkValidationEngine
+from pyside6_files.common.theme import set_properties, set_state, theme
+from pyside6_files.common.validation_feedback import ValidationFeedback
+
+
+# validators モジュールの状態(int)と QValidator.State の対応
+QT_STATES = {
+    validators.INVALID: QValidator.State.Invalid,
+    validators.INTERMEDIATE: QValidator.State.Intermediate,
+    validators.ACCEPTABLE: QValidator.State.Acceptable,
+}
+
+# 数値バリデーターのロケール(小数点は "."、桁区切りは受け付けない)
+# 一括検証エンジンの数値の検証ロジックも同じ規則で判定する
+NUMBER_LOCALE = QLocale(QLocale.Language.C)
+NUMBER_LOCALE.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+
 
 class EmailValidator(QValidator):
     """
     カスタムメールアドレスバリデーター
+
+    正規表現はクラス単位でコンパイル済みのものを使い、
+    キー入力ごとの判定は前回の入力からの差分だけをオートマトンで読み進めます。
     """
     
+    def __init__(self):
+        super().__init__()
+        self.core = validators.EmailCore()
+        
     def validate(self, input_str: str, pos: int):
         """
         メールアドレスの検証
@@ -55,19 +79,9 @@ class EmailValidator(QValidator):
         Returns:
             tuple: (検証状態, 入力文字列, カーソル位置)
         """
-        # 空文字列は中間状態
-        if not input_str:
-            return (QValidator.State.Intermediate, input_str, pos)
-            
-        # 基本的なメール形式チェック
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if re.match(email_pattern, input_str):
-            return (QValidator.State.Acceptable, input_str, pos)
-        elif self.is_partial_email(input_str):
-            return (QValidator.State.Intermediate, input_str, pos)
-        else:
-            return (QValidator.State.Invalid, input_str, pos)
+        # 空文字列も中間状態として扱われる
+        state = self.core.state_incremental(input_str)
+        return (QT_STATES[state], input_str, pos)
             
     def is_partial_email(self, input_str: str) -> bool:
         """
@@ -79,24 +93,7 @@ class EmailValidator(QValidator):
         Returns:
             bool: 部分的なメールアドレスの場合True
         """
-        # 許可された文字のみで構成されているか
-        allowed_chars = re.match(r'^[a-zA-Z0-9._%+-@]*$', input_str)
-        if not allowed_chars:
-            return False
-            
-        # @が2個以上ある場合は無効
-        if input_str.count('@') > 1:
-            return False
-            
-        # @があればより詳細にチェック
-        if '@' in input_str:
-            parts = input_str.split('@')
-            if len(parts) == 2:
-                local, domain = parts
-                # ローカル部が空でない、ドメイン部が有効な文字で構成
-                return len(local) > 0 and bool(re.match(r'^[a-zA-Z0-9.-]*$', domain))
-                
-        return True
+        return self.core.is_partial(input_str)
 
 
 class PasswordValidator(QValidator):
@@ -107,6 +104,7 @@ class PasswordValidator(QValidator):
     def __init__(self, min_length=8):
         super().__init__()
         self.min_length = min_length
+        self.core = validators.PasswordCore(min_length)
         
     def validate(self, input_str: str, pos: int):
         """
@@ -119,19 +117,41 @@ class PasswordValidator(QValidator):
         Returns:
             tuple: (検証状態, 入力文字列, カーソル位置)
         """
-        if len(input_str) < self.min_length:
-            return (QValidator.State.Intermediate, input_str, pos)
-            
-        # パスワード強度チェック
-        has_upper = any(c.isupper() for c in input_str)
-        has_lower = any(c.islower() for c in input_str)
-        has_digit = any(c.isdigit() for c in input_str)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in input_str)
-        
-        if has_upper and has_lower and has_digit and has_special:
-            return (QValidator.State.Acceptable, input_str, pos)
-        else:
-            return (QValidator.State.Intermediate, input_str, pos)
+        # 最小文字数と強度(大文字・小文字・数字・記号)のチェック
+        state = self.core.state(input_str)
+        return (QT_STATES[state], input_str, pos)
+
+
+def field_spec(validator):
+    """
+    入力欄に設定したバリデーターから、一括検証エンジンのスキーマの指定を作る
+
+    「全て検証」や CSV の取り込みでも、入力欄と同じ条件で検証するために使います。
+
+    Args:
+        validator (QValidator): 入力欄のバリデーター
+
+    Returns:
+        tuple: (種類, 引数...)
+
+    Raises:
+        ValueError: 一括検証エンジンで同じ判定ができないバリデーターの場合
+    """
+    if isinstance(validator, EmailValidator):
+        return ("email",)
+    if isinstance(validator, PasswordValidator):
+        return ("password", validator.min_length)
+    if isinstance(validator, (QIntValidator, QDoubleValidator)):
+        locale = validator.locale()
+        if locale.decimalPoint() != "." or not locale.numberOptions() & QLocale.NumberOption.RejectGroupSeparator:
+            raise ValueError("数値バリデーターには NUMBER_LOCALE を設定してください")
+        if isinstance(validator, QIntValidator):
+            return ("int", validator.bottom(), validator.top())
+        scientific = validator.notation() == QDoubleValidator.Notation.ScientificNotation
+        return ("double", validator.bottom(), validator.top(), validator.decimals(), scientific)
+    if isinstance(validator, QRegularExpressionValidator):
+        return ("regex", validator.regularExpression().pattern())
+    raise ValueError(f"一括検証に対応していないバリデーターです: {type(validator).__name__}")
 
 
 class ValidatorDemoWindow(QWidget):
@@ -148,8 +168,26 @@ class ValidatorDemoWindow(QWidget):
         ウィンドウの初期設定とバリデーションサンプルの作成を行います。
         """
         super().__init__()
+        theme.install()
         self.init_ui()
         
+        # 「全て検証」の対象の入力欄と、そのバリデーターから作ったスキーマ
+        self.form_inputs = {
+            "整数": self.int_input,
+            "小数": self.double_input,
+            "年齢": self.age_input,
+            "郵便番号": self.postal_input,
+            "電話番号": self.phone_input,
+            "英数字": self.alphanumeric_input,
+            "メールアドレス": self.email_input,
+            "パスワード": self.password_input,
+        }
+        self.form_schema = {
+            field_name: field_spec(input_widget.validator())
+            for field_name, input_widget in self.form_inputs.items()
+        }
+        self.bulk_engine = BulkValidationEngine(self.form_schema)
+        
     def init_ui(self):
         """
         ユーザーインターフェースの初期化
@@ -186,6 +224,9 @@ class ValidatorDemoWindow(QWidget):
         # ログ表示エリア
         self.create_log_section(main_layout)
         
+        # 検証結果の表示(状態が変わったときだけ再ポリッシュし、ログは上限付き)
+        self.feedback = ValidationFeedback(self.validation_status, self.log_display)
+        
     def create_title_section(self, layout):
         """
         タイトルセクションの作成
@@ -199,16 +240,7 @@ class ValidatorDemoWindow(QWidget):
         title_font.setBold(True)
         title_label.setFont(title_font)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                background-color: #ecf0f1;
-                padding: 15px;
-                border-radius: 8px;
-                border: 2px solid #bdc3c7;
-                margin-bottom: 15px;
-            }
-        """)
+        set_properties(title_label, role="title")
         layout.addWidget(title_label)
         
     def create_numeric_validators_section(self, layout):
@@ -219,28 +251,14 @@ class ValidatorDemoWindow(QWidget):
             layout (QVBoxLayout): 追加先のレイアウト
         """
         numeric_group = QGroupBox("数値バリデーター")
-        numeric_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #3498db;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(numeric_group, accent="blue")
         
         numeric_layout = QFormLayout()
         
         # 整数バリデーター
         self.int_input = QLineEdit()
         int_validator = QIntValidator(-100, 100)
+        int_validator.setLocale(NUMBER_LOCALE)
         self.int_input.setValidator(int_validator)
         self.int_input.setPlaceholderText("整数 (-100 ～ 100)")
         self.int_input.textChanged.connect(lambda text: self.validate_and_log("整数", text, self.int_input))
@@ -249,6 +267,7 @@ class ValidatorDemoWindow(QWidget):
         # 浮動小数点バリデーター
         self.double_input = QLineEdit()
         double_validator = QDoubleValidator(0.0, 999.99, 2)
+        double_validator.setLocale(NUMBER_LOCALE)
         self.double_input.setValidator(double_validator)
         self.double_input.setPlaceholderText("小数 (0.00 ～ 999.99)")
         self.double_input.textChanged.connect(lambda text: self.validate_and_log("小数", text, self.double_input))
@@ -257,6 +276,7 @@ class ValidatorDemoWindow(QWidget):
         # 年齢入力（カスタム範囲）
         self.age_input = QLineEdit()
         age_validator = QIntValidator(0, 150)
+        age_validator.setLocale(NUMBER_LOCALE)
         self.age_input.setValidator(age_validator)
         self.age_input.setPlaceholderText("年齢 (0 ～ 150)")
         self.age_input.textChanged.connect(lambda text: self.validate_and_log("年齢", text, self.age_input))
@@ -273,22 +293,7 @@ class ValidatorDemoWindow(QWidget):
             layout (QVBoxLayout): 追加先のレイアウト
         """
         regex_group = QGroupBox("正規表現バリデーター")
-        regex_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e74c3c;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(regex_group, accent="red")
         
         regex_layout = QFormLayout()
         
@@ -330,22 +335,7 @@ class ValidatorDemoWindow(QWidget):
             layout (QVBoxLayout): 追加先のレイアウト
         """
         custom_group = QGroupBox("カスタムバリデーター")
-        custom_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #f39c12;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(custom_group, accent="orange")
         
         custom_layout = QFormLayout()
         
@@ -367,8 +357,7 @@ class ValidatorDemoWindow(QWidget):
         custom_layout.addRow("パスワード:", self.password_input)
         
         # パスワード強度表示
-        self.password_strength = QLabel("強度: なし")
-        self.password_strength.setStyleSheet("color: #7f8c8d; font-style: italic;")
+        self.password_strength = set_properties(QLabel("強度: なし"), strength="none")
         custom_layout.addRow("", self.password_strength)
         
         custom_group.setLayout(custom_layout)
@@ -382,35 +371,12 @@ class ValidatorDemoWindow(QWidget):
             layout (QVBoxLayout): 追加先のレイアウト
         """
         feedback_group = QGroupBox("検証フィードバック")
-        feedback_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #9b59b6;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(feedback_group, accent="purple")
         
         feedback_layout = QVBoxLayout()
         
         # 検証状態表示
         self.validation_status = QLabel("入力待ち...")
-        self.validation_status.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                padding: 10px;
-                border-radius: 5px;
-                border-left: 4px solid #6c757d;
-            }
-        """)
         feedback_layout.addWidget(self.validation_status)
         
         # テスト用ボタン
@@ -418,36 +384,12 @@ class ValidatorDemoWindow(QWidget):
         
         validate_all_btn = QPushButton("全て検証")
         validate_all_btn.clicked.connect(self.validate_all_inputs)
-        validate_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
+        set_properties(validate_all_btn, variant="success")
         test_layout.addWidget(validate_all_btn)
         
         clear_all_btn = QPushButton("全てクリア")
         clear_all_btn.clicked.connect(self.clear_all_inputs)
-        clear_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        set_properties(clear_all_btn, variant="secondary")
         test_layout.addWidget(clear_all_btn)
         
         feedback_layout.addLayout(test_layout)
@@ -463,56 +405,20 @@ class ValidatorDemoWindow(QWidget):
             layout (QVBoxLayout): 追加先のレイアウト
         """
         log_group = QGroupBox("バリデーションログ")
-        log_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #2c3e50;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-                background-color: white;
-            }
-        """)
+        set_properties(log_group, accent="dark")
         
         log_layout = QVBoxLayout()
         
         self.log_display = QTextEdit()
         self.log_display.setMaximumHeight(120)
         self.log_display.setPlaceholderText("バリデーション結果がここに表示されます...")
-        self.log_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 10px;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-            }
-        """)
+        set_properties(self.log_display, role="log")
         log_layout.addWidget(self.log_display)
         
         # クリアボタン
         clear_log_btn = QPushButton("ログをクリア")
-        clear_log_btn.clicked.connect(self.log_display.clear)
-        clear_log_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        clear_log_btn.clicked.connect(lambda: self.feedback.clear_log())
+        set_properties(clear_log_btn, variant="secondary")
         log_layout.addWidget(clear_log_btn)
         
         log_group.setLayout(log_layout)
@@ -531,34 +437,8 @@ class ValidatorDemoWindow(QWidget):
         if validator:
             state, _, _ = validator.validate(text, 0)
             
-            # スタイルの更新
-            if state == QValidator.State.Acceptable:
-                input_widget.setStyleSheet("border: 2px solid #27ae60; background-color: #d5f4e6;")
-                status = "✓ 有効"
-                color = "#27ae60"
-            elif state == QValidator.State.Intermediate:
-                input_widget.setStyleSheet("border: 2px solid #f39c12; background-color: #fef9e7;")
-                status = "⚠ 部分的"
-                color = "#f39c12"
-            else:
-                input_widget.setStyleSheet("border: 2px solid #e74c3c; background-color: #fadbd8;")
-                status = "✗ 無効"
-                color = "#e74c3c"
-                
-            # ログに記録
-            self.log_display.append(f"[{field_name}] '{text}' → {status}")
-            
-            # 全体ステータス更新
-            self.validation_status.setText(f"最後の検証: {field_name} - {status}")
-            self.validation_status.setStyleSheet(f"""
-                QLabel {{
-                    background-color: #f8f9fa;
-                    padding: 10px;
-                    border-radius: 5px;
-                    border-left: 4px solid {color};
-                    color: {color};
-                }}
-            """)
+            # 入力欄・ステータス・ログの更新(validationState プロパティで色が切り替わる)
+            self.feedback.report(field_name, text, input_widget, state)
             
     def validate_password(self, text: str):
         """
@@ -603,66 +483,48 @@ class ValidatorDemoWindow(QWidget):
         # 強度レベル
         if strength_score == 5:
             strength = "非常に強い"
-            color = "#27ae60"
+            level = "very_strong"
         elif strength_score >= 4:
             strength = "強い"
-            color = "#f39c12"
+            level = "strong"
         elif strength_score >= 3:
             strength = "普通"
-            color = "#e67e22"
+            level = "fair"
         elif strength_score >= 1:
             strength = "弱い"
-            color = "#e74c3c"
+            level = "weak"
         else:
             strength = "なし"
-            color = "#7f8c8d"
+            level = "none"
             
         self.password_strength.setText(f"強度: {strength} ({strength_score}/5)")
-        self.password_strength.setStyleSheet(f"color: {color}; font-weight: bold;")
+        set_state(self.password_strength, "strength", level)
         
         # ログに記録
         criteria_text = ', '.join(criteria)
-        self.log_display.append(f"[パスワード強度] {strength} - {criteria_text}")
+        self.feedback.log(f"[パスワード強度] {strength} - {criteria_text}")
         
     def validate_all_inputs(self):
         """
         全ての入力フィールドを検証
         """
-        inputs = [
-            ("整数", self.int_input),
-            ("小数", self.double_input),
-            ("年齢", self.age_input),
-            ("郵便番号", self.postal_input),
-            ("電話番号", self.phone_input),
-            ("英数字", self.alphanumeric_input),
-            ("メールアドレス", self.email_input),
-        ]
+        self.feedback.log("=== 全フィールドの検証開始 ===")
         
-        self.log_display.append("=== 全フィールドの検証開始 ===")
+        # フォームの入力値を1行のデータとして一括検証エンジンに渡す
+        report = self.bulk_engine.validate_row(
+            {field_name: input_widget.text() for field_name, input_widget in self.form_inputs.items()}
+        )
         
-        valid_count = 0
-        total_count = len(inputs)
+        invalid_fields = [
+            field_name for field_name, states in report.states.items()
+            if states[0] != validators.ACCEPTABLE
+        ]
+        valid_count = len(report.states) - len(invalid_fields)
         
-        for field_name, input_widget in inputs:
-            text = input_widget.text()
-            validator = input_widget.validator()
-            
-            if validator:
-                state, _, _ = validator.validate(text, 0)
-                if state == QValidator.State.Acceptable:
-                    valid_count += 1
-                    
-        # パスワードも含める
-        password_text = self.password_input.text()
-        password_validator = self.password_input.validator()
-        if password_validator:
-            state, _, _ = password_validator.validate(password_text, 0)
-            if state == QValidator.State.Acceptable:
-                valid_count += 1
-            total_count += 1
-            
-        self.log_display.append(f"検証結果: {valid_count}/{total_count} フィールドが有効")
-        self.log_display.append("=== 検証終了 ===")
+        self.feedback.log(f"検証結果: {valid_count}/{len(report.states)} フィールドが有効")
+        if invalid_fields:
+            self.feedback.log(f"未完了のフィールド: {', '.join(invalid_fields)}")
+        self.feedback.log("=== 検証終了 ===")
         
     def clear_all_inputs(self):
         """
@@ -676,22 +538,14 @@ class ValidatorDemoWindow(QWidget):
         
         for input_widget in inputs:
             input_widget.clear()
-            input_widget.setStyleSheet("")  # スタイルもリセット
             
+        # 入力欄とステータスの表示もリセット
+        self.feedback.reset(inputs)
+        
         self.password_strength.setText("強度: なし")
-        self.password_strength.setStyleSheet("color: #7f8c8d; font-style: italic;")
-        
-        self.validation_status.setText("入力待ち...")
-        self.validation_status.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                padding: 10px;
-                border-radius: 5px;
-                border-left: 4px solid #6c757d;
-            }
-        """)
-        
-        self.log_display.append("全てのフィールドをクリアしました")
+        set_state(self.password_strength, "strength", "none")
+        
+        self.feedback.log("全てのフィールドをクリアしました")
 
 
 def main():
@@ -0,0 +1,112 @@
+"""
+自動保存のベンチマーク
+
+--size MB(既定 100 MB)の文書について、次の時間を比較します。
+- 変更前: 保存のたびに全体を書き込む(UI スレッドが止まる時間)
+- 変更後(UI スレッド): ベースを書くときの行のリストのコピー(SNAPSHOT_CHUNK 行ずつ)
+- 変更後(ワーカースレッド): ベースの書き込み、--edits 回の入力ごとのジャーナルへの追記、ベースの書き直し
+最後に、ベースとジャーナルから復元した内容が元の文書と一致することを確認します。
+
+画面は使いません。リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.bench_autosave --size 100
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+from tkinter_files.benchmarks.tk_harness import percentile
+from tkinter_files.common.autosave import AutoSaver, DeltaJournal, atomic_write, autosave_path
+
+FRAME_MS = 16.7
+
+
+def make_lines(size_mb):
+    line = "これはベンチマーク用の行です。The quick brown fox jumps over the lazy dog 0123456789"
+    count = size_mb * 1024 * 1024 // len(line.encode("utf-8"))
+    return [f"{i:08d} {line}" for i in range(count)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def typing_records(lines, edits, rng):
+    """1か所で edits 文字入力した場合の変更(AutoSaver と同じく1行の書き換えは1つにまとめる)"""
+    line = rng.randrange(len(lines)) + 1
+    text = lines[line - 1]
+    record = [line, 1, [text]]
+    for _ in range(edits):
+        text += "x"
+        record[2][0] = text
+    return [record]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="自動保存のベンチマーク")
+    parser.add_argument("--size", type=int, default=100, help="文書の大きさ(MB)")
+    parser.add_argument("--saves", type=int, default=50, help="自動保存の回数")
+    parser.add_argument("--edits", type=int, default=20, help="1回の自動保存までに入力する文字数")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    lines = make_lines(args.size)
+    directory = tempfile.mkdtemp(prefix="bench_autosave_")
+    try:
+        path = os.path.join(directory, "document.txt")
+        print(f"{args.size} MB, {len(lines):,} 行")
+
+        full, _ = timed(atomic_write, path, lines, "utf-8", True)
+        print(f"  変更前: 保存のたびに全体を書き込む(UI スレッド)   {full:>10.1f} ms")
+
+        copy, _ = timed(list, lines)
+        print(f"  参考: 行のリストを一度にコピー(UI スレッド)       {copy:>10.1f} ms")
+
+        # AutoSaver._snapshot と同じく SNAPSHOT_CHUNK 行ずつコピーする(1回分が UI を止める時間)
+        snapshot = []
+        chunks = []
+        for offset in range(0, len(lines), AutoSaver.SNAPSHOT_CHUNK):
+            elapsed, _ = timed(snapshot.extend, lines[offset:offset + AutoSaver.SNAPSHOT_CHUNK])
+            chunks.append(elapsed)
+        mark = "OK" if max(chunks) <= FRAME_MS else "NG"
+        print(f"  変更後: 分けてコピー 1回の最大(UI スレッド)       {max(chunks):>10.1f} ms  {mark}"
+              f"  ({len(chunks)} 回)")
+
+        journal = DeltaJournal(autosave_path(path))
+        base, _ = timed(journal.write_base, snapshot)
+        print(f"  変更後: ベースの書き込み(ワーカースレッド)         {base:>10.1f} ms")
+
+        model = list(lines)
+        appends = []
+        for _ in range(args.saves):
+            records = typing_records(model, args.edits, rng)
+            for line, removed, inserted in records:
+                model[line - 1:line - 1 + removed] = inserted
+            elapsed, _ = timed(journal.append, records)
+            appends.append(elapsed)
+        print(f"  変更後: ジャーナルへの追記(ワーカースレッド)       "
+              f"{statistics.mean(appends):>10.2f} ms  (p95 {percentile(appends, 95):.2f} ms, "
+              f"{journal.journal_bytes:,} バイト)")
+
+        compact, _ = timed(journal.write_base, journal.lines)
+        print(f"  変更後: ベースの書き直し(ワーカースレッド)         {compact:>10.1f} ms")
+
+        records = typing_records(model, args.edits, rng)
+        for line, removed, inserted in records:
+            model[line - 1:line - 1 + removed] = inserted
+        journal.append(records)
+        loaded, restored = timed(DeltaJournal.load, autosave_path(path))
+        result = "一致" if restored == model else "不一致"
+        print(f"  復元(ベース + ジャーナル)                        {loaded:>10.1f} ms  {result}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
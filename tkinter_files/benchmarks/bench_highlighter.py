@@ -0,0 +1,149 @@
+"""
+構文の強調表示のベンチマーク
+
+TextEditor に 100,000 行(既定)の Python ファイルとログファイルを読み込み、
+ファイルの中ほどで event_generate によるキー入力を再現して、1キーごとの処理時間
+(イベント処理と再描画まで)を測定します。強調表示なしの場合と比較し、目標は 5 ms 以内です。
+三重引用符を入力して以降の行がすべて文字列になる場合(バックグラウンドで続きを解析する)も測定します。
+
+画面がない環境では --xvfb を付けて実行します。
+リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.bench_highlighter --xvfb --lines 100000
+"""
+
+import argparse
+import statistics
+import time
+
+from tkinter_files.benchmarks.tk_harness import percentile, start_xvfb
+from tkinter_files.common.highlighter import LogLexer, PythonLexer
+from tkinter_files.samples.t050_text.text_03_editor import TextEditor
+
+TARGET_MS = 5.0
+
+KEYSYMS = {
+    " ": "space", "\n": "Return", ".": "period", ",": "comma", "=": "equal", "#": "numbersign",
+    '"': "quotedbl", "'": "apostrophe", "(": "parenleft", ")": "parenright", ":": "colon",
+}
+
+PYTHON_CHUNK = '''\
+@dataclass
+class Record{n}:
+    """
+    サンプルのレコード {n}
+    """
+    name: str = "record"
+    value: int = {n}
+
+    def total(self, items):
+        # 合計を計算する
+        return sum(item * 0x10 for item in items if item > 1.5e3)
+
+'''
+
+LOG_CHUNK = '''\
+2024-05-01 12:00:{s:02d},123 INFO server started on port 8080 (worker {n})
+2024-05-01 12:00:{s:02d},456 DEBUG request "GET /api/items" took 12.5 ms
+2024-05-01 12:00:{s:02d},789 WARNING slow query: 'SELECT * FROM items' ({n} rows)
+2024-05-01 12:00:{s:02d},999 ERROR unhandled exception
+Traceback (most recent call last):
+  File "app.py", line 42, in handle
+    return process(request)
+ValueError: invalid literal for int() with base 10: 'abc'
+'''
+
+
+def make_content(kind, lines):
+    chunk = PYTHON_CHUNK if kind == "python" else LOG_CHUNK
+    per_chunk = chunk.count("\n")
+    return "".join(chunk.format(n=n, s=n % 60) for n in range(lines // per_chunk + 1))
+
+
+def type_keys(text, keys):
+    """1キーずつ event_generate して、再描画までの時間(ms)のリストを返す"""
+    timings = []
+    for char in keys:
+        keysym = KEYSYMS.get(char, char)
+        start = time.perf_counter()
+        text.event_generate("<KeyPress>", keysym=keysym)
+        text.event_generate("<KeyRelease>", keysym=keysym)
+        text.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def backspace(text):
+    start = time.perf_counter()
+    text.event_generate("<KeyPress>", keysym="BackSpace")
+    text.update_idletasks()
+    return (time.perf_counter() - start) * 1000
+
+
+def wait_for_highlighter(app, timeout=120.0):
+    start = time.perf_counter()
+    while app.highlighter.pending() and time.perf_counter() - start < timeout:
+        app.update()
+    return (time.perf_counter() - start) * 1000
+
+
+def report(label, timings):
+    mark = "OK" if percentile(timings, 95) <= TARGET_MS else "NG"
+    print(f"  {label:<34}{statistics.mean(timings):>8.2f}{percentile(timings, 95):>8.2f}"
+          f"{max(timings):>8.2f}  {mark}")
+
+
+def run(kind, lines, keys):
+    app = TextEditor()
+    app.update()
+    content = make_content(kind, lines)
+    lexer = PythonLexer() if kind == "python" else LogLexer()
+    text = app.text_area
+    middle = f"{lines // 2}.0"
+
+    def prepare(with_lexer):
+        app.highlighter.set_lexer(lexer if with_lexer else None)
+        start = time.perf_counter()
+        text.delete("1.0", "end")
+        text.insert("1.0", content)
+        app.update()
+        load = (time.perf_counter() - start) * 1000
+        background = wait_for_highlighter(app)
+        text.mark_set("insert", middle)
+        text.see("insert")
+        text.focus_force()
+        app.update()
+        return load, background
+
+    print(f"{kind}: {len(app.mirror.lines):,} 行  (平均 / p95 / 最大 ms, 目標 p95 <= {TARGET_MS} ms)")
+    for with_lexer in (False, True):
+        load, background = prepare(with_lexer)
+        label = "強調表示あり" if with_lexer else "強調表示なし"
+        print(f"  {label}: 読み込み {load:.0f} ms, バックグラウンドの字句解析 {background:.0f} ms")
+        report(f"{label}: 通常の入力", type_keys(text, keys))
+        if kind == "python":
+            report(f"{label}: 三重引用符の入力", type_keys(text, '"""'))
+            wait_for_highlighter(app)
+            report(f"{label}: 三重引用符の削除", [backspace(text) for _ in range(3)])
+            wait_for_highlighter(app)
+    app.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="構文の強調表示のベンチマーク")
+    parser.add_argument("--lines", type=int, default=100_000, help="ファイルの行数")
+    parser.add_argument("--keys", default="value = compute(items, 42)  # note\n",
+                        help="入力する文字列")
+    parser.add_argument("--xvfb", action="store_true", help="DISPLAY がなければ Xvfb を起動する")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        for kind in ("python", "log"):
+            run(kind, args.lines, args.keys)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
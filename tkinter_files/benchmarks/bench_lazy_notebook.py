@@ -0,0 +1,185 @@
+"""
+タブの中身を遅延して作るノートブックのベンチマーク
+
+--tabs 個(既定 20 個)のタブがあるツールウィンドウを作り、最初の描画が終わるまで
+(Tk() の作成から最初の update() まで)の時間を比較します。
+- 変更前: すべてのタブの中身(ラベル・入力欄・Text・バインディング)を作ってから表示する
+- 変更後: LazyNotebook で最初のタブだけを作り、残りは選択されたとき・アイドル時間に作る
+
+変更後については次の値も測定します。
+- アイドル時間にすべてのタブを作り終えるまでの時間と、その間の最も長いイベントの待ち時間
+- 事前作成なしで、まだ作っていないタブを初めて選択したときの表示までの時間
+- メモリの上限を小さくした場合に破棄されたタブの数
+最後に ContextKeyBindingApp(3 タブ)の最初の描画までの時間も表示します。
+
+画面がない環境では --xvfb を付けて実行します。
+リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.bench_lazy_notebook --xvfb
+"""
+
+import argparse
+import statistics
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from tkinter_files.benchmarks.tk_harness import percentile, start_xvfb
+from tkinter_files.common.lazy_notebook import LazyNotebook
+
+
+def build_tool_tab(frame, fields):
+    """ツールウィンドウのタブの中身(入力欄が fields 個のフォームと Text)"""
+    tk.Label(frame, text="設定 - Ctrl+S: 適用 / Escape: 元に戻す", anchor=tk.W,
+             bg="lightyellow").pack(fill=tk.X, padx=5, pady=5)
+    form = tk.Frame(frame)
+    form.pack(fill=tk.X, padx=5)
+    columns = 4
+    for i in range(fields):
+        row, column = divmod(i, columns)
+        tk.Label(form, text=f"項目 {i}").grid(row=row, column=column * 2, sticky=tk.E)
+        entry = tk.Entry(form, width=8)
+        entry.insert(0, str(i))
+        entry.grid(row=row, column=column * 2 + 1, padx=2, pady=1)
+        entry.bind("<Control-s>", lambda e: None)
+        entry.bind("<Escape>", lambda e: None)
+    text = tk.Text(frame, height=5)
+    text.insert("1.0", "メモ\n" * 50)
+    text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+
+def make_root():
+    root = tk.Tk()
+    root.geometry("800x600+50+50")
+    notebook = ttk.Notebook(root)
+    notebook.pack(fill=tk.BOTH, expand=True)
+    return root, notebook
+
+
+def first_paint_eager(tabs, fields):
+    start = time.perf_counter()
+    root, notebook = make_root()
+    for i in range(tabs):
+        frame = tk.Frame(notebook)
+        notebook.add(frame, text=f"ツール {i}")
+        build_tool_tab(frame, fields)
+    root.update()
+    elapsed = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return elapsed
+
+
+def make_lazy(tabs, fields, **options):
+    root, notebook = make_root()
+    lazy = LazyNotebook(notebook, **options)
+    for i in range(tabs):
+        lazy.add(f"tool{i}", f"ツール {i}", lambda frame: build_tool_tab(frame, fields))
+    return root, lazy
+
+
+def first_paint_lazy(tabs, fields):
+    start = time.perf_counter()
+    root, lazy = make_lazy(tabs, fields, prewarm=False)
+    root.update()
+    elapsed = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return elapsed
+
+
+def prewarm(tabs, fields):
+    """(最初の描画まで, すべて作り終えるまで, 最も長い1回の update の時間)(ms)"""
+    start = time.perf_counter()
+    # すべてのタブが入るよう、メモリの上限は十分に大きくする
+    root, lazy = make_lazy(tabs, fields, memory_limit=1 << 30)
+    root.update()
+    first = (time.perf_counter() - start) * 1000
+    longest = 0.0
+    while lazy.builds < tabs:
+        step = time.perf_counter()
+        root.update()
+        longest = max(longest, (time.perf_counter() - step) * 1000)
+    total = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return first, total, longest
+
+
+def first_select(tabs, fields):
+    """事前作成なしで、各タブを初めて選択してから表示されるまでの時間(ms)"""
+    root, lazy = make_lazy(tabs, fields, prewarm=False)
+    root.update()
+    times = []
+    for i in range(1, tabs):
+        start = time.perf_counter()
+        lazy.select(f"tool{i}")
+        root.update()
+        times.append((time.perf_counter() - start) * 1000)
+    root.destroy()
+    return times
+
+
+def small_budget(tabs, fields):
+    root, lazy = make_lazy(tabs, fields, prewarm=False)
+    root.update()
+    limit = 3 * lazy.memory
+    root.destroy()
+    root, lazy = make_lazy(tabs, fields, memory_limit=limit, prewarm=False)
+    root.update()
+    for i in range(tabs):
+        lazy.select(f"tool{i}")
+        root.update()
+    built = sum(1 for name in lazy.tabs if lazy.is_built(name))
+    root.destroy()
+    return limit, built, lazy.unloads
+
+
+def first_paint_sample():
+    from tkinter_files.samples.t920_keybinding.keybinding_02_context import ContextKeyBindingApp
+
+    start = time.perf_counter()
+    root = tk.Tk()
+    ContextKeyBindingApp(root)
+    root.update()
+    elapsed = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return elapsed
+
+
+def report(label, values):
+    print(f"  {label:<26}{statistics.mean(values):>8.2f} / p95 {percentile(values, 95):>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="タブの中身を遅延して作るノートブックのベンチマーク")
+    parser.add_argument("--tabs", type=int, default=20, help="タブの数")
+    parser.add_argument("--fields", type=int, default=40, help="タブ1つあたりの入力欄の数")
+    parser.add_argument("--repeat", type=int, default=10, help="ウィンドウを作る回数")
+    parser.add_argument("--xvfb", action="store_true", help="DISPLAY がなければ Xvfb を起動する")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        print(f"タブ {args.tabs} 個, 入力欄 {args.fields} 個/タブ, {args.repeat} 回 (ms)")
+        print("最初の描画まで")
+        report("変更前(すべて作る)", [first_paint_eager(args.tabs, args.fields) for _ in range(args.repeat)])
+        report("変更後(LazyNotebook)", [first_paint_lazy(args.tabs, args.fields) for _ in range(args.repeat)])
+
+        results = [prewarm(args.tabs, args.fields) for _ in range(args.repeat)]
+        print("アイドル時間の事前作成")
+        report("最初の描画まで", [first for first, _, _ in results])
+        report("すべて作り終えるまで", [total for _, total, _ in results])
+        report("最も長い update", [longest for _, _, longest in results])
+
+        print("事前作成なしでタブを初めて選択")
+        report("表示まで", first_select(args.tabs, args.fields))
+
+        limit, built, unloads = small_budget(args.tabs, args.fields)
+        print(f"メモリの上限 {limit / 1024:.0f} KB: 作成済みのタブ {built} 個, 破棄 {unloads} 回")
+
+        print("ContextKeyBindingApp")
+        report("最初の描画まで", [first_paint_sample() for _ in range(args.repeat)])
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+ウィンドウの配置のベンチマーク
+
+サブウィンドウを開くときの配置にかかる時間と、開いて表示されるまでの時間を比較します。
+- 変更前: update_idletasks() でレイアウトを確定させ、winfo_screenwidth() や親の winfo_x() などを問い合わせる
+- 変更後: TkPlacement(画面の大きさと親の位置はキャッシュ)
+
+メインウィンドウには --widgets 個のラベルを並べ、レイアウトの確定に時間がかかる状態で測定します。
+次の3種類の配置を --opens 回ずつ測定します。
+- 画面の中央(BasicSubWindowApp.center_window)
+- 親の中央(SimpleDialog.center_on_parent)
+- 親の右隣(SubWindow.position_beside_parent)
+
+画面がない環境では --xvfb を付けて実行します。
+リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.bench_placement --xvfb
+"""
+
+import argparse
+import statistics
+import time
+import tkinter as tk
+
+from tkinter_files.benchmarks.tk_harness import percentile, start_xvfb
+from tkinter_files.common.placement import TkPlacement
+
+WIDTH = 250
+HEIGHT = 150
+
+
+def center_on_screen_before(window, parent):
+    window.update_idletasks()
+    x = (window.winfo_screenwidth() - WIDTH) // 2
+    y = (window.winfo_screenheight() - HEIGHT) // 2
+    window.geometry(f"{WIDTH}x{HEIGHT}+{x}+{y}")
+
+
+def center_on_parent_before(window, parent):
+    parent.update_idletasks()
+    x = parent.winfo_x() + (parent.winfo_width() - WIDTH) // 2
+    y = parent.winfo_y() + (parent.winfo_height() - HEIGHT) // 2
+    window.geometry(f"{WIDTH}x{HEIGHT}+{x}+{y}")
+
+
+def beside_parent_before(window, parent):
+    parent.update_idletasks()
+    x = parent.winfo_x() + parent.winfo_width() + 10
+    window.geometry(f"{WIDTH}x{HEIGHT}+{x}+{parent.winfo_y()}")
+
+
+def make_root(widgets):
+    root = tk.Tk()
+    root.geometry("600x400+100+100")
+    frame = tk.Frame(root)
+    frame.pack(fill=tk.BOTH, expand=True)
+    columns = 10
+    for i in range(widgets):
+        tk.Label(frame, text=f"ラベル {i}").grid(row=i // columns, column=i % columns)
+    root.update()
+    return root, frame
+
+
+def measure(root, frame, place, opens):
+    """(配置の時間, 開いて表示されるまでの時間) のリスト(ms)"""
+    placing, total = [], []
+    for i in range(opens):
+        # メインウィンドウのレイアウトを変更して、確定していない状態にする
+        frame.grid_slaves()[i % len(frame.grid_slaves())].config(text=f"変更 {i}")
+        start = time.perf_counter()
+        window = tk.Toplevel(root)
+        tk.Label(window, text="サブウィンドウ").pack()
+        place_start = time.perf_counter()
+        place(window, root)
+        placing.append((time.perf_counter() - place_start) * 1000)
+        root.update()
+        total.append((time.perf_counter() - start) * 1000)
+        window.destroy()
+        root.update()
+    return placing, total
+
+
+def report(label, placing, total):
+    print(f"  {label:<18}配置 {statistics.mean(placing):>7.3f} / p95 {percentile(placing, 95):>7.3f}"
+          f"   表示まで {statistics.mean(total):>7.2f} / p95 {percentile(total, 95):>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ウィンドウの配置のベンチマーク")
+    parser.add_argument("--opens", type=int, default=50, help="開く回数")
+    parser.add_argument("--widgets", type=int, default=2000, help="メインウィンドウのラベルの数")
+    parser.add_argument("--xvfb", action="store_true", help="DISPLAY がなければ Xvfb を起動する")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        root, frame = make_root(args.widgets)
+        placement = TkPlacement(root)
+        root.update()
+        cases = [
+            ("画面の中央", center_on_screen_before,
+             lambda window, parent: placement.center_on_screen(window, WIDTH, HEIGHT, near=parent)),
+            ("親の中央", center_on_parent_before,
+             lambda window, parent: placement.center_on_parent(window, parent, WIDTH, HEIGHT)),
+            ("親の右隣", beside_parent_before,
+             lambda window, parent: placement.beside_parent(window, parent, WIDTH, HEIGHT)),
+        ]
+        print(f"ラベル {args.widgets} 個, {args.opens} 回 (ms)")
+        for label, before, after in cases:
+            report(f"{label}: 変更前", *measure(root, frame, before, args.opens))
+            report(f"{label}: 変更後", *measure(root, frame, after, args.opens))
+        print(f"  画面の問い合わせ: {placement.screen_queries} 回")
+        root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
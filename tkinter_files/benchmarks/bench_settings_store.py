@@ -0,0 +1,103 @@
+"""
+設定の保存のベンチマーク
+
+--keys 個(既定 10,000)の設定について、次の時間を比較します。
+- 変更前: 起動時に JSON ファイル全体を読み、切り替えのたびに全体を書き込む(UI スレッド)
+- 変更後: SettingsStore の生成、最初の get()(1キーの読み込み)、全キーの読み込み、
+  set() 1回の時間(UI スレッド)
+  と、--toggles 回続けて切り替えたときの書き込み回数
+
+画面は使いません。リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.bench_settings_store --keys 10000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from tkinter_files.benchmarks.tk_harness import percentile
+from tkinter_files.common.settings_store import SettingsStore
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def make_defaults(count):
+    defaults = {}
+    for i in range(count):
+        kind = i % 4
+        key = f"bench.section{i // 100}.option{i}"
+        defaults[key] = (i % 2 == 0, i, i / 10, f"値{i}")[kind]
+    return defaults
+
+
+def bench_json(path, defaults, toggles, keys):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(defaults, file, ensure_ascii=False)
+
+    def load():
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    startup, values = timed(load)
+
+    def write(key):
+        values[key] = not values[key]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(values, file, ensure_ascii=False)
+
+    timings = [timed(write, keys[i % len(keys)])[0] for i in range(toggles)]
+    return startup, timings, toggles
+
+
+def bench_store(path, defaults, toggles, keys):
+    # 既定値なしで開くと、すべてのキーが変更として書き込まれる
+    seed = SettingsStore(path)
+    seed.update(defaults)
+    seed.close()
+
+    construct, store = timed(SettingsStore, path, defaults)
+    first_get, _ = timed(store.get, keys[0])
+    load_all, _ = timed(lambda: len(store.items()))
+    timings = [timed(store.set, key, not store.get(key))[0] for key in (keys[i % len(keys)] for i in range(toggles))]
+    flush, _ = timed(store.flush)
+    store.close()
+    return construct, first_get, load_all, timings, flush, store.writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="設定の保存のベンチマーク")
+    parser.add_argument("--keys", type=int, default=10_000, help="設定のキーの数")
+    parser.add_argument("--toggles", type=int, default=200, help="続けて切り替える回数")
+    args = parser.parse_args()
+
+    defaults = make_defaults(args.keys)
+    bool_keys = [key for key, value in defaults.items() if isinstance(value, bool)][:10]
+    directory = tempfile.mkdtemp(prefix="bench_settings_")
+    try:
+        startup, timings, writes = bench_json(os.path.join(directory, "settings.json"), defaults,
+                                              args.toggles, bool_keys)
+        print(f"{args.keys:,} キー, {args.toggles} 回の切り替え (ms)")
+        print(f"  変更前(JSON 全体): 起動時の読み込み {startup:.2f}")
+        print(f"    切り替え1回 平均 {statistics.mean(timings):.3f} / p95 {percentile(timings, 95):.3f}"
+              f"  書き込み {writes} 回")
+
+        construct, first_get, load_all, timings, flush, writes = bench_store(
+            os.path.join(directory, "settings.sqlite3"), defaults, args.toggles, bool_keys)
+        print(f"  変更後(SettingsStore): 生成 {construct:.3f}, 最初の get(1キーの読み込み) {first_get:.2f},"
+              f" 全キーの読み込み {load_all:.2f}")
+        print(f"    切り替え1回 平均 {statistics.mean(timings):.3f} / p95 {percentile(timings, 95):.3f}"
+              f"  書き込み {writes} 回(flush {flush:.2f})")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
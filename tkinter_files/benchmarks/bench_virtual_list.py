@@ -0,0 +1,116 @@
+"""
+仮想リストボックスのベンチマーク
+
+次の操作の時間を、tk.Listbox(変更前と同じく全項目を insert し、選択行を後ろから1つずつ delete)と
+VirtualListbox で比較します。tk.Listbox は時間がかかるため --listbox-rows 行(既定 100,000)で測定します。
+- 項目の追加
+- 1行おきに選択(--select 行の範囲)
+- 選択行の削除
+- スクロール(1ページずつ --scrolls 回。1回ごとに再描画まで)
+
+VirtualListbox は続けて 10,000,000 行(既定)でも同じ操作を測定します。
+
+画面がない環境では --xvfb を付けて実行します。
+リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.bench_virtual_list --xvfb
+"""
+
+import argparse
+import time
+import tkinter as tk
+
+from tkinter_files.benchmarks.tk_harness import percentile, start_xvfb
+from tkinter_files.common.virtual_list import GeneratedItems, VirtualListbox
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def item(i):
+    return f"項目 {i + 1}"
+
+
+def bench_listbox(root, rows, select, scrolls):
+    listbox = tk.Listbox(root, selectmode=tk.MULTIPLE, height=20)
+    listbox.pack(fill=tk.BOTH, expand=True)
+    root.update()
+    results = {"追加": timed(lambda: (listbox.insert(tk.END, *[item(i) for i in range(rows)]), root.update()))}
+
+    def select_every_other():
+        for i in range(0, min(select, rows), 2):
+            listbox.selection_set(i)
+        root.update()
+
+    def delete_selected():
+        for i in reversed(listbox.curselection()):
+            listbox.delete(i)
+        root.update()
+
+    results["1行おきに選択"] = timed(select_every_other)
+    results["選択行の削除"] = timed(delete_selected)
+    scroll = []
+    for _ in range(scrolls):
+        scroll.append(timed(lambda: (listbox.yview_scroll(1, tk.PAGES), root.update_idletasks())))
+    listbox.destroy()
+    return results, scroll
+
+
+def bench_virtual(root, rows, select, scrolls):
+    listbox = VirtualListbox(root, selectmode=tk.MULTIPLE, height=20)
+    listbox.pack(fill=tk.BOTH, expand=True)
+    root.update()
+    results = {"追加": timed(lambda: (listbox.extend_source(GeneratedItems(rows, item)), root.update()))}
+
+    def select_every_other():
+        for i in range(0, min(select, rows), 2):
+            listbox.selection_set(i)
+        root.update()
+
+    results["1行おきに選択"] = timed(select_every_other)
+    results["選択行の削除"] = timed(lambda: (listbox.delete_selected(), root.update()))
+    scroll = []
+    for _ in range(scrolls):
+        scroll.append(timed(lambda: (listbox.yview_scroll(1, tk.PAGES), listbox.render())))
+    results["全選択して削除"] = timed(lambda: (listbox.selection_set(0, tk.END), listbox.delete_selected(),
+                                            root.update()))
+    listbox.destroy()
+    return results, scroll
+
+
+def report(label, results, scroll):
+    print(label)
+    for name, ms in results.items():
+        print(f"  {name:<20}{ms:>12.1f} ms")
+    print(f"  {'スクロール(平均/p95)':<20}{sum(scroll) / len(scroll):>12.2f} / {percentile(scroll, 95):.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="仮想リストボックスのベンチマーク")
+    parser.add_argument("--listbox-rows", type=int, default=100_000, help="tk.Listbox で測定する行数")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="VirtualListbox で測定する行数")
+    parser.add_argument("--select", type=int, default=20_000, help="1行おきに選択する範囲の行数")
+    parser.add_argument("--scrolls", type=int, default=200, help="スクロールする回数")
+    parser.add_argument("--xvfb", action="store_true", help="DISPLAY がなければ Xvfb を起動する")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        root = tk.Tk()
+        root.geometry("400x500")
+        report(f"tk.Listbox({args.listbox_rows:,} 行)",
+               *bench_listbox(root, args.listbox_rows, args.select, args.scrolls))
+        report(f"VirtualListbox({args.listbox_rows:,} 行)",
+               *bench_virtual(root, args.listbox_rows, args.select, args.scrolls))
+        report(f"VirtualListbox({args.rows:,} 行)",
+               *bench_virtual(root, args.rows, args.select, args.scrolls))
+        root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+サブウィンドウのプールのベンチマーク
+
+BasicSubWindowApp の情報・設定・ヘルプウィンドウと、NonModalWindowApp のサブウィンドウを
+--cycles 回(既定 50 回)ずつ開いて閉じ、1回の「開く」と「閉じる」にかかる時間
+(表示・再描画まで)を比較します。
+- 変更前: 開くたびに Toplevel と子ウィジェットを作り、閉じるときに destroy する
+- 変更後: WindowPool で作成済みのウィンドウを初期化して deiconify し、閉じるときは withdraw する
+
+最後に、メモリの上限を小さくして LRU で破棄されることを確認します。
+
+画面がない環境では --xvfb を付けて実行します。
+リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.bench_window_pool --xvfb
+"""
+
+import argparse
+import statistics
+import time
+
+from tkinter_files.benchmarks.tk_harness import percentile, start_xvfb
+from tkinter_files.common.window_pool import WindowPool
+from tkinter_files.samples.t910_subwindow.subwindow_01_basic import BasicSubWindowApp
+from tkinter_files.samples.t910_subwindow.subwindow_03_nonmodal import NonModalWindowApp, SubWindow
+
+
+def timed(app, func):
+    start = time.perf_counter()
+    result = func()
+    app.update()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def cycle_rebuild(app, build, reset, cycles):
+    """変更前と同じく、開くたびに作って閉じるたびに destroy する"""
+    opens, closes = [], []
+    for _ in range(cycles):
+        def open_window():
+            window = build()
+            if reset:
+                reset(window)
+            return window
+        elapsed, window = timed(app, open_window)
+        opens.append(elapsed)
+        closes.append(timed(app, window.destroy)[0])
+    return opens, closes
+
+
+def cycle_pool(app, pool, name, cycles):
+    opens, closes = [], []
+    for _ in range(cycles):
+        opens.append(timed(app, lambda: pool.open(name))[0])
+        closes.append(timed(app, lambda: pool.close(name))[0])
+    return opens, closes
+
+
+def report(label, opens, closes):
+    print(f"  {label:<24}開く {statistics.mean(opens):>7.2f} / p95 {percentile(opens, 95):>7.2f}"
+          f"   閉じる {statistics.mean(closes):>6.2f} / p95 {percentile(closes, 95):>6.2f}")
+
+
+def bench_basic(cycles):
+    app = BasicSubWindowApp()
+    app.update()
+    print(f"BasicSubWindowApp ({cycles} 回, ms)")
+    targets = [
+        ("info", app.build_info_window, app.reset_info_window),
+        ("settings", app.build_settings_window, app.reset_settings_window),
+        ("help", app.build_help_window, app.reset_help_window),
+    ]
+    for name, build, reset in targets:
+        report(f"{name}: 変更前", *cycle_rebuild(app, build, reset, cycles))
+        report(f"{name}: 変更後", *cycle_pool(app, app.windows, name, cycles))
+    print(f"  プール: ヒット {app.windows.hits}, 作成 {app.windows.misses}, "
+          f"メモリの見積もり {app.windows.memory / 1024:.0f} KB")
+
+    # 上限を 1 ウィンドウ分にすると、隠しているウィンドウは古いものから破棄される
+    small = WindowPool(app, memory_limit=1)
+    for name, build, reset in targets:
+        small.register(name, build, reset)
+    for name, _, _ in targets:
+        small.open(name)
+        small.close(name)
+    kept = [name for name, entry in small.entries.items() if entry.window is not None]
+    print(f"  メモリの上限が小さい場合: 破棄 {small.evictions} 回, 残ったウィンドウ {kept}")
+    app.destroy()
+
+
+def bench_nonmodal(cycles):
+    app = NonModalWindowApp()
+    app.update()
+    print(f"NonModalWindowApp ({cycles} 回, ms)")
+    report("sub: 変更前", *cycle_rebuild(app, lambda: SubWindow(app), SubWindow.reset, cycles))
+    opens, closes = [], []
+    for _ in range(cycles):
+        opens.append(timed(app, app.open_sub_window)[0])
+        closes.append(timed(app, app.close_sub_window)[0])
+    report("sub: 変更後", opens, closes)
+    app.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="サブウィンドウのプールのベンチマーク")
+    parser.add_argument("--cycles", type=int, default=50, help="開いて閉じる回数")
+    parser.add_argument("--xvfb", action="store_true", help="DISPLAY がなければ Xvfb を起動する")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        bench_basic(args.cycles)
+        bench_nonmodal(args.cycles)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,490 @@
+"""
+tkinter サンプルアプリのベンチマークハーネス
+
+対象のアプリを1つずつ作成し、event_generate で操作を再現しながら次の値を測定します。
+- construct_ms: アプリの作成時間(最初の update() まで)
+- tcl_calls: 作成中と各操作中に Python から呼ばれた Tcl コマンドの回数(コマンド名ごと)
+- handlers: イベントハンドラー・after コールバックごとの呼び出し回数と時間
+- items: Canvas のアイテム数、Text の行数、Listbox / Treeview の行数
+- interactions: TARGETS に定義した操作ごとの時間
+- frames: アニメーションのフレーム間隔(平均・p95・最大)
+
+画面がない環境では Xvfb を使います(--xvfb で起動。xvfb-run 経由で実行しても構いません)。
+--withdraw を付けるとウィンドウを表示せずに測定します。
+
+リポジトリのルートで実行します:
+    python -m tkinter_files.benchmarks.tk_harness --xvfb --output before.json
+    python -m tkinter_files.benchmarks.tk_harness --xvfb --output after.json --baseline before.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tkinter as tk
+from collections import Counter, defaultdict
+from tkinter import ttk
+
+from tkinter_files.common.virtual_list import VirtualListbox
+
+ANIMATION_SECONDS = 2.0
+
+
+class TclCallCounter:
+    """
+    tkapp オブジェクトを包み、call / eval の回数をコマンド名ごとに数えるプロキシ
+
+    tkinter のウィジェットは親の .tk を引き継ぐため、ルートの .tk を差し替えると
+    その後に作成されるウィジェットからの呼び出しもすべて数えられます。
+    """
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.counts = Counter()
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            name = args[0][0] if args[0] else ""
+        else:
+            name = args[0] if args else ""
+        self.counts[str(name)] += 1
+        return self._tkapp.call(*args)
+
+    def eval(self, script):
+        self.counts["<eval>"] += 1
+        return self._tkapp.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+    def snapshot(self):
+        counts = self.counts
+        self.counts = Counter()
+        return dict(counts.most_common())
+
+
+class HandlerProfiler:
+    """
+    Tcl から呼ばれる Python のコールバック(bind / command / after)の時間を記録する
+
+    すべてのコールバックは tkinter.CallWrapper を経由するため、その __call__ を差し替えます。
+    """
+
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self._original = None
+
+    def install(self):
+        self._original = original = tk.CallWrapper.__call__
+        timings = self.timings
+
+        def timed_call(wrapper, *args):
+            start = time.perf_counter()
+            try:
+                return original(wrapper, *args)
+            finally:
+                func = wrapper.func
+                name = getattr(func, "__qualname__", None) or repr(func)
+                timings[name].append((time.perf_counter() - start) * 1000)
+
+        tk.CallWrapper.__call__ = timed_call
+
+    def uninstall(self):
+        if self._original is not None:
+            tk.CallWrapper.__call__ = self._original
+            self._original = None
+
+    def snapshot(self):
+        result = {}
+        for name, values in sorted(self.timings.items()):
+            result[name] = {
+                "count": len(values),
+                "total_ms": round(sum(values), 3),
+                "max_ms": round(max(values), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+            }
+        self.timings.clear()
+        return result
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def install_call_counter():
+    """
+    以後作成される Tk ルートの .tk を TclCallCounter で包む
+
+    Returns:
+        list: 作成されたカウンター(作成順)
+    """
+    counters = []
+    original_init = tk.Tk.__init__
+
+    def init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.tk = TclCallCounter(self.tk)
+        counters.append(self.tk)
+
+    tk.Tk.__init__ = init
+    return counters
+
+
+def count_items(widget):
+    """ウィジェットツリーをたどって、表示しているアイテムの数を集計する"""
+    items = Counter()
+    stack = [widget]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, tk.Canvas):
+            items["canvas_items"] += len(current.find_all())
+        elif isinstance(current, tk.Text):
+            items["text_lines"] += int(current.index("end-1c").split(".")[0])
+        elif isinstance(current, VirtualListbox):
+            # 内部の Listbox は見えている行だけなので、項目数は別に数える
+            items["virtual_rows"] += current.size()
+        elif isinstance(current, tk.Listbox):
+            items["listbox_rows"] += current.size()
+        elif isinstance(current, ttk.Treeview):
+            items["treeview_rows"] += len(current.get_children(""))
+        stack.extend(current.winfo_children())
+    return dict(items)
+
+
+# ---- 操作の定義 ----
+
+def type_text(widget, text):
+    widget.focus_force()
+    for char in text:
+        keysym = {" ": "space", "\n": "Return", ".": "period", ",": "comma"}.get(char, char)
+        widget.event_generate("<KeyPress>", keysym=keysym, when="tail")
+        widget.event_generate("<KeyRelease>", keysym=keysym, when="tail")
+    widget.update()
+
+
+def wait_until(root, predicate, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate() and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+    if not predicate():
+        raise TimeoutError("操作が時間内に終わりませんでした")
+
+
+def drag(widget, points):
+    x, y = points[0]
+    widget.event_generate("<Button-1>", x=x, y=y, when="tail")
+    for x, y in points[1:]:
+        widget.event_generate("<B1-Motion>", x=x, y=y, state=0x100, when="tail")
+    widget.event_generate("<ButtonRelease-1>", x=x, y=y, when="tail")
+    widget.update()
+
+
+def scenario_text_editor(app, root):
+    text = "The quick brown fox jumps over the lazy dog.\n" * 5
+    return [("type_text", lambda: type_text(app.text_area, text))]
+
+
+def scenario_menu_accelerator(app, root):
+    text = "tkinter menu accelerator sample.\n" * 5
+
+    def toggle_view():
+        for sequence in ("<Control-l>", "<Control-l>", "<Control-w>", "<Control-w>"):
+            root.event_generate(sequence, when="tail")
+        root.update()
+
+    def font_size():
+        for sequence in ("<Control-plus>",) * 5 + ("<Control-minus>",) * 5:
+            root.event_generate(sequence, when="tail")
+        root.update()
+
+    def find_all():
+        # 20,000 行の本文から全件検索し、強調表示が終わるまで待つ
+        app.text_area.insert("end", "needle in a haystack, another needle.\n" * 20_000)
+        done = []
+        app.finder.on_done = done.append
+        app.find_query = "needle"
+        app.finder.search("needle")
+        wait_until(root, lambda: done)
+
+    def find_next():
+        for _ in range(100):
+            root.event_generate("<F3>", when="tail")
+        root.update()
+
+    def replace_all():
+        done = []
+        app.finder.replace_all("needle", "pin", on_done=done.append)
+        wait_until(root, lambda: done)
+
+    return [
+        ("type_text", lambda: type_text(app.text_area, text)),
+        ("toggle_view", toggle_view),
+        ("font_size", font_size),
+        ("find_all", find_all),
+        ("find_next", find_next),
+        ("replace_all", replace_all),
+    ]
+
+
+def scenario_shortcut_display(app, root):
+    def press_shortcuts():
+        root.focus_force()
+        for _ in range(50):
+            for sequence in ("<F1>", "<F2>", "<Control-s>", "<Control-z>"):
+                root.event_generate(sequence, when="tail")
+        root.update()
+        # 状態表示のタイマーは押した回数によらず一定数(StatusMessenger)
+        if app.status.pending_timers > 2:
+            raise AssertionError(f"状態表示のタイマーが溜まっています: {app.status.pending_timers}")
+
+    def search():
+        for query in ("c", "co", "cop", "copy", "", "ファイル", ""):
+            app.search_var.set(query)
+            app.search_shortcuts()
+            root.update()
+
+    return [("press_shortcuts", press_shortcuts), ("search", search)]
+
+
+def scenario_interactive_canvas(app, root):
+    def rectangles():
+        app.tool_var.set("rectangle")
+        app.tool_changed()
+        for i in range(50):
+            x, y = 20 + (i % 10) * 60, 20 + (i // 10) * 60
+            drag(app.canvas, [(x, y), (x + 20, y + 10), (x + 40, y + 30)])
+
+    def freehand():
+        app.tool_var.set("freehand")
+        app.tool_changed()
+        for stroke in range(10):
+            drag(app.canvas, [(50 + i * 5, 100 + stroke * 20 + (i % 3)) for i in range(80)])
+
+    def undo():
+        # 履歴が空のときの undo_last はメッセージボックスを開くため、履歴がある分だけ呼ぶ
+        for _ in range(min(20, len(app.drawing_history))):
+            app.undo_last()
+        root.update()
+
+    return [("rectangles", rectangles), ("freehand", freehand), ("undo", undo)]
+
+
+def scenario_multi_scroll(app, root):
+    def scroll():
+        for button in (5,) * 100 + (4,) * 100:
+            app.canvas.event_generate(f"<Button-{button}>", x=10, y=10, when="tail")
+        root.update()
+
+    return [("scroll", scroll)]
+
+
+def scenario_canvas_animation(app, root):
+    return [("reset", lambda: (app.reset_animation(), root.update()))]
+
+
+# クラス名 → (モジュール, ルートを引数に取るか, 操作の定義)
+TARGETS = {
+    "CanvasAnimationApp": ("tkinter_files.samples.t160_canvas.canvas_03_animation", False, scenario_canvas_animation),
+    "InteractiveCanvasApp": ("tkinter_files.samples.t160_canvas.canvas_02_class", False, scenario_interactive_canvas),
+    "MultiScrollApp": ("tkinter_files.samples.t120_scrollbar.scrollbar_03_canvas", False, scenario_multi_scroll),
+    "TextEditor": ("tkinter_files.samples.t050_text.text_03_editor", False, scenario_text_editor),
+    "MenuAcceleratorApp": ("tkinter_files.samples.t920_keybinding.keybinding_03_menu", True, scenario_menu_accelerator),
+    "ShortcutDisplayApp": ("tkinter_files.samples.t920_keybinding.keybinding_04_display", True, scenario_shortcut_display),
+}
+
+
+def measure_frames(app, root, seconds):
+    """
+    アニメーションを seconds 秒動かし、フレーム(animate の呼び出し)の間隔を測定する
+    """
+    stamps = []
+    animate = app.animate
+
+    def recording_animate():
+        stamps.append(time.perf_counter())
+        animate()
+
+    app.animate = recording_animate
+    app.start_animation()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+    app.stop_animation()
+    root.update()
+    app.animate = animate
+
+    intervals = [(b - a) * 1000 for a, b in zip(stamps, stamps[1:])]
+    if not intervals:
+        return {"frames": len(stamps)}
+    return {
+        "frames": len(stamps),
+        "fps": round(len(intervals) / (stamps[-1] - stamps[0]), 1),
+        "mean_ms": round(statistics.mean(intervals), 3),
+        "p95_ms": round(percentile(intervals, 95), 3),
+        "max_ms": round(max(intervals), 3),
+    }
+
+
+def measure_app(name, counters, profiler, withdraw=False, animation_seconds=ANIMATION_SECONDS):
+    """
+    1つのアプリを測定する
+
+    Returns:
+        dict: 測定結果
+    """
+    module_name, takes_root, scenario = TARGETS[name]
+    cls = getattr(importlib.import_module(module_name), name)
+
+    start = time.perf_counter()
+    if takes_root:
+        root = tk.Tk()
+        app = cls(root)
+    else:
+        app = root = cls()
+    if withdraw:
+        root.withdraw()
+    root.update()
+    construct = time.perf_counter() - start
+    counter = counters[-1]
+
+    result = {
+        "construct_ms": round(construct * 1000, 3),
+        "tcl_calls": {"construct": counter.snapshot()},
+        "handlers": {"construct": profiler.snapshot()},
+        "items": {"construct": count_items(root)},
+        "interactions": {},
+    }
+
+    for step_name, step in scenario(app, root):
+        start = time.perf_counter()
+        try:
+            step()
+        except tk.TclError as e:
+            result["interactions"][step_name] = {"error": str(e)}
+            continue
+        result["interactions"][step_name] = {"ms": round((time.perf_counter() - start) * 1000, 3)}
+        result["tcl_calls"][step_name] = counter.snapshot()
+        result["handlers"][step_name] = profiler.snapshot()
+        result["items"][step_name] = count_items(root)
+
+    if hasattr(app, "start_animation"):
+        result["frames"] = measure_frames(app, root, animation_seconds)
+        result["handlers"]["animation"] = profiler.snapshot()
+        result["tcl_calls"]["animation"] = counter.snapshot()
+
+    root.destroy()
+    return result
+
+
+def start_xvfb():
+    """
+    DISPLAY が設定されていなければ Xvfb を起動する
+
+    Returns:
+        subprocess.Popen: 起動した Xvfb(起動しなかった場合は None)
+    """
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    if shutil.which("Xvfb") is None:
+        raise SystemExit("DISPLAY が設定されておらず Xvfb も見つかりません")
+    display = ":99"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+    return process
+
+
+def run(names, withdraw=False, animation_seconds=ANIMATION_SECONDS):
+    """
+    対象のアプリを順番に測定して、JSON に変換できる辞書を返す
+    """
+    counters = install_call_counter()
+    profiler = HandlerProfiler()
+    profiler.install()
+    report = {
+        "python": platform.python_version(),
+        "tk": tk.TkVersion,
+        "withdrawn": withdraw,
+        "apps": {},
+    }
+    try:
+        for name in names:
+            try:
+                report["apps"][name] = measure_app(name, counters, profiler, withdraw, animation_seconds)
+            except Exception as e:  # 1つのアプリの失敗で全体を止めない
+                report["apps"][name] = {"error": f"{type(e).__name__}: {e}"}
+            print(f"  {name}", file=sys.stderr)
+    finally:
+        profiler.uninstall()
+    return report
+
+
+def print_diff(baseline, report):
+    """
+    変更前の結果との差分を表示する(値が大きいほど悪化)
+    """
+    print(f"{'アプリ / 項目':<50}{'before':>12}{'after':>12}{'差分':>12}")
+    for name, after in report["apps"].items():
+        before = baseline.get("apps", {}).get(name)
+        if not before or "error" in before or "error" in after:
+            continue
+        rows = [("construct_ms", before["construct_ms"], after["construct_ms"])]
+        for step_name, step in after["interactions"].items():
+            old = before.get("interactions", {}).get(step_name, {})
+            rows.append((f"{step_name} (ms)", old.get("ms"), step.get("ms")))
+            old_calls = sum(before.get("tcl_calls", {}).get(step_name, {}).values())
+            new_calls = sum(after["tcl_calls"].get(step_name, {}).values())
+            rows.append((f"{step_name} (Tcl呼び出し)", old_calls, new_calls))
+        if "frames" in after and "frames" in before:
+            rows.append(("frame p95 (ms)", before["frames"].get("p95_ms"), after["frames"].get("p95_ms")))
+        print(name)
+        for field, old, new in rows:
+            if old is None or new is None:
+                continue
+            print(f"  {field:<48}{old:>12.1f}{new:>12.1f}{new - old:>+12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="tkinter サンプルアプリのベンチマークハーネス")
+    parser.add_argument("--output", help="結果を書き出す JSON ファイル(省略時は標準出力)")
+    parser.add_argument("--baseline", help="比較する変更前の JSON ファイル")
+    parser.add_argument("--only", nargs="*", choices=sorted(TARGETS), help="対象にするアプリ")
+    parser.add_argument("--xvfb", action="store_true", help="DISPLAY がなければ Xvfb を起動する")
+    parser.add_argument("--withdraw", action="store_true", help="ウィンドウを表示せずに測定する")
+    parser.add_argument("--animation-seconds", type=float, default=ANIMATION_SECONDS,
+                        help="アニメーションのフレーム間隔を測定する秒数")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        report = run(args.only or list(TARGETS), args.withdraw, args.animation_seconds)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    elif not args.baseline:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            print_diff(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
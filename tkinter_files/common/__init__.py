@@ -0,0 +1,19 @@
+"""
+tkinterサンプル共通のヘルパー
+
+複数のサンプルから使う部品をまとめたパッケージです。
+このパッケージを使うサンプルは、リポジトリのルートから
+``python -m tkinter_files.samples.t050_text.text_03_editor`` のように実行します。
+
+モジュール:
+- text_mirror.py: Text ウィジェットの内容を行のリストとして Python 側に保持するミラー
+- highlighter.py: 変更された行と表示範囲だけを字句解析するインクリメンタルな構文強調表示
+- expression.py: 四則演算だけを許可し、コンパイル結果をキャッシュする安全な数式エンジン
+- status.py: タイマー1つで一時的なメッセージを表示・まとめるステータスバーのメッセージ表示
+- virtual_list.py: 見えている行だけを描画し、選択を区間の集合で持つ仮想リストボックス
+- autosave.py: 変更された行だけを差分ジャーナルに追記する、ワーカースレッドでの自動保存
+- settings_store.py: 読み込みを遅らせ、書き込みをワーカースレッドでまとめる SQLite の設定ストア(PySide6 のサンプルからも使う)
+- window_pool.py: サブウィンドウを withdraw で隠して再利用し、メモリの上限を超えたら LRU で破棄するプール
+- placement.py: 画面と作業領域をキャッシュし、親の位置は <Configure> で受け取るウィンドウの配置(PySide6 と共通の計算)
+- lazy_notebook.py: タブの中身を最初に選択されたとき・アイドル時間に作り、メモリの上限を超えたら LRU で破棄するノートブック
+"""
@@ -0,0 +1,369 @@
+"""
+バックグラウンドの自動保存
+
+保存のたびに text.get("1.0", "end") で全体を取り出して書き込むと、
+大きなファイルではその間 UI スレッドが止まります。
+AutoSaver は TextMirror の変更通知から変更された行だけを記録しておき、
+アイドル時にワーカースレッドへ渡して書き込みます。
+
+- 自動保存はベースファイルと追記専用の差分ジャーナルに分けて書く
+  (1回の自動保存の書き込み量は変更された行の分だけ)
+- ジャーナルがベースの半分より大きくなったら、ワーカースレッドでベースを書き直す
+- ファイルの書き込みは一時ファイルに書いてから os.replace で置き換える(途中で落ちても壊れない)
+- UI スレッドで行うのは、変更された行のコピーと、after() で分けて行う行のリストのコピー(参照のみ)だけ
+
+自動保存のファイルは <パス>.autosave と <パス>.autosave.journal です。
+
+使い方:
+    from tkinter_files.common.autosave import AutoSaver, DeltaJournal, autosave_path
+
+    autosaver = AutoSaver(text, mirror, path, on_saved=...)
+    autosaver.save(path, on_done=...)                  # 明示的な保存(非同期)
+    lines = DeltaJournal.load(autosave_path(path))     # 復元(なければ None)
+"""
+
+import json
+import os
+import tempfile
+from concurrent import futures
+
+# 一度に join して書き込む行数(巨大な文字列を一度に作らない)
+WRITE_CHUNK_LINES = 10000
+
+
+def autosave_path(path):
+    """ファイルに対応する自動保存のベースファイルのパス"""
+    return path + ".autosave"
+
+
+def atomic_write(path, lines, encoding="utf-8", final_newline=False):
+    """
+    行のリストを一時ファイルに書いてから os.replace でファイルを置き換える
+
+    Args:
+        path (str): 書き込むファイル
+        lines (list): 行(改行を含まない文字列)のリスト
+        final_newline (bool): 最後の行のあとにも改行を書くかどうか
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as file:
+            for offset in range(0, len(lines), WRITE_CHUNK_LINES):
+                if offset:
+                    file.write("\n")
+                file.write("\n".join(lines[offset:offset + WRITE_CHUNK_LINES]))
+            if final_newline:
+                file.write("\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _apply(lines, record):
+    line, removed, inserted = record
+    lines[line - 1:line - 1 + removed] = inserted
+
+
+class DeltaJournal:
+    """
+    ベースファイルと追記専用の差分ジャーナル
+
+    ジャーナルの1行目はベースファイルの (サイズ, 更新時刻) で、ベースを書き直したときに作り直します。
+    2行目以降は [開始行, 削除した行数, 挿入した行のリスト] の JSON です。
+    ベースとジャーナルの1行目が一致しない場合(ベースの置き換え直後に落ちた場合など)は
+    ジャーナルを使いません。
+
+    ワーカースレッドだけから使います。書き込んだ内容を lines に保持しているので、
+    ベースの書き直しでファイルを読み直す必要はありません。
+    """
+
+    COMPACT_RATIO = 0.5
+    COMPACT_MIN_BYTES = 1 << 20
+
+    def __init__(self, path, encoding="utf-8"):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.encoding = encoding
+        self.lines = None
+        self.base_bytes = 0
+        self.journal_bytes = 0
+        self.compactions = 0
+
+    def write_base(self, lines):
+        """ベースファイルを書き直し、ジャーナルを空にする"""
+        atomic_write(self.path, lines, self.encoding)
+        stat = os.stat(self.path)
+        header = (json.dumps({"base": [stat.st_size, stat.st_mtime_ns]}) + "\n").encode(self.encoding)
+        with open(self.journal_path, "wb") as file:
+            file.write(header)
+            file.flush()
+            os.fsync(file.fileno())
+        self.lines = lines
+        self.base_bytes = stat.st_size
+        self.journal_bytes = len(header)
+
+    def append(self, records):
+        """
+        変更をジャーナルに追記する(大きくなりすぎたらベースを書き直す)
+
+        Returns:
+            bool: ベースを書き直したかどうか
+        """
+        if self.lines is None:
+            raise RuntimeError("ベースファイルがまだ書かれていません")
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        data = data.encode(self.encoding)
+        with open(self.journal_path, "ab") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        for record in records:
+            _apply(self.lines, record)
+        self.journal_bytes += len(data)
+        if self.journal_bytes > max(self.COMPACT_MIN_BYTES, self.base_bytes * self.COMPACT_RATIO):
+            self.write_base(self.lines)
+            self.compactions += 1
+            return True
+        return False
+
+    def discard(self):
+        """自動保存のファイルを削除する"""
+        for path in (self.path, self.journal_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.lines = None
+
+    @classmethod
+    def load(cls, path, encoding="utf-8"):
+        """
+        ベースファイルにジャーナルを適用した行のリストを返す
+
+        Returns:
+            list: 行のリスト。自動保存のファイルがなければ None
+        """
+        try:
+            with open(path, "r", encoding=encoding, newline="") as file:
+                lines = file.read().split("\n")
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        try:
+            with open(path + ".journal", "rb") as file:
+                entries = file.read().split(b"\n")
+        except FileNotFoundError:
+            return lines
+        try:
+            header = json.loads(entries[0])
+        except ValueError:
+            return lines
+        if header.get("base") != [stat.st_size, stat.st_mtime_ns]:
+            return lines
+        # 最後の行は書き込みの途中で落ちた場合に壊れていることがあるので、読めた行まで適用する
+        for entry in entries[1:]:
+            if not entry:
+                continue
+            try:
+                record = json.loads(entry.decode(encoding))
+            except ValueError:
+                break
+            _apply(lines, record)
+        return lines
+
+
+class AutoSaver:
+    """
+    Text ウィジェットの内容をバックグラウンドで自動保存する
+
+    Args:
+        text: Text ウィジェット(after を呼ぶために使う)
+        mirror (TextMirror): text のミラー
+        path (str): 自動保存するファイル(実際には <path>.autosave に書く)
+        interval (int): 最後の変更から自動保存するまでの時間(ミリ秒)
+        on_saved: 自動保存が終わったときに呼ぶ関数(引数なし)
+        on_error: 自動保存に失敗したときに例外を渡して呼ぶ関数
+    """
+
+    INTERVAL_MS = 2000
+    POLL_MS = 50
+    SNAPSHOT_CHUNK = 200_000
+
+    def __init__(self, text, mirror, path, interval=None, on_saved=None, on_error=None, encoding="utf-8"):
+        self.text = text
+        self.mirror = mirror
+        self.interval = interval or self.INTERVAL_MS
+        self.on_saved = on_saved
+        self.on_error = on_error
+        self.encoding = encoding
+        self.executor = futures.ThreadPoolExecutor(max_workers=1)
+        self.pending = []
+        self.needs_base = True
+        self.flush_job = None
+        self.snapshot_job = None
+        self.snapshot_callbacks = []
+        self.journal = DeltaJournal(autosave_path(path), encoding)
+        mirror.listeners.append(self._on_mirror_changed)
+
+    def _on_mirror_changed(self, line, removed, inserted):
+        new_lines = self.mirror.lines[line - 1:line - 1 + inserted]
+        if not self.needs_base:
+            last = self.pending[-1] if self.pending else None
+            if (last is not None and removed == inserted == 1
+                    and last[0] <= line < last[0] + len(last[2])):
+                # 直前の変更で挿入した行の中の1行だけを書き換えた場合(通常の入力)は1つにまとめる
+                last[2][line - last[0]] = new_lines[0]
+            else:
+                self.pending.append([line, removed, new_lines])
+        if self.flush_job is None:
+            self.flush_job = self.text.after(self.interval, self._flush_when_idle)
+
+    def _flush_when_idle(self):
+        self.flush_job = self.text.after_idle(self.flush)
+
+    def _cancel(self):
+        if self.flush_job is not None:
+            self.text.after_cancel(self.flush_job)
+            self.flush_job = None
+
+    def flush(self):
+        """記録した変更をすぐにワーカースレッドへ渡す(ベースがまだなければ全体のコピーから始める)"""
+        self._cancel()
+        if self.needs_base:
+            if self._write_base not in self.snapshot_callbacks:
+                self._snapshot(self._write_base)
+            return
+        if self.pending:
+            future = self.executor.submit(self.journal.append, self.pending)
+            self.pending = []
+            self.watch(future, self._on_flushed)
+
+    def _write_base(self, lines):
+        self.needs_base = False
+        self.pending = []
+        self.watch(self.executor.submit(self.journal.write_base, lines), self._on_flushed)
+
+    def _on_flushed(self, future):
+        if future.exception() is not None:
+            # 次の自動保存ではベースから書き直す
+            self.needs_base = True
+            self.pending = []
+            if self.on_error:
+                self.on_error(future.exception())
+        elif self.on_saved:
+            self.on_saved()
+
+    def _snapshot(self, callback):
+        """
+        行のリストを SNAPSHOT_CHUNK 行ずつ after() で分けてコピーし、終わったら callback(lines) を呼ぶ
+
+        100 MB の文書では行のリストのコピーだけで1フレームを超えるため、分けてコピーします。
+        途中で本文が変更された場合は最初からコピーし直します。
+        """
+        self.snapshot_callbacks.append(callback)
+        if self.snapshot_job is None:
+            self._snapshot_step(self.mirror.version, [], 0)
+
+    def _snapshot_step(self, version, lines, offset):
+        self.snapshot_job = None
+        if version != self.mirror.version:
+            version, lines, offset = self.mirror.version, [], 0
+        lines += self.mirror.lines[offset:offset + self.SNAPSHOT_CHUNK]
+        offset += self.SNAPSHOT_CHUNK
+        if offset < len(self.mirror.lines):
+            self.snapshot_job = self.text.after(1, self._snapshot_step, version, lines, offset)
+            return
+        callbacks, self.snapshot_callbacks = self.snapshot_callbacks, []
+        for callback in callbacks:
+            callback(lines)
+
+    def _cancel_snapshot(self):
+        if self.snapshot_job is not None:
+            self.text.after_cancel(self.snapshot_job)
+            self.snapshot_job = None
+        self.snapshot_callbacks = []
+
+    def _cancel_base_snapshot(self):
+        """コピー中の自動保存のベースの書き込みを取り消す(ほかの保存のコピーは続ける)"""
+        self.snapshot_callbacks = [callback for callback in self.snapshot_callbacks
+                                   if callback != self._write_base]
+        if not self.snapshot_callbacks and self.snapshot_job is not None:
+            self.text.after_cancel(self.snapshot_job)
+            self.snapshot_job = None
+
+    def save(self, path, on_done=None, wait=False):
+        """
+        現在の内容を path に保存する(書き込みはワーカースレッド)
+
+        保存が終わったら自動保存のファイルを削除し、以降は path の自動保存に切り替えます。
+
+        Args:
+            on_done: 完了時に Future を渡して呼ぶ関数
+            wait (bool): すぐに全体をコピーし、書き込みが終わるまで待つ(終了前の保存など)
+
+        Returns:
+            concurrent.futures.Future: wait=True のときは完了した Future、それ以外は None
+        """
+        self._cancel()
+        self._cancel_base_snapshot()
+        old_journal = self.journal
+        new_journal = self.journal = DeltaJournal(autosave_path(path), self.encoding)
+        self.pending = []
+        self.needs_base = True
+
+        def write(lines):
+            atomic_write(path, lines, self.encoding, final_newline=True)
+            # 同じパスに保存した場合、新しいジャーナルがすでに書いたベースは消さない
+            if old_journal.path != new_journal.path or new_journal.lines is None:
+                old_journal.discard()
+
+        def submit(lines):
+            future = self.executor.submit(write, lines)
+            if on_done:
+                self.watch(future, on_done)
+            return future
+
+        if not wait:
+            self._snapshot(submit)
+            return None
+        future = submit(list(self.mirror.lines))
+        futures.wait([future])
+        return future
+
+    def restart(self, path):
+        """自動保存のファイルを削除し、path の自動保存を最初からやり直す(新規作成・開くとき)"""
+        self._cancel()
+        self.executor.submit(self.journal.discard)
+        self.journal = DeltaJournal(autosave_path(path), self.encoding)
+        self.pending = []
+        self.needs_base = True
+
+    def discard(self):
+        """記録した変更と自動保存のファイルを捨てる"""
+        self._cancel()
+        self._cancel_snapshot()
+        self.pending = []
+        self.needs_base = True
+        return self.executor.submit(self.journal.discard)
+
+    def close(self, wait=True):
+        """ワーカースレッドを止める(wait=True なら書き込み中の保存が終わるまで待つ)"""
+        self._cancel()
+        self._cancel_snapshot()
+        if self._on_mirror_changed in self.mirror.listeners:
+            self.mirror.listeners.remove(self._on_mirror_changed)
+        self.executor.shutdown(wait=wait)
+
+    def watch(self, future, callback):
+        """Future が完了したら UI スレッドで callback(future) を呼ぶ"""
+        if future.done():
+            callback(future)
+        else:
+            self.text.after(self.POLL_MS, self.watch, future, callback)
@@ -0,0 +1,200 @@
+"""
+安全な数式エンジン
+
+eval(文字列) は任意の Python コードを実行できるうえ、呼び出すたびに構文解析をやり直します。
+このモジュールでは数式を一度だけ AST に変換し、四則演算などの許可した要素だけで
+できていることを確認してからコンパイルします。コンパイル済みの数式は LRU キャッシュに保持します。
+
+- 使える要素: 数値、変数名、+ - * / // % **、単項の + -、かっこ
+- 関数呼び出し・属性・添字・比較などは ExpressionError になります
+- 結果が複素数になる場合((-8) ** 0.5 など)と、整数の結果が大きすぎる場合も ExpressionError になります
+- NumPy があれば evaluate_many で変数に配列を渡し、列全体をまとめて計算できます
+  (NumPy がなければ値ごとに計算した list を返します)
+
+使い方:
+    from tkinter_files.common.expression import engine
+
+    engine.evaluate("1+2*3")                                # 7
+    engine.evaluate("price * (1 + rate)", price=100, rate=0.1)
+    engine.evaluate_many("x * 1.1 + 3", x=[1, 2, 3])
+"""
+
+import ast
+import functools
+
+try:
+    import numpy as np
+except ImportError:  # NumPy は任意(なければ値ごとに計算する)
+    np = None
+
+# 数式の最大の長さと、** の右辺(定数)の絶対値の上限(巨大な整数の計算で止まらないようにする)
+MAX_LENGTH = 1000
+MAX_EXPONENT = 100
+# 整数の計算結果のビット数の上限(約 1200 桁。str() の桁数の上限 4300 桁より十分小さくする)
+MAX_RESULT_BITS = 4096
+
+ALLOWED_BINARY = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+ALLOWED_UNARY = (ast.UAdd, ast.USub)
+
+# 関数・組み込み名を一切使えない名前空間
+NO_BUILTINS = {"__builtins__": {}}
+
+
+class ExpressionError(ValueError):
+    """数式が不正、または許可されていない要素を含む"""
+
+
+def _check_constant(node):
+    """定数が数値(bool 以外の int / float)であることを確認する"""
+    if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+        raise ExpressionError(f"数値以外の定数は使えません: {node.value!r}")
+
+
+def _check(node):
+    """AST が許可した要素だけでできていることを確認し、使われている変数名を返す"""
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Expression, ast.Load) + ALLOWED_BINARY + ALLOWED_UNARY):
+            continue
+        if isinstance(child, ast.BinOp):
+            if isinstance(child.op, ast.Pow):
+                exponent = child.right
+                if isinstance(exponent, ast.UnaryOp) and isinstance(exponent.op, ALLOWED_UNARY):
+                    exponent = exponent.operand
+                if isinstance(exponent, ast.Constant):
+                    # 文字列などの定数で abs() が TypeError にならないよう、先に型を確認する
+                    _check_constant(exponent)
+                if not isinstance(exponent, ast.Constant) or abs(exponent.value) > MAX_EXPONENT:
+                    raise ExpressionError(f"** の右辺は絶対値 {MAX_EXPONENT} 以下の数値にしてください")
+                if any(isinstance(n, ast.BinOp) and isinstance(n.op, ast.Pow) for n in ast.walk(child.left)):
+                    raise ExpressionError("** を重ねることはできません")
+            continue
+        if isinstance(child, ast.UnaryOp):
+            continue
+        if isinstance(child, ast.Constant):
+            _check_constant(child)
+            continue
+        if isinstance(child, ast.Name):
+            if child.id.startswith("_"):
+                raise ExpressionError(f"使えない名前です: {child.id}")
+            names.add(child.id)
+            continue
+        raise ExpressionError(f"使えない要素です: {type(child).__name__}")
+    return frozenset(names)
+
+
+def _check_result(value):
+    """計算結果が表示できる実数であることを確認する"""
+    if isinstance(value, complex):
+        raise ExpressionError("計算結果が複素数になりました")
+    if isinstance(value, int) and value.bit_length() > MAX_RESULT_BITS:
+        raise ExpressionError("計算結果の整数が大きすぎます")
+    return value
+
+
+class CompiledExpression:
+    """
+    検証・コンパイル済みの数式
+
+    Attributes:
+        source (str): 元の数式
+        names (frozenset): 数式で使われている変数名
+    """
+
+    def __init__(self, source):
+        if len(source) > MAX_LENGTH:
+            raise ExpressionError(f"数式が長すぎます({MAX_LENGTH} 文字まで)")
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ExpressionError(f"数式が正しくありません: {source}") from e
+        self.source = source
+        self.names = _check(tree)
+        self._code = compile(tree, "<expression>", "eval")
+
+    def __call__(self, **variables):
+        """
+        数式を計算する
+
+        Raises:
+            ExpressionError: 変数が足りない場合、結果が複素数または大きすぎる整数の場合
+            ZeroDivisionError: 0 で割った場合
+        """
+        missing = self.names.difference(variables)
+        if missing:
+            raise ExpressionError(f"変数の値がありません: {', '.join(sorted(missing))}")
+        return _check_result(eval(self._code, NO_BUILTINS, variables))
+
+    def evaluate_many(self, **columns):
+        """
+        変数ごとの値の列に対して数式を計算する
+
+        NumPy があれば各列を配列に変換して一度に計算し、配列を返します(0 除算は inf / nan)。
+        ない場合は行ごとに計算した list を返します。列以外の値(スカラー)はすべての行で共通です。
+
+        Returns:
+            numpy.ndarray または list: 行ごとの計算結果
+        """
+        if np is not None:
+            arrays = {name: np.asarray(value, dtype=float) if _is_column(value) else value
+                      for name, value in columns.items()}
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.asarray(self(**arrays), dtype=float)
+
+        column_names = [name for name, value in columns.items() if _is_column(value)]
+        if not column_names:
+            return [self(**columns)]
+        length = len(columns[column_names[0]])
+        if any(len(columns[name]) != length for name in column_names):
+            raise ExpressionError("列の長さがそろっていません")
+        variables = dict(columns)
+        rows = zip(*(columns[name] for name in column_names))
+        results = []
+        for row in rows:
+            variables.update(zip(column_names, row))
+            results.append(_check_result(eval(self._code, NO_BUILTINS, variables)))
+        return results
+
+
+def _is_column(value):
+    return not isinstance(value, (int, float, str, bytes)) and hasattr(value, "__len__")
+
+
+class ExpressionEngine:
+    """
+    数式をコンパイルしてキャッシュするエンジン
+
+    同じ数式を何度計算しても、構文解析と検証は最初の1回だけです。
+    """
+
+    cache_size = 1024
+
+    def __init__(self, cache_size=None):
+        self._compile = functools.lru_cache(maxsize=cache_size or self.cache_size)(CompiledExpression)
+
+    def compile(self, source):
+        """
+        数式をコンパイルする(キャッシュ済みならそれを返す)
+
+        Raises:
+            ExpressionError: 数式が不正な場合
+        """
+        return self._compile(source)
+
+    def evaluate(self, source, **variables):
+        """数式を計算する"""
+        return self._compile(source)(**variables)
+
+    def evaluate_many(self, source, **columns):
+        """数式を列全体に対して計算する(CompiledExpression.evaluate_many を参照)"""
+        return self._compile(source).evaluate_many(**columns)
+
+    def cache_info(self):
+        return self._compile.cache_info()
+
+    def clear(self):
+        self._compile.cache_clear()
+
+
+# アプリ全体で共有する既定のエンジン
+engine = ExpressionEngine()
@@ -0,0 +1,371 @@
+"""
+インクリメンタルな構文強調表示
+
+Text ウィジェットに字句解析器(レキサー)を差し込んで色を付けます。
+- 編集された行から字句解析をやり直し、行末の状態(複数行の文字列の途中など)が
+  前回と同じになった時点で打ち切る
+- タグを付けるのは画面に表示されている行だけ。スクロールで現れた行はその時に付ける
+- 1回の処理は時間の上限までで、残りは after() で少しずつ続ける
+- タグはタグの種類ごとにまとめて tag_add する
+
+レキサーは initial_state と tokenize(line, state) を持つオブジェクトで、
+tokenize は ([(タグ名, 開始列, 終了列)], 行末の状態) を返します。状態は == で比較できる値にします。
+
+使い方:
+    from tkinter_files.common.highlighter import Highlighter, lexer_for_filename
+    from tkinter_files.common.text_mirror import TextMirror
+
+    highlighter = Highlighter(text, TextMirror(text))
+    highlighter.set_lexer(lexer_for_filename("example.py"))
+"""
+
+import builtins
+import keyword
+import os
+import re
+import time
+
+# まだ字句解析していない行の状態
+UNKNOWN = object()
+
+# タグ名 → tag_configure のオプション
+TAG_STYLES = {
+    "keyword": {"foreground": "#0000cc"},
+    "builtin": {"foreground": "#900090"},
+    "definition": {"foreground": "#006680"},
+    "decorator": {"foreground": "#aa5500"},
+    "string": {"foreground": "#008000"},
+    "comment": {"foreground": "#808080"},
+    "number": {"foreground": "#c04000"},
+    "timestamp": {"foreground": "#006680"},
+    "error": {"foreground": "#cc0000"},
+    "warning": {"foreground": "#b36b00"},
+    "info": {"foreground": "#0000cc"},
+    "debug": {"foreground": "#808080"},
+    "traceback": {"foreground": "#a00000"},
+}
+
+
+class PythonLexer:
+    """
+    Python のレキサー
+
+    行末の状態は、閉じていない三重引用符('\"\"\"' または "'''")か None です。
+    """
+
+    initial_state = None
+
+    KEYWORDS = frozenset(keyword.kwlist + getattr(keyword, "softkwlist", []))
+    BUILTINS = frozenset(name for name in dir(builtins) if not name.startswith("_"))
+    TOKEN = re.compile(r"""
+        (?P<comment>\#.*)
+      | (?P<triple>[rRbBuUfF]{0,2}(?:\"\"\"|'''))
+      | (?P<string>[rRbBuUfF]{0,2}(?:"(?:[^"\\]|\\.)*"?|'(?:[^'\\]|\\.)*'?))
+      | (?P<decorator>@[A-Za-z_][\w.]*)
+      | (?P<number>\b(?:0[xXoObB][\da-fA-F_]+|\d[\d_]*\.?\d*(?:[eE][+-]?\d+)?j?)\b)
+      | (?P<name>[A-Za-z_]\w*)
+    """, re.VERBOSE)
+
+    def tokenize(self, line, state):
+        tokens = []
+        pos = 0
+        if state:
+            end = line.find(state)
+            if end < 0:
+                return [("string", 0, len(line))], state
+            pos = end + 3
+            tokens.append(("string", 0, pos))
+
+        after_def = False
+        search = self.TOKEN.search
+        while True:
+            match = search(line, pos)
+            if match is None:
+                return tokens, None
+            kind = match.lastgroup
+            start, pos = match.span()
+            if kind == "name":
+                word = match.group()
+                if after_def:
+                    tokens.append(("definition", start, pos))
+                elif word in self.KEYWORDS:
+                    tokens.append(("keyword", start, pos))
+                elif word in self.BUILTINS:
+                    tokens.append(("builtin", start, pos))
+                after_def = word in ("def", "class")
+                continue
+            after_def = False
+            if kind == "triple":
+                quote = line[pos - 3:pos]
+                end = line.find(quote, pos)
+                if end < 0:
+                    tokens.append(("string", start, len(line)))
+                    return tokens, quote
+                pos = end + 3
+                kind = "string"
+            tokens.append((kind, start, pos))
+
+
+class LogLexer:
+    """
+    ログファイルのレキサー
+
+    タイムスタンプとログレベルに色を付けます。
+    "Traceback" で始まる行から、字下げされていない例外の行までは traceback の状態になります。
+    """
+
+    initial_state = None
+
+    TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?")
+    TOKEN = re.compile(r"""
+        (?P<error>\b(?:ERROR|CRITICAL|FATAL)\b)
+      | (?P<warning>\bWARN(?:ING)?\b)
+      | (?P<info>\bINFO\b)
+      | (?P<debug>\b(?:DEBUG|TRACE)\b)
+      | (?P<string>"[^"]*"|'[^']*')
+      | (?P<number>\b\d+(?:\.\d+)*\b)
+    """, re.VERBOSE)
+
+    def tokenize(self, line, state):
+        if state == "traceback":
+            if line[:1] in (" ", "\t"):
+                return [("traceback", 0, len(line))], state
+            return [("error", 0, len(line))], None
+        if line.startswith("Traceback"):
+            return [("traceback", 0, len(line))], "traceback"
+
+        tokens = []
+        pos = 0
+        match = self.TIMESTAMP.match(line)
+        if match:
+            pos = match.end()
+            tokens.append(("timestamp", 0, pos))
+        for match in self.TOKEN.finditer(line, pos):
+            tokens.append((match.lastgroup, match.start(), match.end()))
+        return tokens, None
+
+
+# 拡張子 → レキサー
+LEXERS = {
+    ".py": PythonLexer,
+    ".pyw": PythonLexer,
+    ".log": LogLexer,
+}
+
+
+def lexer_for_filename(filename):
+    """
+    ファイル名の拡張子に合うレキサーを返す(対応していなければ None)
+    """
+    lexer_class = LEXERS.get(os.path.splitext(filename or "")[1].lower())
+    return lexer_class() if lexer_class else None
+
+
+class Highlighter:
+    """
+    TextMirror の変更を受け取って Text に構文の色を付ける
+
+    states[i] は i 行目(0から数える)の行頭の状態、painted[i] は i 行目のタグが
+    最新の字句解析の結果と一致しているかどうかです。
+    resume は字句解析を続ける必要がある最初の行、converge_after はそれより後ろで
+    行末の状態が前回と同じになれば打ち切ってよい行です。
+    """
+
+    TAG_PREFIX = "hl_"
+    # キー入力1回あたりの処理時間の上限と、残りをバックグラウンドで続けるときの1回分
+    BUDGET_MS = 3.0
+    BACKGROUND_BUDGET_MS = 8.0
+    # 時刻を確認する間隔(行数)
+    CHECK_EVERY = 32
+
+    def __init__(self, text, mirror, lexer=None, styles=None):
+        self.text = text
+        self.mirror = mirror
+        self.lexer = None
+        self.states = []
+        self.painted = bytearray()
+        self.resume = None
+        self.converge_after = 0
+        self.background_job = None
+        self.visible_job = None
+        self.tags = {}
+        for name, options in (styles or TAG_STYLES).items():
+            tag = self.tags[name] = self.TAG_PREFIX + name
+            text.tag_configure(tag, **options)
+            text.tag_lower(tag, "sel")
+
+        mirror.listeners.append(self.on_change)
+
+        # 表示範囲が変わったとき(スクロール・リサイズ・編集)に見えている行へタグを付ける
+        previous = text.cget("yscrollcommand")
+        self._previous_yscroll = text.tk.splitlist(previous) if previous else ()
+        text.configure(yscrollcommand=self._on_yscroll)
+
+        self.set_lexer(lexer)
+
+    def set_lexer(self, lexer):
+        """
+        レキサーを切り替えて全体を字句解析し直す(None で強調表示なし)
+        """
+        self.lexer = lexer
+        self._cancel_jobs()
+        for tag in self.tags.values():
+            self.text.tag_remove(tag, "1.0", "end")
+        count = len(self.mirror.lines)
+        self.painted = bytearray(count)
+        if lexer is None:
+            self.states = []
+            self.resume = None
+            return
+        self.states = [lexer.initial_state] + [UNKNOWN] * count
+        self.resume = 0
+        self.converge_after = count
+        self.run(self.BUDGET_MS)
+
+    def on_change(self, line, removed, inserted):
+        """TextMirror のリスナー: 変更された行から字句解析をやり直す"""
+        first = line - 1
+        self.painted[first:first + removed] = bytes(inserted)
+        if self.lexer is None:
+            return
+        # 変更された最初の行の行頭の状態はそのまま使える。変更範囲の次の行の行頭の状態(前回の値)は
+        # 収束の判定に使うため残し、その間の挿入された行の状態だけを UNKNOWN にする
+        states = self.states
+        if removed == 0:
+            states[first + 1:first + 1] = [UNKNOWN] * (inserted - 1) + [states[first]]
+        elif inserted == 0:
+            del states[first + 1:first + removed + 1]
+        else:
+            states[first + 1:first + removed] = [UNKNOWN] * (inserted - 1)
+        # 行を削除しただけの場合も、続く行の行末の状態は古い行頭の状態から求めたものなので1行は解析する
+        after = first + max(inserted, 1)
+        if self.resume is None:
+            self.resume = first
+            self.converge_after = after
+        else:
+            # 前回の字句解析が途中の場合は、中断した行も解析し直すまで打ち切らない
+            pending = self.resume + 1
+            if pending >= first + removed:
+                pending += inserted - removed
+            if self.converge_after >= first + removed:
+                self.converge_after += inserted - removed
+            self.resume = min(self.resume, first)
+            self.converge_after = max(self.converge_after, pending, after)
+        self.run(self.BUDGET_MS)
+
+    def run(self, budget_ms):
+        """
+        resume の行から、状態が収束するか時間の上限になるまで字句解析する
+
+        Returns:
+            bool: 全体の字句解析が終わったかどうか
+        """
+        if self.resume is None:
+            return True
+        lines = self.mirror.lines
+        count = len(lines)
+        tokenize = self.lexer.tokenize
+        states = self.states
+        painted = self.painted
+        visible_first, visible_last = self.visible_lines()
+        deadline = time.perf_counter() + budget_ms / 1000
+        batch = {}
+        batch_first = batch_last = None
+
+        index = self.resume
+        state = states[index]
+        while index < count:
+            tokens, state = tokenize(lines[index], state)
+            if visible_first <= index <= visible_last:
+                self._collect(batch, index, tokens)
+                if batch_first is None:
+                    batch_first = index
+                batch_last = index
+                painted[index] = 1
+            else:
+                painted[index] = 0
+            index += 1
+            previous = states[index]
+            states[index] = state
+            if index >= self.converge_after and previous is not UNKNOWN and previous == state:
+                self.resume = None
+                break
+            if index % self.CHECK_EVERY == 0 and time.perf_counter() > deadline:
+                self.resume = index
+                break
+        else:
+            self.resume = None
+
+        if batch_first is not None:
+            self._apply(batch, batch_first, batch_last)
+        if self.resume is not None and self.background_job is None:
+            self.background_job = self.text.after(1, self._background)
+        return self.resume is None
+
+    def _background(self):
+        self.background_job = None
+        self.run(self.BACKGROUND_BUDGET_MS)
+
+    def visible_lines(self):
+        """画面に表示されている行の範囲(0から数える。両端を含む)"""
+        first = int(self.text.index("@0,0").split(".")[0]) - 1
+        last = int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0]) - 1
+        return first, last
+
+    def _on_yscroll(self, first, last):
+        if self._previous_yscroll:
+            self.text.tk.call(*self._previous_yscroll, first, last)
+        if self.lexer is not None and self.visible_job is None:
+            self.visible_job = self.text.after_idle(self.paint_visible)
+
+    def paint_visible(self):
+        """表示範囲のうち、状態が分かっていてタグが古い行にタグを付ける"""
+        self.visible_job = None
+        if self.lexer is None:
+            return
+        visible_first, visible_last = self.visible_lines()
+        lines = self.mirror.lines
+        stop = min(visible_last + 1, len(lines))
+        if self.resume is not None:
+            stop = min(stop, self.resume)
+        batch = {}
+        batch_first = batch_last = None
+        for index in range(visible_first, stop):
+            if self.painted[index]:
+                continue
+            tokens, _ = self.lexer.tokenize(lines[index], self.states[index])
+            self._collect(batch, index, tokens)
+            if batch_first is None:
+                batch_first = index
+            batch_last = index
+            self.painted[index] = 1
+        if batch_first is not None:
+            self._apply(batch, batch_first, batch_last)
+
+    def _collect(self, batch, index, tokens):
+        line = index + 1
+        for kind, start, end in tokens:
+            if start < end:
+                batch.setdefault(kind, []).extend((f"{line}.{start}", f"{line}.{end}"))
+
+    def _apply(self, batch, first, last):
+        """first 行から last 行までのタグを付け直す(タグの種類ごとに1回の tag_add)"""
+        start, end = f"{first + 1}.0", f"{last + 1}.end"
+        for tag in self.tags.values():
+            self.text.tag_remove(tag, start, end)
+        for kind, indices in batch.items():
+            tag = self.tags.get(kind)
+            if tag is not None:
+                self.text.tag_add(tag, *indices)
+
+    def pending(self):
+        """字句解析が残っているかどうか"""
+        return self.resume is not None
+
+    def _cancel_jobs(self):
+        if self.background_job is not None:
+            self.text.after_cancel(self.background_job)
+            self.background_job = None
+        if self.visible_job is not None:
+            self.text.after_cancel(self.visible_job)
+            self.visible_job = None
@@ -0,0 +1,199 @@
+"""
+タブの中身を遅延して作るノートブック
+
+ttk.Notebook のタブをすべて作ってからウィンドウを表示すると、タブの数だけ
+ウィジェットの作成とバインディングの設定に時間がかかり、最初の描画が遅れます。
+LazyNotebook はタブには空の Frame だけを追加しておき、そのタブが最初に選択されたとき
+(<<NotebookTabChanged>>)に中身を作ります。
+
+- 最初に表示されるタブだけは add() したときに作る
+- prewarm=True の場合は、アイドル時間に残りのタブを1つずつ作っておく
+  (1つ作るたびにイベントを処理するので、操作を妨げない)
+- 作ったタブのメモリの見積もりの合計が memory_limit を超えたら、
+  最も長く選択されていないタブの中身を destroy する(選択中のタブは破棄しない)
+- 破棄したタブは次に選択されたときに作り直す。状態を残したい場合は unload で保存する
+
+使い方:
+    from tkinter_files.common.lazy_notebook import LazyNotebook
+
+    tabs = LazyNotebook(notebook)
+    tabs.add("editor", "テキストエディタ", build_editor, unload=save_editor_state)
+    tabs.add("list", "リスト管理", build_list)
+"""
+
+import tkinter as tk
+from collections import OrderedDict
+
+from tkinter_files.common.window_pool import estimate_size
+
+
+class _Tab:
+    __slots__ = ("name", "frame", "builder", "unload", "built", "size", "builds")
+
+    def __init__(self, name, frame, builder, unload):
+        self.name = name
+        self.frame = frame
+        self.builder = builder
+        self.unload = unload
+        self.built = False
+        self.size = 0
+        self.builds = 0
+
+
+class LazyNotebook:
+    """
+    ttk.Notebook のタブの中身を最初に選択されたときに作るヘルパー
+
+    Args:
+        notebook (ttk.Notebook): 対象のノートブック
+        memory_limit (int): 作ったタブのメモリの見積もりの上限(バイト)
+        prewarm (bool): アイドル時間にまだ作っていないタブを作っておくか
+    """
+
+    MEMORY_LIMIT = 4 * 1024 * 1024
+    # 事前に作るタブとタブの間に空ける時間(ms)
+    PREWARM_DELAY = 1
+
+    def __init__(self, notebook, memory_limit=None, prewarm=True):
+        self.notebook = notebook
+        self.memory_limit = memory_limit or self.MEMORY_LIMIT
+        self.prewarm = prewarm
+        self.tabs = OrderedDict()     # 追加した順
+        self._by_frame = {}
+        self._recent = OrderedDict()  # 作ったタブ(最後に選択した順)
+        self._current = None
+        self._prewarm_job = None
+        self.builds = 0
+        self.unloads = 0
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+        notebook.bind("<Destroy>", self._on_destroy, add="+")
+
+    def add(self, name, text, builder, unload=None, **options):
+        """
+        タブを追加する(中身は最初に選択されたときに作る)
+
+        Args:
+            name (str): タブの名前
+            text (str): タブに表示する文字列
+            builder: 中身を作る Frame を渡して呼ぶ関数
+            unload: 中身を破棄する前に Frame を渡して呼ぶ関数(状態の保存)
+            **options: notebook.add() に渡すオプション
+
+        Returns:
+            tk.Frame: タブの Frame
+        """
+        frame = tk.Frame(self.notebook)
+        self.notebook.add(frame, text=text, **options)
+        tab = _Tab(name, frame, builder, unload)
+        self.tabs[name] = tab
+        self._by_frame[str(frame)] = tab
+        if str(self.notebook.select()) == str(frame):
+            # 最初のタブはすぐに表示されるので、ここで作っておく
+            self._select(tab)
+        self._schedule_prewarm()
+        return frame
+
+    def frame(self, name):
+        return self.tabs[name].frame
+
+    def is_built(self, name):
+        return self.tabs[name].built
+
+    def ensure(self, name):
+        """タブの中身を作る(作成済みなら何もしない)"""
+        tab = self.tabs[name]
+        if not tab.built:
+            self._build(tab)
+            self._recent[name] = tab
+            self._recent.move_to_end(name)
+            self._evict()
+        return tab.frame
+
+    def select(self, name):
+        """タブを選択する(中身は <<NotebookTabChanged>> で作る)"""
+        self.notebook.select(self.tabs[name].frame)
+
+    def unload(self, name):
+        """タブの中身を破棄する(次に選択されたときに作り直す)"""
+        tab = self.tabs[name]
+        if not tab.built:
+            return
+        if tab.unload:
+            tab.unload(tab.frame)
+        for child in tab.frame.winfo_children():
+            child.destroy()
+        tab.built = False
+        tab.size = 0
+        self._recent.pop(name, None)
+        self.unloads += 1
+
+    @property
+    def memory(self):
+        """作ったタブのメモリの見積もりの合計(バイト)"""
+        return sum(tab.size for tab in self._recent.values())
+
+    def _build(self, tab):
+        tab.builder(tab.frame)
+        tab.built = True
+        tab.size = estimate_size(tab.frame)
+        tab.builds += 1
+        self.builds += 1
+
+    def _on_tab_changed(self, event):
+        if str(event.widget) != str(self.notebook):
+            return
+        tab = self._by_frame.get(str(self.notebook.select()))
+        if tab is not None and tab is not self._current:
+            self._select(tab)
+
+    def _select(self, tab):
+        previous = self._current
+        if previous is not None and previous.built:
+            # 表示していた間に増えた分(Text の内容など)を見積もり直す
+            previous.size = estimate_size(previous.frame)
+        self._current = tab
+        if not tab.built:
+            self._build(tab)
+        self._recent[tab.name] = tab
+        self._recent.move_to_end(tab.name)
+        self._evict()
+
+    def _evict(self):
+        # 最も長く選択されていないタブから破棄する
+        for name, tab in list(self._recent.items()):
+            if self.memory <= self.memory_limit:
+                break
+            if tab is not self._current:
+                self.unload(name)
+
+    # ---- アイドル時間の事前作成 ----
+
+    def _schedule_prewarm(self):
+        if self.prewarm and self._prewarm_job is None:
+            self._prewarm_job = self.notebook.after_idle(self._prewarm_step)
+
+    def _prewarm_step(self):
+        self._prewarm_job = None
+        # 一度も作っていないタブだけを作る(上限で破棄したタブは選択されるまで作らない)
+        tab = next((tab for tab in self.tabs.values() if tab.builds == 0), None)
+        if tab is None:
+            return
+        if self.memory >= self.memory_limit:
+            return
+        self._build(tab)
+        self._recent[tab.name] = tab
+        self._recent.move_to_end(tab.name, last=False)
+        if self.memory > self.memory_limit:
+            # 使っているタブを破棄してまで事前に作らない(入りきらなければ事前作成をやめる)
+            self.unload(tab.name)
+            return
+        # 次のタブは、たまっているイベントを処理してから作る
+        self._prewarm_job = self.notebook.after(self.PREWARM_DELAY, self._prewarm_idle)
+
+    def _prewarm_idle(self):
+        self._prewarm_job = self.notebook.after_idle(self._prewarm_step)
+
+    def _on_destroy(self, event):
+        if str(event.widget) == str(self.notebook) and self._prewarm_job is not None:
+            self.notebook.after_cancel(self._prewarm_job)
+            self._prewarm_job = None
@@ -0,0 +1,194 @@
+"""
+ウィンドウの配置
+
+サブウィンドウを開くたびに winfo_screenwidth() や親ウィンドウの位置を問い合わせ、
+update_idletasks() でレイアウトを確定させてから位置を計算すると、開くまでの時間が長くなります。
+Placement は画面と作業領域(タスクバーなどを除いた範囲)の大きさをキャッシュし、
+親ウィンドウの位置と大きさは <Configure> イベントで受け取った値を使います。
+<Configure> を受け取ったら画面のキャッシュを捨て、次に配置するときに問い合わせ直します。
+
+- 位置の計算(中央・右隣・画面内に収める)はツールキットに依存しない
+- TkPlacement(このモジュール)と QtPlacement(pyside6_files/common/screen_placement.py)は
+  同じメソッドで使える
+- 複数の画面がある場合は、親ウィンドウの中心がある画面の作業領域に収める
+  (tkinter は画面を1つしか取得できないため、親がその外にある場合は収めない)
+
+使い方:
+    from tkinter_files.common.placement import TkPlacement
+
+    placement = TkPlacement(root)
+    placement.center_on_screen(window, 350, 250, near=root)
+    placement.center_on_parent(dialog, root, 250, 150)
+    placement.beside_parent(window, root, 250, 200)
+"""
+
+import re
+from collections import namedtuple
+
+Rect = namedtuple("Rect", "x y width height")
+Screen = namedtuple("Screen", "geometry work_area")
+
+# wm geometry の "幅x高さ+X+Y"(X, Y は負の値のとき "+-10"。"-" で始まる場合は右端・下端からの距離)
+_GEOMETRY = re.compile(r"(\d+)x(\d+)([+-])(-?\d+)([+-])(-?\d+)")
+
+
+def contains(rect, x, y):
+    return rect.x <= x < rect.x + rect.width and rect.y <= y < rect.y + rect.height
+
+
+def center_in(area, width, height):
+    """area の中央に置いた width x height の矩形"""
+    return Rect(area.x + (area.width - width) // 2, area.y + (area.height - height) // 2, width, height)
+
+
+def clamp(rect, area):
+    """rect が area からはみ出さないように移動する(area より大きい場合は左上をそろえる)"""
+    x = max(area.x, min(rect.x, area.x + area.width - rect.width))
+    y = max(area.y, min(rect.y, area.y + area.height - rect.height))
+    return Rect(x, y, rect.width, rect.height)
+
+
+def beside(parent, width, height, gap, area=None):
+    """parent の右隣(入らなければ左隣)に置いた矩形"""
+    rect = Rect(parent.x + parent.width + gap, parent.y, width, height)
+    if area is not None and rect.x + width > area.x + area.width:
+        left = parent.x - gap - width
+        if left >= area.x:
+            rect = Rect(left, parent.y, width, height)
+    return rect
+
+
+class Placement:
+    """
+    ウィンドウの配置(ツールキットに依存しない部分)
+
+    サブクラスは _query_screens()、window_rect()、apply() を実装します。
+    """
+
+    def __init__(self):
+        self._screens = None
+        self.screen_queries = 0
+
+    def _query_screens(self):
+        """Screen のリストを返す(先頭がプライマリ画面)"""
+        raise NotImplementedError
+
+    def window_rect(self, window):
+        """ウィンドウの位置と大きさ(Rect)"""
+        raise NotImplementedError
+
+    def apply(self, window, rect):
+        """ウィンドウを rect の位置と大きさにする"""
+        raise NotImplementedError
+
+    def screens(self):
+        if self._screens is None:
+            self._screens = self._query_screens()
+            self.screen_queries += 1
+        return self._screens
+
+    def invalidate(self):
+        """画面のキャッシュを捨てる(次に配置するときに問い合わせ直す)"""
+        self._screens = None
+
+    def screen_for(self, rect):
+        """rect の中心がある画面(どの画面にもなければ None)"""
+        x = rect.x + rect.width // 2
+        y = rect.y + rect.height // 2
+        for screen in self.screens():
+            if contains(screen.geometry, x, y):
+                return screen
+        return None
+
+    def _place(self, window, rect, area):
+        if area is not None:
+            rect = clamp(rect, area)
+        self.apply(window, rect)
+        return rect
+
+    def center_on_screen(self, window, width, height, near=None):
+        """
+        画面の作業領域の中央に配置する
+
+        Args:
+            near: このウィンドウがある画面に配置する(省略するとプライマリ画面)
+
+        Returns:
+            Rect: 配置した位置と大きさ
+        """
+        screen = self.screen_for(self.window_rect(near)) if near is not None else None
+        area = (screen or self.screens()[0]).work_area
+        return self._place(window, center_in(area, width, height), area)
+
+    def center_on_parent(self, window, parent, width, height):
+        """親ウィンドウの中央に配置する(画面からはみ出す場合は作業領域に収める)"""
+        parent_rect = self.window_rect(parent)
+        screen = self.screen_for(parent_rect)
+        return self._place(window, center_in(parent_rect, width, height), screen and screen.work_area)
+
+    def beside_parent(self, window, parent, width, height, gap=10):
+        """親ウィンドウの右隣に配置する(右に入らなければ左隣)"""
+        parent_rect = self.window_rect(parent)
+        screen = self.screen_for(parent_rect)
+        area = screen and screen.work_area
+        return self._place(window, beside(parent_rect, width, height, gap, area), area)
+
+
+class TkPlacement(Placement):
+    """
+    tkinter のウィンドウの配置
+
+    位置を使うウィンドウは track() しておくと、<Configure> で受け取った位置と大きさを使います
+    (track() していないウィンドウは wm geometry の値を使う。どちらもレイアウトを確定させない)。
+
+    Args:
+        root: Tk(root 自身も track する)
+    """
+
+    TAG = "PlacementTrack"
+
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+        self.rects = {}
+        # 子ウィジェットの <Configure> では呼ばれないよう、専用のバインドタグを使う
+        root.bind_class(self.TAG, "<Configure>", self._on_configure, add="+")
+        root.bind_class(self.TAG, "<Destroy>", lambda event: self.rects.pop(str(event.widget), None), add="+")
+        self.track(root)
+
+    def track(self, window):
+        """ウィンドウの <Configure> を受け取って位置と大きさを覚える"""
+        tags = window.bindtags()
+        if self.TAG not in tags:
+            window.bindtags((self.TAG,) + tags)
+
+    def _on_configure(self, event):
+        self.rects[str(event.widget)] = Rect(event.x, event.y, event.width, event.height)
+        self.invalidate()
+
+    def window_rect(self, window):
+        rect = self.rects.get(str(window))
+        if rect is None:
+            self.track(window)
+            rect = self.rects[str(window)] = self._parse_geometry(window.wm_geometry())
+        return rect
+
+    def _parse_geometry(self, geometry):
+        width, height, x_sign, x, y_sign, y = _GEOMETRY.fullmatch(geometry).groups()
+        width, height, x, y = int(width), int(height), int(x), int(y)
+        if x_sign == "-":
+            x = self.root.winfo_screenwidth() - width - x
+        if y_sign == "-":
+            y = self.root.winfo_screenheight() - height - y
+        return Rect(x, y, width, height)
+
+    def _query_screens(self):
+        width = self.root.winfo_screenwidth()
+        height = self.root.winfo_screenheight()
+        # wm maxsize は最大化したときの大きさ(Windows ではタスクバーを除いた作業領域)
+        max_width, max_height = self.root.wm_maxsize()
+        work_area = Rect(0, 0, min(width, max_width), min(height, max_height))
+        return [Screen(Rect(0, 0, width, height), work_area)]
+
+    def apply(self, window, rect):
+        window.geometry(f"{rect.width}x{rect.height}+{rect.x}+{rect.y}")
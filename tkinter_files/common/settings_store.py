@@ -0,0 +1,312 @@
+"""
+設定の保存
+
+設定を SQLite(WAL モード)に1キー1行で保存します。
+- 起動時は接続も開かず、get() で初めて読むキーはそのキーの行だけを読む
+  (キーが多くても、画面に表示する分の設定しか読まない)
+- 読み込んだ値は既定値と同じ型に変換してメモリに保持し、2回目からの get() はそこから返す
+  (tkinter の変数や QCheckBox に毎回問い合わせる必要がない)
+- set() はメモリ上の値を変えるだけで、書き込みはワーカースレッドが行う。
+  続けて変更された場合は最後の変更から delay 秒待ち、変更されたキーだけを1回のトランザクションで書く
+- 書き込みに失敗した場合は、変更されたキーを残して RETRY_DELAY 秒後に書き直す
+  (ワーカースレッドは止まらない。最後のエラーは last_error で確認できる)
+
+tkinter にも PySide6 にも依存しないので、どちらのサンプルからも使えます。
+
+使い方:
+    from tkinter_files.common.settings_store import SettingsStore, default_settings_path
+
+    settings = SettingsStore(default_settings_path(), {"auto_save": True, "font_size": 11})
+    settings.get("auto_save")          # True(保存されていなければ既定値)
+    settings.set("auto_save", False)   # 少し後にまとめて書き込まれる
+    settings.flush(timeout=1.0)        # すぐに書く(False なら書けていない)
+    settings.close()                   # 書き込みが残っていれば書いてから終了する
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+def default_settings_path(filename="settings.sqlite3"):
+    """サンプル共通の設定ファイルのパス(フォルダがなければ作る)"""
+    base = os.environ.get("APPDATA") or os.path.join(os.path.expanduser("~"), ".config")
+    directory = os.path.join(base, "python_gui_samples")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, filename)
+
+
+_MISSING = object()
+
+
+def _coerce(default, value):
+    """保存されていた値を既定値と同じ型に変換する(変換できなければ既定値)"""
+    try:
+        if isinstance(default, bool):
+            return bool(value)
+        if isinstance(default, (int, float, str)):
+            return type(default)(value)
+    except (TypeError, ValueError):
+        return default
+    return value
+
+
+class SettingsStore:
+    """
+    キーと値の設定を SQLite に保存するストア
+
+    Args:
+        path (str): データベースのファイル
+        defaults (dict): キーと既定値(値の型は get() で返す型になる)
+        delay (float): 最後の変更から書き込むまでの時間(秒)
+        max_delay (float): 変更が続いても、最初の変更からこの時間(秒)が過ぎたら書き込む
+        on_error: 書き込みに失敗したときに例外を渡して呼ぶ関数(ワーカースレッドから呼ばれる)
+
+    Attributes:
+        last_error (Exception): 最後の書き込みのエラー(成功すると None に戻る)
+        errors (int): 書き込みに失敗した回数
+    """
+
+    DELAY = 0.5
+    MAX_DELAY = 5.0
+    RETRY_DELAY = 2.0
+
+    def __init__(self, path, defaults=None, delay=None, max_delay=None, on_error=None):
+        self.path = path
+        self.defaults = dict(defaults or {})
+        self.delay = self.DELAY if delay is None else delay
+        self.max_delay = self.MAX_DELAY if max_delay is None else max_delay
+        self.on_error = on_error
+        self.values = {}
+        self.writes = 0
+        self.written_keys = 0
+        self.errors = 0
+        self.last_error = None
+
+        self._dirty = {}
+        self._first_change = None
+        self._last_change = None
+        self._writing = False
+        self._retry_at = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+        self._reader = None
+        self._complete = False
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID"
+        )
+        return connection
+
+    def _read(self, sql, *args):
+        if self._reader is None:
+            self._reader = self._connect()
+        return self._reader.execute(sql, args).fetchall()
+
+    def _decode(self, key, text):
+        value = json.loads(text)
+        return _coerce(self.defaults[key], value) if key in self.defaults else value
+
+    def load(self):
+        """
+        まだ読んでいないキーをすべて読み込む(items() から呼ばれる)
+
+        1行ずつ json.loads すると 10,000 キーで数十 ms かかるため、
+        すべての値を1つの JSON 配列として一度にデコードします。
+        """
+        rows = [(key, text) for key, text in self._read("SELECT key, value FROM settings")
+                if key not in self.values]
+        try:
+            decoded = json.loads("[" + ",".join(text for _, text in rows) + "]")
+        except ValueError:
+            # 壊れた値があれば1行ずつデコードして、その行だけ飛ばす
+            decoded = []
+            for key, text in rows:
+                try:
+                    decoded.append(json.loads(text))
+                except ValueError:
+                    decoded.append(self.defaults.get(key))
+        defaults = self.defaults
+        for (key, _), value in zip(rows, decoded):
+            self.values[key] = _coerce(defaults[key], value) if key in defaults else value
+        for key, value in defaults.items():
+            self.values.setdefault(key, value)
+        self._complete = True
+
+    def get(self, key, default=None):
+        """
+        値を返す(保存されていなければ既定値)
+
+        まだ読んでいないキーは、そのキーの行だけをデータベースから読みます。
+        """
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+        if not self._complete:
+            rows = self._read("SELECT value FROM settings WHERE key = ?", key)
+            if rows:
+                try:
+                    value = self._decode(key, rows[0][0])
+                except ValueError:
+                    value = self.defaults.get(key, default)
+                self.values[key] = value
+                return value
+        if key in self.defaults:
+            self.values[key] = self.defaults[key]
+            return self.defaults[key]
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def items(self):
+        if not self._complete:
+            self.load()
+        return self.values.items()
+
+    def set(self, key, value):
+        """
+        値を変更する(書き込みはワーカースレッドがまとめて行う)
+
+        Returns:
+            bool: 値が変わったかどうか
+        """
+        if key in self.defaults:
+            value = _coerce(self.defaults[key], value)
+        if self.get(key, _MISSING) == value:
+            return False
+        if self._closed:
+            raise RuntimeError("閉じた設定ストアは変更できません")
+        self.values[key] = value
+        with self._condition:
+            now = time.monotonic()
+            self._dirty[key] = value
+            self._last_change = now
+            if self._first_change is None:
+                self._first_change = now
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="SettingsStore", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return True
+
+    def update(self, values):
+        """複数の値を変更する"""
+        for key, value in values.items():
+            self.set(key, value)
+
+    def reset(self, keys=None):
+        """既定値に戻す(keys を省略するとすべてのキー)"""
+        for key in self.defaults if keys is None else keys:
+            self.set(key, self.defaults[key])
+
+    def _run(self):
+        connection = None
+        try:
+            while True:
+                with self._condition:
+                    while not self._dirty and not self._closed:
+                        self._condition.wait()
+                    # 最後の変更から delay 秒(最初の変更から最大 max_delay 秒)待って、まとめて書く
+                    # 失敗したあとは RETRY_DELAY 秒たつまで書き直さない
+                    while self._dirty and not self._closed:
+                        now = time.monotonic()
+                        deadline = min(self._last_change + self.delay, self._first_change + self.max_delay)
+                        if self._retry_at is not None:
+                            deadline = max(deadline, self._retry_at)
+                        if now >= deadline:
+                            break
+                        self._condition.wait(deadline - now)
+                    if not self._dirty and self._closed:
+                        return
+                    dirty, self._dirty = self._dirty, {}
+                    self._first_change = self._last_change = None
+                    self._retry_at = None
+                    self._writing = True
+                try:
+                    if connection is None:
+                        connection = self._connect()
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO settings (key, value) VALUES (?, ?) "
+                            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                            [(key, json.dumps(value, ensure_ascii=False)) for key, value in dirty.items()],
+                        )
+                except Exception as e:
+                    self._write_failed(dirty, e)
+                    if connection is not None:
+                        connection.close()
+                        connection = None
+                else:
+                    self.writes += 1
+                    self.written_keys += len(dirty)
+                    self.last_error = None
+                finally:
+                    with self._condition:
+                        self._writing = False
+                        self._condition.notify_all()
+                if self._closed and self.last_error is not None:
+                    # 終了時に書けなかった変更は捨てる(close() を止めない)
+                    return
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def _write_failed(self, dirty, error):
+        """書けなかったキーを戻し、RETRY_DELAY 秒後に書き直す"""
+        with self._condition:
+            for key, value in dirty.items():
+                # 書き込み中に変更されたキーは新しい値を残す
+                self._dirty.setdefault(key, value)
+            now = time.monotonic()
+            self._first_change = self._first_change or now
+            self._last_change = self._last_change or now
+            self._retry_at = now + self.RETRY_DELAY
+            self.errors += 1
+            self.last_error = error
+        if self.on_error:
+            self.on_error(error)
+
+    def flush(self, timeout=None):
+        """
+        書き込みが残っていれば、すぐに書いて終わるまで待つ
+
+        書き込みに失敗した場合は、書き直すのを待たずに戻ります。
+
+        Args:
+            timeout (float): 待つ時間の上限(秒)。None なら書き終わるか失敗するまで待つ
+
+        Returns:
+            bool: 残っていた変更をすべて書けたかどうか
+        """
+        with self._condition:
+            errors = self.errors
+            if self._dirty:
+                self._first_change = self._last_change = time.monotonic() - self.max_delay
+                self._retry_at = None
+                self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: not self._writing and (not self._dirty or self.errors != errors), timeout)
+            return not self._dirty and not self._writing
+
+    def close(self):
+        """残っている変更を書き込んでワーカースレッドを終了する"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
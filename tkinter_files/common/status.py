@@ -0,0 +1,139 @@
+"""
+ステータスバーのメッセージ表示
+
+メッセージを表示するたびに root.after(2000, lambda: ...) で「準備完了」に戻す処理を登録すると、
+キーを押し続けたときに取り消されないタイマーが何千個も溜まり、
+古いタイマーが新しいメッセージを途中で消してしまいます(ちらつき)。
+
+StatusMessenger はタイマーを1つだけ使い、表示期限を延ばすときは
+同じタイマーを掛け直します(期限より早く発火した場合は残り時間で掛け直す)。
+期限が早まる場合(短い duration のメッセージ)は、タイマーを取り消して新しい期限で登録します。
+- 同じメッセージが続いた場合は1つにまとめて「(×回数)」を付ける
+- 1回のイベント処理中に何度 show() しても、ラベルの更新はアイドル時の1回だけ
+- 優先度の高いメッセージ(エラーなど)の表示中は、低いメッセージで上書きしない
+
+使い方:
+    from tkinter_files.common.status import StatusMessenger
+
+    status = StatusMessenger(status_bar, idle_text="準備完了")
+    status.show("保存しました")
+    status.show("保存できませんでした", priority=StatusMessenger.HIGH, fg="red")
+"""
+
+import time
+
+
+class StatusMessenger:
+    """
+    ラベルに一時的なメッセージを表示し、一定時間後に待機中の表示へ戻す
+
+    Args:
+        label: メッセージを表示するラベル(config(text=...) できるウィジェット)
+        idle_text (str): 待機中に表示する文字列
+        default_duration (int): メッセージを表示しておく時間(ミリ秒)
+        **idle_options: 待機中の表示に使うオプション(fg など)
+    """
+
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+    def __init__(self, label, idle_text="準備完了", default_duration=2000, **idle_options):
+        self.label = label
+        self.idle_text = idle_text
+        self.idle_options = idle_options
+        self.default_duration = default_duration
+
+        self.text = None
+        self.options = {}
+        self.priority = self.LOW
+        self.repeat = 0
+        self.deadline = None
+        self.timer_job = None
+        self.timer_due = None
+        self.render_job = None
+        self.shown = 0
+        self.coalesced = 0
+
+    def show(self, text, duration=None, priority=NORMAL, **options):
+        """
+        メッセージを表示する
+
+        Args:
+            text (str): メッセージ
+            duration (int): 表示しておく時間(ミリ秒)。0 は次のメッセージまで表示し続ける
+            priority (int): LOW / NORMAL / HIGH
+            **options: ラベルのオプション(fg など)
+
+        Returns:
+            bool: 表示した(まとめた場合を含む)かどうか。優先度の高いメッセージの表示中は False
+        """
+        if self.text is not None and priority < self.priority:
+            return False
+
+        self.shown += 1
+        if text == self.text and options == self.options:
+            self.repeat += 1
+            self.coalesced += 1
+        else:
+            self.text = text
+            self.options = options
+            self.repeat = 1
+        self.priority = priority
+
+        if duration is None:
+            duration = self.default_duration
+        self.deadline = time.monotonic() + duration / 1000 if duration else None
+        if self.deadline is not None:
+            if self.timer_job is not None and self.deadline < self.timer_due:
+                # 登録中のタイマーより期限が早いので、取り消して掛け直す
+                self.label.after_cancel(self.timer_job)
+                self.timer_job = None
+            if self.timer_job is None:
+                self._arm(duration)
+        self._schedule_render()
+        return True
+
+    def clear(self):
+        """すぐに待機中の表示に戻す"""
+        self.text = None
+        self.options = {}
+        self.priority = self.LOW
+        self.repeat = 0
+        self.deadline = None
+        if self.timer_job is not None:
+            self.label.after_cancel(self.timer_job)
+            self.timer_job = None
+        self._schedule_render()
+
+    def _expire(self):
+        self.timer_job = None
+        if self.deadline is None:
+            return
+        remaining = self.deadline - time.monotonic()
+        if remaining > 0.001:
+            # 表示中に期限が延びた場合は、残り時間で掛け直す
+            self._arm(int(remaining * 1000) + 1)
+            return
+        self.clear()
+
+    def _arm(self, delay):
+        self.timer_due = time.monotonic() + delay / 1000
+        self.timer_job = self.label.after(delay, self._expire)
+
+    def _schedule_render(self):
+        if self.render_job is None:
+            self.render_job = self.label.after_idle(self._render)
+
+    def _render(self):
+        self.render_job = None
+        if self.text is None:
+            self.label.config(text=self.idle_text, **self.idle_options)
+            return
+        text = self.text if self.repeat == 1 else f"{self.text} (×{self.repeat})"
+        self.label.config(text=text, **{**self.idle_options, **self.options})
+
+    @property
+    def pending_timers(self):
+        """登録中の Tcl のタイマー・アイドル処理の数(常に 0〜2)"""
+        return (self.timer_job is not None) + (self.render_job is not None)
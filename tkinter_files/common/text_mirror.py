@@ -0,0 +1,109 @@
+"""
+Text ウィジェットのミラー
+
+Text の内容を取り出すには get("1.0", "end") で全体をコピーするしかなく、
+検索や構文の強調表示のたびに呼ぶと大きなファイルでは入力が重くなります。
+TextMirror はウィジェットのコマンドを差し替えて insert / delete を横取りし、
+内容を Python の行のリストとして常に同じ状態に保ちます。
+
+使い方:
+    from tkinter_files.common.text_mirror import TextMirror
+
+    mirror = TextMirror(text)
+    mirror.listeners.append(lambda line, removed, inserted: ...)
+"""
+
+
+class TextMirror:
+    """
+    Text ウィジェットの内容を Python 側に行のリストとして保持するミラー
+
+    ウィジェットのTclコマンドを差し替えて insert / delete を受け取り、
+    変更された行だけを更新します(Text 自身の undo / redo などは全体を読み直し、
+    前後の一致しない範囲だけを変更として扱う)。
+    変更のたびに listeners を (開始行, 削除した行数, 挿入した行数) で呼び出します。
+    行番号は Text と同じく1から数えます。
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.lines = text.get("1.0", "end-1c").split("\n")
+        self.version = 0
+        self.listeners = []
+
+        widget = str(text)
+        self._original = widget + "_mirror"
+        text.tk.call("rename", widget, self._original)
+        text.tk.createcommand(widget, self._dispatch)
+
+    def _call(self, *args):
+        return self.text.tk.call((self._original,) + args)
+
+    def _compare(self, index1, op, index2):
+        return self.text.tk.getboolean(self._call("compare", index1, op, index2))
+
+    def _position(self, index):
+        line, column = str(self._call("index", index)).split(".")
+        return int(line), int(column)
+
+    def _dispatch(self, operation, *args):
+        if operation == "insert" and len(args) >= 2:
+            index = args[0]
+            if self._compare(index, ">", "end-1c"):
+                index = "end-1c"
+            line, column = self._position(index)
+            result = self._call(operation, *args)
+            self._insert(line, column, "".join(args[1::2]))
+            return result
+
+        if operation == "delete" and 1 <= len(args) <= 2:
+            start = self._position(args[0])
+            end_index = args[1] if len(args) == 2 else f"{args[0]}+1c"
+            if self._compare(end_index, ">", "end-1c"):
+                end_index = "end-1c"
+            end = self._position(end_index)
+            result = self._call(operation, *args)
+            if start < end:
+                self._delete(start, end)
+            return result
+
+        result = self._call(operation, *args)
+        if operation in ("replace", "delete", "insert") or (operation == "edit" and args and args[0] in ("undo", "redo")):
+            self.resync()
+        return result
+
+    def _insert(self, line, column, chars):
+        current = self.lines[line - 1]
+        new_lines = (current[:column] + chars + current[column:]).split("\n")
+        self.lines[line - 1:line] = new_lines
+        self._changed(line, 1, len(new_lines))
+
+    def _delete(self, start, end):
+        (start_line, start_column), (end_line, end_column) = start, end
+        merged = self.lines[start_line - 1][:start_column] + self.lines[end_line - 1][end_column:]
+        self.lines[start_line - 1:end_line] = [merged]
+        self._changed(start_line, end_line - start_line + 1, 1)
+
+    def resync(self):
+        """ウィジェットから全体を読み直す(前後の変わらない行は変更として通知しない)"""
+        old = self.lines
+        new = str(self._call("get", "1.0", "end-1c")).split("\n")
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+        self.lines = new
+        if old != new:
+            self._changed(prefix + 1, len(old) - prefix - suffix, len(new) - prefix - suffix)
+
+    def _changed(self, line, removed, inserted):
+        self.version += 1
+        for listener in self.listeners:
+            listener(line, removed, inserted)
+
+    def snapshot(self):
+        """ワーカースレッドに渡すための (バージョン, 行のリストのコピー)"""
+        return self.version, list(self.lines)
@@ -0,0 +1,639 @@
+"""
+仮想リストボックス
+
+tk.Listbox に全項目を insert すると、項目数に比例して Tcl 側のメモリと時間を使い、
+選択項目を後ろから1つずつ delete すると O(項目数 × 選択数) になります。
+VirtualListbox は項目を Python 側に置き、画面に見えている行だけを内部の Listbox に描画します。
+
+- 項目は VirtualSequence が「元のデータの範囲(セグメント)の並び」として保持する。
+  削除はセグメントを切り詰めるだけなので、元のデータはコピーしない
+- 元のデータには list のほか、必要な行だけを作る GeneratedItems や、
+  固定長レコードのファイルを mmap で読む RecordFile を使える
+- 選択は区間の集合(IntervalSet)で持つ。「すべて選択」も区間1つ
+
+使い方:
+    from tkinter_files.common.virtual_list import GeneratedItems, VirtualListbox
+
+    listbox = VirtualListbox(parent, selectmode=tk.EXTENDED)
+    listbox.extend_source(GeneratedItems(10_000_000, lambda i: f"項目 {i + 1}"))
+    listbox.delete_selected()
+"""
+
+import mmap
+import tkinter as tk
+import tkinter.font as tkfont
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet:
+    """
+    整数の集合を、重ならず隣接もしない半開区間 [start, end) の並びで表す
+
+    区間の開始・終了は別々のソート済みリストに持ち、二分探索で操作します。
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def add(self, start, end):
+        """[start, end) を追加する"""
+        if start >= end:
+            return
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+
+    def remove(self, start, end):
+        """[start, end) を取り除く"""
+        if start >= end:
+            return
+        i = bisect_right(self.ends, start)
+        j = bisect_left(self.starts, end)
+        if i >= j:
+            return
+        new_starts = []
+        new_ends = []
+        if self.starts[i] < start:
+            new_starts.append(self.starts[i])
+            new_ends.append(start)
+        if self.ends[j - 1] > end:
+            new_starts.append(end)
+            new_ends.append(self.ends[j - 1])
+        self.starts[i:j] = new_starts
+        self.ends[i:j] = new_ends
+
+    def __contains__(self, value):
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value < self.ends[i]
+
+    def toggle(self, value):
+        if value in self:
+            self.remove(value, value + 1)
+        else:
+            self.add(value, value + 1)
+
+    def clear(self):
+        self.starts.clear()
+        self.ends.clear()
+
+    def __len__(self):
+        """含まれる整数の個数"""
+        return sum(self.ends) - sum(self.starts)
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __iter__(self):
+        for start, end in zip(self.starts, self.ends):
+            yield from range(start, end)
+
+    def intervals(self):
+        return list(zip(self.starts, self.ends))
+
+    def overlapping(self, start, end):
+        """[start, end) と重なる区間を、その範囲に切り詰めて返す"""
+        i = bisect_right(self.ends, start)
+        j = bisect_left(self.starts, end)
+        return [(max(s, start), min(e, end)) for s, e in zip(self.starts[i:j], self.ends[i:j])]
+
+    def first(self):
+        return self.starts[0] if self.starts else None
+
+    def delete_range(self, start, end):
+        """[start, end) の整数を削除し、それより後ろを詰める(リストの行削除に合わせる)"""
+        count = end - start
+        if count <= 0:
+            return
+        self.remove(start, end)
+        i = bisect_left(self.starts, end)
+        self.starts[i:] = [s - count for s in self.starts[i:]]
+        self.ends[i:] = [e - count for e in self.ends[i:]]
+        # 詰めた結果、直前の区間と隣接したらつなげる
+        if 0 < i < len(self.starts) and self.ends[i - 1] == self.starts[i]:
+            self.ends[i - 1] = self.ends[i]
+            del self.starts[i]
+            del self.ends[i]
+
+    def insert_gap(self, position, count):
+        """position の位置に count 個の(選択されていない)行が挿入されたものとしてずらす"""
+        if count <= 0:
+            return
+        i = bisect_right(self.starts, position - 1) - 1
+        if i >= 0 and self.starts[i] < position < self.ends[i]:
+            # 区間の途中に挿入された場合は区間を分ける
+            self.starts.insert(i + 1, position)
+            self.ends.insert(i + 1, self.ends[i])
+            self.ends[i] = position
+        j = bisect_left(self.starts, position)
+        self.starts[j:] = [s + count for s in self.starts[j:]]
+        self.ends[j:] = [e + count for e in self.ends[j:]]
+
+
+class GeneratedItems:
+    """
+    行番号から項目を作るデータ(項目はメモリに持たない)
+
+    Args:
+        count (int): 行数
+        factory: 行番号(0から)を受け取って項目の文字列を返す関数
+    """
+
+    def __init__(self, count, factory):
+        self.count = count
+        self.factory = factory
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.factory(i) for i in range(*index.indices(self.count))]
+        return self.factory(index)
+
+
+class RecordFile:
+    """
+    固定長レコードのファイルを mmap で読むデータ
+
+    1行が record_size バイト(後ろは空白または NUL で埋める)のファイルを、
+    必要な行だけデコードして返します。
+
+    Args:
+        path (str): ファイル名
+        record_size (int): 1レコードのバイト数
+        encoding (str): 文字コード
+    """
+
+    def __init__(self, path, record_size, encoding="utf-8"):
+        self.record_size = record_size
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 空のファイルは mmap できない
+            self._map = b""
+        self.count = len(self._map) // record_size
+
+    @classmethod
+    def create(cls, path, items, record_size, encoding="utf-8"):
+        """項目を固定長レコードとして書き出し、そのファイルを開く"""
+        with open(path, "wb") as f:
+            for item in items:
+                data = item.encode(encoding)[:record_size]
+                f.write(data.ljust(record_size, b" "))
+        return cls(path, record_size, encoding)
+
+    def __len__(self):
+        return self.count
+
+    def _decode(self, index):
+        offset = index * self.record_size
+        return self._map[offset:offset + self.record_size].rstrip(b" \0\n").decode(self.encoding, "replace")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self._decode(index)
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+class VirtualSequence:
+    """
+    元のデータの範囲(セグメント)を並べた、行の挿入・削除ができる列
+
+    segments は (元のデータ, 開始, 終了) のリスト、offsets は各セグメントの先頭の行番号です。
+    削除は該当するセグメントを切り詰めるだけで、元のデータはコピーしません。
+    insert で追加した項目は added(list)に入れ、そこを指すセグメントを挟みます。
+    別の VirtualSequence を渡した場合は、そのセグメントを引き継ぎます(項目はコピーしない)。
+    """
+
+    def __init__(self, items=()):
+        self.added = []
+        self.segments = []
+        self.offsets = []
+        self.total = 0
+        if isinstance(items, VirtualSequence):
+            # 元のデータは追記しかされないので、セグメントの範囲をそのまま共有できる
+            self.segments = list(items.segments)
+            self.offsets = list(items.offsets)
+            self.total = items.total
+        elif items:
+            self.extend_source(items if hasattr(items, "__getitem__") else list(items))
+
+    def __len__(self):
+        return self.total
+
+    def _rebuild_offsets(self):
+        offsets = []
+        total = 0
+        for _, start, end in self.segments:
+            offsets.append(total)
+            total += end - start
+        self.offsets = offsets
+        self.total = total
+
+    def _locate(self, index):
+        k = bisect_right(self.offsets, index) - 1
+        source, start, _ = self.segments[k]
+        return k, source, start + index - self.offsets[k]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.total)
+            if step == 1:
+                return self.slice(start, stop)
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self.total
+        if not 0 <= index < self.total:
+            raise IndexError(index)
+        _, source, position = self._locate(index)
+        return source[position]
+
+    def slice(self, start, end):
+        """[start, end) の項目のリスト(セグメントごとにまとめて取り出す)"""
+        start = max(start, 0)
+        end = min(end, self.total)
+        if start >= end:
+            return []
+        k, _, _ = self._locate(start)
+        items = []
+        while len(items) < end - start:
+            source, seg_start, seg_end = self.segments[k]
+            first = seg_start + max(start - self.offsets[k], 0)
+            last = min(seg_end, first + end - start - len(items))
+            items.extend(source[first:last])
+            k += 1
+        return items
+
+    def extend_source(self, source):
+        """元のデータ全体を末尾に追加する(項目はコピーしない)"""
+        if len(source):
+            self.segments.append((source, 0, len(source)))
+            self.offsets.append(self.total)
+            self.total += len(source)
+
+    def insert(self, index, items):
+        """index の位置に項目を挿入する"""
+        items = list(items)
+        if not items:
+            return
+        index = min(max(index, 0), self.total)
+        start = len(self.added)
+        self.added.extend(items)
+        segment = (self.added, start, len(self.added))
+        if index == self.total:
+            last = self.segments[-1] if self.segments else None
+            if last and last[0] is self.added and last[2] == start:
+                # 末尾への追加が続く場合は1つのセグメントにまとめる
+                self.segments[-1] = (self.added, last[1], len(self.added))
+            else:
+                self.segments.append(segment)
+                self.offsets.append(self.total)
+            self.total += len(items)
+            return
+        k = self._split(index)
+        self.segments.insert(k, segment)
+        self._rebuild_offsets()
+
+    def _split(self, index):
+        """行 index がセグメントの先頭になるように分け、そのセグメントの番号を返す"""
+        if index >= self.total:
+            return len(self.segments)
+        k, source, position = self._locate(index)
+        _, start, end = self.segments[k]
+        if position == start:
+            return k
+        self.segments[k:k + 1] = [(source, start, position), (source, position, end)]
+        self.offsets.insert(k + 1, index)
+        return k + 1
+
+    def delete_intervals(self, intervals):
+        """
+        昇順で重ならない区間 [(開始, 終了)] の行をまとめて削除する
+
+        セグメントと区間を先頭から1回ずつたどるので、
+        処理量は行数ではなくセグメント数と区間数に比例します。
+        """
+        segments = []
+        removed = iter(intervals)
+        cut = next(removed, None)
+        for k, (source, start, end) in enumerate(self.segments):
+            offset = self.offsets[k]
+            length = end - start
+            position = 0
+            while position < length:
+                while cut is not None and cut[1] <= offset + position:
+                    cut = next(removed, None)
+                if cut is None or cut[0] >= offset + length:
+                    segments.append((source, start + position, end))
+                    break
+                keep_until = max(cut[0] - offset, position)
+                if keep_until > position:
+                    segments.append((source, start + position, start + keep_until))
+                position = min(cut[1] - offset, length)
+        self.segments = segments
+        self._rebuild_offsets()
+
+    def delete(self, start, end):
+        self.delete_intervals([(start, end)])
+
+    def clear(self):
+        self.added = []
+        self.segments = []
+        self.offsets = []
+        self.total = 0
+
+
+class VirtualListbox(tk.Frame):
+    """
+    見えている行だけを描画するリストボックス(スクロールバー付き)
+
+    tk.Listbox のよく使うメソッド(insert / delete / get / size / curselection /
+    selection_set / selection_clear / see)を同じ名前で持っています。
+    bind() は内部の Listbox に対して行うので、キーバインディングもそのまま使えます。
+    選択が変わると内部の Listbox に <<ListboxSelect>> を発生させるので、bind() で受け取れます。
+    """
+
+    def __init__(self, master, items=(), selectmode=tk.BROWSE, **listbox_options):
+        super().__init__(master)
+        self.items = VirtualSequence(items)
+        self.selection = IntervalSet()
+        self.selectmode = selectmode
+        self.top = 0
+        self.rows = int(listbox_options.get("height", 10))
+        self.active = 0
+        self.anchor = 0
+        self.render_job = None
+
+        self.listbox = tk.Listbox(self, exportselection=False, activestyle=tk.NONE,
+                                  selectmode=tk.MULTIPLE, **listbox_options)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Listbox 標準の選択・スクロール処理は使わず、行番号を読み替えて自前で処理する。
+        # 内部の処理はこのインスタンス専用のタグにバインドし、bind() で登録した処理に上書きされないようにする
+        self._bindtag = f"VirtualListbox{self.listbox}"
+        self.listbox.bindtags((str(self.listbox), self._bindtag, str(self.winfo_toplevel()), "all"))
+        self.listbox.configure(takefocus=True)
+        for sequence, handler in (
+            ("<Configure>", self._on_configure),
+            ("<Button-1>", self._on_click),
+            ("<Shift-Button-1>", lambda e: self._on_click(e, extend=True)),
+            ("<Control-Button-1>", lambda e: self._on_click(e, toggle=True)),
+            ("<B1-Motion>", self._on_drag),
+            ("<MouseWheel>", lambda e: self.yview_scroll(-3 if e.delta > 0 else 3, "units")),
+            ("<Button-4>", lambda e: self.yview_scroll(-3, "units")),
+            ("<Button-5>", lambda e: self.yview_scroll(3, "units")),
+            ("<Up>", lambda e: self._move(self.active - 1)),
+            ("<Down>", lambda e: self._move(self.active + 1)),
+            ("<Prior>", lambda e: self._move(self.active - self.rows)),
+            ("<Next>", lambda e: self._move(self.active + self.rows)),
+            ("<Home>", lambda e: self._move(0)),
+            ("<End>", lambda e: self._move(len(self.items) - 1)),
+            ("<Shift-Up>", lambda e: self._move(self.active - 1, extend=True)),
+            ("<Shift-Down>", lambda e: self._move(self.active + 1, extend=True)),
+            ("<space>", lambda e: self._select_active(toggle=True)),
+            ("<Destroy>", self._on_destroy),
+        ):
+            self.listbox.bind_class(self._bindtag, sequence, handler)
+        self._schedule_render()
+
+    # ---- tk.Listbox と同じ操作 ----
+
+    def bind(self, sequence=None, func=None, add=None):
+        """内部の Listbox にバインドする"""
+        return self.listbox.bind(sequence, func, add)
+
+    def focus_set(self):
+        self.listbox.focus_set()
+
+    def size(self):
+        return len(self.items)
+
+    def _index(self, index):
+        if index == tk.END:
+            return len(self.items)
+        if index == tk.ACTIVE:
+            return self.active
+        return int(index)
+
+    def insert(self, index, *items):
+        position = self._index(index)
+        self.items.insert(position, items)
+        self.selection.insert_gap(position, len(items))
+        self._schedule_render()
+
+    def extend_source(self, source):
+        """元のデータ(list / GeneratedItems / RecordFile)全体を末尾に追加する"""
+        self.items.extend_source(source)
+        self._schedule_render()
+
+    def get(self, first, last=None):
+        if last is None:
+            return self.items[self._index(first)]
+        end = len(self.items) if last == tk.END else self._index(last) + 1
+        return tuple(self.items.slice(self._index(first), end))
+
+    def delete(self, first, last=None):
+        start = self._index(first)
+        end = start + 1 if last is None else (len(self.items) if last == tk.END else self._index(last) + 1)
+        if start >= end:
+            return
+        self.items.delete(start, end)
+        self.selection.delete_range(start, end)
+        self._after_delete()
+
+    def delete_selected(self):
+        """
+        選択中の行をまとめて削除する
+
+        Returns:
+            int: 削除した行数
+        """
+        intervals = self.selection.intervals()
+        count = len(self.selection)
+        if count:
+            self.items.delete_intervals(intervals)
+            self.selection.clear()
+            self.active = intervals[0][0]
+            self._after_delete()
+        return count
+
+    def curselection(self):
+        """選択中の行番号のタプル(行数が多い場合は selection を直接使う)"""
+        return tuple(self.selection)
+
+    def selection_set(self, first, last=None):
+        start = self._index(first)
+        end = start + 1 if last is None else (len(self.items) if last == tk.END else self._index(last) + 1)
+        self.selection.add(start, min(end, len(self.items)))
+        self._schedule_render()
+
+    select_set = selection_set
+
+    def selection_clear(self, first=0, last=tk.END):
+        start = self._index(first)
+        end = start + 1 if last is None else (len(self.items) if last == tk.END else self._index(last) + 1)
+        self.selection.remove(start, end)
+        self._schedule_render()
+
+    select_clear = selection_clear
+
+    def selection_includes(self, index):
+        return self._index(index) in self.selection
+
+    def see(self, index):
+        index = self._index(index)
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.rows:
+            self.top = index - self.rows + 1
+        self._schedule_render()
+
+    def yview(self, *args):
+        """スクロールバーからの操作("moveto" / "scroll")"""
+        if not args:
+            total = max(len(self.items), 1)
+            return self.top / total, min(self.top + self.rows, total) / total
+        if args[0] == tk.MOVETO:
+            self._scroll_to(int(float(args[1]) * len(self.items)))
+        elif args[0] == tk.SCROLL:
+            self.yview_scroll(int(args[1]), args[2])
+
+    def yview_scroll(self, number, what):
+        step = self.rows if what == tk.PAGES else 1
+        self._scroll_to(self.top + number * step)
+        return "break"
+
+    # ---- 描画 ----
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self.items) - self.rows))
+        if top != self.top:
+            self.top = top
+            self._schedule_render()
+
+    def _after_delete(self):
+        self.active = min(self.active, max(len(self.items) - 1, 0))
+        self.top = max(0, min(self.top, len(self.items) - self.rows))
+        self._schedule_render()
+
+    def _schedule_render(self):
+        if self.render_job is None:
+            self.render_job = self.after_idle(self.render)
+
+    def render(self):
+        """見えている行だけを内部の Listbox に描画する"""
+        self.render_job = None
+        count = self.rows + 1
+        items = self.items.slice(self.top, self.top + count)
+        self.listbox.delete(0, tk.END)
+        if items:
+            self.listbox.insert(0, *items)
+        for start, end in self.selection.overlapping(self.top, self.top + count):
+            self.listbox.selection_set(start - self.top, end - 1 - self.top)
+        self.listbox.yview_moveto(0)
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.top / total, min(self.top + self.rows, total) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_destroy(self, event):
+        # 専用タグのバインドはウィジェットを破棄しても残るので、ここで外す
+        for sequence in self.listbox.bind_class(self._bindtag):
+            self.listbox.unbind_class(self._bindtag, sequence)
+
+    def _on_configure(self, event):
+        font = tkfont.Font(font=self.listbox.cget("font"))
+        border = int(self.listbox.cget("borderwidth")) + int(self.listbox.cget("highlightthickness"))
+        line_height = font.metrics("linespace") + 1 + 2 * int(self.listbox.cget("selectborderwidth"))
+        rows = max(1, (event.height - 2 * border) // line_height)
+        if rows != self.rows:
+            self.rows = rows
+            self._scroll_to(self.top)
+            self._schedule_render()
+
+    # ---- マウス・キーボード ----
+
+    def _row_at(self, y):
+        return min(self.top + self.listbox.nearest(y), len(self.items) - 1)
+
+    def _on_click(self, event, extend=False, toggle=False):
+        self.listbox.focus_set()
+        if not len(self.items):
+            return "break"
+        index = self._row_at(event.y)
+        self.active = index
+        if self.selectmode == tk.MULTIPLE or (toggle and self.selectmode == tk.EXTENDED):
+            self.selection.toggle(index)
+            self.anchor = index
+        elif extend and self.selectmode == tk.EXTENDED:
+            self.selection.clear()
+            self.selection.add(min(self.anchor, index), max(self.anchor, index) + 1)
+        else:
+            self.selection.clear()
+            self.selection.add(index, index + 1)
+            self.anchor = index
+        self._selection_changed()
+        return "break"
+
+    def _on_drag(self, event):
+        if self.selectmode not in (tk.EXTENDED, tk.BROWSE) or not len(self.items):
+            return "break"
+        # 上下にはみ出したらスクロールする
+        if event.y < 0:
+            self._scroll_to(self.top - 1)
+        elif event.y > self.listbox.winfo_height():
+            self._scroll_to(self.top + 1)
+        index = self._row_at(event.y)
+        self.active = index
+        self.selection.clear()
+        if self.selectmode == tk.EXTENDED:
+            self.selection.add(min(self.anchor, index), max(self.anchor, index) + 1)
+        else:
+            self.selection.add(index, index + 1)
+        self._selection_changed()
+        return "break"
+
+    def _move(self, index, extend=False):
+        if not len(self.items):
+            return "break"
+        self.active = max(0, min(index, len(self.items) - 1))
+        self.see(self.active)
+        if extend and self.selectmode == tk.EXTENDED:
+            self.selection.clear()
+            self.selection.add(min(self.anchor, self.active), max(self.anchor, self.active) + 1)
+            self._selection_changed()
+        elif self.selectmode in (tk.BROWSE, tk.EXTENDED):
+            self._select_active()
+        return "break"
+
+    def _select_active(self, toggle=False):
+        if toggle:
+            self.selection.toggle(self.active)
+        else:
+            self.selection.clear()
+            self.selection.add(self.active, self.active + 1)
+            self.anchor = self.active
+        self._selection_changed()
+        return "break"
+
+    def _selection_changed(self):
+        self._schedule_render()
+        self.listbox.event_generate("<<ListboxSelect>>")
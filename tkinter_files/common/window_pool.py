@@ -0,0 +1,175 @@
+"""
+サブウィンドウのプール
+
+ボタンを押すたびに Toplevel と子ウィジェットをすべて作り、閉じるときに destroy すると、
+複雑なウィンドウでは開くたびに数十〜数百 ms かかります。
+WindowPool は種類ごとにウィンドウを一度だけ作り、閉じるときは withdraw で隠しておき、
+次に開くときは状態を初期化して deiconify するだけにします。
+
+- 隠しているウィンドウは最後に使った順に保持し、見積もったメモリの合計が
+  memory_limit を超えたら、最も長く使っていないものから destroy する
+- 表示中のウィンドウは破棄しない
+- 一度隠したウィンドウの状態(入力値・スクロール位置など)は reset で初期化する
+
+使い方:
+    from tkinter_files.common.window_pool import WindowPool
+
+    windows = WindowPool(root)
+    windows.register("help", build_help_window, reset=reset_help_window)
+    window = windows.open("help")   # 作成済みなら初期化して表示するだけ
+    windows.close("help")           # withdraw して次に備える
+"""
+
+import tkinter as tk
+from collections import OrderedDict
+
+# ウィジェット1つあたりのメモリの見積もり(バイト)。Tk からは実際の使用量を取得できないため概算する
+WIDGET_BYTES = 4096
+# Text ウィジェットの1文字あたりのメモリの見積もり(バイト)
+TEXT_CHAR_BYTES = 4
+
+
+def estimate_size(window):
+    """ウィンドウと子孫のウィジェットが使うメモリを見積もる(バイト)"""
+    size = 0
+    stack = [window]
+    while stack:
+        widget = stack.pop()
+        size += WIDGET_BYTES
+        if isinstance(widget, tk.Text):
+            size += int(widget.count("1.0", "end", "chars")[0]) * TEXT_CHAR_BYTES
+        stack.extend(widget.winfo_children())
+    return size
+
+
+class _Entry:
+    __slots__ = ("factory", "reset", "window", "size", "visible")
+
+    def __init__(self, factory, reset):
+        self.factory = factory
+        self.reset = reset
+        self.window = None
+        self.size = 0
+        self.visible = False
+
+
+class WindowPool:
+    """
+    種類ごとに Toplevel を再利用するプール
+
+    Args:
+        master: ウィンドウの親
+        memory_limit (int): 隠しているウィンドウも含めたメモリの見積もりの上限(バイト)
+    """
+
+    MEMORY_LIMIT = 4 * 1024 * 1024
+
+    def __init__(self, master, memory_limit=None):
+        self.master = master
+        self.memory_limit = memory_limit or self.MEMORY_LIMIT
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def register(self, name, factory, reset=None):
+        """
+        ウィンドウの種類を登録する
+
+        Args:
+            name (str): 種類の名前
+            factory: 引数なしで呼ぶと Toplevel を作って返す関数
+            reset: 開くたびに window を渡して呼ぶ関数(状態の初期化・配置)
+        """
+        self.entries[name] = _Entry(factory, reset)
+
+    def open(self, name):
+        """
+        ウィンドウを表示して返す(表示中なら前面に出すだけ)
+
+        Returns:
+            tk.Toplevel: 表示したウィンドウ
+        """
+        entry = self.entries[name]
+        self.entries.move_to_end(name)
+        window = entry.window
+        if window is not None and window.winfo_exists():
+            if entry.visible:
+                window.lift()
+                return window
+            self.hits += 1
+        else:
+            self.misses += 1
+            window = self._build(name, entry)
+        if entry.reset:
+            entry.reset(window)
+        window.deiconify()
+        window.lift()
+        entry.visible = True
+        self._evict()
+        return window
+
+    def _build(self, name, entry):
+        window = entry.factory()
+        # 作っている途中の画面を見せないよう、表示するまで隠しておく
+        window.withdraw()
+        if not window.protocol("WM_DELETE_WINDOW"):
+            # ウィンドウ側で閉じる処理を決めていなければ、閉じるボタンで隠すだけにする
+            window.protocol("WM_DELETE_WINDOW", lambda: self.close(name))
+        window.bind("<Destroy>", lambda event: self._on_destroy(name, event), add="+")
+        entry.window = window
+        entry.size = estimate_size(window)
+        return window
+
+    def close(self, name_or_window):
+        """ウィンドウを隠す(破棄せずに次に開くときまで保持する)"""
+        name = self._name_of(name_or_window)
+        if name is None:
+            return
+        entry = self.entries[name]
+        if entry.window is not None and entry.visible:
+            entry.window.withdraw()
+            entry.visible = False
+            self._evict()
+
+    def is_open(self, name):
+        return self.entries[name].visible
+
+    def discard(self, name):
+        """ウィンドウを破棄する(次に開くときに作り直す)"""
+        entry = self.entries[name]
+        window, entry.window = entry.window, None
+        entry.visible = False
+        entry.size = 0
+        if window is not None and window.winfo_exists():
+            window.destroy()
+
+    @property
+    def memory(self):
+        """保持しているウィンドウのメモリの見積もりの合計(バイト)"""
+        return sum(entry.size for entry in self.entries.values())
+
+    def _evict(self):
+        # 最も長く使っていない、隠しているウィンドウから破棄する
+        for name, entry in list(self.entries.items()):
+            if self.memory <= self.memory_limit:
+                break
+            if entry.window is not None and not entry.visible:
+                self.discard(name)
+                self.evictions += 1
+
+    def _on_destroy(self, name, event):
+        entry = self.entries[name]
+        if entry.window is not None and str(event.widget) == str(entry.window):
+            # 他の場所で destroy された場合は、次に開くときに作り直す
+            entry.window = None
+            entry.visible = False
+            entry.size = 0
+
+    def _name_of(self, name_or_window):
+        if isinstance(name_or_window, str):
+            return name_or_window if name_or_window in self.entries else None
+        for name, entry in self.entries.items():
+            if entry.window is name_or_window:
+                return name
+        return None
@@ -1,9 +1,19 @@
 """
 tkinter スクロールバー付きテキストエディタ
+
+Python(.py)とログ(.log)のファイルは構文を色分けして表示します。
+リポジトリのルートから実行します:
+    python -m tkinter_files.samples.t050_text.text_03_editor
 """
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 
+from tkinter_files.common.highlighter import Highlighter, LogLexer, PythonLexer, lexer_for_filename
+from tkinter_files.common.text_mirror import TextMirror
+
+# 表示メニューの構文の選択肢 → レキサーのクラス
+SYNTAXES = {"なし": None, "Python": PythonLexer, "ログ": LogLexer}
+
 
 class TextEditor(tk.Tk):
     def __init__(self):
@@ -27,6 +37,11 @@ class TextEditor(tk.Tk):
         )
         self.text_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # 構文の強調表示(変更された行と表示範囲だけを字句解析する)
+        self.mirror = TextMirror(self.text_area)
+        self.highlighter = Highlighter(self.text_area, self.mirror)
+        self.syntax_var = tk.StringVar(value="なし")
+        
         # ステータスバー
         self.status_bar = tk.Label(
             self, 
@@ -65,6 +80,27 @@ class TextEditor(tk.Tk):
         edit_menu.add_command(label="コピー", command=lambda: self.text_area.event_generate("<<Copy>>"))
         edit_menu.add_command(label="貼り付け", command=lambda: self.text_area.event_generate("<<Paste>>"))
         edit_menu.add_command(label="すべて選択", command=lambda: self.text_area.tag_add(tk.SEL, "1.0", tk.END))
+        
+        # 表示メニュー
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="表示", menu=view_menu)
+        syntax_menu = tk.Menu(view_menu, tearoff=0)
+        view_menu.add_cascade(label="構文の強調表示", menu=syntax_menu)
+        for name in SYNTAXES:
+            syntax_menu.add_radiobutton(label=name, variable=self.syntax_var, value=name,
+                                        command=self.change_syntax)
+    
+    def change_syntax(self):
+        lexer_class = SYNTAXES[self.syntax_var.get()]
+        self.highlighter.set_lexer(lexer_class() if lexer_class else None)
+    
+    def set_syntax_for(self, filename):
+        # ファイルの拡張子からレキサーを選ぶ(内容を入れる前に切り替えて、字句解析を1回で済ませる)
+        lexer = lexer_for_filename(filename)
+        for name, lexer_class in SYNTAXES.items():
+            if lexer_class is (type(lexer) if lexer else None):
+                self.syntax_var.set(name)
+        self.highlighter.set_lexer(lexer)
     
     def new_file(self):
         if messagebox.askokcancel("新規ファイル", "現在の内容は失われます。続行しますか？"):
@@ -75,12 +111,14 @@ class TextEditor(tk.Tk):
     def open_file(self):
         filename = filedialog.askopenfilename(
             title="ファイルを開く",
-            filetypes=[("テキストファイル", "*.txt"), ("すべてのファイル", "*.*")]
+            filetypes=[("テキストファイル", "*.txt"), ("Python", "*.py"), ("ログ", "*.log"),
+                       ("すべてのファイル", "*.*")]
         )
         if filename:
             try:
                 with open(filename, 'r', encoding='utf-8') as file:
                     content = file.read()
+                    self.set_syntax_for(filename)
                     self.text_area.delete("1.0", tk.END)
                     self.text_area.insert("1.0", content)
                     self.filename = filename
@@ -103,6 +141,7 @@ class TextEditor(tk.Tk):
         if filename:
             self.save_to_file(filename)
             self.filename = filename
+            self.set_syntax_for(filename)
             self.title(f"テキストエディタ - {filename}")
     
     def save_to_file(self, filename):
@@ -1,9 +1,34 @@
 """
 tkinter 設定オプション画面
+
+設定は SettingsStore で保存し、次に起動したときに復元します。
+リポジトリのルートから実行します:
+    python -m tkinter_files.samples.t070_checkbutton.checkbutton_03_settings
 """
 import tkinter as tk
 from tkinter import messagebox
 
+from tkinter_files.common.settings_store import SettingsStore, default_settings_path
+
+# 設定のキーと既定値(キーは他のサンプルと同じファイルを共有するため接頭辞を付ける)
+DEFAULTS = {
+    "checkbutton_03.auto_save": True,
+    "checkbutton_03.startup": False,
+    "checkbutton_03.backup": True,
+    "checkbutton_03.email_notification": False,
+    "checkbutton_03.desktop_notification": True,
+    "checkbutton_03.sound_notification": False,
+}
+
+LABELS = {
+    "checkbutton_03.auto_save": "自動保存",
+    "checkbutton_03.startup": "スタートアップ",
+    "checkbutton_03.backup": "自動バックアップ",
+    "checkbutton_03.email_notification": "メール通知",
+    "checkbutton_03.desktop_notification": "デスクトップ通知",
+    "checkbutton_03.sound_notification": "音声通知",
+}
+
 
 class SettingsApp(tk.Tk):
     def __init__(self):
@@ -11,7 +36,16 @@ class SettingsApp(tk.Tk):
         self.title("設定オプション")
         self.geometry("400x350")
         
+        self.settings = SettingsStore(default_settings_path(), DEFAULTS)
+        self.variables = {}
         self.create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def setting_variable(self, key):
+        """保存されている値で初期化した BooleanVar を作る"""
+        variable = tk.BooleanVar(value=self.settings.get(key))
+        self.variables[key] = variable
+        return variable
     
     def create_widgets(self):
         # タイトル
@@ -23,16 +57,16 @@ class SettingsApp(tk.Tk):
         general_frame.pack(fill="x", padx=20, pady=10)
         
         # 設定変数
-        self.auto_save_var = tk.BooleanVar(value=True)
-        self.startup_var = tk.BooleanVar()
-        self.backup_var = tk.BooleanVar(value=True)
+        self.auto_save_var = self.setting_variable("checkbutton_03.auto_save")
+        self.startup_var = self.setting_variable("checkbutton_03.startup")
+        self.backup_var = self.setting_variable("checkbutton_03.backup")
         
         # チェックボタン
         auto_save_check = tk.Checkbutton(
             general_frame, 
             text="自動保存を有効にする", 
             variable=self.auto_save_var,
-            command=self.on_setting_changed
+            command=lambda: self.on_setting_changed("checkbutton_03.auto_save")
         )
         auto_save_check.pack(anchor="w", pady=2)
         
@@ -40,7 +74,7 @@ class SettingsApp(tk.Tk):
             general_frame, 
             text="Windowsスタートアップに追加", 
             variable=self.startup_var,
-            command=self.on_setting_changed
+            command=lambda: self.on_setting_changed("checkbutton_03.startup")
         )
         startup_check.pack(anchor="w", pady=2)
         
@@ -48,7 +82,7 @@ class SettingsApp(tk.Tk):
             general_frame, 
             text="自動バックアップを有効にする", 
             variable=self.backup_var,
-            command=self.on_setting_changed
+            command=lambda: self.on_setting_changed("checkbutton_03.backup")
         )
         backup_check.pack(anchor="w", pady=2)
         
@@ -57,15 +91,15 @@ class SettingsApp(tk.Tk):
         notification_frame.pack(fill="x", padx=20, pady=10)
         
         # 通知設定変数
-        self.email_notification_var = tk.BooleanVar()
-        self.desktop_notification_var = tk.BooleanVar(value=True)
-        self.sound_notification_var = tk.BooleanVar()
+        self.email_notification_var = self.setting_variable("checkbutton_03.email_notification")
+        self.desktop_notification_var = self.setting_variable("checkbutton_03.desktop_notification")
+        self.sound_notification_var = self.setting_variable("checkbutton_03.sound_notification")
         
         email_notification_check = tk.Checkbutton(
             notification_frame, 
             text="メール通知", 
             variable=self.email_notification_var,
-            command=self.on_setting_changed
+            command=lambda: self.on_setting_changed("checkbutton_03.email_notification")
         )
         email_notification_check.pack(anchor="w", pady=2)
         
@@ -73,7 +107,7 @@ class SettingsApp(tk.Tk):
             notification_frame, 
             text="デスクトップ通知", 
             variable=self.desktop_notification_var,
-            command=self.on_setting_changed
+            command=lambda: self.on_setting_changed("checkbutton_03.desktop_notification")
         )
         desktop_notification_check.pack(anchor="w", pady=2)
         
@@ -81,7 +115,7 @@ class SettingsApp(tk.Tk):
             notification_frame, 
             text="音声通知", 
             variable=self.sound_notification_var,
-            command=self.on_setting_changed
+            command=lambda: self.on_setting_changed("checkbutton_03.sound_notification")
         )
         sound_notification_check.pack(anchor="w", pady=2)
         
@@ -95,31 +129,32 @@ class SettingsApp(tk.Tk):
         reset_button = tk.Button(button_frame, text="リセット", command=self.reset_settings)
         reset_button.pack(side=tk.LEFT, padx=5)
     
-    def on_setting_changed(self):
-        print("設定が変更されました")
+    def on_setting_changed(self, key):
+        # 書き込みはワーカースレッドがまとめて行う(続けて切り替えても1回だけ書く)
+        self.settings.set(key, self.variables[key].get())
     
     def save_settings(self):
-        settings = {
-            "自動保存": self.auto_save_var.get(),
-            "スタートアップ": self.startup_var.get(),
-            "自動バックアップ": self.backup_var.get(),
-            "メール通知": self.email_notification_var.get(),
-            "デスクトップ通知": self.desktop_notification_var.get(),
-            "音声通知": self.sound_notification_var.get()
-        }
-        
-        enabled_settings = [key for key, value in settings.items() if value]
+        # 書き込みが終わるのを UI スレッドで待つのは最大 1 秒まで
+        if not self.settings.flush(timeout=1.0):
+            error = self.settings.last_error
+            detail = f"\n{error}" if error is not None else ""
+            messagebox.showwarning("設定保存", "設定をまだ保存できていません。しばらくしてから書き直します。" + detail)
+            return
+        # 値は Tk の変数ではなく設定のキャッシュから読む
+        enabled_settings = [label for key, label in LABELS.items() if self.settings.get(key)]
         message = "有効な設定:\n" + "\n".join([f"• {setting}" for setting in enabled_settings])
         messagebox.showinfo("設定保存", message if enabled_settings else "有効な設定がありません")
     
     def reset_settings(self):
-        self.auto_save_var.set(True)
-        self.startup_var.set(False)
-        self.backup_var.set(True)
-        self.email_notification_var.set(False)
-        self.desktop_notification_var.set(True)
-        self.sound_notification_var.set(False)
+        self.settings.reset()
+        for key, variable in self.variables.items():
+            variable.set(self.settings.get(key))
         messagebox.showinfo("リセット", "設定をデフォルト値にリセットしました")
+    
+    def on_close(self):
+        # 書き込みが残っていれば書いてから終了する
+        self.settings.close()
+        self.destroy()
 
 if __name__ == "__main__":
     app = SettingsApp()
@@ -1,9 +1,19 @@
 """
 tkinter 複数選択リストボックス
+
+項目は見えている行だけを描画する VirtualListbox で表示するため、
+1000万件の項目でもスクロール・全選択・削除がすぐに終わります。
+リポジトリのルートから実行します:
+    python -m tkinter_files.samples.t100_listbox.listbox_03_multiselect
 """
 import tkinter as tk
 from tkinter import messagebox
 
+from tkinter_files.common.virtual_list import GeneratedItems, VirtualListbox
+
+# 選択結果に一覧表示する最大件数
+SHOW_LIMIT = 100
+
 
 class MultiSelectListboxApp(tk.Tk):
     def __init__(self):
@@ -18,17 +28,15 @@ class MultiSelectListboxApp(tk.Tk):
         # タイトル
         tk.Label(self, text="プログラミング言語を選択（複数可）:", font=("Arial", 12, "bold")).pack(pady=10)
         
-        # リストボックス（複数選択モード）
-        self.listbox = tk.Listbox(self, selectmode=tk.MULTIPLE, height=8, font=("Arial", 10))
-        self.listbox.pack(pady=10)
-        
-        # 項目を追加
+        # 項目
         languages = [
             "Python", "JavaScript", "Java", "C++", "C#", "Go", "Rust", 
             "TypeScript", "PHP", "Ruby", "Swift", "Kotlin", "Dart"
         ]
-        for lang in languages:
-            self.listbox.insert(tk.END, lang)
+        
+        # リストボックス（複数選択モード。見えている行だけを描画する）
+        self.listbox = VirtualListbox(self, languages, selectmode=tk.MULTIPLE, height=8, font=("Arial", 10))
+        self.listbox.pack(pady=10)
         
         # ボタンフレーム
         button_frame = tk.Frame(self)
@@ -38,6 +46,7 @@ class MultiSelectListboxApp(tk.Tk):
         tk.Button(button_frame, text="選択項目を表示", command=self.show_selection).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="すべて選択", command=self.select_all).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="選択解除", command=self.clear_selection).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="1000万件を追加", command=self.add_many_items).pack(side=tk.LEFT, padx=5)
         
         # 項目操作フレーム
         operation_frame = tk.Frame(self)
@@ -56,11 +65,19 @@ class MultiSelectListboxApp(tk.Tk):
         self.result_text.pack(pady=5)
     
     def show_selection(self):
-        selection_indices = self.listbox.curselection()
-        if selection_indices:
-            selected_items = [self.listbox.get(i) for i in selection_indices]
-            result = f"選択された言語 ({len(selected_items)}個):\n"
+        count = len(self.listbox.selection)
+        if count:
+            # 選択範囲(区間)ごとにまとめて取り出し、先頭の SHOW_LIMIT 件だけ表示する
+            selected_items = []
+            for start, end in self.listbox.selection.intervals():
+                end = min(end, start + SHOW_LIMIT - len(selected_items))
+                selected_items.extend(self.listbox.get(start, end - 1))
+                if len(selected_items) >= SHOW_LIMIT:
+                    break
+            result = f"選択された言語 ({count}個):\n"
             result += "\n".join(f"- {item}" for item in selected_items)
+            if count > len(selected_items):
+                result += f"\n...ほか {count - len(selected_items)} 個"
         else:
             result = "何も選択されていません。"
         
@@ -84,14 +101,16 @@ class MultiSelectListboxApp(tk.Tk):
         else:
             messagebox.showwarning("警告", "言語名を入力してください。")
     
+    def add_many_items(self):
+        # 項目は表示するときに行番号から作る(メモリには持たない)
+        self.listbox.extend_source(GeneratedItems(10_000_000, lambda i: f"項目 {i + 1}"))
+    
     def remove_selected(self):
-        selection_indices = list(self.listbox.curselection())
-        if selection_indices:
-            # 後ろから削除（インデックスがずれるのを防ぐため）
-            for i in reversed(selection_indices):
-                self.listbox.delete(i)
+        # 選択範囲ごとにまとめて削除する(1行ずつ delete しない)
+        count = self.listbox.delete_selected()
+        if count:
             self.result_text.delete(1.0, tk.END)
-            messagebox.showinfo("削除完了", f"{len(selection_indices)}個の項目を削除しました。")
+            messagebox.showinfo("削除完了", f"{count}個の項目を削除しました。")
         else:
             messagebox.showwarning("警告", "削除する項目を選択してください。")
 
@@ -1,10 +1,22 @@
 """
 tkinter 実用的なメッセージボックス例
+
+編集中の内容はバックグラウンドで自動保存し、次に開いたときに復元を確認します。
+リポジトリのルートから実行します:
+    python -m tkinter_files.samples.t140_messagebox.messagebox_03_practical
 """
 import os
+import tempfile
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
+from tkinter_files.common.autosave import AutoSaver, DeltaJournal, autosave_path
+from tkinter_files.common.text_mirror import TextMirror
+
+# ファイル名のない新しいドキュメントの自動保存先
+UNTITLED_PATH = os.path.join(tempfile.gettempdir(), "messagebox_03_untitled.txt")
+
 
 class PracticalMessageboxApp(tk.Tk):
     def __init__(self):
@@ -16,6 +28,7 @@ class PracticalMessageboxApp(tk.Tk):
         self.current_file = None
         self.is_modified = False
         self.create_widgets()
+        self.after_idle(self.recover_autosave, UNTITLED_PATH)
     
     def create_widgets(self):
         # メニューバー
@@ -57,9 +70,9 @@ class PracticalMessageboxApp(tk.Tk):
         self.text_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # テキスト変更の監視
-        self.text_area.bind("<KeyPress>", self.on_text_change)
-        self.text_area.bind("<Button-1>", self.on_text_change)
+        # テキスト変更の監視(ミラーが insert / delete を受け取ったときだけ変更ありにする)
+        self.mirror = TextMirror(self.text_area)
+        self.mirror.listeners.append(self.on_text_change)
         
         # ステータスバー
         self.status_bar = tk.Label(self, text="準備完了", relief=tk.SUNKEN, anchor=tk.W, bg="lightgray")
@@ -69,8 +82,11 @@ class PracticalMessageboxApp(tk.Tk):
         self.text_area.insert(1.0, "新しいドキュメント\n\nここにテキストを入力してください。\nファイル操作でメッセージボックスの動作を確認できます。")
         self.is_modified = False
         self.update_title()
+        
+        self.autosaver = AutoSaver(self.text_area, self.mirror, UNTITLED_PATH,
+                                   on_saved=self.on_autosaved, on_error=self.on_autosave_error)
     
-    def on_text_change(self, event=None):
+    def on_text_change(self, *args):
         if not self.is_modified:
             self.is_modified = True
             self.update_title()
@@ -83,6 +99,30 @@ class PracticalMessageboxApp(tk.Tk):
             title += " *"
         self.title(title)
     
+    def on_autosaved(self):
+        self.status_bar.config(text=f"自動保存しました ({time.strftime('%H:%M:%S')})")
+    
+    def on_autosave_error(self, error):
+        self.status_bar.config(text=f"自動保存できませんでした: {error}")
+    
+    def recover_autosave(self, path):
+        """自動保存のデータがあれば、復元するか確認する"""
+        lines = DeltaJournal.load(autosave_path(path))
+        if lines is None or lines == self.mirror.lines:
+            return
+        if messagebox.askyesno(
+            "自動保存の復元",
+            "保存されていない編集内容が自動保存されています。\n復元しますか？",
+            icon="question"
+        ):
+            self.text_area.delete(1.0, tk.END)
+            self.text_area.insert(1.0, "\n".join(lines))
+            self.is_modified = True
+            self.update_title()
+            self.status_bar.config(text="自動保存された内容を復元しました")
+        else:
+            self.autosaver.discard()
+    
     def check_unsaved_changes(self):
         """未保存の変更があるかチェックし、保存するか確認"""
         if not self.is_modified:
@@ -95,7 +135,7 @@ class PracticalMessageboxApp(tk.Tk):
         )
         
         if result is True:  # はい
-            return self.save_file()
+            return self.save_file(wait=True)
         elif result is False:  # いいえ
             return True
         else:  # キャンセル
@@ -105,6 +145,7 @@ class PracticalMessageboxApp(tk.Tk):
         if self.check_unsaved_changes():
             self.text_area.delete(1.0, tk.END)
             self.current_file = None
+            self.autosaver.restart(UNTITLED_PATH)
             self.is_modified = False
             self.update_title()
             self.status_bar.config(text="新しいドキュメントを作成しました")
@@ -123,31 +164,53 @@ class PracticalMessageboxApp(tk.Tk):
                         self.text_area.delete(1.0, tk.END)
                         self.text_area.insert(1.0, content)
                         self.current_file = filename
+                        self.autosaver.restart(filename)
                         self.is_modified = False
                         self.update_title()
                         self.status_bar.config(text=f"ファイルを開きました: {os.path.basename(filename)}")
                         messagebox.showinfo("ファイルを開く", f"ファイルを開きました:\n{os.path.basename(filename)}")
                 except Exception as e:
                     messagebox.showerror("エラー", f"ファイルを開けませんでした:\n{str(e)}")
+                else:
+                    self.recover_autosave(filename)
     
-    def save_file(self):
+    def save_file(self, wait=False):
+        """
+        保存する(書き込みはワーカースレッドで行い、UI を止めない)
+        
+        Args:
+            wait (bool): 書き込みが終わるまで待つかどうか(終了・新規作成の前の保存)
+        
+        Returns:
+            bool: 保存を開始した(wait=True なら保存できた)かどうか
+        """
         if not self.current_file:
-            return self.save_as_file()
+            return self.save_as_file(wait)
         
-        try:
-            content = self.text_area.get(1.0, tk.END)
-            with open(self.current_file, 'w', encoding='utf-8') as file:
-                file.write(content)
-            self.is_modified = False
+        filename = self.current_file
+        version = self.mirror.version
+        self.status_bar.config(text=f"保存中: {os.path.basename(filename)}")
+        
+        def on_done(future):
+            error = future.exception()
+            if error is not None:
+                messagebox.showerror("保存エラー", f"ファイルを保存できませんでした:\n{str(error)}")
+                return
+            # 保存中に編集された場合は変更ありのままにする
+            self.is_modified = self.mirror.version != version
             self.update_title()
-            self.status_bar.config(text=f"ファイルを保存しました: {os.path.basename(self.current_file)}")
-            messagebox.showinfo("保存完了", f"ファイルを保存しました:\n{os.path.basename(self.current_file)}")
+            self.status_bar.config(text=f"ファイルを保存しました: {os.path.basename(filename)}")
+            if not wait:
+                messagebox.showinfo("保存完了", f"ファイルを保存しました:\n{os.path.basename(filename)}")
+        
+        if not wait:
+            self.autosaver.save(filename, on_done)
             return True
-        except Exception as e:
-            messagebox.showerror("保存エラー", f"ファイルを保存できませんでした:\n{str(e)}")
-            return False
+        future = self.autosaver.save(filename, wait=True)
+        on_done(future)
+        return future.exception() is None
     
-    def save_as_file(self):
+    def save_as_file(self, wait=False):
         filename = filedialog.asksaveasfilename(
             title="名前を付けて保存",
             defaultextension=".txt",
@@ -155,7 +218,7 @@ class PracticalMessageboxApp(tk.Tk):
         )
         if filename:
             self.current_file = filename
-            return self.save_file()
+            return self.save_file(wait)
         return False
     
     def clear_all(self):
@@ -188,6 +251,10 @@ class PracticalMessageboxApp(tk.Tk):
     def quit_app(self):
         if self.check_unsaved_changes():
             if messagebox.askokcancel("終了確認", "アプリケーションを終了しますか？"):
+                # 保存しないことを選んだ場合の自動保存は不要なので消してから終了する
+                if self.is_modified:
+                    self.autosaver.discard()
+                self.autosaver.close()
                 self.quit()
 
 if __name__ == "__main__":
@@ -1,9 +1,16 @@
 """
 tkinter 基本的なサブウィンドウ
+
+サブウィンドウは WindowPool で一度だけ作り、閉じても隠しておいて次に開くときに再利用します。
+リポジトリのルートから実行します:
+    python -m tkinter_files.samples.t910_subwindow.subwindow_01_basic
 """
 import tkinter as tk
 from tkinter import messagebox
 
+from tkinter_files.common.placement import TkPlacement
+from tkinter_files.common.window_pool import WindowPool
+
 
 class BasicSubWindowApp(tk.Tk):
     def __init__(self):
@@ -12,6 +19,15 @@ class BasicSubWindowApp(tk.Tk):
         self.title("基本的なサブウィンドウ")
         self.geometry("400x300")
         
+        # 画面の大きさをキャッシュして配置する
+        self.placement = TkPlacement(self)
+        
+        # サブウィンドウのプール(開くたびに作り直さない)
+        self.windows = WindowPool(self)
+        self.windows.register("info", self.build_info_window, reset=self.reset_info_window)
+        self.windows.register("settings", self.build_settings_window, reset=self.reset_settings_window)
+        self.windows.register("help", self.build_help_window, reset=self.reset_help_window)
+        
         self.create_widgets()
     
     def create_widgets(self):
@@ -65,15 +81,27 @@ class BasicSubWindowApp(tk.Tk):
         self.counter_label.pack(pady=20)
     
     def open_info_window(self):
+        self.open_window("info")
+    
+    def open_settings_window(self):
+        self.open_window("settings")
+    
+    def open_help_window(self):
+        self.open_window("help")
+    
+    def open_window(self, name):
+        # 表示中のウィンドウは前面に出すだけなので、数えるのは新しく表示したときだけ
+        already_open = self.windows.is_open(name)
+        self.windows.open(name)
+        if not already_open:
+            self.update_counter()
+    
+    def build_info_window(self):
         # 情報表示用のサブウィンドウ
         info_window = tk.Toplevel(self)
         info_window.title("アプリケーション情報")
-        info_window.geometry("350x250")
         info_window.resizable(False, False)
         
-        # 中央に配置
-        self.center_window(info_window, 350, 250)
-        
         # アイコン風の装飾
         header_frame = tk.Frame(info_window, bg="darkblue", height=60)
         header_frame.pack(fill=tk.X)
@@ -107,22 +135,22 @@ class BasicSubWindowApp(tk.Tk):
         tk.Button(
             content_frame, 
             text="閉じる", 
-            command=info_window.destroy,
+            command=lambda: self.windows.close("info"),
             bg="gray",
             fg="white",
             width=10
         ).pack(pady=10)
         
-        self.update_counter()
+        return info_window
     
-    def open_settings_window(self):
+    def reset_info_window(self, window):
+        # 中央に配置
+        self.center_window(window, 350, 250)
+    
+    def build_settings_window(self):
         # 設定用のサブウィンドウ
         settings_window = tk.Toplevel(self)
         settings_window.title("設定")
-        settings_window.geometry("400x300")
-        
-        # 中央に配置
-        self.center_window(settings_window, 400, 300)
         
         # ヘッダー
         header_frame = tk.Frame(settings_window, bg="darkgreen", height=50)
@@ -145,9 +173,13 @@ class BasicSubWindowApp(tk.Tk):
         general_frame = tk.LabelFrame(content_frame, text="一般設定", font=("Arial", 11, "bold"))
         general_frame.pack(fill=tk.X, pady=10)
         
-        tk.Checkbutton(general_frame, text="起動時にヒントを表示", font=("Arial", 10)).pack(anchor=tk.W, padx=10, pady=5)
-        tk.Checkbutton(general_frame, text="自動保存を有効にする", font=("Arial", 10)).pack(anchor=tk.W, padx=10, pady=5)
-        tk.Checkbutton(general_frame, text="音声通知を有効にする", font=("Arial", 10)).pack(anchor=tk.W, padx=10, pady=5)
+        # 再利用するときに初期値へ戻す (変数, 初期値) のリスト
+        # (tkinter の変数は __eq__ だけを定義していてハッシュできないので dict のキーにはしない)
+        self.settings_defaults = []
+        for text in ("起動時にヒントを表示", "自動保存を有効にする", "音声通知を有効にする"):
+            variable = tk.BooleanVar()
+            self.settings_defaults.append((variable, False))
+            tk.Checkbutton(general_frame, text=text, variable=variable, font=("Arial", 10)).pack(anchor=tk.W, padx=10, pady=5)
         
         # 表示設定
         display_frame = tk.LabelFrame(content_frame, text="表示設定", font=("Arial", 11, "bold"))
@@ -155,10 +187,12 @@ class BasicSubWindowApp(tk.Tk):
         
         tk.Label(display_frame, text="テーマ:", font=("Arial", 10)).grid(row=0, column=0, sticky="w", padx=10, pady=5)
         theme_var = tk.StringVar(value="ライト")
+        self.settings_defaults.append((theme_var, "ライト"))
         tk.OptionMenu(display_frame, theme_var, "ライト", "ダーク", "自動").grid(row=0, column=1, sticky="w", padx=10, pady=5)
         
         tk.Label(display_frame, text="フォントサイズ:", font=("Arial", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         font_var = tk.StringVar(value="中")
+        self.settings_defaults.append((font_var, "中"))
         tk.OptionMenu(display_frame, font_var, "小", "中", "大").grid(row=1, column=1, sticky="w", padx=10, pady=5)
         
         # ボタン
@@ -168,7 +202,7 @@ class BasicSubWindowApp(tk.Tk):
         tk.Button(
             button_frame, 
             text="保存", 
-            command=lambda: [messagebox.showinfo("設定", "設定を保存しました。"), settings_window.destroy()],
+            command=lambda: [messagebox.showinfo("設定", "設定を保存しました。"), self.windows.close("settings")],
             bg="green",
             fg="white",
             width=8
@@ -177,22 +211,24 @@ class BasicSubWindowApp(tk.Tk):
         tk.Button(
             button_frame, 
             text="キャンセル", 
-            command=settings_window.destroy,
+            command=lambda: self.windows.close("settings"),
             bg="gray",
             fg="white",
             width=8
         ).pack(side=tk.LEFT, padx=5)
         
-        self.update_counter()
+        return settings_window
     
-    def open_help_window(self):
+    def reset_settings_window(self, window):
+        # 前回開いたときの入力を初期値に戻す
+        for variable, value in self.settings_defaults:
+            variable.set(value)
+        self.center_window(window, 400, 300)
+    
+    def build_help_window(self):
         # ヘルプ用のサブウィンドウ
         help_window = tk.Toplevel(self)
         help_window.title("ヘルプ")
-        help_window.geometry("500x400")
-        
-        # 中央に配置
-        self.center_window(help_window, 500, 400)
         
         # ヘッダー
         header_frame = tk.Frame(help_window, bg="darkorange", height=50)
@@ -216,6 +252,7 @@ class BasicSubWindowApp(tk.Tk):
         text_frame.pack(fill=tk.BOTH, expand=True)
         
         help_text = tk.Text(text_frame, wrap=tk.WORD, font=("Arial", 10))
+        self.help_text = help_text
         scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL, command=help_text.yview)
         help_text.config(yscrollcommand=scrollbar.set)
         
@@ -277,23 +314,22 @@ v1.0.0 - 初期リリース
         tk.Button(
             content_frame, 
             text="閉じる", 
-            command=help_window.destroy,
+            command=lambda: self.windows.close("help"),
             bg="orange",
             fg="white",
             width=10
         ).pack(pady=10)
         
-        self.update_counter()
+        return help_window
+    
+    def reset_help_window(self, window):
+        # 前回のスクロール位置を先頭に戻す
+        self.help_text.yview_moveto(0)
+        self.center_window(window, 500, 400)
     
     def center_window(self, window, width, height):
-        # ウィンドウを画面の中央に配置
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
-        
-        x = (screen_width - width) // 2
-        y = (screen_height - height) // 2
-        
-        window.geometry(f"{width}x{height}+{x}+{y}")
+        # メインウィンドウがある画面の作業領域の中央に配置(画面の大きさはキャッシュを使う)
+        self.placement.center_on_screen(window, width, height, near=self)
     
     def update_counter(self):
         # ウィンドウカウンターを更新
@@ -1,9 +1,14 @@
 """
 tkinter モーダルダイアログ
+
+リポジトリのルートから実行します:
+    python -m tkinter_files.samples.t910_subwindow.subwindow_02_modal
 """
 import tkinter as tk
 from tkinter import messagebox
 
+from tkinter_files.common.placement import TkPlacement
+
 
 class ModalDialogApp(tk.Tk):
     def __init__(self):
@@ -14,6 +19,8 @@ class ModalDialogApp(tk.Tk):
         
         # ダイアログ管理用
         self.current_dialog = None
+        # ダイアログの配置(メインウィンドウの位置は <Configure> で受け取って覚えておく)
+        self.placement = TkPlacement(self)
         
         self.create_widgets()
     
@@ -102,21 +109,8 @@ class SimpleDialog(tk.Toplevel):
                  bg="gray", fg="white", width=8).pack(side=tk.LEFT, padx=5)
     
     def center_on_parent(self, parent):
-        parent.update_idletasks()
-        
-        # 親ウィンドウの中央に配置
-        parent_x = parent.winfo_x()
-        parent_y = parent.winfo_y()
-        parent_width = parent.winfo_width()
-        parent_height = parent.winfo_height()
-        
-        dialog_width = 250
-        dialog_height = 150
-        
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        
-        self.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        # 親ウィンドウの中央に配置(update_idletasks でレイアウトを確定させずに、覚えている位置を使う)
+        parent.placement.center_on_parent(self, parent, 250, 150)
     
     def ok(self):
         self.result = self.entry.get()
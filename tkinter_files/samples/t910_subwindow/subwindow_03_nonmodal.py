@@ -1,9 +1,16 @@
 """
 tkinter 非モーダルウィンドウ
+
+サブウィンドウは WindowPool で再利用します(閉じると隠し、次に開くときに状態を初期化して表示)。
+リポジトリのルートから実行します:
+    python -m tkinter_files.samples.t910_subwindow.subwindow_03_nonmodal
 """
 import tkinter as tk
 from tkinter import messagebox
 
+from tkinter_files.common.placement import TkPlacement
+from tkinter_files.common.window_pool import WindowPool
+
 
 class NonModalWindowApp(tk.Tk):
     def __init__(self):
@@ -14,6 +21,9 @@ class NonModalWindowApp(tk.Tk):
         
         # ウィンドウ管理用
         self.sub_window = None
+        self.placement = TkPlacement(self)
+        self.windows = WindowPool(self)
+        self.windows.register("sub", lambda: SubWindow(self), reset=SubWindow.reset)
         
         self.create_widgets()
     
@@ -49,17 +59,11 @@ class NonModalWindowApp(tk.Tk):
         tk.Button(self, text="テストボタン", command=lambda: messagebox.showinfo("テスト", "クリックできました！")).pack()
     
     def open_sub_window(self):
-        # 重複開防止
-        if self.sub_window and self.sub_window.winfo_exists():
-            self.sub_window.lift()  # 既存ウィンドウを前面に
-            return
-        
-        # 非モーダルウィンドウを作成
-        self.sub_window = SubWindow(self)
+        # 表示中なら前面に出すだけ(重複して開かない)。閉じたウィンドウは作り直さずに再表示する
+        self.sub_window = self.windows.open("sub")
     
     def close_sub_window(self):
-        if self.sub_window and self.sub_window.winfo_exists():
-            self.sub_window.destroy()
+        self.windows.close("sub")
         self.sub_window = None
 
 class SubWindow(tk.Toplevel):
@@ -68,20 +72,22 @@ class SubWindow(tk.Toplevel):
         
         self.parent = parent
         self.title("サブウィンドウ")
-        self.geometry("250x200")
         self.resizable(True, True)
         
         # 非モーダル設定（grab_setを呼ばない）
         self.transient(parent)  # 親に関連付けるが、操作はブロックしない
         
-        # 親ウィンドウの右側に配置
-        self.position_beside_parent(parent)
-        
         self.create_widgets()
         
         # 閉じる処理をカスタマイズ
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    def reset(self):
+        """再表示する前にカウンターを初期化し、親ウィンドウの右側に配置する"""
+        self.counter = 0
+        self.counter_label.config(text=f"カウンター: {self.counter}")
+        self.position_beside_parent(self.parent)
+    
     def create_widgets(self):
         tk.Label(self, text="非モーダルウィンドウ", font=("Arial", 12, "bold")).pack(pady=10)
         
@@ -105,17 +111,8 @@ class SubWindow(tk.Toplevel):
                  bg="gray", fg="white", width=10).pack(pady=10)
     
     def position_beside_parent(self, parent):
-        parent.update_idletasks()
-        
-        # 親ウィンドウの右側に配置
-        parent_x = parent.winfo_x()
-        parent_y = parent.winfo_y()
-        parent_width = parent.winfo_width()
-        
-        x = parent_x + parent_width + 10
-        y = parent_y
-        
-        self.geometry(f"250x200+{x}+{y}")
+        # 親ウィンドウの右側に配置(右に入らなければ左側。update_idletasks は呼ばない)
+        parent.placement.beside_parent(self, parent, 250, 200)
     
     def increment(self):
         self.counter += 1
@@ -126,9 +123,8 @@ class SubWindow(tk.Toplevel):
         self.counter_label.config(text=f"カウンター: {self.counter}")
     
     def on_closing(self):
-        # 親のサブウィンドウ参照をクリア
-        self.parent.sub_window = None
-        self.destroy()
+        # 破棄せずに隠す(親のプールが次に開くときに再利用する)
+        self.parent.close_sub_window()
 
 if __name__ == "__main__":
     app = NonModalWindowApp()
@@ -7,6 +7,11 @@
 import tkinter as tk
 from tkinter import ttk
 
+from tkinter_files.common.expression import ExpressionError, engine
+from tkinter_files.common.lazy_notebook import LazyNotebook
+from tkinter_files.common.status import StatusMessenger
+from tkinter_files.common.virtual_list import VirtualListbox
+
 
 class ContextKeyBindingApp:
     def __init__(self, root):
@@ -14,28 +19,40 @@ class ContextKeyBindingApp:
         root.title("コンテキスト固有キーバインディング")
         root.geometry("600x400")
         
+        # タブの状態(タブの中身を破棄しても残す)
+        self.text_content = ("ここにテキストを入力してください。\n"
+                             "Ctrl+Dで行複製、Ctrl+Kで行削除できます。\n"
+                             "Ctrl+U/Lで大文字/小文字変換もできます。")
+        self.list_items = [f"アイテム {i}" for i in range(1, 11)]
+        self.calc_text = "0"
+        self.calc_expression = ""
+        self.calc_result = 0
+        
         # ノートブック（タブウィジェット）
+        # タブの中身は最初に選択されたときに作り、残りはアイドル時間に作っておく
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.tabs = LazyNotebook(self.notebook)
         
         # テキストエディタタブ
-        self.create_text_tab()
+        self.tabs.add("text", "テキストエディタ", self.create_text_tab, unload=self.unload_text_tab)
         
         # リスト管理タブ
-        self.create_list_tab()
+        self.tabs.add("list", "リスト管理", self.create_list_tab, unload=self.unload_list_tab)
         
         # 計算機タブ
-        self.create_calculator_tab()
+        self.tabs.add("calculator", "計算機", self.create_calculator_tab, unload=self.unload_calculator_tab)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed, add="+")
         
         # ステータスバー
         self.status_bar = tk.Label(root, text="準備完了", relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
         
-    def create_text_tab(self):
-        """テキストエディタタブ"""
-        text_frame = tk.Frame(self.notebook)
-        self.notebook.add(text_frame, text="テキストエディタ")
+        # ステータスバーのメッセージ(タイマーは1つだけ使い、一定時間後に「準備完了」へ戻す)
+        self.status = StatusMessenger(self.status_bar, idle_text="準備完了")
         
+    def create_text_tab(self, text_frame):
+        """テキストエディタタブ"""
         # 説明ラベル
         info_label = tk.Label(text_frame, 
                              text="テキストエディタ - キーバインディング:\n"
@@ -57,10 +74,8 @@ class ContextKeyBindingApp:
         self.text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # 初期テキスト
-        self.text_widget.insert(1.0, "ここにテキストを入力してください。\n"
-                                     "Ctrl+Dで行複製、Ctrl+Kで行削除できます。\n"
-                                     "Ctrl+U/Lで大文字/小文字変換もできます。")
+        # 初期テキスト(タブを作り直した場合は破棄する前の内容)
+        self.text_widget.insert(1.0, self.text_content)
         
         # テキスト固有のキーバインディング
         self.text_widget.bind('<Control-d>', self.duplicate_text_line)
@@ -68,11 +83,11 @@ class ContextKeyBindingApp:
         self.text_widget.bind('<Control-u>', self.text_to_upper)
         self.text_widget.bind('<Control-l>', self.text_to_lower)
         
-    def create_list_tab(self):
-        """リスト管理タブ"""
-        list_frame = tk.Frame(self.notebook)
-        self.notebook.add(list_frame, text="リスト管理")
+    def unload_text_tab(self, text_frame):
+        self.text_content = self.text_widget.get("1.0", "end-1c")
         
+    def create_list_tab(self, list_frame):
+        """リスト管理タブ"""
         # 説明ラベル
         info_label = tk.Label(list_frame,
                              text="リスト管理 - キーバインディング:\n"
@@ -95,20 +110,9 @@ class ContextKeyBindingApp:
         add_btn = tk.Button(input_frame, text="追加", command=self.add_list_item)
         add_btn.pack(side=tk.RIGHT)
         
-        # リストボックス
-        list_container = tk.Frame(list_frame)
-        list_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        self.listbox = tk.Listbox(list_container, selectmode=tk.EXTENDED)
-        list_scrollbar = tk.Scrollbar(list_container, orient=tk.VERTICAL, command=self.listbox.yview)
-        self.listbox.config(yscrollcommand=list_scrollbar.set)
-        
-        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # 初期データ
-        for i in range(1, 11):
-            self.listbox.insert(tk.END, f"アイテム {i}")
+        # リストボックス(スクロールバー付き。見えている行だけを描画する)
+        self.listbox = VirtualListbox(list_frame, self.list_items, selectmode=tk.EXTENDED)
+        self.listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
             
         # リスト固有のキーバインディング
         self.listbox.bind('<Delete>', self.delete_list_items)
@@ -116,11 +120,12 @@ class ContextKeyBindingApp:
         self.listbox.bind('<Control-i>', lambda e: self.list_entry.focus_set())
         self.listbox.bind('<Return>', self.edit_list_item)
         
-    def create_calculator_tab(self):
-        """計算機タブ"""
-        calc_frame = tk.Frame(self.notebook)
-        self.notebook.add(calc_frame, text="計算機")
+    def unload_list_tab(self, list_frame):
+        # 項目はコピーせず、VirtualListbox の列をそのまま次のリストボックスに渡す
+        self.list_items = self.listbox.items
         
+    def create_calculator_tab(self, calc_frame):
+        """計算機タブ"""
         # 説明ラベル
         info_label = tk.Label(calc_frame,
                              text="計算機 - キーバインディング:\n"
@@ -134,7 +139,7 @@ class ContextKeyBindingApp:
         # ディスプレイ
         self.calc_display = tk.Entry(calc_frame, font=("Arial", 16), justify=tk.RIGHT)
         self.calc_display.pack(fill=tk.X, padx=5, pady=5)
-        self.calc_display.insert(0, "0")
+        self.calc_display.insert(0, self.calc_text)
         
         # ボタンフレーム
         button_frame = tk.Frame(calc_frame)
@@ -163,11 +168,15 @@ class ContextKeyBindingApp:
             
         # 計算機固有のキーバインディング
         calc_frame.bind('<Key>', self.calc_key_press)
-        calc_frame.focus_set()  # フォーカスを設定してキーイベントを受け取る
         
-        # 計算機の状態
-        self.calc_expression = ""
-        self.calc_result = 0
+    def unload_calculator_tab(self, calc_frame):
+        self.calc_text = self.calc_display.get()
+        
+    def on_tab_changed(self, event):
+        # 計算機タブを選択したら、フォーカスを設定してキーイベントを受け取る
+        calc_frame = self.tabs.frame("calculator")
+        if str(self.notebook.select()) == str(calc_frame):
+            calc_frame.focus_set()
         
     # テキストエディタ用メソッド
     def duplicate_text_line(self, event):
@@ -175,15 +184,13 @@ class ContextKeyBindingApp:
         current_line = widget.index(tk.INSERT).split('.')[0]
         line_content = widget.get(f"{current_line}.0", f"{current_line}.end")
         widget.insert(f"{current_line}.end", f"\n{line_content}")
-        self.status_bar.config(text="行を複製しました")
-        self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+        self.status.show("行を複製しました")
         
     def delete_text_line(self, event):
         widget = event.widget
         current_line = widget.index(tk.INSERT).split('.')[0]
         widget.delete(f"{current_line}.0", f"{int(current_line)+1}.0")
-        self.status_bar.config(text="行を削除しました")
-        self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+        self.status.show("行を削除しました")
         
     def text_to_upper(self, event):
         widget = event.widget
@@ -191,10 +198,9 @@ class ContextKeyBindingApp:
             selected_text = widget.get(tk.SEL_FIRST, tk.SEL_LAST)
             widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
             widget.insert(tk.INSERT, selected_text.upper())
-            self.status_bar.config(text="大文字に変換しました")
+            self.status.show("大文字に変換しました")
         except tk.TclError:
-            self.status_bar.config(text="テキストを選択してください")
-        self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+            self.status.show("テキストを選択してください")
         
     def text_to_lower(self, event):
         widget = event.widget
@@ -202,10 +208,9 @@ class ContextKeyBindingApp:
             selected_text = widget.get(tk.SEL_FIRST, tk.SEL_LAST)
             widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
             widget.insert(tk.INSERT, selected_text.lower())
-            self.status_bar.config(text="小文字に変換しました")
+            self.status.show("小文字に変換しました")
         except tk.TclError:
-            self.status_bar.config(text="テキストを選択してください")
-        self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+            self.status.show("テキストを選択してください")
         
     # リスト管理用メソッド
     def add_list_item(self, event=None):
@@ -213,32 +218,27 @@ class ContextKeyBindingApp:
         if text:
             self.listbox.insert(tk.END, text)
             self.list_entry.delete(0, tk.END)
-            self.status_bar.config(text=f"'{text}' を追加しました")
-            self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+            self.status.show(f"'{text}' を追加しました")
             
     def delete_list_items(self, event):
-        selections = self.listbox.curselection()
-        if selections:
-            # 後ろから削除（インデックスがずれないように）
-            for index in reversed(selections):
-                self.listbox.delete(index)
-            self.status_bar.config(text=f"{len(selections)}個のアイテムを削除しました")
-            self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+        # 選択範囲ごとにまとめて削除する
+        count = self.listbox.delete_selected()
+        if count:
+            self.status.show(f"{count}個のアイテムを削除しました")
             
     def select_all_list_items(self, event):
         self.listbox.select_set(0, tk.END)
-        self.status_bar.config(text="すべてのアイテムを選択しました")
-        self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+        self.status.show("すべてのアイテムを選択しました")
         
     def edit_list_item(self, event):
-        selection = self.listbox.curselection()
-        if selection:
-            current_text = self.listbox.get(selection[0])
+        index = self.listbox.selection.first()
+        if index is not None:
+            current_text = self.listbox.get(index)
             self.list_entry.delete(0, tk.END)
             self.list_entry.insert(0, current_text)
             self.list_entry.focus_set()
-            self.listbox.delete(selection[0])
-            self.status_bar.config(text="アイテムを編集モードにしました")
+            self.listbox.delete(index)
+            self.status.show("アイテムを編集モードにしました", duration=0)
             
     # 計算機用メソッド
     def calc_button_click(self, btn_text):
@@ -277,17 +277,17 @@ class ContextKeyBindingApp:
     def calc_execute(self):
         try:
             full_expression = self.calc_expression + self.calc_display.get()
-            result = eval(full_expression)  # 注意: 実際の製品では安全な評価が必要
+            # 四則演算だけを許可した数式エンジンで計算(同じ式のコンパイル結果はキャッシュされる)
+            result = engine.evaluate(full_expression)
             self.calc_display.delete(0, tk.END)
             self.calc_display.insert(0, str(result))
             self.calc_expression = ""
-            self.status_bar.config(text=f"計算結果: {result}")
-        except:
+            self.status.show(f"計算結果: {result}")
+        except (ExpressionError, ArithmeticError):
             self.calc_display.delete(0, tk.END)
             self.calc_display.insert(0, "エラー")
             self.calc_expression = ""
-            self.status_bar.config(text="計算エラーが発生しました")
-        self.root.after(2000, lambda: self.status_bar.config(text="準備完了"))
+            self.status.show("計算エラーが発生しました", priority=StatusMessenger.HIGH)
 
 def main():
     root = tk.Tk()
@@ -4,8 +4,208 @@
 accelerator オプションと実際のキーバインディングを組み合わせた例
 """
 
+import re
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import filedialog, messagebox, simpledialog, ttk
+
+from tkinter_files.common.highlighter import Highlighter, lexer_for_filename
+from tkinter_files.common.text_mirror import TextMirror
+
+
+def find_spans(lines, pattern):
+    """
+    正規表現に一致する範囲を (開始行, 開始列), (終了行, 終了列) のリストで返す
+
+    ワーカースレッドで実行します。行番号は Text と同じく1から数えます。
+    """
+    text = "\n".join(lines)
+    starts = []
+    ends = []
+    line, line_start, position = 1, 0, 0
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        if start == end:
+            continue
+        newlines = text.count("\n", position, start)
+        if newlines:
+            line += newlines
+            line_start = text.rfind("\n", position, start) + 1
+        position = start
+        starts.append((line, start - line_start))
+
+        inner = text.count("\n", start, end)
+        if inner:
+            line += inner
+            line_start = text.rfind("\n", start, end) + 1
+            position = end
+        ends.append((line, end - line_start))
+    return starts, ends
+
+
+class FindController:
+    """
+    Text ウィジェットの検索・すべて置換・すべて強調表示
+
+    - 検索はミラーのコピーに対してワーカースレッドで正規表現を実行する
+    - 一致箇所のタグは CHUNK 件ずつ after() で分けて追加し、画面を止めない
+    - 次/前の一致は一致位置のソート済みリストを二分探索する
+    - 本文が変更されたら、少し待ってから検索し直す
+    """
+
+    TAG = "found"
+    CHUNK = 500
+    POLL_MS = 20
+    RESEARCH_MS = 300
+
+    def __init__(self, text, mirror, on_done=None):
+        self.text = text
+        self.mirror = mirror
+        self.on_done = on_done
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pattern = None
+        self.starts = []
+        self.ends = []
+        self.generation = 0
+        self.research_job = None
+        text.tag_configure(self.TAG, background="yellow")
+        text.tag_lower(self.TAG, "sel")
+        mirror.listeners.append(self._on_mirror_changed)
+
+    def compile(self, query, regex=False, nocase=False):
+        return re.compile(query if regex else re.escape(query), re.IGNORECASE if nocase else 0)
+
+    def search(self, query, regex=False, nocase=False):
+        """
+        検索を開始する(結果は非同期に反映され、完了時に on_done(件数) が呼ばれる)
+        """
+        self.pattern = self.compile(query, regex, nocase)
+        self._start_search()
+
+    def _start_search(self):
+        self.generation += 1
+        generation = self.generation
+        version, lines = self.mirror.snapshot()
+        future = self.executor.submit(find_spans, lines, self.pattern)
+        self._poll(future, generation, version)
+
+    def _poll(self, future, generation, version):
+        if generation != self.generation:
+            return
+        if not future.done():
+            self.text.after(self.POLL_MS, self._poll, future, generation, version)
+            return
+        if version != self.mirror.version:
+            # 検索中に本文が変わった場合は結果を捨てて検索し直す
+            self._start_search()
+            return
+        self.starts, self.ends = future.result()
+        self.text.tag_remove(self.TAG, "1.0", "end")
+        self._apply_chunk(generation, 0)
+
+    def _apply_chunk(self, generation, offset):
+        if generation != self.generation:
+            return
+        chunk = []
+        for (start_line, start_column), (end_line, end_column) in zip(
+            self.starts[offset:offset + self.CHUNK], self.ends[offset:offset + self.CHUNK]
+        ):
+            chunk.append(f"{start_line}.{start_column}")
+            chunk.append(f"{end_line}.{end_column}")
+        if chunk:
+            self.text.tag_add(self.TAG, *chunk)
+        offset += self.CHUNK
+        if offset < len(self.starts):
+            self.text.after(1, self._apply_chunk, generation, offset)
+        elif self.on_done:
+            self.on_done(len(self.starts))
+
+    def _on_mirror_changed(self, line, removed, inserted):
+        if self.pattern is None:
+            return
+        if self.research_job is not None:
+            self.text.after_cancel(self.research_job)
+        self.research_job = self.text.after(self.RESEARCH_MS, self._research)
+
+    def _research(self):
+        self.research_job = None
+        if self.pattern is not None:
+            self._start_search()
+
+    def _select(self, i):
+        start_line, start_column = self.starts[i]
+        end_line, end_column = self.ends[i]
+        start = f"{start_line}.{start_column}"
+        self.text.tag_remove(tk.SEL, "1.0", "end")
+        self.text.tag_add(tk.SEL, start, f"{end_line}.{end_column}")
+        self.text.mark_set(tk.INSERT, start)
+        self.text.see(tk.INSERT)
+        return start
+
+    def _cursor(self):
+        line, column = self.text.index(tk.INSERT).split(".")
+        return int(line), int(column)
+
+    def next(self):
+        """カーソルより後ろの最初の一致を選択する(末尾まで来たら先頭へ)"""
+        if not self.starts:
+            return None
+        i = bisect_right(self.starts, self._cursor())
+        return self._select(i if i < len(self.starts) else 0)
+
+    def previous(self):
+        """カーソルより前の最後の一致を選択する(先頭まで来たら末尾へ)"""
+        if not self.starts:
+            return None
+        i = bisect_left(self.starts, self._cursor()) - 1
+        return self._select(i)
+
+    def replace_all(self, query, replacement, regex=False, nocase=False, on_done=None):
+        """
+        すべて置換する(置換後の本文はワーカースレッドで作成し、1回の編集として反映する)
+        """
+        pattern = self.compile(query, regex, nocase)
+        template = replacement if regex else replacement.replace("\\", "\\\\")
+        version, lines = self.mirror.snapshot()
+        future = self.executor.submit(lambda: pattern.subn(template, "\n".join(lines)))
+        self.generation += 1
+        self._poll_replace(future, self.generation, version, query, replacement, regex, nocase, on_done)
+
+    def _poll_replace(self, future, generation, version, *args):
+        if generation != self.generation:
+            return
+        if not future.done():
+            self.text.after(self.POLL_MS, self._poll_replace, future, generation, version, *args)
+            return
+        on_done = args[-1]
+        if version != self.mirror.version:
+            self.replace_all(*args)
+            return
+        new_text, count = future.result()
+        if count:
+            self.text.edit_separator()
+            self.text.delete("1.0", "end-1c")
+            self.text.insert("1.0", new_text)
+            self.text.edit_separator()
+        self.clear()
+        if on_done:
+            on_done(count)
+
+    def clear(self):
+        """強調表示と検索状態をクリアする"""
+        self.generation += 1
+        self.pattern = None
+        self.starts = []
+        self.ends = []
+        if self.research_job is not None:
+            self.text.after_cancel(self.research_job)
+            self.research_job = None
+        self.text.tag_remove(self.TAG, "1.0", "end")
+
+    def close(self):
+        self.clear()
+        self.executor.shutdown(wait=False)
 
 
 class MenuAcceleratorApp:
@@ -73,6 +273,12 @@ class MenuAcceleratorApp:
                              accelerator="Ctrl+A", underline=2)
         edit_menu.add_command(label="検索", command=self.find, 
                              accelerator="Ctrl+F", underline=0)
+        edit_menu.add_command(label="次を検索", command=self.find_next,
+                             accelerator="F3")
+        edit_menu.add_command(label="前を検索", command=self.find_previous,
+                             accelerator="Shift+F3")
+        edit_menu.add_command(label="置換", command=self.replace_all,
+                             accelerator="Ctrl+H", underline=0)
         
         # 表示メニュー
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -138,6 +344,15 @@ class MenuAcceleratorApp:
                                    "各種機能を実行できます。\n\n"
                                    "F1キーでショートカット一覧を表示できます。")
         
+        # 検索(すべての一致を強調表示)
+        self.mirror = TextMirror(self.text_area)
+        self.finder = FindController(self.text_area, self.mirror)
+        self.find_query = None
+        
+        # 構文の強調表示(開いたファイルの拡張子で切り替える)
+        self.highlighter = Highlighter(self.text_area, self.mirror)
+        self.line_number_count = 0
+        
         # フォント設定
         self.current_font_size = 11
         self.update_font()
@@ -159,6 +374,11 @@ class MenuAcceleratorApp:
         self.root.bind('<Control-v>', lambda e: self.paste())
         self.root.bind('<Control-a>', lambda e: self.select_all())
         self.root.bind('<Control-f>', lambda e: self.find())
+        self.root.bind('<F3>', lambda e: self.find_next())
+        self.root.bind('<Shift-F3>', lambda e: self.find_previous())
+        self.root.bind('<Control-h>', lambda e: self.replace_all())
+        # Text の標準の Ctrl+H は1文字削除なので、Text では置換だけを実行してクラスのバインディングを止める
+        self.text_area.bind('<Control-h>', self.on_replace_key)
         
         # 表示操作
         self.root.bind('<Control-l>', lambda e: self.toggle_line_numbers())
@@ -183,12 +403,14 @@ class MenuAcceleratorApp:
         if self.check_save_needed():
             filename = filedialog.askopenfilename(
                 title="ファイルを開く",
-                filetypes=[("テキストファイル", "*.txt"), ("すべてのファイル", "*.*")]
+                filetypes=[("テキストファイル", "*.txt"), ("Python", "*.py"), ("ログ", "*.log"),
+                           ("すべてのファイル", "*.*")]
             )
             if filename:
                 try:
                     with open(filename, 'r', encoding='utf-8') as file:
                         content = file.read()
+                        self.highlighter.set_lexer(lexer_for_filename(filename))
                         self.text_area.delete(1.0, tk.END)
                         self.text_area.insert(1.0, content)
                         self.current_file = filename
@@ -225,6 +447,7 @@ class MenuAcceleratorApp:
                     file.write(content)
                 self.current_file = filename
                 self.is_modified = False
+                self.highlighter.set_lexer(lexer_for_filename(filename))
                 self.update_title()
                 self.status_bar.config(text=f"ファイルを保存しました: {filename}")
             except Exception as e:
@@ -232,6 +455,7 @@ class MenuAcceleratorApp:
                 
     def exit_app(self):
         if self.check_save_needed():
+            self.finder.close()
             self.root.quit()
             
     # 編集操作メソッド
@@ -277,19 +501,68 @@ class MenuAcceleratorApp:
         self.status_bar.config(text="すべて選択しました")
         
     def find(self):
-        search_text = tk.simpledialog.askstring("検索", "検索する文字列を入力してください:")
+        search_text = simpledialog.askstring("検索", "検索する文字列を入力してください:",
+                                             initialvalue=self.find_query or "")
         if search_text:
-            # 簡単な検索実装
-            start_pos = self.text_area.search(search_text, "1.0", tk.END)
-            if start_pos:
-                end_pos = f"{start_pos}+{len(search_text)}c"
-                self.text_area.tag_remove(tk.SEL, "1.0", tk.END)
-                self.text_area.tag_add(tk.SEL, start_pos, end_pos)
-                self.text_area.mark_set(tk.INSERT, start_pos)
-                self.text_area.see(tk.INSERT)
-                self.status_bar.config(text=f"'{search_text}' が見つかりました")
-            else:
-                self.status_bar.config(text=f"'{search_text}' は見つかりませんでした")
+            # すべての一致をワーカースレッドで検索し、完了後に on_find_done で次の一致を選択
+            self.find_query = search_text
+            self.status_bar.config(text=f"'{search_text}' を検索中...")
+            self.finder.on_done = self.on_find_done
+            self.finder.search(search_text)
+        elif search_text == "":
+            self.find_query = None
+            self.finder.clear()
+            self.status_bar.config(text="検索をクリアしました")
+            
+    def on_find_done(self, count):
+        if count:
+            self.finder.next()
+            self.status_bar.config(text=f"'{self.find_query}' が {count} 件見つかりました")
+        else:
+            self.status_bar.config(text=f"'{self.find_query}' は見つかりませんでした")
+        # 以降の再検索(本文の変更時)では選択を動かさない
+        self.finder.on_done = self.on_research_done
+        
+    def on_research_done(self, count):
+        self.status_bar.config(text=f"'{self.find_query}': {count} 件")
+        
+    def find_next(self):
+        if not self.find_query:
+            self.find()
+            return
+        if self.finder.next() is None:
+            self.status_bar.config(text=f"'{self.find_query}' は見つかりませんでした")
+            
+    def find_previous(self):
+        if not self.find_query:
+            self.find()
+            return
+        if self.finder.previous() is None:
+            self.status_bar.config(text=f"'{self.find_query}' は見つかりませんでした")
+            
+    def on_replace_key(self, event):
+        self.replace_all()
+        return "break"
+        
+    def replace_all(self):
+        search_text = simpledialog.askstring("置換", "検索する文字列を入力してください:",
+                                             initialvalue=self.find_query or "")
+        if not search_text:
+            return
+        replacement = simpledialog.askstring("置換", f"'{search_text}' を置き換える文字列:")
+        if replacement is None:
+            return
+        self.find_query = None
+        self.status_bar.config(text=f"'{search_text}' を置換中...")
+        self.finder.replace_all(search_text, replacement,
+                                on_done=lambda count: self.on_replace_done(search_text, count))
+        
+    def on_replace_done(self, search_text, count):
+        if count:
+            self.on_text_change()
+            self.status_bar.config(text=f"'{search_text}' を {count} 件置換しました")
+        else:
+            self.status_bar.config(text=f"'{search_text}' は見つかりませんでした")
                 
     # 表示操作メソッド
     def toggle_line_numbers(self):
@@ -340,6 +613,9 @@ class MenuAcceleratorApp:
   Ctrl+V    貼り付け
   Ctrl+A    すべて選択
   Ctrl+F    検索
+  F3        次を検索
+  Shift+F3  前を検索
+  Ctrl+H    置換
 
 表示操作:
   Ctrl+L    行番号表示切り替え
@@ -370,14 +646,21 @@ class MenuAcceleratorApp:
             self.update_line_numbers()
             
     def update_line_numbers(self):
-        content = self.text_area.get(1.0, tk.END)
-        lines = content.count('\n')
-        line_numbers = '\n'.join(str(i) for i in range(1, lines + 1))
+        # 行数はミラーから取得し、増減した分の行番号だけを追加・削除する
+        lines = len(self.mirror.lines)
+        shown = self.line_number_count
+        if lines == shown:
+            return
         
         self.line_number_text.config(state=tk.NORMAL)
-        self.line_number_text.delete(1.0, tk.END)
-        self.line_number_text.insert(1.0, line_numbers)
+        if lines > shown:
+            start = 1 if shown == 0 else shown + 1
+            line_numbers = '\n'.join(str(i) for i in range(start, lines + 1))
+            self.line_number_text.insert(tk.END + '-1c', line_numbers if shown == 0 else '\n' + line_numbers)
+        else:
+            self.line_number_text.delete(f"{lines}.end", tk.END + '-1c')
         self.line_number_text.config(state=tk.DISABLED)
+        self.line_number_count = lines
         
     def update_title(self):
         title = "メニューアクセラレータ例"
@@ -403,9 +686,6 @@ class MenuAcceleratorApp:
         return True
 
 def main():
-    # simpledialog import
-    import tkinter.simpledialog
-    
     root = tk.Tk()
     app = MenuAcceleratorApp(root)
     
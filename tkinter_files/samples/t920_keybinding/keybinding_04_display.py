@@ -6,11 +6,116 @@
 
 import datetime
 import tkinter as tk
+from collections import Counter, deque
 from tkinter import ttk
 
+from tkinter_files.common.status import StatusMessenger
+
+
+class ShortcutIndex:
+    """ショートカット検索用のインデックス
+
+    小文字化した文字列と n-gram(1〜3文字) の索引を最初に一度だけ作り、
+    検索のたびに全件を小文字化し直さないようにする。
+    直前の検索語を含む検索語(入力を続けた場合)は、直前の結果だけを絞り込む。
+    """
+
+    NGRAM = 3
+
+    def __init__(self, shortcuts):
+        # 行番号(0始まり)をそのまま Treeview の iid として使う
+        self.keys = list(shortcuts)
+        self.haystacks = []
+        self.categories = {}
+        self.grams = {}
+        for index, (shortcut, info) in enumerate(shortcuts.items()):
+            fields = (shortcut.lower(), info['action'].lower())
+            self.haystacks.append(fields)
+            self.categories.setdefault(info['category'], set()).add(index)
+            for field in fields:
+                for n in range(1, self.NGRAM + 1):
+                    for start in range(len(field) - n + 1):
+                        self.grams.setdefault(field[start:start + n], set()).add(index)
+        self.all_ids = set(range(len(self.keys)))
+        self.last_query = ""
+        self.last_result = self.all_ids
+
+    def _contains(self, index, query):
+        shortcut, action = self.haystacks[index]
+        return query in shortcut or query in action
+
+    def search(self, query):
+        """query を含む行番号の集合を返す"""
+        query = query.lower()
+        if query == self.last_query:
+            return self.last_result
+        if not query:
+            result = self.all_ids
+        elif self.last_query and self.last_query in query:
+            # 入力を続けた場合は直前の結果から絞り込む
+            result = {i for i in self.last_result if self._contains(i, query)}
+        elif len(query) <= self.NGRAM:
+            result = self.grams.get(query, set())
+        else:
+            grams = [query[i:i + self.NGRAM] for i in range(len(query) - self.NGRAM + 1)]
+            candidate_sets = sorted((self.grams.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*candidate_sets)
+            result = {i for i in candidates if self._contains(i, query)}
+        self.last_query = query
+        self.last_result = result
+        return result
+
+    def filter(self, category, query):
+        """カテゴリと検索語で絞り込んだ行番号を、元の並び順のリストで返す"""
+        result = self.search(query)
+        if category is not None:
+            result = result & self.categories.get(category, set())
+        return sorted(result)
+
+
+class UsageStatistics:
+    """ショートカットの使用回数を逐次更新する集計
+
+    実行のたびに履歴全体を数え直さず、Counter と上位 k 件のリストだけを更新する。
+    使用回数は増える一方なので、上位に入れるのは今回実行したショートカットだけになり、
+    1回の更新は O(k) で済む。
+    """
+
+    def __init__(self, top_k=5):
+        self.top_k = top_k
+        self.counts = Counter()
+        self.total = 0
+        self.top = []  # 使用回数の多い順の (ショートカット, 回数)
+
+    def add(self, shortcut):
+        self.counts[shortcut] += 1
+        self.total += 1
+        count = self.counts[shortcut]
+        
+        self.top = [entry for entry in self.top if entry[0] != shortcut]
+        position = len(self.top)
+        while position > 0 and self.top[position - 1][1] < count:
+            position -= 1
+        self.top.insert(position, (shortcut, count))
+        del self.top[self.top_k:]
+
+    def most_common(self):
+        """最も使用されたショートカットと回数。未使用なら None"""
+        return self.top[0] if self.top else None
+
+    def clear(self):
+        self.counts.clear()
+        self.total = 0
+        self.top = []
+
 
 class ShortcutDisplayApp:
-    def __init__(self, root):
+    def __init__(self, root, history_limit=500, history_log=None, spill_interval=5000):
+        """
+        history_limit: 画面とメモリに保持する履歴の最大件数
+        history_log: 指定すると、履歴を定期的にこのファイルへ追記する
+        spill_interval: 履歴ファイルへ書き出す間隔(ミリ秒)
+        """
         self.root = root
         root.title("ショートカット一覧とリアルタイム表示")
         root.geometry("800x600")
@@ -59,13 +164,28 @@ class ShortcutDisplayApp:
             'Page Down': {'action': '次のページ', 'category': 'ナビゲーション'},
         }
         
-        # 実行履歴
-        self.execution_history = []
+        # 実行履歴(上限付きのリングバッファ)
+        self.history_limit = history_limit
+        self.execution_history = deque(maxlen=history_limit)
+        self.statistics = UsageStatistics()
+        
+        # 履歴ファイルへの書き出し待ちの行
+        self.history_log = history_log
+        self.spill_interval = spill_interval
+        self.pending_log_lines = []
+        
+        # 検索用インデックスと、現在ツリーに表示している行
+        self.shortcut_index = ShortcutIndex(self.shortcuts)
+        self.visible_ids = []
+        self.filter_job = None
         
         # UI作成
         self.create_ui()
         self.setup_keybindings()
         
+        if self.history_log:
+            self.root.after(self.spill_interval, self.spill_history)
+        
     def create_ui(self):
         # メインフレーム
         main_frame = tk.Frame(self.root)
@@ -135,6 +255,10 @@ class ShortcutDisplayApp:
                                       fg="blue", font=("Arial", 10))
         self.current_status.pack(side=tk.LEFT, padx=10)
         
+        # 状態表示(キーを押し続けてもタイマーは1つだけ。同じショートカットは回数をまとめて表示)
+        self.status = StatusMessenger(self.current_status, idle_text="キー入力待ち...",
+                                      default_duration=3000, fg="blue")
+        
         # クリアボタン
         clear_btn = tk.Button(status_frame, text="履歴クリア", command=self.clear_history)
         clear_btn.pack(side=tk.RIGHT)
@@ -161,31 +285,48 @@ class ShortcutDisplayApp:
         self.most_used_label.pack(side=tk.RIGHT)
         
     def populate_tree(self):
-        """ショートカット一覧をツリーに表示"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
+        """ショートカット一覧をツリーに表示(全行を一度だけ挿入する)"""
+        for index, (shortcut, info) in enumerate(self.shortcuts.items()):
+            self.tree.insert('', tk.END, iid=str(index), values=(shortcut, info['action'], info['category']))
+        self.visible_ids = list(range(len(self.shortcuts)))
+        self.apply_filter()
+        
+    def apply_filter(self):
+        """絞り込み結果との差分だけツリーを更新する"""
+        self.filter_job = None
         category_filter = self.category_var.get()
-        search_text = self.search_var.get().lower()
-        
-        for shortcut, info in self.shortcuts.items():
-            # カテゴリフィルター
-            if category_filter != "すべて" and info['category'] != category_filter:
-                continue
-                
-            # 検索フィルター
-            if search_text and search_text not in shortcut.lower() and search_text not in info['action'].lower():
-                continue
-                
-            self.tree.insert('', tk.END, values=(shortcut, info['action'], info['category']))
+        category = None if category_filter == "すべて" else category_filter
+        new_ids = self.shortcut_index.filter(category, self.search_var.get())
+        
+        new_set = set(new_ids)
+        old_set = set(self.visible_ids)
+        hidden = [str(i) for i in self.visible_ids if i not in new_set]
+        shown = new_set - old_set
+        
+        if len(shown) > len(new_ids) // 2:
+            # 大半が入れ替わる場合は一括で子要素を置き換える
+            self.tree.set_children('', *(str(i) for i in new_ids))
+        else:
+            if hidden:
+                self.tree.detach(*hidden)
+            # 残っている行の順序は変わらないので、新しく表示する行だけ正しい位置に戻す
+            for position, i in enumerate(new_ids):
+                if i in shown:
+                    self.tree.move(str(i), '', position)
+        self.visible_ids = new_ids
+        
+    def schedule_filter(self):
+        """連続した入力をまとめ、アイドル時に一度だけ絞り込む"""
+        if self.filter_job is None:
+            self.filter_job = self.root.after_idle(self.apply_filter)
             
     def filter_shortcuts(self, event=None):
         """カテゴリフィルターが変更された時の処理"""
-        self.populate_tree()
+        self.schedule_filter()
         
     def search_shortcuts(self, event=None):
         """検索フィールドが変更された時の処理"""
-        self.populate_tree()
+        self.schedule_filter()
         
     def setup_keybindings(self):
         """キーバインディングの設定"""
@@ -247,42 +388,50 @@ class ShortcutDisplayApp:
                 'category': info['category']
             })
             
-            # 履歴リストボックスに追加
+            self.statistics.add(shortcut_key)
+            if self.history_log:
+                self.pending_log_lines.append(f"{datetime.date.today()} {history_entry}\n")
+            
+            # 履歴リストボックスに追加(上限を超えた古い行は削除)
             self.history_listbox.insert(0, history_entry)
+            if self.history_listbox.size() > self.history_limit:
+                self.history_listbox.delete(self.history_limit, tk.END)
             
-            # 現在の状態更新
-            self.current_status.config(text=f"実行: {shortcut_key} → {info['action']}", fg="green")
+            # 現在の状態更新(一定時間後に「キー入力待ち...」に戻る)
+            self.status.show(f"実行: {shortcut_key} → {info['action']}", fg="green")
             
             # 統計更新
             self.update_statistics()
             
-            # 一定時間後にステータスをリセット
-            self.root.after(3000, lambda: self.current_status.config(text="キー入力待ち...", fg="blue"))
-            
     def clear_history(self):
         """履歴をクリア"""
         self.history_listbox.delete(0, tk.END)
         self.execution_history.clear()
+        self.statistics.clear()
         self.update_statistics()
-        self.current_status.config(text="履歴をクリアしました", fg="orange")
-        self.root.after(2000, lambda: self.current_status.config(text="キー入力待ち...", fg="blue"))
+        self.status.show("履歴をクリアしました", duration=2000, fg="orange")
         
     def update_statistics(self):
         """統計情報を更新"""
-        total_count = len(self.execution_history)
-        self.stats_label.config(text=f"実行回数: {total_count}回")
-        
-        if total_count > 0:
-            # 最も使用されたショートカットを計算
-            shortcut_counts = {}
-            for entry in self.execution_history:
-                shortcut = entry['shortcut']
-                shortcut_counts[shortcut] = shortcut_counts.get(shortcut, 0) + 1
-                
-            most_used = max(shortcut_counts.items(), key=lambda x: x[1])
+        self.stats_label.config(text=f"実行回数: {self.statistics.total}回")
+        
+        most_used = self.statistics.most_common()
+        if most_used:
             self.most_used_label.config(text=f"最多使用: {most_used[0]} ({most_used[1]}回)")
         else:
             self.most_used_label.config(text="")
+            
+    def spill_history(self):
+        """書き出し待ちの履歴をファイルへ追記する"""
+        self.flush_history_log()
+        self.root.after(self.spill_interval, self.spill_history)
+        
+    def flush_history_log(self):
+        if not self.pending_log_lines:
+            return
+        with open(self.history_log, 'a', encoding='utf-8') as f:
+            f.writelines(self.pending_log_lines)
+        self.pending_log_lines.clear()
 
 def main():
     root = tk.Tk()
@@ -296,6 +445,7 @@ def main():
     
     # アプリケーション実行
     root.mainloop()
+    app.flush_history_log()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file